@@ -81,6 +81,7 @@ const colorMap = {
     [ServeReplicaState.RECOVERING]: orange,
     [ServeReplicaState.RUNNING]: green,
     [ServeReplicaState.STOPPING]: red,
+    [ServeReplicaState.STANDBY]: blueGrey,
   },
 } as {
   [key: string]: {
@@ -63,6 +63,7 @@ export enum ServeReplicaState {
   RECOVERING = "RECOVERING",
   RUNNING = "RUNNING",
   STOPPING = "STOPPING",
+  STANDBY = "STANDBY",
 }
 
 export type ServeReplica = {
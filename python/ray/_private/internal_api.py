@@ -30,11 +30,7 @@ def memory_summary(
 ):
     from ray.dashboard.memory_utils import memory_summary
 
-    address = services.canonicalize_bootstrap_address_or_die(address)
-
-    state = GlobalState()
-    options = GcsClientOptions.from_gcs_address(address)
-    state._initialize_global_state(options)
+    state = get_state_from_address(address)
     if stats_only:
         return get_store_stats(state)
     return memory_summary(
@@ -42,8 +38,17 @@ def memory_summary(
     ) + get_store_stats(state)
 
 
-def get_store_stats(state, node_manager_address=None, node_manager_port=None):
-    """Returns a formatted string describing memory usage in the cluster."""
+def get_state_from_address(address=None):
+    address = services.canonicalize_bootstrap_address_or_die(address)
+
+    state = GlobalState()
+    options = GcsClientOptions.from_gcs_address(address)
+    state._initialize_global_state(options)
+    return state
+
+
+def get_memory_info_reply(state, node_manager_address=None, node_manager_port=None):
+    """Returns global memory info."""
 
     from ray.core.generated import node_manager_pb2, node_manager_pb2_grpc
 
@@ -76,6 +81,13 @@ def get_store_stats(state, node_manager_address=None, node_manager_port=None):
         node_manager_pb2.FormatGlobalMemoryInfoRequest(include_memory_info=False),
         timeout=60.0,
     )
+    return reply
+
+
+def get_store_stats(state, node_manager_address=None, node_manager_port=None):
+    """Returns a formatted string describing memory usage in the cluster."""
+
+    reply = get_memory_info_reply(state, node_manager_address, node_manager_port)
     return store_stats_summary(reply)
 
 
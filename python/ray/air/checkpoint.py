@@ -30,6 +30,7 @@ from ray.air.constants import PREPROCESSOR_KEY, CHECKPOINT_ID_ATTR
 from ray.util.annotations import DeveloperAPI, PublicAPI
 
 if TYPE_CHECKING:
+    from ray.air.checkpoint_store import ContentAddressedStore
     from ray.data.preprocessor import Preprocessor
 
 
@@ -41,6 +42,8 @@ _FS_CHECKPOINT_KEY = "fs_checkpoint"
 _BYTES_DATA_KEY = "bytes_data"
 _METADATA_KEY = "_metadata"
 _CHECKPOINT_DIR_PREFIX = "checkpoint_tmp_"
+# Files that are not written through a `ContentAddressedStore`.
+_STORE_EXCLUDE = [f"./{_CHECKPOINT_METADATA_FILE_NAME}", f"./{PREPROCESSOR_KEY}"]
 
 logger = logging.getLogger(__name__)
 
@@ -512,7 +515,21 @@ class Checkpoint:
         with open(checkpoint_metadata_path, "wb") as file:
             pickle.dump(self._metadata, file)
 
-    def _to_directory(self, path: str, move_instead_of_copy: bool = False) -> None:
+    def _to_directory(
+        self,
+        path: str,
+        move_instead_of_copy: bool = False,
+        store: Optional["ContentAddressedStore"] = None,
+    ) -> None:
+        if store and not self._local_path:
+            # Files are written in place below, which would modify the files
+            # shared through the store. Instead, write the checkpoint to a
+            # temporary directory first.
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                self._to_directory(tmp_dir)
+                _copy_directory_to_store(store, tmp_dir, path)
+            return
+
         if self._data_dict:
             data_dict = self.to_dict()
             if _FS_CHECKPOINT_KEY in data_dict:
@@ -557,6 +574,12 @@ class Checkpoint:
                             shutil.move(
                                 str(inner.absolute()), str(path_pathlib.absolute())
                             )
+                    elif store:
+                        _copy_directory_to_store(
+                            store,
+                            str(local_path_pathlib.absolute()),
+                            str(path_pathlib.absolute()),
+                        )
                     else:
                         shutil.copytree(
                             str(local_path_pathlib.absolute()),
@@ -575,13 +598,20 @@ class Checkpoint:
         if self._override_preprocessor_set and self._override_preprocessor:
             save_preprocessor_to_dir(self._override_preprocessor, path)
 
-    def _to_directory_safe(self, path: str, move_instead_of_copy: bool = False) -> None:
+    def _to_directory_safe(
+        self,
+        path: str,
+        move_instead_of_copy: bool = False,
+        store: Optional["ContentAddressedStore"] = None,
+    ) -> None:
         try:
             # Timeout 0 means there will be only one attempt to acquire
             # the file lock. If it cannot be aquired, a TimeoutError
             # will be thrown.
             with TempFileLock(f"{path}.lock", timeout=0):
-                self._to_directory(path, move_instead_of_copy=move_instead_of_copy)
+                self._to_directory(
+                    path, move_instead_of_copy=move_instead_of_copy, store=store
+                )
         except TimeoutError:
             # if the directory is already locked, then wait but do not do anything.
             with TempFileLock(f"{path}.lock", timeout=-1):
@@ -609,12 +639,21 @@ class Checkpoint:
         self._local_path = self._to_directory_safe(path, move_instead_of_copy=True)
         return self._local_path
 
-    def to_directory(self, path: Optional[str] = None) -> str:
+    def to_directory(
+        self,
+        path: Optional[str] = None,
+        store: Optional["ContentAddressedStore"] = None,
+    ) -> str:
         """Write checkpoint data to directory.
 
         Args:
             path: Target directory to restore data in. If not specified,
                 will create a temporary directory.
+            store: If set, the checkpoint files are written through this
+                :class:`~ray.air.checkpoint_store.ContentAddressedStore`, so
+                that files shared with other checkpoints in the store are
+                only stored once. The files in ``path`` must then not be
+                modified in place.
 
         Returns:
             str: Directory containing checkpoint data.
@@ -625,7 +664,7 @@ class Checkpoint:
 
         _make_dir(path, acquire_del_lock=not user_provided_path)
 
-        return self._to_directory_safe(path)
+        return self._to_directory_safe(path, store=store)
 
     @contextlib.contextmanager
     def as_directory(self) -> Iterator[str]:
@@ -877,6 +916,20 @@ def _pack(path: str) -> bytes:
     return stream.getvalue()
 
 
+def _copy_directory_to_store(
+    store: "ContentAddressedStore", source: str, target: str
+) -> None:
+    """Copy the directory in ``source`` to ``target`` through ``store``."""
+    store.copy_directory(source, target, exclude=_STORE_EXCLUDE)
+    # These files may be overwritten in place after the checkpoint is
+    # written, so they are copied instead of linked to the store.
+    for file_name in (_CHECKPOINT_METADATA_FILE_NAME, PREPROCESSOR_KEY):
+        if os.path.exists(os.path.join(source, file_name)):
+            shutil.copy2(
+                os.path.join(source, file_name), os.path.join(target, file_name)
+            )
+
+
 def _unpack(stream: bytes, path: str) -> str:
     """Unpack archive in bytes string into directory in ``path``."""
     with tarfile.open(fileobj=io.BytesIO(stream)) as tar:
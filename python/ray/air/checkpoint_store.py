@@ -0,0 +1,241 @@
+import errno
+import fnmatch
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from typing import Dict, List, Optional, Union
+
+from ray.util import log_once
+from ray.util.annotations import DeveloperAPI
+
+logger = logging.getLogger(__name__)
+
+_CHUNKS_DIR_NAME = "chunks"
+_TMP_FILE_PREFIX = ".tmp_"
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@DeveloperAPI
+class ContentAddressedStore:
+    """Stores checkpoint files once per unique content.
+
+    Each file that is written through the store is hashed, and its content
+    is kept as a single chunk under ``root``, named after its SHA-256 hash.
+    The target file is a hard link to that chunk. Checkpoints that share
+    files, e.g. the checkpoints of PBT trials cloned from the same trial,
+    or successive checkpoints of a trial that only update some files,
+    thus only take up storage once for each distinct file, and writing
+    a file that is already in the store does not copy any data.
+
+    The target directories are plain directory trees, so they can be read
+    (and deleted) like any other checkpoint directory. The number of hard
+    links of a chunk is its reference count: deleting a checkpoint
+    directory releases its chunks, and ``collect_garbage()`` removes the
+    chunks that are no longer referenced by any checkpoint.
+
+    Files written through the store must not be modified in place, as
+    this would change all checkpoints that share the file. Replace them
+    instead, e.g. by writing them through the store again.
+
+    The store and the target directories have to be on the same local or
+    mounted file system. Otherwise, files are copied without
+    deduplication.
+
+    Example:
+
+        .. code-block:: python
+
+            store = ContentAddressedStore("/mnt/shared/checkpoint_store")
+            store.copy_directory("/tmp/checkpoint", "/mnt/shared/ckpt_1")
+            store.copy_directory("/tmp/checkpoint", "/mnt/shared/ckpt_2")
+
+            # Deleting a checkpoint releases its files in the store
+            shutil.rmtree("/mnt/shared/ckpt_1")
+            store.collect_garbage()
+
+    Args:
+        root: Directory to keep the chunks in.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike]):
+        self._root = os.path.abspath(os.path.expanduser(str(root)))
+        self._chunks_dir = os.path.join(self._root, _CHUNKS_DIR_NAME)
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    def copy_file(self, source: str, target: str) -> int:
+        """Writes the file at ``source`` to ``target`` through the store.
+
+        Args:
+            source: Path of the file to write.
+            target: Path to write the file to. An existing file at this path
+                is replaced.
+
+        Returns:
+            The number of bytes written to the store. This is 0 if a file
+            with the same content was already in the store.
+        """
+        digest = self._hash_file(source)
+        chunk_path = self._get_chunk_path(digest)
+        if os.path.exists(target) and os.path.exists(chunk_path):
+            if os.path.samefile(target, chunk_path):
+                return 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        # The chunk may be garbage collected by another process between
+        # adding it and linking it, in which case it is added again.
+        while True:
+            num_bytes_written = self._add_chunk(source, chunk_path)
+            try:
+                self._link(chunk_path, target)
+            except FileNotFoundError:
+                if not os.path.exists(chunk_path):
+                    continue
+                raise
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.ENOTSUP):
+                    raise
+                if log_once("content_addressed_store_link_failed"):
+                    logger.warning(
+                        f"Could not link `{target}` to the checkpoint store at "
+                        f"`{self._root}`, copying the file instead. Files are only "
+                        f"deduplicated if the store is on the same file system "
+                        f"as the checkpoints. Error: {e}"
+                    )
+                shutil.copy2(source, target)
+                num_bytes_written = os.path.getsize(source)
+            return num_bytes_written
+
+    def copy_directory(
+        self, source: str, target: str, exclude: Optional[List[str]] = None
+    ) -> int:
+        """Writes all files in the ``source`` directory to ``target``.
+
+        Files in ``target`` that do not exist in ``source`` are kept.
+
+        Args:
+            source: Directory to write.
+            target: Directory to write the files to.
+            exclude: Patterns of relative paths to skip, e.g. ``["./*.png"]``.
+                Paths are matched in the form ``./subdir/file``.
+
+        Returns:
+            The number of bytes written to the store.
+        """
+        num_bytes_written = 0
+        for root, _, files in os.walk(source):
+            rel_root = os.path.relpath(root, source)
+            os.makedirs(os.path.join(target, rel_root), exist_ok=True)
+            for file in files:
+                candidate = os.path.join(rel_root, file)
+                if exclude and any(
+                    fnmatch.fnmatch(candidate, pattern) for pattern in exclude
+                ):
+                    continue
+                num_bytes_written += self.copy_file(
+                    os.path.join(source, candidate),
+                    os.path.normpath(os.path.join(target, candidate)),
+                )
+        return num_bytes_written
+
+    def add_directory(self, path: str, exclude: Optional[List[str]] = None) -> int:
+        """Moves the files in ``path`` into the store, in place.
+
+        Each file in ``path`` is replaced with a link to its chunk in the
+        store.
+
+        Args:
+            path: Directory to move into the store.
+            exclude: Patterns of relative paths to skip, see
+                ``copy_directory()``.
+
+        Returns:
+            The number of bytes written to the store.
+        """
+        return self.copy_directory(path, path, exclude=exclude)
+
+    def get_ref_counts(self) -> Dict[str, int]:
+        """Returns the number of files referencing each chunk, by hash."""
+        return {
+            os.path.basename(chunk_path): os.stat(chunk_path).st_nlink - 1
+            for chunk_path in self._list_chunks()
+        }
+
+    def collect_garbage(self) -> int:
+        """Removes all chunks that are no longer referenced by any file.
+
+        Returns:
+            The number of bytes freed.
+        """
+        num_bytes_freed = 0
+        for chunk_path in self._list_chunks():
+            try:
+                stat = os.stat(chunk_path)
+                if stat.st_nlink <= 1:
+                    os.remove(chunk_path)
+                    num_bytes_freed += stat.st_size
+            except FileNotFoundError:
+                # Removed by another process
+                pass
+        return num_bytes_freed
+
+    def _get_chunk_path(self, digest: str) -> str:
+        return os.path.join(self._chunks_dir, digest[:2], digest)
+
+    def _list_chunks(self) -> List[str]:
+        if not os.path.isdir(self._chunks_dir):
+            return []
+        chunk_paths = []
+        for prefix in os.listdir(self._chunks_dir):
+            prefix_dir = os.path.join(self._chunks_dir, prefix)
+            chunk_paths.extend(
+                os.path.join(prefix_dir, name)
+                for name in os.listdir(prefix_dir)
+                if not name.startswith(_TMP_FILE_PREFIX)
+            )
+        return chunk_paths
+
+    def _add_chunk(self, source: str, chunk_path: str) -> int:
+        if os.path.exists(chunk_path):
+            return 0
+        chunk_dir = os.path.dirname(chunk_path)
+        os.makedirs(chunk_dir, exist_ok=True)
+        # Write to a temporary file first, so that other processes never
+        # see partially written chunks.
+        tmp_path = os.path.join(chunk_dir, f"{_TMP_FILE_PREFIX}{uuid.uuid4().hex}")
+        try:
+            shutil.copyfile(source, tmp_path)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, chunk_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return os.path.getsize(chunk_path)
+
+    @staticmethod
+    def _link(chunk_path: str, target: str):
+        # Link to a temporary path first and then replace the target, so the
+        # target is never missing, and an existing target file that other
+        # checkpoints link to is not modified.
+        tmp_path = os.path.join(
+            os.path.dirname(os.path.abspath(target)),
+            f"{_TMP_FILE_PREFIX}{uuid.uuid4().hex}",
+        )
+        os.link(chunk_path, tmp_path)
+        try:
+            os.replace(tmp_path, target)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                sha256.update(block)
+        return sha256.hexdigest()
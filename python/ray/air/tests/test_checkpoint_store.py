@@ -0,0 +1,128 @@
+import os
+
+import pytest
+
+from ray.air.checkpoint import Checkpoint
+from ray.air.checkpoint_store import ContentAddressedStore
+
+
+def _write_file(path, content: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _read_file(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path):
+    path = tmp_path / "source"
+    _write_file(str(path / "model.bin"), b"model" * 100)
+    _write_file(str(path / "subdir" / "optimizer.bin"), b"optimizer" * 100)
+    _write_file(str(path / "exclude.txt"), b"exclude")
+    yield str(path)
+
+
+def test_copy_directory_deduplicates(tmp_path, checkpoint_dir):
+    store = ContentAddressedStore(str(tmp_path / "store"))
+    target_1 = str(tmp_path / "target_1")
+    target_2 = str(tmp_path / "target_2")
+
+    num_bytes = store.copy_directory(checkpoint_dir, target_1)
+    assert num_bytes == 500 + 900 + 7
+
+    # All files are already in the store, so nothing is written
+    assert store.copy_directory(checkpoint_dir, target_2) == 0
+    for target in [target_1, target_2]:
+        assert _read_file(os.path.join(target, "model.bin")) == b"model" * 100
+        assert _read_file(os.path.join(target, "subdir", "optimizer.bin")) == (
+            b"optimizer" * 100
+        )
+    assert sorted(store.get_ref_counts().values()) == [2, 2, 2]
+
+    # Updating one file only writes the new file
+    _write_file(os.path.join(checkpoint_dir, "model.bin"), b"new_model")
+    assert store.copy_directory(checkpoint_dir, target_2) == 9
+    assert _read_file(os.path.join(target_1, "model.bin")) == b"model" * 100
+    assert _read_file(os.path.join(target_2, "model.bin")) == b"new_model"
+    assert sorted(store.get_ref_counts().values()) == [1, 1, 2, 2]
+
+
+def test_copy_directory_exclude(tmp_path, checkpoint_dir):
+    store = ContentAddressedStore(str(tmp_path / "store"))
+    target = str(tmp_path / "target")
+
+    store.copy_directory(checkpoint_dir, target, exclude=["./exclude*"])
+    assert not os.path.exists(os.path.join(target, "exclude.txt"))
+    assert os.path.exists(os.path.join(target, "model.bin"))
+    assert len(store.get_ref_counts()) == 2
+
+
+def test_add_directory(tmp_path, checkpoint_dir):
+    store = ContentAddressedStore(str(tmp_path / "store"))
+    target = str(tmp_path / "target")
+    store.copy_directory(checkpoint_dir, target)
+
+    # Files that are already in the store are linked in place
+    assert store.add_directory(checkpoint_dir) == 0
+    assert _read_file(os.path.join(checkpoint_dir, "model.bin")) == b"model" * 100
+    assert sorted(store.get_ref_counts().values()) == [2, 2, 2]
+
+
+def test_collect_garbage(tmp_path, checkpoint_dir):
+    store = ContentAddressedStore(str(tmp_path / "store"))
+    target_1 = str(tmp_path / "target_1")
+    target_2 = str(tmp_path / "target_2")
+    store.copy_directory(checkpoint_dir, target_1)
+    _write_file(os.path.join(checkpoint_dir, "model.bin"), b"new_model")
+    store.copy_directory(checkpoint_dir, target_2)
+
+    # Chunks referenced by the other checkpoint are kept
+    os.remove(os.path.join(target_1, "exclude.txt"))
+    assert store.collect_garbage() == 0
+
+    os.remove(os.path.join(target_1, "model.bin"))
+    assert store.collect_garbage() == 500
+    assert sorted(store.get_ref_counts().values()) == [1, 1, 2]
+    assert _read_file(os.path.join(target_2, "model.bin")) == b"new_model"
+
+    # Written again after being garbage collected
+    _write_file(os.path.join(checkpoint_dir, "model.bin"), b"model" * 100)
+    assert store.copy_directory(checkpoint_dir, target_1) == 500
+
+
+def test_checkpoint_to_directory(tmp_path, checkpoint_dir):
+    store = ContentAddressedStore(str(tmp_path / "store"))
+    checkpoint = Checkpoint.from_directory(checkpoint_dir)
+
+    path_1 = checkpoint.to_directory(str(tmp_path / "checkpoint_1"), store=store)
+    path_2 = checkpoint.to_directory(str(tmp_path / "checkpoint_2"), store=store)
+    assert sorted(store.get_ref_counts().values()) == [2, 2, 2]
+    for path in [path_1, path_2]:
+        restored = Checkpoint.from_directory(path)
+        with restored.as_directory() as restored_dir:
+            assert _read_file(os.path.join(restored_dir, "model.bin")) == (
+                b"model" * 100
+            )
+
+    dict_checkpoint = Checkpoint.from_dict({"model": [1, 2, 3]})
+    dict_checkpoint.to_directory(str(tmp_path / "dict_1"), store=store)
+    dict_checkpoint.to_directory(str(tmp_path / "dict_2"), store=store)
+    # Overwriting a checkpoint does not modify the files shared with others
+    Checkpoint.from_dict({"model": [4]}).to_directory(
+        str(tmp_path / "dict_1"), store=store
+    )
+    restored = Checkpoint.from_directory(str(tmp_path / "dict_1")).to_dict()
+    assert restored["model"] == [4]
+    restored = Checkpoint.from_directory(str(tmp_path / "dict_2")).to_dict()
+    assert restored["model"] == [1, 2, 3]
+    assert sorted(store.get_ref_counts().values()) == [1, 1, 2, 2, 2]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -19,11 +19,12 @@ import numpy as np
 from ray.air.constants import TENSOR_COLUMN_NAME
 from ray._private.utils import _get_pyarrow_version
 from ray.data._internal.arrow_ops import transform_polars, transform_pyarrow
+from ray.data._internal.null_aggregate import _wrap_acc
 from ray.data._internal.table_block import (
     TableBlockAccessor,
     TableBlockBuilder,
 )
-from ray.data.aggregate import AggregateFn
+from ray.data.aggregate import AggregateFn, Count, Max, Mean, Min, Sum
 from ray.data.block import (
     Block,
     BlockAccessor,
@@ -534,6 +535,141 @@ class ArrowBlockAccessor(TableBlockAccessor):
 
         return builder.build()
 
+    def combine_unsorted(self, key: KeyFn, aggs: Tuple[AggregateFn]) -> Block[ArrowRow]:
+        """Combine rows with the same key into an accumulator.
+
+        This doesn't require the block to be sorted by key. If all aggregations are
+        built-in aggregations on numeric columns, the groups are aggregated with
+        Arrow's vectorized ``Table.group_by().aggregate()``, instead of sorting the
+        block and aggregating the groups one at a time.
+
+        Returns:
+            A block sorted by key, with the same columns as `combine()`.
+        """
+        if not self._can_combine_vectorized(key, aggs):
+            return super().combine_unsorted(key, aggs)
+
+        import pyarrow.compute as pac
+
+        # Aggregate copies of the columns with unique names, so that the names of
+        # the aggregated columns don't conflict.
+        columns = {key: self._table[key], "__size": self._table[key]}
+        aggregations = [("__size", "count", pac.CountOptions(mode="all"))]
+        for i, agg in enumerate(aggs):
+            if type(agg) is Count:
+                continue
+            name = f"__agg_{i}"
+            columns[name] = self._table[agg._key_fn]
+            aggregations.append((name, "count"))
+            if type(agg) is Mean:
+                aggregations.append((name, "sum"))
+            else:
+                aggregations.append((name, type(agg).__name__.lower()))
+        grouped = (
+            pyarrow.table(columns).group_by(key).aggregate(aggregations).sort_by(key)
+        )
+
+        # Build the same accumulator columns as `combine()`.
+        size = grouped["__size_count"]
+        combined = {key: grouped[key]}
+        count = collections.defaultdict(int)
+        for i, agg in enumerate(aggs):
+            name = agg.name
+            # Check for conflicts with existing aggregation name.
+            if count[name] > 0:
+                name = self._munge_conflict(name, count[name])
+            count[name] += 1
+            if type(agg) is Count:
+                combined[name] = size
+                continue
+            num_valid = grouped[f"__agg_{i}_count"]
+            if type(agg) is Mean:
+                values = [grouped[f"__agg_{i}_sum"], num_valid]
+            else:
+                values = [grouped[f"__agg_{i}_{type(agg).__name__.lower()}"]]
+            combined[name] = self._build_accumulators(
+                agg, grouped[key], values, num_valid, size
+            )
+        return pyarrow.table(combined)
+
+    @staticmethod
+    def _build_accumulators(
+        agg: AggregateFn,
+        keys: "pyarrow.ChunkedArray",
+        values: List["pyarrow.ChunkedArray"],
+        num_valid: "pyarrow.ChunkedArray",
+        size: "pyarrow.ChunkedArray",
+    ) -> "pyarrow.Array":
+        """Build the wrapped accumulators of an aggregation from its grouped values.
+
+        Each accumulator is the list of the values of its group, followed by the
+        has-data flag (see `_wrap_acc()`).
+        """
+        import pyarrow.compute as pac
+
+        if agg._ignore_nulls:
+            has_nulls = pac.any(pac.equal(num_valid, 0)).as_py()
+        else:
+            has_nulls = pac.any(pac.less(num_valid, size)).as_py()
+        if has_nulls:
+            # Groups with nulls get a null or empty accumulator, so build the
+            # accumulators one at a time.
+            accumulators = []
+            rows = zip(
+                keys.to_pylist(),
+                num_valid.to_pylist(),
+                size.to_pylist(),
+                *[v.to_pylist() for v in values],
+            )
+            for key, num_valid_, size_, *value in rows:
+                if num_valid_ < size_ and not agg._ignore_nulls:
+                    accumulators.append(None)
+                elif num_valid_ == 0:
+                    # All values are null, so the accumulator is empty.
+                    accumulators.append(agg.init(key))
+                else:
+                    if len(value) == 1:
+                        value = value[0]
+                    accumulators.append(_wrap_acc(value, has_data=True))
+            return pyarrow.array(accumulators)
+
+        # Interleave the values with the has-data flag, and slice the flattened
+        # values into lists of the same length.
+        if pyarrow.types.is_floating(values[0].type):
+            dtype = np.float64
+        else:
+            dtype = np.int64
+        width = len(values) + 1
+        flat_values = np.column_stack(
+            [v.to_numpy().astype(dtype) for v in values]
+            + [np.ones(len(keys), dtype=dtype)]
+        )
+        offsets = np.arange(0, len(keys) * width + 1, width, dtype=np.int32)
+        return pyarrow.ListArray.from_arrays(
+            pyarrow.array(offsets), pyarrow.array(flat_values.ravel())
+        )
+
+    def _can_combine_vectorized(self, key: KeyFn, aggs: Tuple[AggregateFn]) -> bool:
+        if not isinstance(key, str) or self.num_rows() == 0:
+            return False
+        if not hasattr(pyarrow.Table, "group_by"):
+            # Table.group_by() was added in Arrow 7.0.0.
+            return False
+        for agg in aggs:
+            if type(agg) is Count:
+                continue
+            if type(agg) not in (Sum, Min, Max, Mean):
+                return False
+            if not isinstance(agg._key_fn, str):
+                return False
+            col_type = self._table.schema.field(agg._key_fn).type
+            if not (
+                pyarrow.types.is_integer(col_type)
+                or pyarrow.types.is_floating(col_type)
+            ):
+                return False
+        return True
+
     @staticmethod
     def _munge_conflict(name, count):
         return f"{name}_{count+1}"
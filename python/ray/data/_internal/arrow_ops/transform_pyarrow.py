@@ -45,6 +45,15 @@ def take_table(
     return table
 
 
+def filter_table(
+    table: "pyarrow.Table", expression: "pyarrow.dataset.Expression"
+) -> "pyarrow.Table":
+    """Returns the rows of the table for which the expression is true."""
+    import pyarrow.dataset as pds
+
+    return pds.dataset(table).to_table(filter=expression)
+
+
 def unify_schemas(
     schemas: List["pyarrow.Schema"],
 ) -> "pyarrow.Schema":
@@ -1,5 +1,6 @@
-import random
-from typing import Optional, List
+from typing import Optional
+
+import numpy as np
 
 from ray.data.block import Block, BlockAccessor
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
@@ -175,22 +176,22 @@ class ShufflingBatcher(BatcherInterface):
     #
     # This shuffling batcher lazily builds a shuffle buffer from added blocks, and once
     # a batch is requested via .next_batch(), it concatenates the blocks into a concrete
-    # shuffle buffer, generates random shuffle indices, and starts returning shuffled
-    # batches.
+    # shuffle buffer, generates a random permutation of the buffer's row indices with
+    # NumPy, and starts returning shuffled batches by taking the rows at the next
+    # `batch_size` indices of the permutation.
     #
-    # Adding of more blocks can be intermixed with retrieving batches, but it should be
-    # noted that we can end up performing two expensive operations on each retrieval:
-    #  1. Build added blocks into a concrete shuffle buffer.
-    #  2. Generate random shuffle indices.
-    # Note that (1) and (2) only happen when new blocks are added, upon the next
-    # retrieval. I.e., if no new blocks have been added since the last batch retrieval,
-    # and there are still batches in the existing concrete shuffle buffer to be yielded,
-    # then each batch retrieval will only involve slicing the batch out of the concrete
-    # shuffle buffer.
+    # Adding of more blocks can be intermixed with retrieving batches. When new blocks
+    # have been added, the next retrieval appends them to the end of the concrete
+    # shuffle buffer, and shuffles the indices of the not yet yielded rows together
+    # with the indices of the new rows. Rows that were already yielded are left in the
+    # buffer, which is only compacted once they outnumber the rows that weren't
+    # yielded yet, so the buffer isn't re-materialized on every refill.
     #
-    # Similarly, adding blocks is very cheap. Each added block will be appended to a
-    # list, with concatenation of the underlying data delayed until the next batch
-    # retrieval.
+    # Adding blocks is very cheap. Each added block will be appended to a builder, with
+    # concatenation of the underlying data delayed until the next batch retrieval. If
+    # no new blocks have been added since the last batch retrieval, each batch
+    # retrieval will only involve taking the batch rows out of the concrete shuffle
+    # buffer.
     #
     # Since (1) runs of block additions are cheap, and (2) runs of batch retrievals are
     # cheap, callers of ShufflingBatcher are encouraged to add as many blocks as
@@ -231,12 +232,10 @@ class ShufflingBatcher(BatcherInterface):
         self._buffer_min_size = shuffle_buffer_min_size
         self._builder = DelegatingBlockBuilder()
         self._shuffle_buffer: Block = None
-        self._shuffle_indices: List[int] = None
+        self._shuffle_indices: np.ndarray = None
         self._batch_head = 0
         self._done_adding = False
-
-        if shuffle_seed is not None:
-            random.seed(shuffle_seed)
+        self._rng = np.random.default_rng(shuffle_seed)
 
     def add(self, block: Block):
         """Add a block to the shuffle buffer.
@@ -285,13 +284,10 @@ class ShufflingBatcher(BatcherInterface):
         """Return shuffle buffer size."""
         buffer_size = self._builder.num_rows()
         if self._shuffle_buffer is not None:
-            # Include the size of the concrete (materialized) shuffle buffer, adjusting
-            # for the batch head position, which also serves as a counter of the number
-            # of already-yielded rows from the current concrete shuffle buffer.
-            buffer_size += (
-                BlockAccessor.for_block(self._shuffle_buffer).num_rows()
-                - self._batch_head
-            )
+            # Include the not yet yielded rows of the concrete (materialized) shuffle
+            # buffer. The batch head position serves as a counter of the number of
+            # already-yielded shuffle indices.
+            buffer_size += len(self._shuffle_indices) - self._batch_head
         return buffer_size
 
     def next_batch(self) -> Block:
@@ -303,16 +299,28 @@ class ShufflingBatcher(BatcherInterface):
         assert self.has_batch() or (self._done_adding and self.has_any())
         # Add rows in the builder to the shuffle buffer.
         if self._builder.num_rows() > 0:
+            num_new_rows = self._builder.num_rows()
             if self._shuffle_buffer is not None:
-                if self._batch_head > 0:
-                    # Compact the materialized shuffle buffer.
-                    # TODO(Clark): If alternating between adding blocks and fetching
-                    # shuffled batches, this aggressive compaction could be inefficient.
-                    self._shuffle_buffer = BlockAccessor.for_block(
-                        self._shuffle_buffer
-                    ).take(self._shuffle_indices[self._batch_head :])
-                # Add the unyielded rows from the existing shuffle buffer.
+                remaining_indices = self._shuffle_indices[self._batch_head :]
+                accessor = BlockAccessor.for_block(self._shuffle_buffer)
+                if len(remaining_indices) < accessor.num_rows() - len(
+                    remaining_indices
+                ):
+                    # Compact the materialized shuffle buffer once the yielded rows
+                    # outnumber the remaining rows.
+                    self._shuffle_buffer = accessor.take(remaining_indices)
+                    remaining_indices = np.arange(len(remaining_indices))
+                # Append the new rows to the existing shuffle buffer.
+                offset = BlockAccessor.for_block(self._shuffle_buffer).num_rows()
+                new_rows = self._builder.build()
+                self._builder = DelegatingBlockBuilder()
                 self._builder.add_block(self._shuffle_buffer)
+                self._builder.add_block(new_rows)
+                indices = np.concatenate(
+                    [remaining_indices, np.arange(offset, offset + num_new_rows)]
+                )
+            else:
+                indices = np.arange(num_new_rows)
             # Build the new shuffle buffer.
             self._shuffle_buffer = self._builder.build()
             if (
@@ -328,19 +336,15 @@ class ShufflingBatcher(BatcherInterface):
                 )
             # Reset the builder.
             self._builder = DelegatingBlockBuilder()
-            # Invalidate the shuffle indices.
-            self._shuffle_indices = None
+            # Shuffle the remaining rows together with the new rows.
+            self._shuffle_indices = self._rng.permutation(indices)
             self._batch_head = 0
 
         assert self._shuffle_buffer is not None
-        buffer_size = BlockAccessor.for_block(self._shuffle_buffer).num_rows()
         # Truncate the batch to the buffer size, if necessary.
-        batch_size = min(self._batch_size, buffer_size)
-
-        if self._shuffle_indices is None:
-            # Need to generate new shuffle indices.
-            self._shuffle_indices = list(range(buffer_size))
-            random.shuffle(self._shuffle_indices)
+        batch_size = min(
+            self._batch_size, len(self._shuffle_indices) - self._batch_head
+        )
 
         # Get the shuffle indices for this batch.
         batch_indices = self._shuffle_indices[
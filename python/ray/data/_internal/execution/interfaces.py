@@ -367,6 +367,25 @@ class PhysicalOperator(Operator):
         """
         self._inputs_complete = True
 
+    def need_more_inputs(self) -> bool:
+        """Return whether this operator still needs inputs from its upstream operators.
+
+        Operators that can produce all their outputs before consuming all their inputs
+        (e.g., the Limit operator) should override this method. Once no downstream
+        operator needs more inputs, the executor calls `mark_execution_completed()` on
+        the upstream operators.
+        """
+        return not self._inputs_complete
+
+    def mark_execution_completed(self) -> None:
+        """Stop execution of this operator, because its outputs are no longer needed.
+
+        After this is called, no more inputs will be added to this operator. Operators
+        should drop their queued inputs and cancel their outstanding work, so that the
+        operator completes as soon as possible.
+        """
+        self._inputs_complete = True
+
     def has_next(self) -> bool:
         """Returns when a downstream output is available.
 
@@ -239,6 +239,14 @@ class ActorPoolMapOperator(MapOperator):
         # Try to scale pool down.
         self._scale_down_if_needed()
 
+    def mark_execution_completed(self):
+        # Drop the queued bundles. Active tasks are left to finish, since actor tasks
+        # can't be cancelled.
+        self._bundle_queue.clear()
+        self._inputs_done = True
+        self._kill_inactive_workers_if_done()
+        super().mark_execution_completed()
+
     def _kill_inactive_workers_if_done(self):
         if self._inputs_done and not self._bundle_queue:
             # No more tasks will be submitted, so we kill all current and future
@@ -51,6 +51,10 @@ class InputDataBuffer(PhysicalOperator):
     def get_next(self) -> RefBundle:
         return self._input_data.pop(0)
 
+    def mark_execution_completed(self) -> None:
+        self._input_data.clear()
+        super().mark_execution_completed()
+
     def num_outputs_total(self) -> Optional[int]:
         return self._num_outputs
 
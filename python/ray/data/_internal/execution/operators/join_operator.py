@@ -0,0 +1,113 @@
+from typing import List, Optional, Tuple
+
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.join import join_impl
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.execution.interfaces import (
+    RefBundle,
+    PhysicalOperator,
+)
+
+
+class JoinOperator(PhysicalOperator):
+    """An operator that joins its inputs on a set of key columns.
+
+    NOTE: the implementation is bulk for now, which materializes all its inputs in
+    object store, before starting execution.
+    """
+
+    def __init__(
+        self,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        on: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            on: The columns to join on.
+            how: The type of join, one of "inner", "left", "right" or "outer".
+            suffixes: The suffixes to add to overlapping non-key column names from
+                the left and right hand side.
+        """
+        self._on = on
+        self._how = how
+        self._suffixes = suffixes
+        self._left_buffer: List[RefBundle] = []
+        self._right_buffer: List[RefBundle] = []
+        self._output_buffer: List[RefBundle] = []
+        self._stats: StatsDict = {}
+        super().__init__("Join", [left_input_op, right_input_op])
+
+    def num_outputs_total(self) -> Optional[int]:
+        # The number of outputs depends on whether the join broadcasts one side.
+        return None
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._left_buffer.append(refs)
+        else:
+            self._right_buffer.append(refs)
+
+    def inputs_done(self) -> None:
+        self._output_buffer, self._stats = self._join(
+            self._left_buffer, self._right_buffer
+        )
+        self._left_buffer.clear()
+        self._right_buffer.clear()
+        super().inputs_done()
+
+    def has_next(self) -> bool:
+        return len(self._output_buffer) > 0
+
+    def get_next(self) -> RefBundle:
+        return self._output_buffer.pop(0)
+
+    def get_stats(self) -> StatsDict:
+        return self._stats
+
+    def _join(
+        self, left_input: List[RefBundle], right_input: List[RefBundle]
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        """Join the RefBundles from `left_input` with the ones from `right_input`.
+
+        See `ray.data._internal.join` for the implementation.
+        """
+        left_blocks = _to_block_list(left_input)
+        right_blocks = _to_block_list(right_input)
+        output_blocks, stats = join_impl(
+            left_blocks,
+            right_blocks,
+            False,
+            self._on,
+            self._how,
+            self._suffixes,
+        )
+        output_refs = [
+            RefBundle([(block, meta)], owns_blocks=True)
+            for block, meta in output_blocks.get_blocks_with_metadata()
+        ]
+
+        # Clean up inputs.
+        for ref in left_input:
+            ref.destroy_if_owned()
+        for ref in right_input:
+            ref.destroy_if_owned()
+
+        return output_refs, stats
+
+
+def _to_block_list(bundles: List[RefBundle]) -> BlockList:
+    blocks, metadata = [], []
+    for bundle in bundles:
+        for block, meta in bundle.blocks:
+            blocks.append(block)
+            metadata.append(meta)
+    owned_by_consumer = all(bundle.owns_blocks for bundle in bundles)
+    return BlockList(blocks, metadata, owned_by_consumer=owned_by_consumer)
@@ -0,0 +1,109 @@
+import math
+from typing import List, Optional
+
+from ray.data.block import Block, BlockAccessor, BlockMetadata
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.execution.interfaces import (
+    RefBundle,
+    PhysicalOperator,
+)
+from ray.types import ObjectRef
+
+
+class LimitOperator(PhysicalOperator):
+    """An operator that passes through the first `limit` rows of its input.
+
+    Once the limit is reached, the operator stops accepting inputs, which lets the
+    executor mark its upstream operators as completed and cancel their outstanding
+    tasks (see `PhysicalOperator.need_more_inputs()`).
+    """
+
+    def __init__(self, limit: int, input_op: PhysicalOperator):
+        """Create a LimitOperator.
+
+        Args:
+            limit: The maximum number of rows to output.
+            input_op: The upstream operator.
+        """
+        self._limit = limit
+        self._consumed_rows = 0
+        self._buffer: List[RefBundle] = []
+        self._output_metadata: List[BlockMetadata] = []
+        super().__init__(f"Limit[limit={limit}]", [input_op])
+
+    def _limit_reached(self) -> bool:
+        return self._consumed_rows >= self._limit
+
+    def need_more_inputs(self) -> bool:
+        return not self._limit_reached() and super().need_more_inputs()
+
+    def completed(self) -> bool:
+        if self._limit_reached():
+            return not self.has_next()
+        return super().completed()
+
+    def num_outputs_total(self) -> Optional[int]:
+        # The upstream number of outputs is only an upper bound once the limit is
+        # reached.
+        if self._limit_reached():
+            return len(self._output_metadata) + len(self._buffer)
+        return super().num_outputs_total()
+
+    def throttling_disabled(self) -> bool:
+        # Truncating blocks only submits a task for the last block, so there is no
+        # need to throttle this operator.
+        return True
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert input_index == 0, input_index
+        if self._limit_reached():
+            # Inputs that were in flight when the limit was reached.
+            return
+        out_blocks: List[ObjectRef[Block]] = []
+        out_meta: List[BlockMetadata] = []
+        for block, meta in refs.blocks:
+            assert meta.num_rows is not None, meta
+            num_rows_left = self._limit - self._consumed_rows
+            if meta.num_rows > num_rows_left:
+                block, meta = _truncate_block(block, meta, num_rows_left)
+            out_blocks.append(block)
+            out_meta.append(meta)
+            self._consumed_rows += meta.num_rows
+            if self._limit_reached():
+                break
+        self._buffer.append(
+            RefBundle(list(zip(out_blocks, out_meta)), owns_blocks=refs.owns_blocks)
+        )
+
+    def has_next(self) -> bool:
+        return len(self._buffer) > 0
+
+    def get_next(self) -> RefBundle:
+        bundle = self._buffer.pop(0)
+        self._output_metadata.extend(meta for _, meta in bundle.blocks)
+        return bundle
+
+    def get_stats(self) -> StatsDict:
+        return {self._name: self._output_metadata}
+
+
+def _truncate_block(
+    b: ObjectRef[Block], m: BlockMetadata, num_rows: int
+) -> (ObjectRef[Block], BlockMetadata):
+    truncate_single_block = cached_remote_fn(_truncate_single_block)
+    size_bytes = None
+    if m.size_bytes is not None:
+        size_bytes = int(math.floor(m.size_bytes * (num_rows / m.num_rows)))
+    meta = BlockMetadata(
+        num_rows=num_rows,
+        size_bytes=size_bytes,
+        schema=m.schema,
+        input_files=m.input_files,
+        exec_stats=None,
+    )
+    return truncate_single_block.remote(b, num_rows), meta
+
+
+def _truncate_single_block(b: Block, num_rows: int) -> Block:
+    return BlockAccessor.for_block(b).slice(0, num_rows, copy=True)
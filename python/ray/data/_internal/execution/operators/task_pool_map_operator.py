@@ -65,6 +65,16 @@ class TaskPoolMapOperator(MapOperator):
         task.output = self._map_ref_to_ref_bundle(ref)
         self._handle_task_done(task)
 
+    def mark_execution_completed(self):
+        # Cancel all active tasks, since their outputs are no longer needed. The
+        # cancellation isn't forced, so the workers are kept for the following
+        # operators. The cancelled tasks aren't awaited on shutdown, since tasks
+        # that are already running may not be interrupted.
+        for task in self.get_work_refs():
+            ray.cancel(task)
+        self._tasks.clear()
+        super().mark_execution_completed()
+
     def shutdown(self):
         task_refs = self.get_work_refs()
         # Cancel all active tasks.
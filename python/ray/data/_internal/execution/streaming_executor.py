@@ -2,7 +2,7 @@ import threading
 import time
 import os
 import uuid
-from typing import Iterator, Optional
+from typing import Dict, Iterator, Optional
 
 import ray
 from ray.data.context import DataContext
@@ -20,8 +20,11 @@ from ray.data._internal.execution.streaming_executor_state import (
     AutoscalingState,
     Topology,
     TopologyResourceUsage,
+    OpMemoryBudget,
     OpState,
+    attribute_spilled_bytes,
     build_streaming_topology,
+    compute_memory_budgets,
     process_completed_tasks,
     select_operator_to_run,
     DEFAULT_OBJECT_STORE_MEMORY_LIMIT_FRACTION,
@@ -41,6 +44,13 @@ DEBUG_TRACE_SCHEDULING = "RAY_DATA_TRACE_SCHEDULING" in os.environ
 # progress bar seeming to stall for very large scale workloads.
 PROGRESS_BAR_UPDATE_INTERVAL = 50
 
+# Min number of seconds between two queries of the object store spilling of the
+# cluster, when operator memory budgets are enabled.
+SPILLED_BYTES_REFRESH_INTERVAL_S = 5
+
+# Timeout of a single query of the object store spilling of the cluster.
+SPILLED_BYTES_QUERY_TIMEOUT_S = 3
+
 
 class StreamingExecutor(Executor, threading.Thread):
     """A streaming Datastream executor.
@@ -59,6 +69,15 @@ class StreamingExecutor(Executor, threading.Thread):
         self._execution_id = uuid.uuid4().hex
         self._autoscaling_state = AutoscalingState()
 
+        # Per-operator memory budgets, and the object store spilling of the cluster
+        # to attribute to the operators over budget.
+        self._memory_budgets_enabled = (
+            DataContext.get_current().enable_operator_memory_budgets
+        )
+        self._memory_budgets: Dict[PhysicalOperator, OpMemoryBudget] = {}
+        self._spilled_bytes_total: Optional[int] = None
+        self._spilled_bytes_poller: Optional[_SpilledBytesPoller] = None
+
         # The executor can be shutdown while still running.
         self._shutdown_lock = threading.RLock()
         self._shutdown = False
@@ -138,6 +157,8 @@ class StreamingExecutor(Executor, threading.Thread):
             self._shutdown = True
             # Give the scheduling loop some time to finish processing.
             self.join(timeout=2.0)
+            if self._spilled_bytes_poller:
+                self._spilled_bytes_poller.stop()
             # Freeze the stats and save it.
             self._final_stats = self._generate_stats()
             stats_summary_string = self._final_stats.to_summary().to_string(
@@ -193,6 +214,15 @@ class StreamingExecutor(Executor, threading.Thread):
             builder = stats.child_builder(op.name, override_start_time=self._start_time)
             stats = builder.build_multistage(op.get_stats())
             stats.extra_metrics = op.get_metrics()
+            if self._memory_budgets_enabled:
+                stats.extra_metrics = dict(stats.extra_metrics)
+                if op in self._memory_budgets:
+                    stats.extra_metrics["obj_store_mem_budget"] = self._memory_budgets[
+                        op
+                    ].budget
+                stats.extra_metrics["obj_store_mem_spilled"] = self._topology[
+                    op
+                ].spilled_bytes
         return stats
 
     def _scheduling_loop_step(self, topology: Topology) -> bool:
@@ -219,6 +249,9 @@ class StreamingExecutor(Executor, threading.Thread):
         limits = self._get_or_refresh_resource_limits()
         cur_usage = TopologyResourceUsage.of(topology)
         self._report_current_usage(cur_usage, limits)
+        memory_budgets = self._get_memory_budgets(topology, limits)
+        if memory_budgets is not None:
+            self._refresh_spilled_bytes(topology)
         op = select_operator_to_run(
             topology,
             cur_usage,
@@ -226,6 +259,7 @@ class StreamingExecutor(Executor, threading.Thread):
             ensure_at_least_one_running=self._consumer_idling(),
             execution_id=self._execution_id,
             autoscaling_state=self._autoscaling_state,
+            memory_budgets=memory_budgets,
         )
         i = 0
         while op is not None:
@@ -243,6 +277,7 @@ class StreamingExecutor(Executor, threading.Thread):
                 ensure_at_least_one_running=self._consumer_idling(),
                 execution_id=self._execution_id,
                 autoscaling_state=self._autoscaling_state,
+                memory_budgets=self._get_memory_budgets(topology, limits),
             )
 
         # Update the progress bar to reflect scheduling decisions.
@@ -276,6 +311,40 @@ class StreamingExecutor(Executor, threading.Thread):
             ),
         )
 
+    def _get_memory_budgets(
+        self, topology: Topology, limits: ExecutionResources
+    ) -> Optional[Dict[PhysicalOperator, OpMemoryBudget]]:
+        """Return the current memory budgets of the operators, if enabled."""
+        if not self._memory_budgets_enabled:
+            return None
+        self._memory_budgets = compute_memory_budgets(topology, limits)
+        return self._memory_budgets
+
+    def _refresh_spilled_bytes(self, topology: Topology) -> None:
+        """Attribute the object store memory spilled in the cluster since the last
+        refresh to the operators that are over their memory budget.
+
+        Note that Ray doesn't track which objects are spilled, so this is only an
+        estimate, which also includes the spilling caused by other workloads running
+        in the cluster.
+        """
+        if self._spilled_bytes_poller is None:
+            self._spilled_bytes_poller = _SpilledBytesPoller(
+                ray.get_runtime_context().gcs_address,
+                ray.get_runtime_context().get_node_id(),
+            )
+            self._spilled_bytes_poller.start()
+        spilled_bytes_total = self._spilled_bytes_poller.spilled_bytes_total
+        if spilled_bytes_total is None:
+            return
+        if self._spilled_bytes_total is not None:
+            attribute_spilled_bytes(
+                topology,
+                self._memory_budgets,
+                spilled_bytes_total - self._spilled_bytes_total,
+            )
+        self._spilled_bytes_total = spilled_bytes_total
+
     def _report_current_usage(
         self, cur_usage: TopologyResourceUsage, limits: ExecutionResources
     ) -> None:
@@ -290,6 +359,80 @@ class StreamingExecutor(Executor, threading.Thread):
             self._global_info.set_description(resources_status)
 
 
+class _SpilledBytesPoller(threading.Thread):
+    """Polls the object store spilling of the cluster in a daemon thread.
+
+    The query is fanned out by the raylet to all nodes in the cluster, so it
+    must not block the scheduling loop, which reads the last polled value instead.
+    """
+
+    def __init__(self, gcs_address: str, node_id: str):
+        threading.Thread.__init__(self, name="SpilledBytesPoller", daemon=True)
+        self._gcs_address = gcs_address
+        self._node_id = node_id
+        self._stop_event = threading.Event()
+        self._stub = None
+        # The total object store memory spilled in the cluster as of the last
+        # successful query, or None if it wasn't queried yet.
+        self.spilled_bytes_total: Optional[int] = None
+
+    def run(self):
+        while not self._stop_event.is_set():
+            spilled_bytes_total = self._query()
+            if spilled_bytes_total is not None:
+                self.spilled_bytes_total = spilled_bytes_total
+            self._stop_event.wait(SPILLED_BYTES_REFRESH_INTERVAL_S)
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _query(self) -> Optional[int]:
+        from ray.core.generated import node_manager_pb2
+
+        try:
+            if self._stub is None:
+                self._stub = self._connect()
+            reply = self._stub.FormatGlobalMemoryInfo(
+                node_manager_pb2.FormatGlobalMemoryInfoRequest(
+                    include_memory_info=False
+                ),
+                timeout=SPILLED_BYTES_QUERY_TIMEOUT_S,
+            )
+            return reply.store_stats.spilled_bytes_total
+        except Exception:
+            logger.get_logger(log_to_stdout=False).debug(
+                "Failed to query the object store spilling of the cluster.",
+                exc_info=True,
+            )
+            # Reconnect on the next query, the raylet may have died.
+            self._stub = None
+            return None
+
+    def _connect(self):
+        """Connect to the raylet of this node, or any other alive raylet."""
+        from ray._private.internal_api import (
+            MAX_MESSAGE_LENGTH,
+            get_state_from_address,
+        )
+        from ray._private.utils import init_grpc_channel
+        from ray.core.generated import node_manager_pb2_grpc
+
+        state = get_state_from_address(self._gcs_address)
+        try:
+            nodes = [node for node in state.node_table() if node["Alive"]]
+        finally:
+            state.disconnect()
+        nodes.sort(key=lambda node: node["NodeID"] != self._node_id)
+        channel = init_grpc_channel(
+            f"{nodes[0]['NodeManagerAddress']}:{nodes[0]['NodeManagerPort']}",
+            options=[
+                ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+                ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+            ],
+        )
+        return node_manager_pb2_grpc.NodeManagerServiceStub(channel)
+
+
 def _validate_dag(dag: PhysicalOperator, limits: ExecutionResources) -> None:
     """Raises an exception on invalid DAGs.
 
@@ -96,6 +96,22 @@ class DownstreamMemoryInfo:
     object_store_memory: float
 
 
+@dataclass
+class OpMemoryBudget:
+    """The share of the object store memory limit assigned to an operator."""
+
+    # The object store memory the operator may use once the topology is at its
+    # memory limit.
+    budget: int
+
+    # The object store memory used by the operator and its outqueue.
+    usage: int
+
+    # The expected object store memory of the outputs of the next task dispatched
+    # to the operator.
+    expected_task_output: int
+
+
 class OpState:
     """The execution state tracked for each PhysicalOperator.
 
@@ -121,6 +137,12 @@ class OpState:
         self.progress_bar = None
         self.num_completed_tasks = 0
         self.inputs_done_called = False
+        # The total size of the bundles dispatched to and produced by the operator,
+        # used to estimate the size of its outputs.
+        self.input_bytes = 0
+        self.output_bytes = 0
+        # The estimated object store memory spilled because of this operator.
+        self.spilled_bytes = 0
 
     def initialize_progress_bars(self, index: int, verbose_progress: bool) -> int:
         """Create progress bars at the given index (line offset in console).
@@ -164,6 +186,7 @@ class OpState:
         """Move a bundle produced by the operator to its outqueue."""
         self.outqueue.append(ref)
         self.num_completed_tasks += 1
+        self.output_bytes += ref.size_bytes()
         if self.progress_bar:
             self.progress_bar.update(1)
 
@@ -181,6 +204,8 @@ class OpState:
             + self.inqueue_memory_usage()
         )
         desc += f", {mem} objects"
+        if self.spilled_bytes:
+            desc += f", {memory_string(self.spilled_bytes)} spilled"
         suffix = self.op.progress_str()
         if suffix:
             desc += f", {suffix}"
@@ -190,7 +215,9 @@ class OpState:
         """Move a bundle from the operator inqueue to the operator itself."""
         for i, inqueue in enumerate(self.inqueues):
             if inqueue:
-                self.op.add_input(inqueue.popleft(), input_index=i)
+                ref = inqueue.popleft()
+                self.input_bytes += ref.size_bytes()
+                self.op.add_input(ref, input_index=i)
                 return
         assert False, "Nothing to dispatch"
 
@@ -237,6 +264,28 @@ class OpState:
         """Return the object store memory of this operator's outqueue."""
         return self._queue_memory_usage(self.outqueue)
 
+    def memory_usage(self) -> int:
+        """Return the object store memory of this operator and its outqueue."""
+        return (
+            self.op.current_resource_usage().object_store_memory or 0
+        ) + self.outqueue_memory_usage()
+
+    def output_size_ratio(self) -> float:
+        """Return the observed ratio of the output size to the input size of this
+        operator, or 1 if it hasn't been observed yet."""
+        if not self.input_bytes or not self.output_bytes:
+            return 1.0
+        return self.output_bytes / self.input_bytes
+
+    def expected_task_output_bytes(self) -> int:
+        """Estimate the object store memory of the outputs of the next task."""
+        for inqueue in self.inqueues:
+            try:
+                return round(inqueue[0].size_bytes() * self.output_size_ratio())
+            except IndexError:
+                continue
+        return 0
+
     def _queue_memory_usage(self, queue: Deque[RefBundle]) -> int:
         """Sum the object store memory usage in this queue.
 
@@ -332,6 +381,26 @@ def process_completed_tasks(topology: Topology) -> None:
         while op.has_next():
             op_state.add_output(op.get_next())
 
+    # Stop ops whose outputs are no longer needed by any downstream op (e.g., when a
+    # Limit op has reached its limit). Ops are visited in reverse topological order,
+    # so this is propagated all the way up to the input ops.
+    downstream_ops: Dict[PhysicalOperator, List[PhysicalOperator]] = {
+        op: [] for op in topology
+    }
+    for op in topology:
+        for dep in op.input_dependencies:
+            downstream_ops[dep].append(op)
+    for op, op_state in reversed(list(topology.items())):
+        if downstream_ops[op] and not any(
+            dep.need_more_inputs() for dep in downstream_ops[op]
+        ):
+            if not op_state.inputs_done_called:
+                op.mark_execution_completed()
+                op_state.inputs_done_called = True
+                for inqueue in op_state.inqueues:
+                    inqueue.clear()
+            op_state.outqueue.clear()
+
     # Call inputs_done() on ops where no more inputs are coming.
     for op, op_state in topology.items():
         inputs_done = all(
@@ -345,6 +414,74 @@ def process_completed_tasks(topology: Topology) -> None:
             op_state.inputs_done_called = True
 
 
+def compute_memory_budgets(
+    topology: Topology, limits: ExecutionResources
+) -> Dict[PhysicalOperator, OpMemoryBudget]:
+    """Split the object store memory limit into a budget for each operator.
+
+    The budget of an operator is proportional to the expected size of its inputs and
+    outputs, relative to the size of the input data of the topology. The outputs of
+    an operator are expected to be `output_size_ratio()` times the size of its
+    inputs, which compounds along the DAG: e.g., for an `InputDataBuffer -> Read ->
+    Decode -> Resize` topology whose decoded data is 10x the size of the read data,
+    and whose resized data is 0.2x the size of the decoded data, the operators get
+    (1 + 1), (1 + 10) and (10 + 2) shares of the limit respectively.
+
+    Args:
+        topology: The topology to compute the budgets for.
+        limits: The execution resource limits.
+
+    Returns:
+        The memory budget of each operator, excluding input buffers.
+    """
+    if limits.object_store_memory is None:
+        return {}
+    # The expected size of the outputs of each operator, relative to the size of
+    # the input data. Note that the topology is in topological sort order.
+    output_scales: Dict[PhysicalOperator, float] = {}
+    weights: Dict[PhysicalOperator, float] = {}
+    for op, state in topology.items():
+        if isinstance(op, InputDataBuffer):
+            output_scales[op] = 1.0
+            continue
+        input_scale = sum(output_scales[dep] for dep in op.input_dependencies)
+        output_scales[op] = input_scale * state.output_size_ratio()
+        weights[op] = input_scale + output_scales[op]
+    total_weight = sum(weights.values())
+    budgets = {}
+    for op, weight in weights.items():
+        state = topology[op]
+        budgets[op] = OpMemoryBudget(
+            budget=round(limits.object_store_memory * weight / total_weight),
+            usage=state.memory_usage(),
+            expected_task_output=state.expected_task_output_bytes(),
+        )
+    return budgets
+
+
+def attribute_spilled_bytes(
+    topology: Topology,
+    memory_budgets: Dict[PhysicalOperator, OpMemoryBudget],
+    spilled_bytes: int,
+) -> None:
+    """Attribute newly spilled object store memory to the operators of a topology.
+
+    The spilled bytes are split between the operators that are over their memory
+    budget, proportionally to how much they are over budget. If no operator is
+    over budget, they're split proportionally to the memory usage of the operators.
+    """
+    if spilled_bytes <= 0 or not memory_budgets:
+        return
+    weights = {op: max(0, b.usage - b.budget) for op, b in memory_budgets.items()}
+    if not any(weights.values()):
+        weights = {op: b.usage for op, b in memory_budgets.items()}
+    total_weight = sum(weights.values())
+    if not total_weight:
+        return
+    for op, weight in weights.items():
+        topology[op].spilled_bytes += round(spilled_bytes * weight / total_weight)
+
+
 def select_operator_to_run(
     topology: Topology,
     cur_usage: TopologyResourceUsage,
@@ -352,6 +489,7 @@ def select_operator_to_run(
     ensure_at_least_one_running: bool,
     execution_id: str,
     autoscaling_state: AutoscalingState,
+    memory_budgets: Optional[Dict[PhysicalOperator, OpMemoryBudget]] = None,
 ) -> Optional[PhysicalOperator]:
     """Select an operator to run, if possible.
 
@@ -365,13 +503,22 @@ def select_operator_to_run(
     Note that memory limits also apply to the outqueue of the output operator. This
     provides backpressure if the consumer is slow. However, once a bundle is returned
     to the user, it is no longer tracked.
+
+    If `memory_budgets` are given (see `compute_memory_budgets()`), operators are
+    throttled on object store memory based on their own budget instead of the memory
+    usage downstream of them.
     """
     assert isinstance(cur_usage, TopologyResourceUsage), cur_usage
 
     # Filter to ops that are eligible for execution.
     ops = []
     for op, state in topology.items():
-        under_resource_limits = _execution_allowed(op, cur_usage, limits)
+        under_resource_limits = _execution_allowed(
+            op,
+            cur_usage,
+            limits,
+            memory_budgets.get(op) if memory_budgets is not None else None,
+        )
         if state.num_queued() > 0 and op.should_add_input() and under_resource_limits:
             ops.append(op)
         # Update the op in all cases to enable internal autoscaling, etc.
@@ -462,6 +609,7 @@ def _execution_allowed(
     op: PhysicalOperator,
     global_usage: TopologyResourceUsage,
     global_limits: ExecutionResources,
+    memory_budget: Optional[OpMemoryBudget] = None,
 ) -> bool:
     """Return whether an operator is allowed to execute given resource usage.
 
@@ -473,10 +621,16 @@ def _execution_allowed(
     k/N * global_limit; i.e., the N - k operator sub-DAG is using more object store
     memory than it's share.
 
+    If the operator has a memory budget, the expected output of its next task is
+    counted towards the object store utilization, so that it's throttled before the
+    global limit is exceeded. Once it would be exceeded, the operator is only
+    throttled if its own memory usage is over its budget.
+
     Args:
         op: The operator to check.
         global_usage: Resource usage across the entire topology.
         global_limits: Execution resource limits.
+        memory_budget: The memory budget of the operator, if any.
 
     Returns:
         Whether the op is allowed to run.
@@ -512,6 +666,10 @@ def _execution_allowed(
 
     # Under global limits; always allow.
     new_usage = global_floored.add(inc_indicator)
+    if memory_budget is not None:
+        new_usage = new_usage.add(
+            ExecutionResources(object_store_memory=memory_budget.expected_task_output)
+        )
     if new_usage.satisfies_limit(global_limits):
         return True
 
@@ -523,6 +681,15 @@ def _execution_allowed(
         cpu=global_limits.cpu, gpu=global_limits.gpu
     )
     global_ok_sans_memory = new_usage.satisfies_limit(global_limits_sans_memory)
+    if memory_budget is not None:
+        # Always allow an operator without memory usage to run, so that it can't be
+        # starved by a budget smaller than the outputs of a single task.
+        budget_ok = (
+            memory_budget.usage == 0
+            or memory_budget.usage + memory_budget.expected_task_output
+            <= memory_budget.budget
+        )
+        return global_ok_sans_memory and budget_ok
     downstream_usage = global_usage.downstream_memory_usage[op]
     downstream_limit = global_limits.scale(downstream_usage.topology_fraction)
     downstream_memory_ok = ExecutionResources(
@@ -0,0 +1,281 @@
+"""
+We implement a distributed hash join. Joining is done in 2 stages: partitioning
+both sides by the join key, and joining the co-located partitions.
+
+Partitioning: each side is hash partitioned on the join key into the same number
+of partitions with an all-to-all shuffle, so that all rows with a given key end up
+in the partitions with the same index on both sides.
+
+Joining: a join task receives the partitions with the same index from both sides,
+and joins them locally.
+
+If one side is small enough (see `DataContext.broadcast_join_threshold_bytes`),
+the shuffle is skipped and the small side is instead broadcast to a join task for
+each block of the other side.
+"""
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from ray.data._internal.block_list import BlockList
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.progress_bar import ProgressBar
+from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+from ray.types import ObjectRef
+
+if TYPE_CHECKING:
+    import pandas
+
+JOIN_TYPES = ("inner", "left", "right", "outer")
+
+
+class _HashPartitionOp(ShuffleOp):
+    """
+    Operator used to hash partition both sides of a join on the join key.
+    """
+
+    def __init__(self, key: List[str]):
+        super().__init__(map_args=[key])
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        accessor = BlockAccessor.for_block(block)
+        out = accessor.hash_partition(key, output_num_blocks)
+        meta = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+        return out + [meta]
+
+    @staticmethod
+    def reduce(
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> (Block, BlockMetadata):
+        return _concat_blocks(*mapper_outputs)
+
+
+class SimpleHashPartitionOp(_HashPartitionOp, SimpleShufflePlan):
+    pass
+
+
+class PushBasedHashPartitionOp(_HashPartitionOp, PushBasedShufflePlan):
+    pass
+
+
+def validate_join_args(on: Union[str, List[str]], how: str) -> List[str]:
+    """Validate the arguments of a join, and return the join key as a list."""
+    if how not in JOIN_TYPES:
+        raise ValueError(f"Join type must be one of {JOIN_TYPES}, got: {how}")
+    if isinstance(on, str):
+        on = [on]
+    if not on or not all(isinstance(col, str) for col in on):
+        raise ValueError(
+            f"Join key must be a column name or a list of column names, got: {on}"
+        )
+    return list(on)
+
+
+def join_impl(
+    left: BlockList,
+    right: BlockList,
+    clear_input_blocks: bool,
+    on: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+) -> Tuple[BlockList, dict]:
+    """Join the blocks of `left` with the blocks of `right` on the `on` columns."""
+    owned_by_consumer = left._owned_by_consumer
+    left_blocks_with_metadata = left.get_blocks_with_metadata()
+    right_blocks_with_metadata = right.get_blocks_with_metadata()
+    if len(left_blocks_with_metadata) == 0 and len(right_blocks_with_metadata) == 0:
+        return BlockList([], [], owned_by_consumer=owned_by_consumer), {}
+
+    broadcast_side = _choose_broadcast_side(
+        left_blocks_with_metadata, right_blocks_with_metadata, how
+    )
+    join_blocks = cached_remote_fn(_join_blocks, num_returns=2)
+    stats = {}
+    if broadcast_side is not None:
+        if broadcast_side == "right":
+            small, big = right_blocks_with_metadata, left_blocks_with_metadata
+        else:
+            small, big = left_blocks_with_metadata, right_blocks_with_metadata
+        # Concatenate the small side once, and pass the same block to every join
+        # task.
+        concat_blocks = cached_remote_fn(_concat_blocks, num_returns=2)
+        small_block, _ = concat_blocks.remote(*[b for b, _ in small])
+        pairs = []
+        for block, _ in big:
+            if broadcast_side == "right":
+                pairs.append(([block], [small_block]))
+            else:
+                pairs.append(([small_block], [block]))
+        del small, big
+    else:
+        num_partitions = max(
+            len(left_blocks_with_metadata), len(right_blocks_with_metadata)
+        )
+        left_partitions = _hash_partition(
+            left,
+            len(left_blocks_with_metadata),
+            num_partitions,
+            clear_input_blocks,
+            on,
+            stats,
+            "left",
+        )
+        right_partitions = _hash_partition(
+            right,
+            len(right_blocks_with_metadata),
+            num_partitions,
+            clear_input_blocks,
+            on,
+            stats,
+            "right",
+        )
+        del left_blocks_with_metadata, right_blocks_with_metadata
+        pairs = list(zip(left_partitions, right_partitions))
+        del left_partitions, right_partitions
+    if clear_input_blocks:
+        left.clear()
+        right.clear()
+
+    out_blocks = []
+    out_metadata = []
+    for left_blocks, right_blocks in pairs:
+        block, meta = join_blocks.remote(
+            on, how, suffixes, len(left_blocks), *left_blocks, *right_blocks
+        )
+        out_blocks.append(block)
+        out_metadata.append(meta)
+    # Early release memory.
+    del pairs
+
+    join_bar = ProgressBar("Join", total=len(out_metadata))
+    out_metadata = join_bar.fetch_until_complete(out_metadata)
+    join_bar.close()
+    stats["join"] = out_metadata
+    return (
+        BlockList(out_blocks, out_metadata, owned_by_consumer=owned_by_consumer),
+        stats,
+    )
+
+
+def _choose_broadcast_side(
+    left: List[Tuple[ObjectRef[Block], BlockMetadata]],
+    right: List[Tuple[ObjectRef[Block], BlockMetadata]],
+    how: str,
+) -> Optional[str]:
+    """Return the side to broadcast to the other side's blocks, if any.
+
+    Only a side whose unmatched rows are dropped can be broadcast, since each join
+    task only sees part of the other side.
+    """
+    threshold = DataContext.get_current().broadcast_join_threshold_bytes
+    candidates = {
+        "inner": ["left", "right"],
+        "left": ["right"],
+        "right": ["left"],
+        "outer": [],
+    }[how]
+    sizes = {"left": _size_bytes(left), "right": _size_bytes(right)}
+    candidates = [
+        side
+        for side in candidates
+        if sizes[side] is not None and sizes[side] < threshold
+    ]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda side: sizes[side])
+
+
+def _size_bytes(
+    blocks_with_metadata: List[Tuple[ObjectRef[Block], BlockMetadata]]
+) -> Optional[int]:
+    size_bytes = 0
+    for _, meta in blocks_with_metadata:
+        if meta.size_bytes is None:
+            return None
+        size_bytes += meta.size_bytes
+    return size_bytes
+
+
+def _hash_partition(
+    blocks: BlockList,
+    num_blocks: int,
+    num_partitions: int,
+    clear_input_blocks: bool,
+    on: List[str],
+    stats: dict,
+    side: str,
+) -> List[List[ObjectRef[Block]]]:
+    """Hash partition `blocks` on `on`, returning the blocks of each partition."""
+    if num_blocks == 0:
+        return [[] for _ in range(num_partitions)]
+    if DataContext.get_current().use_push_based_shuffle:
+        partition_op_cls = PushBasedHashPartitionOp
+    else:
+        partition_op_cls = SimpleHashPartitionOp
+    partition_op = partition_op_cls(on)
+    partitions, partition_stats = partition_op.execute(
+        blocks, num_partitions, clear_input_blocks
+    )
+    for name, metadata in partition_stats.items():
+        stats[f"{side}_{name}"] = metadata
+    return [[block] for block in partitions.get_blocks()]
+
+
+def _concat_blocks(*blocks: List[Block]) -> (Block, BlockMetadata):
+    stats = BlockExecStats.builder()
+    builder = DelegatingBlockBuilder()
+    for block in blocks:
+        builder.add_block(block)
+    new_block = builder.build()
+    accessor = BlockAccessor.for_block(new_block)
+    new_metadata = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+    return new_block, new_metadata
+
+
+def _join_blocks(
+    on: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+    num_left_blocks: int,
+    *blocks: List[Block],
+) -> (Block, BlockMetadata):
+    """Join the first `num_left_blocks` blocks with the remaining blocks."""
+    import pandas as pd
+
+    stats = BlockExecStats.builder()
+    left, _ = _concat_blocks(*blocks[:num_left_blocks])
+    right, _ = _concat_blocks(*blocks[num_left_blocks:])
+    left_acc = BlockAccessor.for_block(left)
+    right_acc = BlockAccessor.for_block(right)
+    left_df = _to_pandas(left_acc, on)
+    right_df = _to_pandas(right_acc, on)
+    out = pd.merge(left_df, right_df, how=how, on=on, suffixes=suffixes)
+    out.reset_index(drop=True, inplace=True)
+    out = BlockAccessor.for_block(out)
+    if isinstance(left, pd.DataFrame) and isinstance(right, pd.DataFrame):
+        new_block = out.to_block()
+    else:
+        new_block = out.to_arrow()
+    accessor = BlockAccessor.for_block(new_block)
+    new_metadata = accessor.get_metadata(input_files=None, exec_stats=stats.build())
+    return new_block, new_metadata
+
+
+def _to_pandas(accessor: BlockAccessor, on: List[str]) -> "pandas.DataFrame":
+    import pandas as pd
+
+    df = accessor.to_pandas()
+    if accessor.num_rows() == 0 and not all(col in df.columns for col in on):
+        # An empty block may not have a schema.
+        return pd.DataFrame(columns=on)
+    return df
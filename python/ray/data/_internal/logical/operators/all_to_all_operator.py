@@ -91,6 +91,7 @@ class Sort(AbstractAllToAll):
         input_op: LogicalOperator,
         key: Optional[KeyFn],
         descending: bool,
+        split_hot_keys: Optional[bool] = None,
     ):
         super().__init__(
             "Sort",
@@ -98,6 +99,7 @@ class Sort(AbstractAllToAll):
         )
         self._key = key
         self._descending = descending
+        self._split_hot_keys = split_hot_keys
 
 
 class Aggregate(AbstractAllToAll):
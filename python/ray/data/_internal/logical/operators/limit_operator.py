@@ -0,0 +1,18 @@
+from ray.data._internal.logical.interfaces import LogicalOperator
+
+
+class Limit(LogicalOperator):
+    """Logical operator for limit."""
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        limit: int,
+    ):
+        """
+        Args:
+            input_op: The operator preceding this operator in the plan DAG.
+            limit: The maximum number of rows to output.
+        """
+        super().__init__("Limit", [input_op])
+        self._limit = limit
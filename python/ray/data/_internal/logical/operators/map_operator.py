@@ -1,10 +1,13 @@
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.compute import UDF, ComputeStrategy, TaskPoolStrategy
 from ray.data.block import BatchUDF, RowUDF
 from ray.data.context import DEFAULT_BATCH_SIZE
 
+if TYPE_CHECKING:
+    import pyarrow
+
 
 class AbstractMap(LogicalOperator):
     """Abstract class for logical operators that should be converted to physical
@@ -110,6 +113,72 @@ class MapBatches(AbstractUDFMap):
         self._zero_copy_batch = zero_copy_batch
 
 
+class Project(MapBatches):
+    """Logical operator for select_columns and drop_columns.
+
+    It's executed as a MapBatches of `fn`, but also records the projected
+    columns so that the optimizer can push the projection down into the read.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        fn: BatchUDF,
+        cols: List[str],
+        drop: bool = False,
+        batch_format: Optional[str] = "default",
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            input_op: The operator preceding this operator in the plan DAG.
+            fn: The batch function selecting or dropping the columns.
+            cols: The columns to select, or to drop if `drop` is True.
+            drop: Whether `cols` are dropped rather than selected.
+            batch_format: The batch format `fn` expects.
+            compute: The compute strategy.
+            ray_remote_args: Args to provide to ray.remote.
+        """
+        super().__init__(
+            input_op,
+            fn,
+            batch_format=batch_format,
+            zero_copy_batch=True,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._cols = cols
+        self._drop = drop
+
+
+class ExpressionFilter(MapBatches):
+    """Logical operator for filter with a pyarrow expression as predicate.
+
+    It's executed as a MapBatches of `fn` over Arrow batches, but also records
+    the expression so that the optimizer can push it down into the read.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        fn: BatchUDF,
+        filter_expr: "pyarrow.dataset.Expression",
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            input_op,
+            fn,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._name = "Filter"
+        self._filter_expr = filter_expr
+
+
 class MapRows(AbstractUDFMap):
     """Logical operator for map."""
 
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 from ray.data._internal.logical.interfaces import LogicalOperator
 
 
@@ -15,3 +17,29 @@ class Zip(LogicalOperator):
             right_input_op: The input operator at right hand side.
         """
         super().__init__("Zip", [left_input_op, right_input_op])
+
+
+class Join(LogicalOperator):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        on: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            on: The columns to join on.
+            how: The type of join, one of "inner", "left", "right" or "outer".
+            suffixes: The suffixes to add to overlapping non-key column names from
+                the left and right hand side.
+        """
+        super().__init__("Join", [left_input_op, right_input_op])
+        self._on = on
+        self._how = how
+        self._suffixes = suffixes
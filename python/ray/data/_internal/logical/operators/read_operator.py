@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ray.data._internal.logical.operators.map_operator import AbstractMap
 from ray.data.datasource.datasource import Datasource
@@ -18,3 +18,5 @@ class Read(AbstractMap):
         self._datasource = datasource
         self._parallelism = parallelism
         self._read_args = read_args
+        # The maximum number of rows to read, pushed down by LimitPushdownRule.
+        self._limit: Optional[int] = None
@@ -7,7 +7,9 @@ from ray.data._internal.logical.interfaces import (
     PhysicalPlan,
 )
 from ray.data._internal.logical.rules import (
+    LimitPushdownRule,
     OperatorFusionRule,
+    ReadPushdownRule,
     ReorderRandomizeBlocksRule,
 )
 from ray.data._internal.planner.planner import Planner
@@ -18,7 +20,7 @@ class LogicalOptimizer(Optimizer):
 
     @property
     def rules(self) -> List[Rule]:
-        return [ReorderRandomizeBlocksRule()]
+        return [ReorderRandomizeBlocksRule(), ReadPushdownRule(), LimitPushdownRule()]
 
 
 class PhysicalOptimizer(Optimizer):
@@ -1,4 +1,11 @@
+from ray.data._internal.logical.rules.limit_pushdown import LimitPushdownRule
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
+from ray.data._internal.logical.rules.read_pushdown import ReadPushdownRule
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
 
-__all__ = ["ReorderRandomizeBlocksRule", "OperatorFusionRule"]
+__all__ = [
+    "ReorderRandomizeBlocksRule",
+    "ReadPushdownRule",
+    "LimitPushdownRule",
+    "OperatorFusionRule",
+]
@@ -0,0 +1,68 @@
+import copy
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.limit_operator import Limit
+from ray.data._internal.logical.operators.map_operator import MapRows, Project
+from ray.data._internal.logical.operators.read_operator import Read
+
+
+class LimitPushdownRule(Rule):
+    """Rule for pushing Limit operators down towards the Read operator.
+
+    1. A Limit is moved before a preceding operator that doesn't change the number of
+    rows (MapRows, or a Project from select_columns or drop_columns), so that operator
+    only processes the rows that are returned.
+    2. Consecutive Limits are merged into the smallest one.
+    3. A Limit directly following a Read is pushed into the read task generation, so
+    only the read tasks needed to reach the limit are launched. This uses the number
+    of rows in the read task metadata. The Limit itself is kept, since the remaining
+    read tasks can still return more rows than needed.
+
+    The operators of the original plan are never modified, so other datastreams
+    sharing them are not affected.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag: LogicalOperator = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(
+            new_op is not old_op
+            for new_op, old_op in zip(input_ops, op.input_dependencies)
+        ):
+            op = copy.copy(op)
+            op._input_dependencies = input_ops
+
+        if isinstance(op, Limit):
+            return _push_down_limit(op)
+        return op
+
+
+def _push_down_limit(op: Limit) -> LogicalOperator:
+    input_op = op.input_dependencies[0]
+    if isinstance(input_op, Limit):
+        limit = min(op._limit, input_op._limit)
+        return _push_down_limit(Limit(input_op.input_dependencies[0], limit))
+    if isinstance(input_op, (MapRows, Project)):
+        new_op = copy.copy(input_op)
+        new_op._input_dependencies = [
+            _push_down_limit(Limit(input_op.input_dependencies[0], op._limit))
+        ]
+        return new_op
+    if _supports_pushdown(input_op):
+        read_op = copy.copy(input_op)
+        if read_op._limit is None or op._limit < read_op._limit:
+            read_op._limit = op._limit
+        return Limit(read_op, op._limit)
+    return op
+
+
+def _supports_pushdown(op: LogicalOperator) -> bool:
+    # The number of rows in the read task metadata doesn't account for filters or
+    # block UDFs applied by the reader.
+    if not isinstance(op, Read):
+        return False
+    read_args = op._read_args or {}
+    return read_args.get("filter") is None and read_args.get("_block_udf") is None
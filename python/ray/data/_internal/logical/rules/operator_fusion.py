@@ -1,22 +1,40 @@
-from typing import Iterator
+import copy
+from typing import Any, Dict, Iterator
 
 from ray.data.block import Block
 
 # TODO(Clark): Remove compute dependency once we delete the legacy compute.
 from ray.data._internal.compute import is_task_compute, CallableClass, get_compute
-from ray.data._internal.execution.interfaces import PhysicalOperator, TaskContext
+from ray.data._internal.execution.interfaces import (
+    MapTransformFn,
+    PhysicalOperator,
+    TaskContext,
+)
 from ray.data._internal.logical.interfaces import Rule, PhysicalPlan
+from ray.data.context import DataContext
 
 
 # Scheduling strategy can be inherited from upstream operator if not specified.
 INHERITABLE_REMOTE_ARGS = ["scheduling_strategy"]
 
+# Remote args that request resources for a task or actor.
+RESOURCE_REMOTE_ARGS = [
+    "num_cpus",
+    "num_gpus",
+    "memory",
+    "resources",
+    "accelerator_type",
+]
+
 
 class OperatorFusionRule(Rule):
     """Fuses linear chains of compatible physical operators."""
 
     def apply(self, plan: PhysicalPlan) -> PhysicalPlan:
         self._op_map = plan.op_map.copy()
+        # The transformation functions of the map operators fused into all-to-all
+        # operators.
+        self._upstream_map_fns: Dict[PhysicalOperator, MapTransformFn] = {}
         # Do DFS fusion.
         root = self._apply(plan.dag)
         return PhysicalPlan(root, self._op_map)
@@ -50,12 +68,23 @@ class OperatorFusionRule(Rule):
               uses a task pool while the downstream operator uses an actor pool.
             * If both operators involve callable classes, the callable classes are
               the same class AND constructor args are the same for both.
-            * They have compatible remote arguments.
+            * They have compatible remote arguments, or the upstream operator is a task
+              pool operator that doesn't request any resources while the downstream
+              operator uses an actor pool.
+
+        We also support fusing an upstream MapOperator into a downstream
+        AllToAllOperator, see `_can_fuse_all_to_all()`.
         """
+        from ray.data._internal.execution.operators.all_to_all_operator import (
+            AllToAllOperator,
+        )
         from ray.data._internal.execution.operators.map_operator import MapOperator
         from ray.data._internal.logical.operators.map_operator import AbstractMap
         from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
 
+        if isinstance(down_op, AllToAllOperator):
+            return self._can_fuse_all_to_all(down_op, up_op)
+
         # We only support fusing MapOperators.
         if not isinstance(down_op, MapOperator) or not isinstance(up_op, MapOperator):
             return False
@@ -107,22 +136,88 @@ class OperatorFusionRule(Rule):
         ):
             return False
 
-        # Only fuse if the ops' remote arguments are compatible.
+        # Only fuse if the ops' remote arguments are compatible. A task pool operator
+        # that doesn't request any resources can also be fused into a downstream
+        # actor pool operator, in which case it runs in the actors with the
+        # downstream operator's resources. Its other remote arguments must still be
+        # compatible.
+        fuse_into_actors = (
+            isinstance(up_logical_op, AbstractUDFMap)
+            and is_task_compute(up_logical_op._compute)
+            and not is_task_compute(down_logical_op._compute)
+            and not _requests_resources(up_logical_op._ray_remote_args or {})
+        )
         if not _are_remote_args_compatible(
-            up_logical_op._ray_remote_args or {}, down_logical_op._ray_remote_args or {}
+            up_logical_op._ray_remote_args or {},
+            down_logical_op._ray_remote_args or {},
+            ignore_resources=fuse_into_actors,
         ):
             return False
 
         # Otherwise, ops are compatible for fusion.
         return True
 
+    def _can_fuse_all_to_all(
+        self, down_op: PhysicalOperator, up_op: PhysicalOperator
+    ) -> bool:
+        """Returns whether the provided downstream all-to-all operator can be fused
+        with the given upstream operator.
+
+        We currently support fusing the operators if the following are all true:
+            * Fusing shuffle stages is enabled with
+              `DataContext.optimize_fuse_shuffle_stages`.
+            * The downstream operator is a random shuffle or a shuffling repartition,
+              whose map tasks can apply the upstream transformation to their input
+              blocks. Sorts and aggregations sample their input blocks before the
+              shuffle, so they can't be fused.
+            * The upstream operator is a MapOperator applying a UDF with a task pool.
+              Reads aren't fused, so that the shuffle map tasks are scheduled based on
+              the read outputs.
+            * They have compatible remote arguments.
+        """
+        from ray.data._internal.execution.operators.map_operator import MapOperator
+        from ray.data._internal.logical.operators.all_to_all_operator import (
+            RandomShuffle,
+            Repartition,
+        )
+        from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
+
+        if not DataContext.get_current().optimize_fuse_shuffle_stages:
+            return False
+
+        if not isinstance(up_op, MapOperator):
+            return False
+
+        down_logical_op = self._op_map[down_op]
+        up_logical_op = self._op_map[up_op]
+
+        if not isinstance(down_logical_op, (RandomShuffle, Repartition)) or (
+            isinstance(down_logical_op, Repartition) and not down_logical_op._shuffle
+        ):
+            return False
+
+        if not isinstance(up_logical_op, AbstractUDFMap) or not is_task_compute(
+            up_logical_op._compute
+        ):
+            return False
+
+        return _are_remote_args_compatible(
+            up_logical_op._ray_remote_args or {}, down_logical_op._ray_remote_args or {}
+        )
+
     def _fuse(self, down_op: PhysicalOperator, up_op: PhysicalOperator):
         """Fuse the downstream operator with its upstream operator."""
+        from ray.data._internal.execution.operators.all_to_all_operator import (
+            AllToAllOperator,
+        )
         from ray.data._internal.execution.operators.map_operator import MapOperator
         from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
 
         assert self._can_fuse(down_op, up_op)
 
+        if isinstance(down_op, AllToAllOperator):
+            return self._fuse_all_to_all(down_op, up_op)
+
         # Fuse operator names.
         name = up_op.name + "->" + down_op.name
 
@@ -205,15 +300,105 @@ class OperatorFusionRule(Rule):
         # Return the fused physical operator.
         return op
 
+    def _fuse_all_to_all(
+        self, down_op: PhysicalOperator, up_op: PhysicalOperator
+    ) -> PhysicalOperator:
+        """Fuse the downstream all-to-all operator with its upstream map operator.
+
+        The upstream transformation is applied to each input block in the map tasks
+        of the shuffle, so the upstream output blocks aren't materialized in the
+        object store.
+        """
+        from ray.data._internal.execution.operators.all_to_all_operator import (
+            AllToAllOperator,
+        )
+        from ray.data._internal.logical.operators.all_to_all_operator import (
+            RandomShuffle,
+        )
+        from ray.data._internal.planner.random_shuffle import (
+            generate_random_shuffle_fn,
+        )
+        from ray.data._internal.planner.repartition import generate_repartition_fn
+
+        # Fuse operator names.
+        name = up_op.name + "->" + down_op.name
+
+        down_logical_op = self._op_map.pop(down_op)
+        up_logical_op = self._op_map.pop(up_op)
+
+        # Fuse transformation functions, including the ones of map operators that
+        # were previously fused into the downstream operator.
+        up_transform_fn = up_op.get_transformation_fn()
+        down_upstream_map_fn = self._upstream_map_fns.pop(down_op, None)
+        if down_upstream_map_fn is None:
+            transform_fn = up_transform_fn
+        else:
+
+            def transform_fn(
+                blocks: Iterator[Block], ctx: TaskContext
+            ) -> Iterator[Block]:
+                blocks = up_transform_fn(blocks, ctx)
+                return down_upstream_map_fn(blocks, ctx)
+
+        # The map tasks of the shuffle run the upstream transformation, so we take
+        # the upstream op's remote args.
+        ray_remote_args = up_logical_op._ray_remote_args
+        if isinstance(down_logical_op, RandomShuffle):
+            bulk_fn = generate_random_shuffle_fn(
+                down_logical_op._seed,
+                down_logical_op._num_outputs,
+                ray_remote_args,
+                upstream_map_fn=transform_fn,
+            )
+        else:
+            bulk_fn = generate_repartition_fn(
+                down_logical_op._num_outputs,
+                down_logical_op._shuffle,
+                ray_remote_args,
+                upstream_map_fn=transform_fn,
+            )
+
+        # Make the upstream operator's inputs the new, fused operator's inputs.
+        input_deps = up_op.input_dependencies
+        assert len(input_deps) == 1
+        op = AllToAllOperator(
+            bulk_fn,
+            input_deps[0],
+            num_outputs=down_logical_op._num_outputs,
+            name=name,
+        )
+        self._upstream_map_fns[op] = transform_fn
+
+        # Build an all-to-all logical operator to be used as a reference for further
+        # fusion.
+        logical_op = copy.copy(down_logical_op)
+        logical_op._input_dependencies = up_logical_op.input_dependencies
+        logical_op._ray_remote_args = ray_remote_args
+        self._op_map[op] = logical_op
+        # Return the fused physical operator.
+        return op
+
+
+def _requests_resources(ray_remote_args: Dict[str, Any]) -> bool:
+    """Check if Ray remote arguments explicitly request resources."""
+    return any(ray_remote_args.get(key) is not None for key in RESOURCE_REMOTE_ARGS)
+
+
+def _are_remote_args_compatible(up_args, down_args, ignore_resources=False):
+    """Check if Ray remote arguments are compatible for merging.
 
-def _are_remote_args_compatible(up_args, down_args):
-    """Check if Ray remote arguments are compatible for merging."""
+    If ``ignore_resources`` is set, the requested resources don't need to match.
+    """
     from ray.data._internal.execution.operators.map_operator import (
         _canonicalize_ray_remote_args,
     )
 
     up_args = _canonicalize_ray_remote_args(up_args)
     down_args = _canonicalize_ray_remote_args(down_args)
+    if ignore_resources:
+        for key in RESOURCE_REMOTE_ARGS:
+            up_args.pop(key, None)
+            down_args.pop(key, None)
     remote_args = down_args.copy()
     for key in INHERITABLE_REMOTE_ARGS:
         if key in up_args:
@@ -5,6 +5,7 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
     AbstractAllToAll,
     RandomizeBlocks,
 )
+from ray.data._internal.logical.operators.limit_operator import Limit
 
 
 class ReorderRandomizeBlocksRule(Rule):
@@ -15,8 +16,8 @@ class ReorderRandomizeBlocksRule(Rule):
 
     1. Dedupes multiple RandomizeBlocks operators if they are not seeded.
     2. Moves RandomizeBlocks operator to the end of a sequence of AbstractUDFMap
-    operators. RandomizeBlocks operators are not moved across AbstractAllToAll operator
-    boundaries.
+    operators. RandomizeBlocks operators are not moved across AbstractAllToAll or Limit
+    operator boundaries.
     """
 
     def apply(self, plan: LogicalPlan) -> LogicalPlan:
@@ -49,13 +50,13 @@ class ReorderRandomizeBlocksRule(Rule):
                     # dependencies.
                     assert len(upstream_ops[i].input_dependencies) == 1
                     upstream_ops[i] = upstream_ops[i].input_dependencies[0]
-            if isinstance(current_op, AbstractAllToAll) and not isinstance(
+            if isinstance(current_op, (AbstractAllToAll, Limit)) and not isinstance(
                 current_op, RandomizeBlocks
             ):
-                # If this operator is a an AllToAll Operator, then insert
+                # If this operator is a an AllToAll or Limit Operator, then insert
                 # RandomizeBlocks right before this operator rather than the end of the
-                # DAG.
-                # All-to-all operators can have only 1 input operator.
+                # DAG, since the output of these operators depends on the block order.
+                # All-to-all and Limit operators can have only 1 input operator.
                 assert len(upstream_ops) == 1
                 input_op = upstream_ops[0]
                 for random_op in operators:
@@ -0,0 +1,93 @@
+import copy
+from typing import List, Optional
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import (
+    ExpressionFilter,
+    Project,
+)
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.datasource.parquet_datasource import ParquetDatasource
+
+
+class ReadPushdownRule(Rule):
+    """Rule for pushing projections and filters down into Read operators.
+
+    A Project (from select_columns or drop_columns) or an ExpressionFilter
+    directly following a Read of a datasource that supports it is merged into
+    the read arguments, so the datasource only reads the needed columns and
+    can skip data using the filter (e.g. Parquet row group statistics).
+
+    1. Selected columns replace the read columns if they are a subset of them.
+    2. Dropped columns are removed from the read columns. This is only done
+    when the read columns are known, since the full schema isn't available
+    during optimization.
+    3. Filter expressions are combined with any filter of the read.
+
+    The Read operators of the original plan are never modified, so other
+    datastreams sharing them are not affected.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag: LogicalOperator = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        # Push down into the upstream operators first, so a chain of projections
+        # and filters is merged into the read one operator at a time.
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        if any(
+            new_op is not old_op
+            for new_op, old_op in zip(input_ops, op.input_dependencies)
+        ):
+            op = copy.copy(op)
+            op._input_dependencies = input_ops
+
+        if len(input_ops) == 1 and _supports_pushdown(input_ops[0]):
+            read_op = input_ops[0]
+            if isinstance(op, Project):
+                columns = _get_projected_columns(op, read_op._read_args)
+                if columns is not None:
+                    return _copy_read_op(read_op, columns=columns)
+            elif isinstance(op, ExpressionFilter):
+                read_filter = read_op._read_args.get("filter")
+                if read_filter is None:
+                    read_filter = op._filter_expr
+                else:
+                    read_filter = read_filter & op._filter_expr
+                return _copy_read_op(read_op, filter=read_filter)
+        return op
+
+
+def _supports_pushdown(op: LogicalOperator) -> bool:
+    # A block UDF applied by the reader could depend on the pruned columns or
+    # rows, so reads with one are left untouched.
+    return (
+        isinstance(op, Read)
+        and isinstance(op._datasource, ParquetDatasource)
+        and op._read_args is not None
+        and op._read_args.get("_block_udf") is None
+    )
+
+
+def _get_projected_columns(op: Project, read_args: dict) -> Optional[List[str]]:
+    """Returns the columns to read after the projection, or None if it can't be
+    pushed down."""
+    read_columns = read_args.get("columns")
+    if read_columns is not None and not set(op._cols).issubset(read_columns):
+        # Let the projection raise the missing column error.
+        return None
+    if op._drop:
+        if read_columns is None:
+            return None
+        columns = [col for col in read_columns if col not in op._cols]
+    else:
+        columns = list(op._cols)
+    # An empty column list means all columns to the datasource.
+    return columns or None
+
+
+def _copy_read_op(op: Read, **read_args) -> Read:
+    new_op = copy.copy(op)
+    new_op._read_args = {**op._read_args, **read_args}
+    return new_op
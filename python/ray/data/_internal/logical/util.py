@@ -56,6 +56,9 @@ _op_name_white_list = [
     "Aggregate",
     # N-ary
     "Zip",
+    "Join",
+    # Limit
+    "Limit",
 ]
 
 
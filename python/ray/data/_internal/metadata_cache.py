@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ray.data.context import DataContext
+
+logger = logging.getLogger(__name__)
+
+# Namespace of cached directory listings, keyed by directory path and modification
+# time.
+FILE_LISTING_NAMESPACE = "file_listings"
+
+# Namespace of cached Parquet file footers, keyed by file path, size and
+# modification time.
+PARQUET_METADATA_NAMESPACE = "parquet_metadata"
+
+_ENTRY_SUFFIX = ".pkl"
+
+
+class MetadataCache:
+    """An on-disk cache of file listings and file metadata, shared across runs.
+
+    Each entry is pickled to its own file in a subdirectory of `cache_dir` per
+    namespace, named after a hash of its key, and is written atomically so that
+    concurrent jobs can share the same cache directory. Entries expire `ttl_s`
+    seconds after they were written, and the least recently used entries are
+    evicted once the total size of the cache exceeds `max_size_bytes`.
+
+    The cache is best-effort: any error reading or writing an entry is logged and
+    treated as a cache miss.
+    """
+
+    def __init__(self, cache_dir: str, ttl_s: float, max_size_bytes: int):
+        self._cache_dir = os.path.expanduser(cache_dir)
+        self._ttl_s = ttl_s
+        self._max_size_bytes = max_size_bytes
+
+    @staticmethod
+    def from_context(
+        context: Optional[DataContext] = None,
+    ) -> Optional["MetadataCache"]:
+        """Return the metadata cache configured in the DataContext, if enabled."""
+        if context is None:
+            context = DataContext.get_current()
+        if context.metadata_cache_dir is None:
+            return None
+        return MetadataCache(
+            context.metadata_cache_dir,
+            context.metadata_cache_ttl_s,
+            context.metadata_cache_max_bytes,
+        )
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key`, or None if it's missing or expired."""
+        entry_path = self._entry_path(namespace, key)
+        try:
+            with open(entry_path, "rb") as f:
+                entry_key, created_at, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug(
+                f"Failed to read metadata cache entry {entry_path}.", exc_info=True
+            )
+            return None
+        if entry_key != key:
+            # Hash collision.
+            return None
+        if time.time() - created_at > self._ttl_s:
+            _remove(entry_path)
+            return None
+        try:
+            # Bump the entry's modification time, which is used to evict the least
+            # recently used entries.
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, namespace: str, key: Hashable, value: Any) -> None:
+        """Cache `value` for `key`."""
+        self.put_all(namespace, {key: value})
+
+    def put_all(self, namespace: str, entries: Dict[Hashable, Any]) -> None:
+        """Cache all values of `entries` for their keys, then evict if needed."""
+        if not entries:
+            return
+        now = time.time()
+        try:
+            os.makedirs(os.path.join(self._cache_dir, namespace), exist_ok=True)
+            for key, value in entries.items():
+                self._write(self._entry_path(namespace, key), (key, now, value))
+        except Exception:
+            logger.debug("Failed to write metadata cache entries.", exc_info=True)
+            return
+        self._evict()
+
+    def _entry_path(self, namespace: str, key: Hashable) -> str:
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self._cache_dir, namespace, digest + _ENTRY_SUFFIX)
+
+    def _write(self, entry_path: str, entry: Tuple[Hashable, float, Any]) -> None:
+        # Write to a temporary file and rename it, so that readers never see a
+        # partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            _remove(tmp_path)
+            raise
+
+    def _evict(self) -> None:
+        """Evict expired entries, then the least recently used entries until the
+        cache fits in `max_size_bytes`."""
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        now = time.time()
+        for root, _, files in os.walk(self._cache_dir):
+            for name in files:
+                if not name.endswith(_ENTRY_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                # An entry's modification time is at least its creation time, so
+                # entries that weren't used within the TTL have expired.
+                if now - stat.st_mtime > self._ttl_s:
+                    _remove(path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+        if total_size <= self._max_size_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            _remove(path)
+            total_size -= size
+            if total_size <= self._max_size_bytes:
+                break
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
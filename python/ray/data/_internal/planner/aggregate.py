@@ -6,6 +6,7 @@ from ray.data._internal.execution.interfaces import (
     TaskContext,
 )
 from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    HashAggregateTaskSpec,
     SortAggregateTaskSpec,
 )
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
@@ -50,25 +51,31 @@ def generate_aggregate_fn(
 
         num_mappers = len(blocks)
 
-        if key is None:
-            num_outputs = 1
-            boundaries = []
-        else:
-            # Use same number of output partitions.
+        context = DataContext.get_current()
+        if context.use_hash_groupby and isinstance(key, str):
+            # Use same number of output partitions. Hash partitioning doesn't need
+            # to sample the key boundaries.
             num_outputs = num_mappers
-            # Sample boundaries for aggregate key.
-            boundaries = SortTaskSpec.sample_boundaries(
-                blocks,
-                [(key, "ascending")] if isinstance(key, str) else key,
-                num_outputs,
+            agg_spec = HashAggregateTaskSpec(key=key, aggs=aggs)
+        else:
+            if key is None:
+                num_outputs = 1
+                boundaries = []
+            else:
+                # Use same number of output partitions.
+                num_outputs = num_mappers
+                # Sample boundaries for aggregate key.
+                boundaries = SortTaskSpec.sample_boundaries(
+                    blocks,
+                    [(key, "ascending")] if isinstance(key, str) else key,
+                    num_outputs,
+                )
+            agg_spec = SortAggregateTaskSpec(
+                boundaries=boundaries,
+                key=key,
+                aggs=aggs,
             )
-
-        agg_spec = SortAggregateTaskSpec(
-            boundaries=boundaries,
-            key=key,
-            aggs=aggs,
-        )
-        if DataContext.get_current().use_push_based_shuffle:
+        if context.use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(agg_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(agg_spec)
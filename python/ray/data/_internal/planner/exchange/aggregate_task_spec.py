@@ -109,3 +109,59 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+class HashAggregateTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for hash-based aggregate tasks.
+
+    Partial aggregate (`map`): rows with the same key in each block are combined
+    (with vectorized Arrow aggregations where possible), then the combined block is
+    partitioned by the hash of the key. Unlike the sort-based aggregate, this doesn't
+    need to sample the key boundaries.
+
+    Final aggregate (`reduce`): each task would receive a block from every worker that
+    consists of the keys with the same hash partition. It then merges the blocks,
+    which are sorted by key within each partition, and aggregates on-the-fly.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        aggs: List[AggregateFn],
+    ):
+        super().__init__(
+            map_args=[key, aggs],
+            reduce_args=[key, aggs],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: List[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+
+        block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        combined = BlockAccessor.for_block(block).combine_unsorted(key, aggs)
+        parts = BlockAccessor.for_block(combined).hash_partition(
+            [key], output_num_blocks
+        )
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+    @staticmethod
+    def reduce(
+        key: str,
+        aggs: List[AggregateFn],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        return SortAggregateTaskSpec.reduce(
+            key, aggs, *mapper_outputs, partial_reduce=partial_reduce
+        )
@@ -4,6 +4,7 @@ from typing import List, Optional, Tuple, Union
 import numpy as np
 
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+from ray.data._internal.execution.interfaces import MapTransformFn, TaskContext
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 
@@ -19,9 +20,18 @@ class ShuffleTaskSpec(ExchangeTaskSpec):
         self,
         random_shuffle: bool = False,
         random_seed: Optional[int] = None,
+        upstream_map_fn: Optional[MapTransformFn] = None,
     ):
+        """
+        Args:
+            random_shuffle: Whether to randomly shuffle the rows.
+            random_seed: The seed to use for the random shuffle.
+            upstream_map_fn: The transformation function of upstream map operators
+                fused into this shuffle, which is applied to each input block in
+                the map tasks.
+        """
         super().__init__(
-            map_args=[random_shuffle, random_seed],
+            map_args=[upstream_map_fn, random_shuffle, random_seed],
             reduce_args=[random_shuffle, random_seed],
         )
 
@@ -30,11 +40,22 @@ class ShuffleTaskSpec(ExchangeTaskSpec):
         idx: int,
         block: Block,
         output_num_blocks: int,
+        upstream_map_fn: Optional[MapTransformFn],
         random_shuffle: bool,
         random_seed: Optional[int],
     ) -> List[Union[BlockMetadata, Block]]:
-        # TODO: Support fusion with other upstream operators.
         stats = BlockExecStats.builder()
+        if upstream_map_fn:
+            blocks = list(upstream_map_fn([block], TaskContext(task_idx=idx)))
+            if len(blocks) == 1:
+                block = blocks[0]
+            elif blocks:
+                builder = BlockAccessor.for_block(blocks[0]).builder()
+                for b in blocks:
+                    builder.add_block(b)
+                block = builder.build()
+            else:
+                block = DelegatingBlockBuilder().build()
         block = BlockAccessor.for_block(block)
 
         # Randomize the distribution of records to blocks.
@@ -17,6 +17,10 @@ T = TypeVar("T")
 # (Callable).
 SortKeyT = Union[None, List[Tuple[str, str]], Callable[[T], Any]]
 
+# The factor by which to increase the number of samples when re-sampling the
+# boundaries of a datastream with hot keys.
+SKEWED_RESAMPLING_FACTOR = 10
+
 
 class SortTaskSpec(ExchangeTaskSpec):
     """
@@ -38,6 +42,10 @@ class SortTaskSpec(ExchangeTaskSpec):
     Merging (`reduce`): a merge task would receive a block from every worker that
     consists of items in a certain range. It then merges the sorted blocks into one
     sorted block and becomes part of the new, sorted block.
+
+    If `split_hot_keys` is set, the rows of keys that are frequent enough to appear
+    several times in the boundaries are spread over several merge tasks, instead of
+    all going to a single one (see `split_hot_key_partitions`).
     """
 
     def __init__(
@@ -45,9 +53,10 @@ class SortTaskSpec(ExchangeTaskSpec):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        split_hot_keys: bool = False,
     ):
         super().__init__(
-            map_args=[boundaries, key, descending],
+            map_args=[boundaries, key, descending, split_hot_keys],
             reduce_args=[key, descending],
         )
 
@@ -59,11 +68,14 @@ class SortTaskSpec(ExchangeTaskSpec):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        split_hot_keys: bool = False,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
         out = BlockAccessor.for_block(block).sort_and_partition(
             boundaries, key, descending
         )
+        if split_hot_keys:
+            out = split_hot_key_partitions(out, boundaries, key, descending)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -82,11 +94,18 @@ class SortTaskSpec(ExchangeTaskSpec):
 
     @staticmethod
     def sample_boundaries(
-        blocks: List[ObjectRef[Block]], key: SortKeyT, num_reducers: int
+        blocks: List[ObjectRef[Block]],
+        key: SortKeyT,
+        num_reducers: int,
+        resample_if_skewed: bool = False,
     ) -> List[T]:
         """
         Return (num_reducers - 1) items in ascending order from the blocks that
         partition the domain into ranges with approximately equally many elements.
+
+        If `resample_if_skewed` is set and the sampled items have hot keys, the blocks
+        are sampled again with more samples, to estimate the fraction of rows of each
+        hot key more accurately.
         """
         # TODO(Clark): Support multiple boundary sampling keys.
         if isinstance(key, list) and len(key) > 1:
@@ -103,22 +122,112 @@ class SortTaskSpec(ExchangeTaskSpec):
         samples = sample_bar.fetch_until_complete(sample_results)
         sample_bar.close()
         del sample_results
-        samples = [s for s in samples if len(s) > 0]
-        # The datastream is empty
-        if len(samples) == 0:
-            return [None] * (num_reducers - 1)
-        builder = DelegatingBlockBuilder()
-        for sample in samples:
-            builder.add_block(sample)
-        samples = builder.build()
-        column = key[0][0] if isinstance(key, list) else None
-        sample_items = BlockAccessor.for_block(samples).to_numpy(column)
-        sample_items = np.sort(sample_items)
-        ret = [
-            np.quantile(sample_items, q, interpolation="nearest")
-            for q in np.linspace(0, 1, num_reducers)
+        boundaries = boundaries_from_samples(samples, key, num_reducers)
+        if resample_if_skewed and has_hot_keys(boundaries):
+            sample_results = [
+                sample_block.remote(block, n_samples * SKEWED_RESAMPLING_FACTOR, key)
+                for block in blocks
+            ]
+            sample_bar = ProgressBar("Sort Resample", len(sample_results))
+            samples = sample_bar.fetch_until_complete(sample_results)
+            sample_bar.close()
+            del sample_results
+            boundaries = boundaries_from_samples(samples, key, num_reducers)
+        return boundaries
+
+
+def boundaries_from_samples(
+    samples: List[Block], key: SortKeyT, num_reducers: int
+) -> List[T]:
+    """Return (num_reducers - 1) quantiles of the sampled items as boundaries."""
+    samples = [s for s in samples if len(s) > 0]
+    # The datastream is empty
+    if len(samples) == 0:
+        return [None] * (num_reducers - 1)
+    builder = DelegatingBlockBuilder()
+    for sample in samples:
+        builder.add_block(sample)
+    samples = builder.build()
+    column = key[0][0] if isinstance(key, list) else None
+    sample_items = BlockAccessor.for_block(samples).to_numpy(column)
+    sample_items = np.sort(sample_items)
+    ret = [
+        np.quantile(sample_items, q, interpolation="nearest")
+        for q in np.linspace(0, 1, num_reducers)
+    ]
+    return ret[1:]
+
+
+def has_hot_keys(boundaries: List[T]) -> bool:
+    """Return whether the boundaries have a key that's frequent enough to appear in
+    them several times."""
+    return any(
+        boundaries[i] is not None and boundaries[i] == boundaries[i + 1]
+        for i in range(len(boundaries) - 1)
+    )
+
+
+def split_hot_key_partitions(
+    partitions: List[Block], boundaries: List[T], key: SortKeyT, descending: bool
+) -> List[Block]:
+    """Spread the rows of hot keys of a sorted and partitioned block over all the
+    partitions that they can go to.
+
+    A hot key appears several times in a row in the boundaries, e.g., `b[i]` to
+    `b[j]`. All of its rows would then go to a single partition (`i` or `j + 1`,
+    depending on the sort order), while the partitions between these boundaries
+    would be empty. Since the partitions `i` to `j + 1` are adjacent in the sort
+    order, and the ones in between can only hold rows of the hot key, its rows can
+    be spread evenly over all of them without breaking the sort order.
+
+    Only sorts by a column are supported; other partitions are returned as is.
+    """
+    if not isinstance(key, list):
+        return partitions
+    column = key[0][0]
+    partitions = list(partitions)
+    i = 0
+    while i < len(boundaries):
+        j = i
+        while j + 1 < len(boundaries) and boundaries[j + 1] == boundaries[i]:
+            j += 1
+        if j > i and boundaries[i] is not None:
+            partitions[i : j + 2] = _spread_key(
+                partitions[i], partitions[j + 1], j - i + 2, boundaries[i], column
+            )
+        i = j + 1
+    return partitions
+
+
+def _spread_key(
+    first: Block, last: Block, num_partitions: int, value: T, column: str
+) -> List[Block]:
+    """Split the rows of two adjacent partitions into `num_partitions` partitions,
+    with the rows of the `value` key spread evenly over them."""
+    first_acc = BlockAccessor.for_block(first)
+    last_acc = BlockAccessor.for_block(last)
+    if first_acc.num_rows() == 0 and last_acc.num_rows() == 0:
+        return [first] + [
+            first_acc.slice(0, 0, copy=False) for _ in range(num_partitions - 1)
         ]
-        return ret[1:]
+    builder = DelegatingBlockBuilder()
+    builder.add_block(first)
+    builder.add_block(last)
+    acc = BlockAccessor.for_block(builder.build())
+    num_rows = acc.num_rows()
+    # The rows of the key are contiguous, and are preceded by the rows of the first
+    # partition with other keys.
+    is_value = acc.to_numpy(column) == value
+    start = first_acc.num_rows() - int(np.sum(is_value[: first_acc.num_rows()]))
+    end = start + int(np.sum(is_value))
+    bounds = [
+        start + round(k * (end - start) / num_partitions)
+        for k in range(1, num_partitions)
+    ]
+    return [
+        acc.slice(lo, hi, copy=False)
+        for lo, hi in zip([0] + bounds, bounds + [num_rows])
+    ]
 
 
 def _sample_block(block: Block[T], n_samples: int, key: SortKeyT) -> Block[T]:
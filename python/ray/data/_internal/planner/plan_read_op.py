@@ -24,6 +24,8 @@ def _plan_read_op(op: Read) -> PhysicalOperator:
     def get_input_data() -> List[RefBundle]:
         reader = op._datasource.create_reader(**op._read_args)
         read_tasks = reader.get_read_tasks(op._parallelism)
+        if op._limit is not None:
+            read_tasks = _truncate_read_tasks(read_tasks, op._limit)
         return [
             RefBundle(
                 [
@@ -52,3 +54,20 @@ def _plan_read_op(op: Read) -> PhysicalOperator:
             yield from read_task()
 
     return MapOperator.create(do_read, inputs, name="DoRead")
+
+
+def _truncate_read_tasks(read_tasks: List[ReadTask], limit: int) -> List[ReadTask]:
+    """Truncate the read tasks to the minimum number of tasks that read at least
+    limit rows.
+
+    If the number of rows of a read task is not available, it will be treated as a
+    0-row task and will be included in the truncated output.
+    """
+    out_tasks = []
+    out_num_rows = 0
+    for read_task in read_tasks:
+        if out_num_rows >= limit:
+            break
+        out_tasks.append(read_task)
+        out_num_rows += read_task.get_metadata().num_rows or 0
+    return out_tasks
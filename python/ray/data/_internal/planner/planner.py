@@ -1,6 +1,8 @@
 from typing import Dict
 
 from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.join_operator import JoinOperator
+from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
 from ray.data._internal.logical.interfaces import (
     LogicalOperator,
@@ -8,7 +10,8 @@ from ray.data._internal.logical.interfaces import (
     PhysicalPlan,
 )
 from ray.data._internal.logical.operators.all_to_all_operator import AbstractAllToAll
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.limit_operator import Limit
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.operators.from_arrow_operator import FromArrowRefs
 from ray.data._internal.logical.operators.from_items_operator import FromItems
 from ray.data._internal.logical.operators.from_numpy_operator import FromNumpyRefs
@@ -78,6 +81,18 @@ class Planner:
         elif isinstance(logical_op, Zip):
             assert len(physical_children) == 2
             physical_op = ZipOperator(physical_children[0], physical_children[1])
+        elif isinstance(logical_op, Join):
+            assert len(physical_children) == 2
+            physical_op = JoinOperator(
+                physical_children[0],
+                physical_children[1],
+                logical_op._on,
+                logical_op._how,
+                logical_op._suffixes,
+            )
+        elif isinstance(logical_op, Limit):
+            assert len(physical_children) == 1
+            physical_op = LimitOperator(logical_op._limit, physical_children[0])
         else:
             raise ValueError(
                 f"Found unknown logical operator during planning: {logical_op}"
@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
+    MapTransformFn,
     RefBundle,
     TaskContext,
 )
@@ -20,15 +21,24 @@ def generate_random_shuffle_fn(
     seed: Optional[int],
     num_outputs: Optional[int] = None,
     ray_remote_args: Optional[Dict[str, Any]] = None,
+    upstream_map_fn: Optional[MapTransformFn] = None,
 ) -> AllToAllTransformFn:
-    """Generate function to randomly shuffle each records of blocks."""
+    """Generate function to randomly shuffle each records of blocks.
+
+    If `upstream_map_fn` is given, it's applied to each input block in the shuffle
+    map tasks, which fuses upstream map operators into the shuffle.
+    """
 
     def fn(
         refs: List[RefBundle],
         ctx: TaskContext,
     ) -> Tuple[List[RefBundle], StatsDict]:
         num_input_blocks = sum(len(r.blocks) for r in refs)
-        shuffle_spec = ShuffleTaskSpec(random_shuffle=True, random_seed=seed)
+        shuffle_spec = ShuffleTaskSpec(
+            random_shuffle=True,
+            random_seed=seed,
+            upstream_map_fn=upstream_map_fn,
+        )
 
         if DataContext.get_current().use_push_based_shuffle:
             if num_outputs is not None:
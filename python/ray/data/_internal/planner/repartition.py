@@ -1,7 +1,8 @@
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
+    MapTransformFn,
     RefBundle,
     TaskContext,
 )
@@ -23,21 +24,36 @@ from ray.data.context import DataContext
 def generate_repartition_fn(
     num_outputs: int,
     shuffle: bool,
+    ray_remote_args: Optional[Dict[str, Any]] = None,
+    upstream_map_fn: Optional[MapTransformFn] = None,
 ) -> AllToAllTransformFn:
-    """Generate function to partition each records of blocks."""
+    """Generate function to partition each records of blocks.
+
+    If `upstream_map_fn` is given, it's applied to each input block in the shuffle
+    map tasks, which fuses upstream map operators into the repartition. This is only
+    supported if `shuffle` is True.
+    """
+    assert shuffle or upstream_map_fn is None
 
     def shuffle_repartition_fn(
         refs: List[RefBundle],
         ctx: TaskContext,
     ) -> Tuple[List[RefBundle], StatsDict]:
-        shuffle_spec = ShuffleTaskSpec(random_shuffle=False)
+        shuffle_spec = ShuffleTaskSpec(
+            random_shuffle=False, upstream_map_fn=upstream_map_fn
+        )
 
         if DataContext.get_current().use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(shuffle_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(shuffle_spec)
 
-        return scheduler.execute(refs, num_outputs)
+        return scheduler.execute(
+            refs,
+            num_outputs,
+            map_ray_remote_args=ray_remote_args,
+            reduce_ray_remote_args=ray_remote_args,
+        )
 
     def split_repartition_fn(
         refs: List[RefBundle],
@@ -1,5 +1,5 @@
 from functools import partial
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
@@ -22,12 +22,19 @@ from ray.data.context import DataContext
 def generate_sort_fn(
     key: SortKeyT,
     descending: bool,
+    split_hot_keys: Optional[bool] = None,
 ) -> AllToAllTransformFn:
-    """Generate function to sort blocks by the specified key column or key function."""
+    """Generate function to sort blocks by the specified key column or key function.
+
+    If `split_hot_keys` is set, the rows of hot keys may be split across output
+    blocks (see `SortTaskSpec`). If None, this is set by
+    `DataContext.use_skew_aware_sort`.
+    """
 
     def fn(
         key: SortKeyT,
         descending: bool,
+        split_hot_keys: Optional[bool],
         refs: List[RefBundle],
         ctx: TaskContext,
     ) -> Tuple[List[RefBundle], StatsDict]:
@@ -51,13 +58,24 @@ def generate_sort_fn(
         # Use same number of output partitions.
         num_outputs = num_mappers
 
+        context = DataContext.get_current()
+        if split_hot_keys is None:
+            split_hot_keys = context.use_skew_aware_sort
+
         # Sample boundaries for sort key.
-        boundaries = SortTaskSpec.sample_boundaries(blocks, key, num_outputs)
+        boundaries = SortTaskSpec.sample_boundaries(
+            blocks, key, num_outputs, resample_if_skewed=split_hot_keys
+        )
         if descending:
             boundaries.reverse()
-        sort_spec = SortTaskSpec(boundaries=boundaries, key=key, descending=descending)
+        sort_spec = SortTaskSpec(
+            boundaries=boundaries,
+            key=key,
+            descending=descending,
+            split_hot_keys=split_hot_keys,
+        )
 
-        if DataContext.get_current().use_push_based_shuffle:
+        if context.use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(sort_spec)
         else:
             scheduler = PullBasedShuffleTaskScheduler(sort_spec)
@@ -67,4 +85,4 @@ def generate_sort_fn(
     # NOTE: use partial function to pass parameters to avoid error like
     # "UnboundLocalError: local variable ... referenced before assignment",
     # because `key` and `descending` variables are reassigned in `fn()`.
-    return partial(fn, key, descending)
+    return partial(fn, key, descending, split_hot_keys)
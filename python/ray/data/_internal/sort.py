@@ -18,11 +18,14 @@ block and becomes part of the new, sorted datastream.
 """
 from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
 
-import numpy as np
-
 from ray.data._internal.block_list import BlockList
-from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import TaskContext
+from ray.data._internal.planner.exchange.sort_task_spec import (
+    SKEWED_RESAMPLING_FACTOR,
+    boundaries_from_samples,
+    has_hot_keys,
+    split_hot_key_partitions,
+)
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data._internal.remote_fn import cached_remote_fn
@@ -48,11 +51,14 @@ class _SortOp(ShuffleOp):
         boundaries: List[T],
         key: SortKeyT,
         descending: bool,
+        split_hot_keys: bool = False,
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
         out = BlockAccessor.for_block(block).sort_and_partition(
             boundaries, key, descending
         )
+        if split_hot_keys:
+            out = split_hot_key_partitions(out, boundaries, key, descending)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -83,10 +89,15 @@ def sample_boundaries(
     key: SortKeyT,
     num_reducers: int,
     ctx: Optional[TaskContext] = None,
+    resample_if_skewed: bool = False,
 ) -> List[T]:
     """
     Return (num_reducers - 1) items in ascending order from the blocks that
     partition the domain into ranges with approximately equally many elements.
+
+    If `resample_if_skewed` is set and the sampled items have hot keys, the blocks
+    are sampled again with more samples, to estimate the fraction of rows of each
+    hot key more accurately.
     """
     # TODO(Clark): Support multiple boundary sampling keys.
     if isinstance(key, list) and len(key) > 1:
@@ -112,22 +123,18 @@ def sample_boundaries(
     if should_close_bar:
         sample_bar.close()
     del sample_results
-    samples = [s for s in samples if len(s) > 0]
-    # The datastream is empty
-    if len(samples) == 0:
-        return [None] * (num_reducers - 1)
-    builder = DelegatingBlockBuilder()
-    for sample in samples:
-        builder.add_block(sample)
-    samples = builder.build()
-    column = key[0][0] if isinstance(key, list) else None
-    sample_items = BlockAccessor.for_block(samples).to_numpy(column)
-    sample_items = np.sort(sample_items)
-    ret = [
-        np.quantile(sample_items, q, interpolation="nearest")
-        for q in np.linspace(0, 1, num_reducers)
-    ]
-    return ret[1:]
+    boundaries = boundaries_from_samples(samples, key, num_reducers)
+    if resample_if_skewed and has_hot_keys(boundaries):
+        sample_results = [
+            sample_block.remote(block, n_samples * SKEWED_RESAMPLING_FACTOR, key)
+            for block in blocks
+        ]
+        sample_bar = ProgressBar("Sort Resample", len(sample_results))
+        samples = sample_bar.fetch_until_complete(sample_results)
+        sample_bar.close()
+        del sample_results
+        boundaries = boundaries_from_samples(samples, key, num_reducers)
+    return boundaries
 
 
 # Note: currently the map_groups() API relies on this implementation
@@ -138,7 +145,14 @@ def sort_impl(
     key: SortKeyT,
     descending: bool = False,
     ctx: Optional[TaskContext] = None,
+    split_hot_keys: Optional[bool] = None,
 ) -> Tuple[BlockList, dict]:
+    """Sort the blocks by `key`.
+
+    If `split_hot_keys` is set, the rows of hot keys may be split across output
+    blocks (see `split_hot_key_partitions`). If None, this is set by
+    `DataContext.use_skew_aware_sort`.
+    """
     stage_info = {}
     blocks_list = blocks.get_blocks()
     if len(blocks_list) == 0:
@@ -150,21 +164,27 @@ def sort_impl(
     if isinstance(key, list):
         descending = key[0][1] == "descending"
 
+    context = DataContext.get_current()
+    if split_hot_keys is None:
+        split_hot_keys = context.use_skew_aware_sort
+
     num_mappers = len(blocks_list)
     # Use same number of output partitions.
     num_reducers = num_mappers
     # TODO(swang): sample_boundaries could be fused with a previous stage.
-    boundaries = sample_boundaries(blocks_list, key, num_reducers, ctx)
+    boundaries = sample_boundaries(
+        blocks_list, key, num_reducers, ctx, resample_if_skewed=split_hot_keys
+    )
     if descending:
         boundaries.reverse()
 
-    context = DataContext.get_current()
     if context.use_push_based_shuffle:
         sort_op_cls = PushBasedSortOp
     else:
         sort_op_cls = SimpleSortOp
     sort_op = sort_op_cls(
-        map_args=[boundaries, key, descending], reduce_args=[key, descending]
+        map_args=[boundaries, key, descending, split_hot_keys],
+        reduce_args=[key, descending],
     )
     return sort_op.execute(
         blocks,
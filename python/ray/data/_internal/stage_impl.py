@@ -8,10 +8,11 @@ from ray.data._internal.shuffle_and_partition import (
     PushBasedShufflePartitionOp,
     SimpleShufflePartitionOp,
 )
-from ray.data._internal.split import _split_at_indices
+from ray.data._internal.split import _split_at_index, _split_at_indices
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import TaskContext
+from ray.data._internal.join import join_impl
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.sort import sort_impl
 from ray.data.context import DataContext
@@ -109,6 +110,27 @@ class RandomizeBlocksStage(AllToAllStage):
         return randomized_block_list, {}
 
 
+class LimitStage(AllToAllStage):
+    """Implementation of `Datastream.limit()` when the optimizer is enabled."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+
+        super().__init__("Limit", None, self.do_limit)
+
+    def do_limit(self, block_list, *_):
+        # Truncate the block list to the minimum number of blocks that contains at
+        # least `limit` rows.
+        block_list = block_list.truncate_by_rows(self._limit)
+        blocks, metadata, _, _ = _split_at_index(block_list, self._limit)
+        return (
+            BlockList(
+                blocks, metadata, owned_by_consumer=block_list._owned_by_consumer
+            ),
+            {},
+        )
+
+
 class RandomShuffleStage(AllToAllStage):
     """Implementation of `Datastream.random_shuffle()`."""
 
@@ -263,6 +285,27 @@ class ZipStage(AllToAllStage):
         super().__init__("Zip", None, do_zip_all)
 
 
+class JoinStage(AllToAllStage):
+    """Implementation of `Datastream.join()`."""
+
+    def __init__(
+        self,
+        other: "Datastream",
+        on: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+    ):
+        def do_join_all(block_list: BlockList, clear_input_blocks: bool, *_):
+            # Execute other to a block list. Unlike zip, the join output doesn't
+            # depend on the order of the blocks.
+            other_block_list = other._plan.execute()
+            return join_impl(
+                block_list, other_block_list, clear_input_blocks, on, how, suffixes
+            )
+
+        super().__init__("Join", None, do_join_all)
+
+
 def _calculate_blocks_rows_and_bytes(
     blocks_with_metadata: BlockPartition,
 ) -> Tuple[List[int], List[int]]:
@@ -313,7 +356,13 @@ def _do_zip(
 class SortStage(AllToAllStage):
     """Implementation of `Datastream.sort()`."""
 
-    def __init__(self, ds: "Datastream", key: Optional[KeyFn], descending: bool):
+    def __init__(
+        self,
+        ds: "Datastream",
+        key: Optional[KeyFn],
+        descending: bool,
+        split_hot_keys: Optional[bool] = None,
+    ):
         def do_sort(
             block_list,
             ctx: TaskContext,
@@ -336,7 +385,9 @@ class SortStage(AllToAllStage):
                     _validate_key_fn(schema, subkey)
             else:
                 _validate_key_fn(schema, key)
-            return sort_impl(blocks, clear_input_blocks, key, descending, ctx)
+            return sort_impl(
+                blocks, clear_input_blocks, key, descending, ctx, split_hot_keys
+            )
 
         super().__init__(
             "Sort",
@@ -238,3 +238,32 @@ class TableBlockAccessor(BlockAccessor):
             return self._empty_table()
         k = min(n_samples, self.num_rows())
         return self._sample(k, key)
+
+    def hash_partition(self, key: List[str], num_partitions: int) -> List[Block]:
+        if self.num_rows() == 0:
+            # If the table is empty we may not have the key columns.
+            return [self._table] * num_partitions
+        import pandas as pd
+
+        keys = BlockAccessor.for_block(self.select(key)).to_pandas()
+        # Hash all numeric keys as floats, so that equal keys of different numeric
+        # types (e.g. int64 and float64) land in the same partition.
+        keys = keys.astype(
+            {
+                col: np.float64
+                for col, dtype in keys.dtypes.items()
+                if pd.api.types.is_numeric_dtype(dtype)
+                and not pd.api.types.is_bool_dtype(dtype)
+            }
+        )
+        hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+        partition_ids = (hashes % num_partitions).astype(np.int64)
+        indices = np.argsort(partition_ids, kind="stable")
+        bounds = np.cumsum(np.bincount(partition_ids, minlength=num_partitions))
+        table = BlockAccessor.for_block(self.take(indices))
+        partitions = []
+        start = 0
+        for end in bounds.tolist():
+            partitions.append(table.slice(start, end, copy=False))
+            start = end
+        return partitions
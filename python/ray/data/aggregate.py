@@ -124,6 +124,7 @@ class Sum(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"sum({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
         null_merge = _null_wrap_merge(ignore_nulls, lambda a1, a2: a1 + a2)
 
@@ -155,6 +156,7 @@ class Min(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"min({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
         null_merge = _null_wrap_merge(ignore_nulls, min)
 
@@ -186,6 +188,7 @@ class Max(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"max({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
         null_merge = _null_wrap_merge(ignore_nulls, max)
 
@@ -217,6 +220,7 @@ class Mean(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"mean({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
         null_merge = _null_wrap_merge(
             ignore_nulls, lambda a1, a2: [a1[0] + a2[0], a1[1] + a2[1]]
@@ -467,10 +467,27 @@ class BlockAccessor(Generic[T]):
         """Return a list of sorted partitions of this block."""
         raise NotImplementedError
 
+    def hash_partition(self, key: List[str], num_partitions: int) -> List["Block[T]"]:
+        """Return a list of partitions of this block, assigned by key hash."""
+        raise NotImplementedError
+
     def combine(self, key: KeyFn, agg: "AggregateFn") -> Block[U]:
         """Combine rows with the same key into an accumulator."""
         raise NotImplementedError
 
+    def combine_unsorted(self, key: KeyFn, aggs: Tuple["AggregateFn"]) -> Block[U]:
+        """Combine rows with the same key into an accumulator.
+
+        Unlike `combine()`, this doesn't require the block to be sorted by key. The
+        returned block is sorted by key.
+        """
+        if key is None:
+            return self.combine(key, aggs)
+        block = self.sort_and_partition(
+            [], [(key, "ascending")] if isinstance(key, str) else key, False
+        )[0]
+        return BlockAccessor.for_block(block).combine(key, aggs)
+
     @staticmethod
     def merge_sorted_blocks(
         blocks: List["Block[T]"], key: Any, descending: bool
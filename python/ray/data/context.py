@@ -62,12 +62,26 @@ DEFAULT_USE_PUSH_BASED_SHUFFLE = bool(
     os.environ.get("RAY_DATA_PUSH_BASED_SHUFFLE", None)
 )
 
+# Joins with a side smaller than this size in bytes broadcast that side to every
+# block of the other side, instead of shuffling both sides.
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = 10 * 1024 * 1024
+
 # The default global scheduling strategy.
 DEFAULT_SCHEDULING_STRATEGY = "DEFAULT"
 
 # Whether to use Polars for tabular datastream sorts, groupbys, and aggregations.
 DEFAULT_USE_POLARS = False
 
+# Whether to use hash partitioning instead of range partitioning for groupby
+# aggregations. This skips sampling and sorting the keys, and combines rows with
+# vectorized Arrow aggregations where possible, but the output is not sorted by key.
+DEFAULT_USE_HASH_GROUPBY = False
+
+# Whether Datastream.sort() spreads the rows of hot keys, i.e., keys that make up a
+# large fraction of the sampled rows, over several output blocks instead of a
+# single oversized one. Rows with the same key may then end up in different blocks.
+DEFAULT_USE_SKEW_AWARE_SORT = bool(int(os.environ.get("RAY_DATA_SKEW_AWARE_SORT", "0")))
+
 # Whether to use the new executor backend.
 DEFAULT_NEW_EXECUTION_BACKEND = bool(
     int(os.environ.get("RAY_DATA_NEW_EXECUTION_BACKEND", "1"))
@@ -89,6 +103,29 @@ DEFAULT_TRACE_ALLOCATIONS = bool(int(os.environ.get("RAY_DATA_TRACE_ALLOCATIONS"
 # Whether to estimate in-memory decoding data size for data source.
 DEFAULT_DECODING_SIZE_ESTIMATION_ENABLED = True
 
+# The local directory in which to cache file listings and Parquet file metadata
+# across runs. If None, the metadata cache is disabled. Cached listings are checked
+# against the modification times of the listed directory and its subdirectories.
+# Listings of object store prefixes are never cached, since they have no
+# modification time to detect changes.
+DEFAULT_METADATA_CACHE_DIR = os.environ.get("RAY_DATA_METADATA_CACHE_DIR", None)
+
+# The number of seconds after which cached file listings and metadata expire.
+DEFAULT_METADATA_CACHE_TTL_S = 24 * 60 * 60
+
+# The maximum total size of the metadata cache on disk. The least recently used
+# entries are evicted when the cache grows past this size.
+DEFAULT_METADATA_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Whether the streaming executor splits its object store memory limit into
+# per-operator budgets, derived from the observed output size of each operator.
+# Operators over their budget are throttled once the object store memory limit is
+# about to be exceeded, and the object store spilling of the cluster is attributed
+# to the operators over budget in the execution stats.
+DEFAULT_ENABLE_OPERATOR_MEMORY_BUDGETS = bool(
+    int(os.environ.get("RAY_DATA_OPERATOR_MEMORY_BUDGETS", "0"))
+)
+
 # Whether to automatically cast NumPy ndarray columns in Pandas DataFrames to tensor
 # extension columns.
 DEFAULT_ENABLE_TENSOR_EXTENSION_CASTING = True
@@ -149,12 +186,19 @@ class DataContext:
         actor_prefetcher_enabled: bool,
         use_push_based_shuffle: bool,
         pipeline_push_based_shuffle_reduce_tasks: bool,
+        broadcast_join_threshold_bytes: int,
         scheduling_strategy: SchedulingStrategyT,
         use_polars: bool,
+        use_hash_groupby: bool,
+        use_skew_aware_sort: bool,
         new_execution_backend: bool,
         use_streaming_executor: bool,
         eager_free: bool,
         decoding_size_estimation: bool,
+        metadata_cache_dir: Optional[str],
+        metadata_cache_ttl_s: float,
+        metadata_cache_max_bytes: int,
+        enable_operator_memory_budgets: bool,
         min_parallelism: bool,
         enable_tensor_extension_casting: bool,
         enable_auto_log_stats: bool,
@@ -181,12 +225,19 @@ class DataContext:
         self.pipeline_push_based_shuffle_reduce_tasks = (
             pipeline_push_based_shuffle_reduce_tasks
         )
+        self.broadcast_join_threshold_bytes = broadcast_join_threshold_bytes
         self.scheduling_strategy = scheduling_strategy
         self.use_polars = use_polars
+        self.use_hash_groupby = use_hash_groupby
+        self.use_skew_aware_sort = use_skew_aware_sort
         self.new_execution_backend = new_execution_backend
         self.use_streaming_executor = use_streaming_executor
         self.eager_free = eager_free
         self.decoding_size_estimation = decoding_size_estimation
+        self.metadata_cache_dir = metadata_cache_dir
+        self.metadata_cache_ttl_s = metadata_cache_ttl_s
+        self.metadata_cache_max_bytes = metadata_cache_max_bytes
+        self.enable_operator_memory_budgets = enable_operator_memory_budgets
         self.min_parallelism = min_parallelism
         self.enable_tensor_extension_casting = enable_tensor_extension_casting
         self.enable_auto_log_stats = enable_auto_log_stats
@@ -229,12 +280,23 @@ class DataContext:
                     # because of a scheduling bug at large scale.
                     # See https://github.com/ray-project/ray/issues/25412.
                     pipeline_push_based_shuffle_reduce_tasks=True,
+                    broadcast_join_threshold_bytes=(
+                        DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
+                    ),
                     scheduling_strategy=DEFAULT_SCHEDULING_STRATEGY,
                     use_polars=DEFAULT_USE_POLARS,
+                    use_hash_groupby=DEFAULT_USE_HASH_GROUPBY,
+                    use_skew_aware_sort=DEFAULT_USE_SKEW_AWARE_SORT,
                     new_execution_backend=DEFAULT_NEW_EXECUTION_BACKEND,
                     use_streaming_executor=DEFAULT_USE_STREAMING_EXECUTOR,
                     eager_free=DEFAULT_EAGER_FREE,
                     decoding_size_estimation=DEFAULT_DECODING_SIZE_ESTIMATION_ENABLED,
+                    metadata_cache_dir=DEFAULT_METADATA_CACHE_DIR,
+                    metadata_cache_ttl_s=DEFAULT_METADATA_CACHE_TTL_S,
+                    metadata_cache_max_bytes=DEFAULT_METADATA_CACHE_MAX_BYTES,
+                    enable_operator_memory_budgets=(
+                        DEFAULT_ENABLE_OPERATOR_MEMORY_BUDGETS
+                    ),
                     min_parallelism=DEFAULT_MIN_PARALLELISM,
                     enable_tensor_extension_casting=(
                         DEFAULT_ENABLE_TENSOR_EXTENSION_CASTING
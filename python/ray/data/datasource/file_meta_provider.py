@@ -4,6 +4,7 @@ import pathlib
 import os
 import re
 from typing import (
+    Dict,
     List,
     Optional,
     Union,
@@ -16,6 +17,11 @@ from typing import (
 if TYPE_CHECKING:
     import pyarrow
 
+from ray.data._internal.metadata_cache import (
+    FILE_LISTING_NAMESPACE,
+    PARQUET_METADATA_NAMESPACE,
+    MetadataCache,
+)
 from ray.data.block import BlockMetadata
 from ray.data.datasource.partitioning import Partitioning
 from ray.util.annotations import DeveloperAPI
@@ -135,6 +141,11 @@ class DefaultFileMetadataProvider(BaseFileMetadataProvider):
 
     Calculates block size in bytes as the sum of its constituent file sizes,
     and assumes a fixed number of rows per file.
+
+    If `DataContext.metadata_cache_dir` is set, directory listings are cached on
+    disk across runs, and invalidated when the modification time of the directory
+    or any of its subdirectories changes. Object store prefixes have no
+    modification time, so their listings are not cached.
     """
 
     def _get_block_metadata(
@@ -164,7 +175,13 @@ class DefaultFileMetadataProvider(BaseFileMetadataProvider):
         partitioning: Optional[Partitioning] = None,
         ignore_missing_paths: bool = False,
     ) -> Iterator[Tuple[str, int]]:
-        yield from _expand_paths(paths, filesystem, partitioning, ignore_missing_paths)
+        yield from _expand_paths(
+            paths,
+            filesystem,
+            partitioning,
+            ignore_missing_paths,
+            MetadataCache.from_context(),
+        )
 
 
 @DeveloperAPI
@@ -270,6 +287,9 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
 
     Aggregates total block bytes and number of rows using the Parquet file metadata
     associated with a list of Arrow Parquet datastream file fragments.
+
+    If `DataContext.metadata_cache_dir` is set, Parquet file metadata is cached on
+    disk across runs, keyed by the file path, size, and modification time.
     """
 
     def _get_block_metadata(
@@ -310,29 +330,104 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
         pieces: List["pyarrow.dataset.ParquetFileFragment"],
         **ray_remote_args,
     ) -> Optional[List["pyarrow.parquet.FileMetaData"]]:
-        from ray.data.datasource.parquet_datasource import (
-            PARALLELIZE_META_FETCH_THRESHOLD,
-            PIECES_PER_META_FETCH,
-            _SerializedPiece,
-            _fetch_metadata_serialization_wrapper,
-            _fetch_metadata,
-        )
-        from ray.data.datasource.file_based_datasource import _fetch_metadata_parallel
-
-        if len(pieces) > PARALLELIZE_META_FETCH_THRESHOLD:
-            # Wrap Parquet fragments in serialization workaround.
-            pieces = [_SerializedPiece(piece) for piece in pieces]
-            # Fetch Parquet metadata in parallel using Ray tasks.
-            return list(
-                _fetch_metadata_parallel(
-                    pieces,
-                    _fetch_metadata_serialization_wrapper,
-                    PIECES_PER_META_FETCH,
-                    **ray_remote_args,
-                )
+        cache = MetadataCache.from_context()
+        if cache is None or not pieces:
+            return _fetch_parquet_metadata(pieces, **ray_remote_args)
+
+        keys = _parquet_metadata_cache_keys(pieces, **ray_remote_args)
+        metadata = [cache.get(PARQUET_METADATA_NAMESPACE, key) for key in keys]
+        missing = [i for i, m in enumerate(metadata) if m is None]
+        if missing:
+            fetched = _fetch_parquet_metadata(
+                [pieces[i] for i in missing], **ray_remote_args
             )
-        else:
-            return _fetch_metadata(pieces)
+            # Metadata is only fetched up to the first piece that doesn't have any.
+            for i, m in zip(missing, fetched):
+                metadata[i] = m
+            cache.put_all(
+                PARQUET_METADATA_NAMESPACE,
+                {keys[i]: m for i, m in zip(missing, fetched)},
+            )
+        if None in metadata:
+            # Only return the metadata up to the first piece without any, like
+            # `_fetch_metadata()` does.
+            metadata = metadata[: metadata.index(None)]
+        return metadata
+
+
+def _fetch_parquet_metadata(
+    pieces: List["pyarrow.dataset.ParquetFileFragment"],
+    **ray_remote_args,
+) -> List["pyarrow.parquet.FileMetaData"]:
+    from ray.data.datasource.parquet_datasource import (
+        PARALLELIZE_META_FETCH_THRESHOLD,
+        PIECES_PER_META_FETCH,
+        _SerializedPiece,
+        _fetch_metadata_serialization_wrapper,
+        _fetch_metadata,
+    )
+    from ray.data.datasource.file_based_datasource import _fetch_metadata_parallel
+
+    if len(pieces) > PARALLELIZE_META_FETCH_THRESHOLD:
+        # Wrap Parquet fragments in serialization workaround.
+        pieces = [_SerializedPiece(piece) for piece in pieces]
+        # Fetch Parquet metadata in parallel using Ray tasks.
+        return list(
+            _fetch_metadata_parallel(
+                pieces,
+                _fetch_metadata_serialization_wrapper,
+                PIECES_PER_META_FETCH,
+                **ray_remote_args,
+            )
+        )
+    else:
+        return _fetch_metadata(pieces)
+
+
+def _parquet_metadata_cache_keys(
+    pieces: List["pyarrow.dataset.ParquetFileFragment"],
+    **ray_remote_args,
+) -> List[Tuple[str, str, int, Optional[int]]]:
+    """Return the metadata cache keys of the Parquet file fragments.
+
+    The keys include the size and modification time of each file, so that cached
+    metadata is invalidated when a file is rewritten. Like the metadata itself, the
+    file infos of many fragments are fetched in parallel using Ray tasks.
+    """
+    from ray.data.datasource.parquet_datasource import (
+        PARALLELIZE_META_FETCH_THRESHOLD,
+        PIECES_PER_META_FETCH,
+    )
+    from ray.data.datasource.file_based_datasource import (
+        _wrap_s3_serialization_workaround,
+        _unwrap_s3_serialization_workaround,
+        _fetch_metadata_parallel,
+    )
+
+    filesystem = pieces[0].filesystem
+    paths = [piece.path for piece in pieces]
+    if len(pieces) > PARALLELIZE_META_FETCH_THRESHOLD:
+        wrapped_filesystem = _wrap_s3_serialization_workaround(filesystem)
+
+        def _file_stats_fetcher(paths: List[str]) -> List[Tuple[int, Optional[int]]]:
+            fs = _unwrap_s3_serialization_workaround(wrapped_filesystem)
+            return [
+                (file_info.size, file_info.mtime_ns)
+                for file_info in fs.get_file_info(list(paths))
+            ]
+
+        file_stats = _fetch_metadata_parallel(
+            paths, _file_stats_fetcher, PIECES_PER_META_FETCH, **ray_remote_args
+        )
+    else:
+        file_stats = [
+            (file_info.size, file_info.mtime_ns)
+            for file_info in filesystem.get_file_info(paths)
+        ]
+    return [
+        (filesystem.type_name, path, size, mtime_ns)
+        for path, (size, mtime_ns) in zip(paths, file_stats)
+    ]
 
 
 def _handle_read_os_error(error: OSError, paths: Union[str, List[str]]) -> str:
@@ -375,6 +470,7 @@ def _expand_paths(
     filesystem: "pyarrow.fs.FileSystem",
     partitioning: Optional[Partitioning],
     ignore_missing_paths: bool = False,
+    cache: Optional[MetadataCache] = None,
 ) -> Iterator[Tuple[str, int]]:
     """Get the file sizes for all provided file paths."""
     from pyarrow.fs import LocalFileSystem
@@ -397,7 +493,9 @@ def _expand_paths(
         # Local file systems are very fast to hit.
         or isinstance(filesystem, LocalFileSystem)
     ):
-        yield from _get_file_infos_serial(paths, filesystem, ignore_missing_paths)
+        yield from _get_file_infos_serial(
+            paths, filesystem, ignore_missing_paths, cache
+        )
     else:
         # 2. Common path prefix case.
         # Get longest common path of all paths.
@@ -410,7 +508,7 @@ def _expand_paths(
             and common_path == _unwrap_protocol(partitioning.base_dir)
         ) or all(str(pathlib.Path(path).parent) == common_path for path in paths):
             yield from _get_file_infos_common_path_prefix(
-                paths, common_path, filesystem, ignore_missing_paths
+                paths, common_path, filesystem, ignore_missing_paths, cache
             )
         # 3. Parallelization case.
         else:
@@ -421,16 +519,19 @@ def _expand_paths(
                 "metadata fetching."
             )
             # Parallelize requests via Ray tasks.
-            yield from _get_file_infos_parallel(paths, filesystem, ignore_missing_paths)
+            yield from _get_file_infos_parallel(
+                paths, filesystem, ignore_missing_paths, cache
+            )
 
 
 def _get_file_infos_serial(
     paths: List[str],
     filesystem: "pyarrow.fs.FileSystem",
     ignore_missing_paths: bool = False,
+    cache: Optional[MetadataCache] = None,
 ) -> Iterator[Tuple[str, int]]:
     for path in paths:
-        yield from _get_file_infos(path, filesystem, ignore_missing_paths)
+        yield from _get_file_infos(path, filesystem, ignore_missing_paths, cache)
 
 
 def _get_file_infos_common_path_prefix(
@@ -438,10 +539,11 @@ def _get_file_infos_common_path_prefix(
     common_path: str,
     filesystem: "pyarrow.fs.FileSystem",
     ignore_missing_paths: bool = False,
+    cache: Optional[MetadataCache] = None,
 ) -> Iterator[Tuple[str, int]]:
     path_to_size = {path: None for path in paths}
     for path, file_size in _get_file_infos(
-        common_path, filesystem, ignore_missing_paths
+        common_path, filesystem, ignore_missing_paths, cache
     ):
         if path in path_to_size:
             path_to_size[path] = file_size
@@ -458,6 +560,7 @@ def _get_file_infos_parallel(
     paths: List[str],
     filesystem: "pyarrow.fs.FileSystem",
     ignore_missing_paths: bool = False,
+    cache: Optional[MetadataCache] = None,
 ) -> Iterator[Tuple[str, int]]:
     from ray.data.datasource.file_based_datasource import (
         PATHS_PER_FILE_SIZE_FETCH_TASK,
@@ -474,7 +577,7 @@ def _get_file_infos_parallel(
         fs = _unwrap_s3_serialization_workaround(filesystem)
         return list(
             itertools.chain.from_iterable(
-                _get_file_infos(path, fs, ignore_missing_paths) for path in paths
+                _get_file_infos(path, fs, ignore_missing_paths, cache) for path in paths
             )
         )
 
@@ -484,9 +587,19 @@ def _get_file_infos_parallel(
 
 
 def _get_file_infos(
-    path: str, filesystem: "pyarrow.fs.FileSystem", ignore_missing_path: bool = False
+    path: str,
+    filesystem: "pyarrow.fs.FileSystem",
+    ignore_missing_path: bool = False,
+    cache: Optional[MetadataCache] = None,
 ) -> List[Tuple[str, int]]:
-    """Get the file info for all files at or under the provided path."""
+    """Get the file info for all files at or under the provided path.
+
+    If a metadata cache is provided, directory listings are looked up in and added to
+    the cache, keyed by the directory path and modification time. Since these are
+    recursive listings, the modification times of the subdirectories are cached
+    with the listing, and checked before it's used. Listings of directories without
+    a modification time, e.g. object store prefixes, are not cached.
+    """
     from pyarrow.fs import FileType
 
     file_infos = []
@@ -495,8 +608,25 @@ def _get_file_infos(
     except OSError as e:
         _handle_read_os_error(e, path)
     if file_info.type == FileType.Directory:
-        for (file_path, file_size) in _expand_directory(path, filesystem):
+        # Object stores don't report a modification time for prefixes, so a cached
+        # listing couldn't be invalidated when files are added. Such listings are
+        # never cached, since a stale listing would silently skip files.
+        if file_info.mtime_ns is None:
+            cache = None
+        if cache is not None:
+            key = (filesystem.type_name, path, file_info.mtime_ns)
+            cached = cache.get(FILE_LISTING_NAMESPACE, key)
+            # The modification time of a directory isn't updated when files in its
+            # subdirectories change, so the subdirectories are checked as well.
+            if cached is not None and _are_mtimes_unchanged(cached[0], filesystem):
+                return cached[1]
+        subdir_mtimes = {}
+        for (file_path, file_size) in _expand_directory(
+            path, filesystem, subdir_mtimes=subdir_mtimes
+        ):
             file_infos.append((file_path, file_size))
+        if cache is not None and None not in subdir_mtimes.values():
+            cache.put(FILE_LISTING_NAMESPACE, key, (subdir_mtimes, file_infos))
     elif file_info.type == FileType.File:
         file_infos.append((path, file_info.size))
     elif file_info.type == FileType.NotFound and ignore_missing_path:
@@ -507,11 +637,28 @@ def _get_file_infos(
     return file_infos
 
 
+def _are_mtimes_unchanged(
+    dir_mtimes: Dict[str, int], filesystem: "pyarrow.fs.FileSystem"
+) -> bool:
+    """Check that the directories still have the given modification times."""
+    from pyarrow.fs import FileType
+
+    if not dir_mtimes:
+        return True
+    # Get the file infos of all directories with a single call.
+    file_infos = filesystem.get_file_info(list(dir_mtimes))
+    return all(
+        file_info.type == FileType.Directory and file_info.mtime_ns == mtime_ns
+        for file_info, mtime_ns in zip(file_infos, dir_mtimes.values())
+    )
+
+
 def _expand_directory(
     path: str,
     filesystem: "pyarrow.fs.FileSystem",
     exclude_prefixes: Optional[List[str]] = None,
     ignore_missing_path: bool = False,
+    subdir_mtimes: Optional[Dict[str, Optional[int]]] = None,
 ) -> List[Tuple[str, int]]:
     """
     Expand the provided directory path to a list of file paths.
@@ -523,6 +670,8 @@ def _expand_directory(
         exclude_prefixes: The file relative path prefixes that should be
             excluded from the returned file set. Default excluded prefixes are
             "." and "_".
+        subdir_mtimes: If provided, the modification times of all subdirectories
+            are added to this dict, by path.
 
     Returns:
         An iterator of (file_path, file_size) tuples.
@@ -530,7 +679,7 @@ def _expand_directory(
     if exclude_prefixes is None:
         exclude_prefixes = [".", "_"]
 
-    from pyarrow.fs import FileSelector
+    from pyarrow.fs import FileSelector, FileType
 
     selector = FileSelector(path, recursive=True, allow_not_found=ignore_missing_path)
     files = filesystem.get_file_info(selector)
@@ -538,6 +687,8 @@ def _expand_directory(
     out = []
     for file_ in files:
         if not file_.is_file:
+            if subdir_mtimes is not None and file_.type == FileType.Directory:
+                subdir_mtimes[file_.path] = file_.mtime_ns
             continue
         file_path = file_.path
         if not file_path.startswith(base_path):
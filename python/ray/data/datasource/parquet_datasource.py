@@ -258,7 +258,9 @@ class _ParquetDatasourceReader(Reader):
         for file_metadata in self._metadata:
             for row_group_idx in range(file_metadata.num_row_groups):
                 row_group_metadata = file_metadata.row_group(row_group_idx)
-                total_size += row_group_metadata.total_byte_size
+                total_size += _get_row_group_size_bytes(
+                    row_group_metadata, self._columns
+                )
         return total_size * self._encoding_ratio
 
     def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
@@ -285,6 +287,17 @@ class _ParquetDatasourceReader(Reader):
             # since the resulting row count is unknown.
             if self._reader_args.get("filter") is not None:
                 meta.num_rows = None
+            # If the read is projected, only count the size of the read columns.
+            if (
+                self._columns
+                and meta.size_bytes is not None
+                and len(metadata) == len(pieces)
+            ):
+                meta.size_bytes = sum(
+                    _get_row_group_size_bytes(m.row_group(i), self._columns)
+                    for m in metadata
+                    for i in range(m.num_row_groups)
+                )
 
             if meta.size_bytes is not None:
                 meta.size_bytes = int(meta.size_bytes * self._encoding_ratio)
@@ -362,6 +375,27 @@ class _ParquetDatasourceReader(Reader):
         return max(ratio, PARQUET_ENCODING_RATIO_ESTIMATE_LOWER_BOUND)
 
 
+def _get_row_group_size_bytes(
+    row_group_metadata: "pyarrow.parquet.RowGroupMetaData",
+    columns: Optional[List[str]],
+) -> int:
+    """Returns the uncompressed size of the columns read from a row group.
+
+    If the read is projected to a subset of the columns, only the column chunks
+    of these columns are counted.
+    """
+    if not columns:
+        return row_group_metadata.total_byte_size
+    columns = set(columns)
+    total_size = 0
+    for column_idx in range(row_group_metadata.num_columns):
+        column_metadata = row_group_metadata.column(column_idx)
+        # Nested columns have one chunk per leaf, e.g. "a.list.element".
+        if column_metadata.path_in_schema.split(".")[0] in columns:
+            total_size += column_metadata.total_uncompressed_size
+    return total_size
+
+
 def _read_pieces(
     block_udf, reader_args, columns, schema, serialized_pieces: List[_SerializedPiece]
 ) -> Iterator["pyarrow.Table"]:
@@ -29,19 +29,23 @@ import ray.cloudpickle as pickle
 from ray._private.usage import usage_lib
 from ray.air.constants import TENSOR_COLUMN_NAME
 from ray.air.util.data_batch_conversion import BlockFormat
+from ray.data._internal.arrow_ops import transform_pyarrow
 from ray.data._internal.logical.operators.all_to_all_operator import (
     RandomShuffle,
     RandomizeBlocks,
     Repartition,
     Sort,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.limit_operator import Limit
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.optimizers import LogicalPlan
 from ray.data._internal.logical.operators.map_operator import (
+    ExpressionFilter,
     Filter,
     FlatMap,
     MapRows,
     MapBatches,
+    Project,
 )
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.planner.filter import generate_filter_fn
@@ -71,12 +75,15 @@ from ray.data._internal.util import (
     _is_local_scheme,
     ConsumptionAPI,
 )
+from ray.data._internal.join import validate_join_args
 from ray.data._internal.pandas_block import PandasBlockSchema
 from ray.data._internal.plan import (
     ExecutionPlan,
     OneToOneStage,
 )
 from ray.data._internal.stage_impl import (
+    JoinStage,
+    LimitStage,
     RandomizeBlocksStage,
     RepartitionStage,
     RandomShuffleStage,
@@ -772,12 +779,13 @@ class Datastream(Generic[T]):
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
 
-        return self.map_batches(
+        return self._project(
             lambda batch: batch.drop(columns=cols),
+            cols,
+            drop=True,
             batch_format="pandas",
-            zero_copy_batch=True,
             compute=compute,
-            **ray_remote_args,
+            ray_remote_args=ray_remote_args,
         )
 
     def select_columns(
@@ -819,13 +827,61 @@ class Datastream(Generic[T]):
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
-        return self.map_batches(
+        return self._project(
             lambda batch: BlockAccessor.for_block(batch).select(columns=cols),
-            zero_copy_batch=True,
+            cols,
+            drop=False,
+            batch_format="default",
             compute=compute,
-            **ray_remote_args,
+            ray_remote_args=ray_remote_args,
+        )
+
+    def _project(
+        self,
+        fn: BatchUDF,
+        cols: List[str],
+        *,
+        drop: bool,
+        batch_format: str,
+        compute: Optional[Union[str, ComputeStrategy]],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Datastream":
+        """Apply the batch function ``fn`` selecting or dropping ``cols``.
+
+        This is equivalent to ``map_batches(fn)``, but the logical plan records
+        the columns so the optimizer can push the projection into the read.
+        """
+        batch_format = _apply_strict_mode_batch_format(batch_format)
+        transform_fn = generate_map_batches_fn(
+            batch_size=DEFAULT_BATCH_SIZE,
+            batch_format=batch_format,
+            zero_copy_batch=True,
+        )
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                f"MapBatches({fn.__name__})",
+                transform_fn,
+                compute,
+                ray_remote_args,
+                fn=fn,
+            )
         )
 
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = Project(
+                logical_plan.dag,
+                fn,
+                cols,
+                drop=drop,
+                batch_format=batch_format,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+
+        return Datastream(plan, self._epoch, self._lazy, logical_plan)
+
     def flat_map(
         self,
         fn: FlatMapUDF[T, U],
@@ -902,7 +958,7 @@ class Datastream(Generic[T]):
 
     def filter(
         self,
-        fn: RowUDF[T, U],
+        fn: Union[RowUDF[T, U], "pyarrow.dataset.Expression"],
         *,
         compute: Union[str, ComputeStrategy] = None,
         **ray_remote_args,
@@ -910,7 +966,7 @@ class Datastream(Generic[T]):
         """Filter out records that do not satisfy the given predicate.
 
         Consider using ``.map_batches()`` for better performance (you can implement
-        filter by dropping records).
+        filter by dropping records), or passing a pyarrow expression as predicate.
 
         Examples:
             >>> import ray
@@ -919,12 +975,22 @@ class Datastream(Generic[T]):
             Filter
             +- Datastream(num_blocks=..., num_rows=100, schema=<class 'int'>)
 
+            >>> import pyarrow.dataset as pds
+            >>> ds = ray.data.range_table(100)
+            >>> ds.filter(pds.field("value") < 50)
+            Filter
+            +- Datastream(num_blocks=..., num_rows=100, schema={value: int64})
+
         Time complexity: O(datastream size / parallelism)
 
         Args:
             fn: The predicate to apply to each record, or a class type
                 that can be instantiated to create such a callable. Callable classes are
-                only supported for the actor compute strategy.
+                only supported for the actor compute strategy. It can also be a
+                pyarrow expression, which is evaluated on Arrow batches of
+                records. Expressions following a Parquet read are pushed down into
+                the read when the new execution optimizer is enabled, so row
+                groups are skipped using their statistics.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
                 pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
@@ -943,6 +1009,11 @@ class Datastream(Generic[T]):
                 "For example, use ``compute=ActorPoolStrategy(size=n)``."
             )
 
+        if _is_arrow_expression(fn):
+            return self._filter_by_expression(
+                fn, compute=compute, ray_remote_args=ray_remote_args
+            )
+
         self._warn_slow()
 
         transform_fn = generate_filter_fn()
@@ -963,6 +1034,40 @@ class Datastream(Generic[T]):
 
         return Datastream(plan, self._epoch, self._lazy, logical_plan)
 
+    def _filter_by_expression(
+        self,
+        expr: "pyarrow.dataset.Expression",
+        *,
+        compute: Optional[Union[str, ComputeStrategy]],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Datastream[T]":
+        """Filter out records that do not satisfy the pyarrow expression."""
+
+        def fn(batch: "pyarrow.Table") -> "pyarrow.Table":
+            return transform_pyarrow.filter_table(batch, expr)
+
+        transform_fn = generate_map_batches_fn(
+            batch_size=DEFAULT_BATCH_SIZE,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+        )
+        plan = self._plan.with_stage(
+            OneToOneStage("Filter", transform_fn, compute, ray_remote_args, fn=fn)
+        )
+
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = ExpressionFilter(
+                logical_plan.dag,
+                fn,
+                expr,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+
+        return Datastream(plan, self._epoch, self._lazy, logical_plan)
+
     def repartition(self, num_blocks: int, *, shuffle: bool = False) -> "Datastream[T]":
         """Repartition the datastream into exactly this number of blocks.
 
@@ -2116,8 +2221,18 @@ class Datastream(Generic[T]):
         Returns:
             A new, sorted datastream.
         """
+        return self._sort(key, descending)
 
-        plan = self._plan.with_stage(SortStage(self, key, descending))
+    def _sort(
+        self,
+        key: Optional[KeyFn] = None,
+        descending: bool = False,
+        split_hot_keys: Optional[bool] = None,
+    ) -> "Datastream[T]":
+        """Sort the datastream, optionally allowing the rows of hot keys to be split
+        across blocks. If `split_hot_keys` is None, this is set by
+        `DataContext.use_skew_aware_sort`."""
+        plan = self._plan.with_stage(SortStage(self, key, descending, split_hot_keys))
 
         logical_plan = self._logical_plan
         if logical_plan is not None:
@@ -2125,6 +2240,7 @@ class Datastream(Generic[T]):
                 logical_plan.dag,
                 key=key,
                 descending=descending,
+                split_hot_keys=split_hot_keys,
             )
             logical_plan = LogicalPlan(op)
         return Datastream(plan, self._epoch, self._lazy, logical_plan)
@@ -2175,14 +2291,82 @@ class Datastream(Generic[T]):
             logical_plan = LogicalPlan(op)
         return Datastream(plan, self._epoch, self._lazy, logical_plan)
 
-    @ConsumptionAPI
+    def join(
+        self,
+        other: "Datastream[U]",
+        on: Union[str, List[str]],
+        how: str = "inner",
+        *,
+        suffixes: Tuple[str, str] = ("_x", "_y"),
+    ) -> "Datastream[T]":
+        """Join this datastream with another datastream on the given key columns.
+
+        Both datastreams are hash partitioned on the key columns with an all-to-all
+        shuffle, and the partitions with the same keys are joined in parallel. If
+        one side is smaller than ``DataContext.broadcast_join_threshold_bytes`` and
+        the join type allows it, that side is instead broadcast to every block of
+        the other side, which avoids shuffling either side.
+
+        .. note::
+            The rows of the output are not ordered.
+
+        .. note::
+            Joined datastreams are not lineage-serializable, i.e. they can not be
+            used as a tunable hyperparameter in Ray Tune.
+
+        Examples:
+            >>> import ray
+            >>> users = ray.data.from_items(
+            ...     [{"id": i, "name": f"user_{i}"} for i in range(3)])
+            >>> orders = ray.data.from_items(
+            ...     [{"id": i % 2, "amount": i} for i in range(4)])
+            >>> users.join(orders, on="id").sort("amount").take() # doctest: +SKIP
+            [{'id': 0, 'name': 'user_0', 'amount': 0}, \
+{'id': 1, 'name': 'user_1', 'amount': 1}, \
+{'id': 0, 'name': 'user_0', 'amount': 2}, \
+{'id': 1, 'name': 'user_1', 'amount': 3}]
+
+        Time complexity: O(datastream size / parallelism)
+
+        Args:
+            other: The datastream to join with on the right hand side.
+            on: The column name or list of column names to join on. They must be
+                present in both datastreams.
+            how: The type of join, one of ``"inner"``, ``"left"``, ``"right"`` or
+                ``"outer"``, with the same semantics as :func:`pandas.merge`.
+            suffixes: The suffixes to add to the names of overlapping non-key
+                columns from the left and right hand side.
+
+        Returns:
+            A new datastream with the columns of both datastreams.
+        """
+        on = validate_join_args(on, how)
+        plan = self._plan.with_stage(JoinStage(other, on, how, suffixes))
+
+        logical_plan = self._logical_plan
+        other_logical_plan = other._logical_plan
+        if logical_plan is not None and other_logical_plan is not None:
+            op = Join(logical_plan.dag, other_logical_plan.dag, on, how, suffixes)
+            logical_plan = LogicalPlan(op)
+        return Datastream(plan, self._epoch, self._lazy, logical_plan)
+
+    @ConsumptionAPI(
+        delegate=(
+            "If the optimizer is disabled (``DataContext.optimizer_enabled``), "
+            "this operation"
+        )
+    )
     def limit(self, limit: int) -> "Datastream[T]":
-        """Materialize and truncate the datastream to the first ``limit`` records.
+        """Truncate the datastream to the first ``limit`` records.
 
         Contrary to :meth`.take`, this will not move any data to the caller's
         machine. Instead, it will return a new ``Datastream`` pointing to the truncated
         distributed data.
 
+        If the optimizer is enabled, the limit is applied lazily: it's pushed down
+        into the reads where possible, and execution stops once ``limit`` records
+        have been produced. Otherwise, the datastream is materialized and truncated.
+
         Examples:
             >>> import ray
             >>> ds = ray.data.range(1000)
@@ -2197,6 +2381,16 @@ class Datastream(Generic[T]):
         Returns:
             The truncated datastream.
         """
+        if (
+            self._logical_plan is not None
+            and DataContext.get_current().optimizer_enabled
+        ):
+            # Add the limit lazily, so it can be pushed down into the reads, and the
+            # streaming execution stops once the limit is reached.
+            plan = self._plan.with_stage(LimitStage(limit))
+            logical_plan = LogicalPlan(Limit(self._logical_plan.dag, limit))
+            return Datastream(plan, self._epoch, self._lazy, logical_plan)
+
         start_time = time.perf_counter()
         # Truncate the block list to the minimum number of blocks that contains at least
         # `limit` rows.
@@ -3809,6 +4003,7 @@ class Datastream(Generic[T]):
         self,
         key: str,
         num_workers: Optional[int] = None,
+        cache_size: int = 0,
     ) -> RandomAccessDataset:
         """Convert this datastream into a distributed RandomAccessDataset (EXPERIMENTAL).
 
@@ -3829,10 +4024,15 @@ class Datastream(Generic[T]):
                 in the cluster by four. As a rule of thumb, you can expect each worker
                 to provide ~3000 records / second via ``get_async()``, and
                 ~10000 records / second via ``multiget()``.
+            cache_size: The number of recently looked up records that each worker
+                caches, which speeds up lookups of frequently queried keys. By
+                default, records are not cached.
         """
         if num_workers is None:
             num_workers = 4 * len(ray.nodes())
-        return RandomAccessDataset(self, key, num_workers=num_workers)
+        return RandomAccessDataset(
+            self, key, num_workers=num_workers, cache_size=cache_size
+        )
 
     @ConsumptionAPI
     def repeat(self, times: Optional[int] = None) -> "DatasetPipeline[T]":
@@ -4751,6 +4951,14 @@ def _block_to_arrow(block: Block):
     return block.to_arrow()
 
 
+def _is_arrow_expression(obj: Any) -> bool:
+    try:
+        import pyarrow.dataset as pds
+    except ImportError:
+        return False
+    return isinstance(obj, pds.Expression)
+
+
 def _sliding_window(iterable: Iterable, n: int):
     """Creates an iterator consisting of n-width sliding windows over
     iterable. The sliding windows are constructed lazily such that an
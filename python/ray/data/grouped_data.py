@@ -117,6 +117,38 @@ class PushBasedGroupbyOp(_GroupbyOp, PushBasedShufflePlan):
     pass
 
 
+class _HashGroupbyOp(_GroupbyOp):
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        key: str,
+        aggs: Tuple[AggregateFn],
+    ) -> List[Union[BlockMetadata, Block]]:
+        """Combine rows with the same key and partition the block by key hash."""
+        stats = BlockExecStats.builder()
+
+        block = _GroupbyOp._prune_unused_columns(block, key, aggs)
+        combined = BlockAccessor.for_block(block).combine_unsorted(key, aggs)
+        # Partitioning keeps the combined rows sorted by key within each partition.
+        parts = BlockAccessor.for_block(combined).hash_partition(
+            [key], output_num_blocks
+        )
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return parts + [meta]
+
+
+class SimpleShuffleHashGroupbyOp(_HashGroupbyOp, SimpleShufflePlan):
+    pass
+
+
+class PushBasedHashGroupbyOp(_HashGroupbyOp, PushBasedShufflePlan):
+    pass
+
+
 @PublicAPI
 class GroupedData(Generic[T]):
     """Represents a grouped datastream created by calling ``Datastream.groupby()``.
@@ -195,6 +227,22 @@ class GroupedData(Generic[T]):
 
             num_mappers = blocks.initial_num_blocks()
             num_reducers = num_mappers
+            ctx = DataContext.get_current()
+            if ctx.use_hash_groupby and isinstance(self._key, str):
+                # Hash partitioning doesn't need to sample the key boundaries.
+                if ctx.use_push_based_shuffle:
+                    shuffle_op_cls = PushBasedHashGroupbyOp
+                else:
+                    shuffle_op_cls = SimpleShuffleHashGroupbyOp
+                shuffle_op = shuffle_op_cls(
+                    map_args=[self._key, aggs], reduce_args=[self._key, aggs]
+                )
+                return shuffle_op.execute(
+                    blocks,
+                    num_reducers,
+                    clear_input_blocks,
+                    ctx=task_ctx,
+                )
             if self._key is None:
                 num_reducers = 1
                 boundaries = []
@@ -207,7 +255,6 @@ class GroupedData(Generic[T]):
                     num_reducers,
                     task_ctx,
                 )
-            ctx = DataContext.get_current()
             if ctx.use_push_based_shuffle:
                 shuffle_op_cls = PushBasedGroupbyOp
             else:
@@ -341,9 +388,9 @@ class GroupedData(Generic[T]):
         """
         # Globally sort records by key.
         # Note that sort() will ensure that records of the same key partitioned
-        # into the same block.
+        # into the same block, as long as hot keys aren't split.
         if self._key is not None:
-            sorted_ds = self._datastream.sort(self._key)
+            sorted_ds = self._datastream._sort(self._key, split_hot_keys=False)
         else:
             sorted_ds = self._datastream.repartition(1)
 
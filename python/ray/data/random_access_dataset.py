@@ -2,14 +2,15 @@ import bisect
 import logging
 import random
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import numpy as np
-from typing import List, Any, Generic, Optional, TYPE_CHECKING
+from typing import Dict, List, Any, Generic, Optional, Tuple, TYPE_CHECKING
 
 import ray
 from ray.types import ObjectRef
-from ray.data.block import T, BlockAccessor
+from ray.data.block import T, Block, BlockAccessor
 from ray.data.context import DataContext, DEFAULT_SCHEDULING_STRATEGY
+from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.util.annotations import PublicAPI
 
@@ -23,6 +24,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# The kinds of NumPy dtypes that are compared as numbers.
+_NUMERIC_KINDS = "biuf"
+
+# Sentinel for cache misses, since None is cached for missing keys.
+_MISSING = object()
+
 
 @PublicAPI(stability="alpha")
 class RandomAccessDataset(Generic[T]):
@@ -36,6 +43,7 @@ class RandomAccessDataset(Generic[T]):
         ds: "Datastream[T]",
         key: str,
         num_workers: int,
+        cache_size: int = 0,
     ):
         """Construct a RandomAccessDataset (internal API).
 
@@ -63,6 +71,7 @@ class RandomAccessDataset(Generic[T]):
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
                 self._upper_bounds.append(b[1])
+        self._upper_bounds_array = np.asarray(self._upper_bounds)
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
@@ -72,7 +81,7 @@ class RandomAccessDataset(Generic[T]):
             scheduling_strategy = "SPREAD"
         self._workers = [
             _RandomAccessWorker.options(scheduling_strategy=scheduling_strategy).remote(
-                key
+                key, cache_size
             )
             for _ in range(num_workers)
         ]
@@ -153,24 +162,34 @@ class RandomAccessDataset(Generic[T]):
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
-        batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
+        keys = list(keys)
+        block_indices = self._find_le_batch(keys)
+        # Group the keys by the worker serving their block, so that each worker gets
+        # a single request for all of its blocks.
+        worker_positions = defaultdict(list)
+        for block_index, positions in _group_by_index(block_indices):
+            if block_index < 0:
                 continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+            worker_positions[self._worker_for(block_index)].append(positions)
+        futures = {}
+        for worker, positions in worker_positions.items():
+            positions = np.concatenate(positions)
+            futures[worker] = (
+                positions,
+                worker.multiget.remote(
+                    block_indices[positions].tolist(), [keys[p] for p in positions]
+                ),
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+        results = [None] * len(keys)
+        for positions, fut in futures.values():
+            block, indices = ray.get(fut)
+            if block is None:
+                continue
+            acc = BlockAccessor.for_block(block)
+            for p, i in zip(positions, indices):
+                if i >= 0:
+                    results[p] = acc._get_row(i)
+        return results
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -190,6 +209,12 @@ class RandomAccessDataset(Generic[T]):
         msg += "- Mean access time: {}us\n".format(
             int(total_time / (1 + sum(accesses)) * 1e6)
         )
+        cache_hits = sum(s["cache_hits"] for s in stats)
+        cache_lookups = cache_hits + sum(s["cache_misses"] for s in stats)
+        if cache_lookups:
+            msg += "- Cache hit rate: {}%\n".format(
+                round(100 * cache_hits / cache_lookups, 2)
+            )
         return msg
 
     def _worker_for(self, block_index: int):
@@ -201,44 +226,90 @@ class RandomAccessDataset(Generic[T]):
             return None
         return i
 
+    def _find_le_batch(self, keys: List[Any]) -> np.ndarray:
+        """Vectorized version of `_find_le()`, which returns -1 for missing keys."""
+        if not self._upper_bounds:
+            return np.full(len(keys), -1)
+        try:
+            needles = _as_search_keys(keys, self._upper_bounds_array)
+            indices = np.searchsorted(self._upper_bounds_array, needles)
+            indices[
+                (indices >= len(self._upper_bounds)) | (needles < self._lower_bound)
+            ] = -1
+            return indices
+        except TypeError:
+            # The keys can't be compared in NumPy, e.g., because some are None.
+            indices = [self._find_le(k) for k in keys]
+            return np.array([-1 if i is None else i for i in indices], dtype=np.int64)
+
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
-    def __init__(self, key_field):
+    def __init__(self, key_field, cache_size=0):
         self.blocks = None
+        self.key_columns: Dict[int, np.ndarray] = {}
         self.key_field = key_field
+        self.cache = _LRUCache(cache_size) if cache_size > 0 else None
         self.num_accesses = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
         self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.key_columns = {}
 
     def get(self, block_index, key):
-        start = time.perf_counter()
-        result = self._get(block_index, key)
-        self.total_time += time.perf_counter() - start
-        self.num_accesses += 1
-        return result
+        block, indices = self.multiget([block_index], [key])
+        if indices[0] < 0:
+            return None
+        return BlockAccessor.for_block(block)._get_row(indices[0])
 
     def multiget(self, block_indices, keys):
+        """Find the records for a list of keys.
+
+        Returns:
+            A block with the found records, and the index of the record of each key
+            in that block, or -1 if not found. Returning a compact block instead of
+            rows avoids serializing the assigned blocks backing each row.
+        """
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
+        # The (block, row index) location of the record of each key.
+        locations = [None] * len(keys)
+        if self.cache is None:
+            lookups = list(range(len(keys)))
         else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+            # Serve the hot keys from the cache, and look up the rest.
+            lookups = []
+            for i, key in enumerate(keys):
+                location = self.cache.get(key, _MISSING)
+                if location is _MISSING:
+                    lookups.append(i)
+                else:
+                    locations[i] = location
+        for block_index, positions in _group_by_index(
+            np.asarray([block_indices[i] for i in lookups])
+        ):
+            block = self.blocks[block_index]
+            rows = self._find_rows(block_index, [keys[lookups[p]] for p in positions])
+            for p, row in zip(positions, rows):
+                if row >= 0:
+                    locations[lookups[p]] = (block, row)
+        result, indices = _take_records(locations)
+        if self.cache is not None:
+            # Cache a copy of each record in its own one-row block, so the
+            # cache doesn't keep the result block or the assigned blocks alive
+            # and its memory is bounded by the cache size.
+            accessor = BlockAccessor.for_block(result) if result is not None else None
+            for i in lookups:
+                index = indices[i]
+                self.cache.put(
+                    keys[i],
+                    (accessor.slice(index, index + 1, copy=True), 0)
+                    if index >= 0
+                    else None,
+                )
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
-        return result
+        return result, indices
 
     def ping(self):
         return ray.get_runtime_context().get_node_id()
@@ -248,20 +319,117 @@ class _RandomAccessWorker:
             "num_blocks": len(self.blocks),
             "num_accesses": self.num_accesses,
             "total_time": self.total_time,
+            "cache_hits": self.cache.hits if self.cache else 0,
+            "cache_misses": self.cache.misses if self.cache else 0,
         }
 
-    def _get(self, block_index, key):
-        if block_index is None:
-            return None
+    def _find_rows(self, block_index, keys) -> List[int]:
+        """Find the row indices of a list of keys in a block, or -1 if not found.
+
+        This does a vectorized binary search over the sorted key column of the
+        block.
+        """
         block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
-            return None
-        acc = BlockAccessor.for_block(block)
-        return acc._get_row(i)
+        column = self.key_columns.get(block_index)
+        if column is None:
+            column = BlockAccessor.for_block(block).to_numpy(self.key_field)
+            self.key_columns[block_index] = column
+        try:
+            needles = _as_search_keys(keys, column)
+            indices = np.searchsorted(column, needles)
+            found = indices < len(column)
+            found[found] = column[indices[found]] == needles[found]
+        except TypeError:
+            # The keys can't be compared in NumPy, e.g., because some are None.
+            column = block[self.key_field]
+            if isinstance(block, pa.Table):
+                column = _ArrowListWrapper(column)
+            rows = [_binary_search_find(column, k) for k in keys]
+            return [-1 if i is None else i for i in rows]
+        return np.where(found, indices, -1).tolist()
+
+
+def _take_records(
+    locations: List[Optional[Tuple[Block, int]]]
+) -> Tuple[Optional[Block], List[int]]:
+    """Copy the records at the given (block, row index) locations into a new block.
+
+    Returns:
+        The new block, or None if there are no records, and the index of each
+        location in the new block, or -1 for None locations.
+    """
+    # The row indices to take from each block, and their positions in `locations`.
+    parts: Dict[int, Tuple[Block, List[int], List[int]]] = {}
+    for i, location in enumerate(locations):
+        if location is None:
+            continue
+        block, row = location
+        part = parts.setdefault(id(block), (block, [], []))
+        part[1].append(row)
+        part[2].append(i)
+    indices = [-1] * len(locations)
+    if not parts:
+        return None, indices
+    builder = DelegatingBlockBuilder()
+    offset = 0
+    for block, rows, positions in parts.values():
+        builder.add_block(BlockAccessor.for_block(block).take(rows))
+        for j, i in enumerate(positions):
+            indices[i] = offset + j
+        offset += len(rows)
+    return builder.build(), indices
+
+
+def _group_by_index(indices: np.ndarray):
+    """Yield each distinct index, and the positions at which it occurs."""
+    if len(indices) == 0:
+        return
+    order = np.argsort(indices, kind="stable")
+    unique, starts = np.unique(indices[order], return_index=True)
+    for index, positions in zip(unique, np.split(order, starts[1:])):
+        yield int(index), positions
+
+
+def _as_search_keys(keys: List[Any], column: np.ndarray) -> np.ndarray:
+    """Convert keys to an array that can be searched for in `column`.
+
+    NumPy would otherwise convert, e.g., a mix of int and str keys to str, and
+    compare numbers and strings without raising an error.
+    """
+    needles = np.asarray(keys)
+    if (needles.dtype.kind in _NUMERIC_KINDS) != (column.dtype.kind in _NUMERIC_KINDS):
+        needles = np.array(keys, dtype=object)
+    return needles
+
+
+class _LRUCache:
+    """A least recently used cache of the records looked up by a worker."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            value = self._entries[key]
+        except (KeyError, TypeError):
+            # TypeError is raised for unhashable keys.
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        try:
+            self._entries[key] = value
+        except TypeError:
+            return
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
 
 
 def _binary_search_find(column, x):
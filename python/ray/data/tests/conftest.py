@@ -310,6 +310,15 @@ def use_push_based_shuffle(request):
     ctx.use_push_based_shuffle = original
 
 
+@pytest.fixture(params=[False, True])
+def use_hash_groupby(request):
+    ctx = ray.data.context.DataContext.get_current()
+    original = ctx.use_hash_groupby
+    ctx.use_hash_groupby = request.param
+    yield request.param
+    ctx.use_hash_groupby = original
+
+
 @pytest.fixture(params=[True, False])
 def enable_automatic_tensor_extension_cast(request):
     ctx = ray.data.context.DataContext.get_current()
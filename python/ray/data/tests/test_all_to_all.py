@@ -128,6 +128,131 @@ def test_zip_preserve_order(ray_start_regular_shared):
     assert result == list(zip(range(num_items), range(num_items))), result
 
 
+def _join_expected(left, right, on, how, suffixes=("_x", "_y")):
+    expected = pd.merge(left, right, on=on, how=how, suffixes=suffixes)
+    return expected.sort_values(list(expected.columns)).reset_index(drop=True)
+
+
+def _join_result(ds):
+    result = ds.to_pandas()
+    return result.sort_values(list(result.columns)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("broadcast", [False, True])
+def test_join(ray_start_regular_shared, use_push_based_shuffle, how, broadcast):
+    ctx = DataContext.get_current()
+    original = ctx.broadcast_join_threshold_bytes
+    if not broadcast:
+        ctx.broadcast_join_threshold_bytes = 0
+    try:
+        left = pd.DataFrame({"id": range(0, 40), "a": range(40)})
+        right = pd.DataFrame({"id": [i % 30 for i in range(60)], "b": range(60)})
+        ds = (
+            ray.data.from_pandas(left)
+            .repartition(4)
+            .join(ray.data.from_pandas(right).repartition(7), on="id", how=how)
+        )
+        expected = _join_expected(left, right, "id", how)
+        pd.testing.assert_frame_equal(_join_result(ds), expected, check_dtype=False)
+    finally:
+        ctx.broadcast_join_threshold_bytes = original
+
+
+def test_join_broadcast_side(ray_start_regular_shared):
+    from ray.data._internal.join import _choose_broadcast_side
+    from ray.data.block import BlockMetadata
+
+    def blocks(size_bytes):
+        meta = BlockMetadata(
+            num_rows=1,
+            size_bytes=size_bytes,
+            schema=None,
+            input_files=None,
+            exec_stats=None,
+        )
+        return [(None, meta)]
+
+    ctx = DataContext.get_current()
+    original = ctx.broadcast_join_threshold_bytes
+    ctx.broadcast_join_threshold_bytes = 100
+    try:
+        small, smaller, large = blocks(50), blocks(10), blocks(1000)
+        assert _choose_broadcast_side(large, small, "inner") == "right"
+        assert _choose_broadcast_side(small, large, "inner") == "left"
+        assert _choose_broadcast_side(small, smaller, "inner") == "right"
+        assert _choose_broadcast_side(large, small, "left") == "right"
+        assert _choose_broadcast_side(small, large, "left") is None
+        assert _choose_broadcast_side(small, large, "right") == "left"
+        assert _choose_broadcast_side(large, small, "right") is None
+        assert _choose_broadcast_side(small, smaller, "outer") is None
+        assert _choose_broadcast_side(large, blocks(None), "inner") is None
+        assert _choose_broadcast_side(large, large, "inner") is None
+    finally:
+        ctx.broadcast_join_threshold_bytes = original
+
+
+def test_join_arrow(ray_start_regular_shared):
+    left = pa.table({"k1": [1, 1, 2, 3], "k2": ["a", "b", "a", "a"], "v": [1, 2, 3, 4]})
+    right = pa.table({"k1": [1.0, 2.0, 4.0], "k2": ["a", "a", "a"], "v": [5, 6, 7]})
+    ds = (
+        ray.data.from_arrow(left)
+        .repartition(2)
+        .join(
+            ray.data.from_arrow(right),
+            on=["k1", "k2"],
+            suffixes=("_left", "_right"),
+        )
+    )
+    assert ds.schema().names == ["k1", "k2", "v_left", "v_right"]
+    assert sorted(ds.to_pandas().itertuples(index=False)) == [
+        (1, "a", 1, 5),
+        (2, "a", 3, 6),
+    ]
+
+
+def test_join_empty(ray_start_regular_shared):
+    left = ray.data.from_items([{"id": i, "a": i} for i in range(10)])
+    right = ray.data.from_items([{"id": i, "b": i} for i in range(10)])
+    right = right.filter(lambda row: row["id"] > 100)
+    assert left.join(right, on="id").count() == 0
+    assert left.join(right, on="id", how="left").count() == 10
+    assert left.join(right, on="id", how="outer").count() == 10
+
+
+def test_join_errors(ray_start_regular_shared):
+    ds = ray.data.from_items([{"id": i} for i in range(10)])
+    with pytest.raises(ValueError):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError):
+        ds.join(ds, on=[])
+
+
+@pytest.mark.parametrize("num_partitions", [1, 3, 8])
+def test_hash_partition(ray_start_regular_shared, num_partitions):
+    from ray.data.block import BlockAccessor
+
+    df = pd.DataFrame({"id": list(range(20)) * 2, "value": range(40)})
+    for block in [df, pa.Table.from_pandas(df)]:
+        partitions = BlockAccessor.for_block(block).hash_partition(
+            ["id"], num_partitions
+        )
+        assert len(partitions) == num_partitions
+        partitions = [BlockAccessor.for_block(p).to_pandas() for p in partitions]
+        assert sum(len(p) for p in partitions) == len(df)
+        for i, p in enumerate(partitions):
+            for j, other in enumerate(partitions):
+                if i != j:
+                    assert not set(p["id"]) & set(other["id"])
+    # Equal keys of different numeric types are in the same partition.
+    int_partitions = BlockAccessor.for_block(df).hash_partition(["id"], 8)
+    float_partitions = BlockAccessor.for_block(
+        df.astype({"id": "float64"})
+    ).hash_partition(["id"], 8)
+    for int_partition, float_partition in zip(int_partitions, float_partitions):
+        assert set(int_partition["id"]) == set(float_partition["id"])
+
+
 def test_empty_shuffle(ray_start_regular_shared):
     ds = ray.data.range(100, parallelism=100)
     ds = ds.filter(lambda x: x)
@@ -217,7 +342,9 @@ def test_grouped_datastream_repr(ray_start_regular_shared):
     assert repr(ds.groupby("key")) == f"GroupedData(datastream={ds!r}, key='key')"
 
 
-def test_groupby_arrow(ray_start_regular_shared, use_push_based_shuffle):
+def test_groupby_arrow(
+    ray_start_regular_shared, use_push_based_shuffle, use_hash_groupby
+):
     # Test empty datastream.
     agg_ds = (
         ray.data.range_table(10)
@@ -228,6 +355,75 @@ def test_groupby_arrow(ray_start_regular_shared, use_push_based_shuffle):
     assert agg_ds.count() == 0
 
 
+@pytest.mark.parametrize("ignore_nulls", [True, False])
+def test_combine_unsorted(ray_start_regular_shared, ignore_nulls):
+    from ray.data.block import BlockAccessor
+
+    table = pa.table(
+        {
+            "A": [2, 0, 1, 2, 0, 1, 3],
+            "B": [1.5, None, 2.0, 4.0, 3.5, None, None],
+            "C": [5, 3, 2, 7, 1, 4, 6],
+        }
+    )
+    aggs = [
+        Count(),
+        Sum("B", ignore_nulls=ignore_nulls),
+        Min("B", ignore_nulls=ignore_nulls),
+        Max("C", ignore_nulls=ignore_nulls),
+        Mean("B", ignore_nulls=ignore_nulls),
+        Sum("C", ignore_nulls=ignore_nulls),
+    ]
+    acc = BlockAccessor.for_block(table)
+    assert acc._can_combine_vectorized("A", aggs)
+    sorted_table = acc.sort_and_partition([], [("A", "ascending")], False)[0]
+    expected = BlockAccessor.for_block(sorted_table).combine("A", aggs)
+    combined = acc.combine_unsorted("A", aggs)
+    assert combined.to_pydict() == expected.to_pydict()
+    assert combined.schema == expected.schema
+
+    # Aggregations that can't be vectorized are combined after sorting the block.
+    aggs.append(Std("C"))
+    assert not acc._can_combine_vectorized("A", aggs)
+    expected = BlockAccessor.for_block(sorted_table).combine("A", aggs)
+    assert acc.combine_unsorted("A", aggs).to_pydict() == expected.to_pydict()
+
+
+@pytest.mark.parametrize("num_parts", [1, 7])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_hash(
+    ray_start_regular_shared, use_push_based_shuffle, num_parts, ds_format
+):
+    ctx = DataContext.get_current()
+    original = ctx.use_hash_groupby
+    ctx.use_hash_groupby = True
+    try:
+        xs = list(range(100))
+        random.shuffle(xs)
+        df = pd.DataFrame(
+            {"A": [x % 7 for x in xs], "B": [x if x % 5 else None for x in xs]}
+        )
+        ds = ray.data.from_pandas(df).repartition(num_parts)
+        if ds_format == "arrow":
+            ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pyarrow")
+        agg_df = (
+            ds.groupby("A")
+            .aggregate(Count(), Sum("B"), Min("B"), Max("B"), Mean("B"), Std("B"))
+            .to_pandas()
+            .sort_values("A")
+        )
+        expected_grouped = df.groupby("A")["B"]
+        np.testing.assert_array_equal(
+            agg_df["count()"].to_numpy(), df.groupby("A").size().to_numpy()
+        )
+        for agg in ["sum", "min", "max", "mean", "std"]:
+            result = agg_df[f"{agg}(B)"].to_numpy()
+            expected = getattr(expected_grouped, agg)().to_numpy()
+            np.testing.assert_array_almost_equal(result, expected)
+    finally:
+        ctx.use_hash_groupby = original
+
+
 def test_groupby_errors(ray_start_regular_shared):
     ds = ray.data.range(100)
 
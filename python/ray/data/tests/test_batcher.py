@@ -71,7 +71,7 @@ def test_shuffling_batcher():
         if new_data_added:
             # If new data was added, confirm that the old shuffle indices were
             # invalidated.
-            assert batcher._shuffle_indices != old_shuffle_indices
+            assert batcher._shuffle_indices is not old_shuffle_indices
         assert batcher._batch_head == current_cursor + len(batch)
 
         if should_have_batch_after:
@@ -128,6 +128,35 @@ def test_shuffling_batcher():
     )
 
 
+def test_shuffling_batcher_yields_each_row_once():
+    batch_size = 7
+
+    def shuffle(seed):
+        batcher = ShufflingBatcher(
+            batch_size=batch_size, shuffle_buffer_min_size=20, shuffle_seed=seed
+        )
+        rows = []
+        start = 0
+        # Intermix adding blocks and consuming batches, so that rows not yet yielded
+        # are reshuffled with newly added rows, and the shuffle buffer is compacted.
+        for num_rows in [25, 3, 40, 1, 13]:
+            batcher.add(pa.table({"foo": list(range(start, start + num_rows))}))
+            start += num_rows
+            while batcher.has_batch():
+                rows.extend(batcher.next_batch()["foo"].to_pylist())
+        batcher.done_adding()
+        while batcher.has_any():
+            rows.extend(batcher.next_batch()["foo"].to_pylist())
+        return rows
+
+    rows = shuffle(42)
+    assert sorted(rows) == list(range(82))
+    assert rows != list(range(82))
+    # The same seed yields the same order.
+    assert shuffle(42) == rows
+    assert shuffle(43) != rows
+
+
 def test_batching_pyarrow_table_with_many_chunks():
     """Make sure batching a pyarrow table with many chunks is fast.
 
@@ -1,14 +1,19 @@
+import os
+import time
 from typing import List, Optional
 import itertools
 import pytest
 import pandas as pd
 
 import ray
+from ray.data._internal.execution.interfaces import ExecutionOptions
 from ray.data._internal.execution.legacy_compat import _blocks_to_input_buffer
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.all_to_all_operator import AllToAllOperator
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.join_operator import JoinOperator
+from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.logical.interfaces import LogicalPlan
 from ray.data._internal.logical.operators.from_arrow_operator import (
     FromArrowRefs,
@@ -27,7 +32,11 @@ from ray.data._internal.logical.operators.from_pandas_operator import (
     FromModin,
     FromPandasRefs,
 )
-from ray.data._internal.logical.optimizers import PhysicalOptimizer
+from ray.data._internal.logical.optimizers import (
+    LogicalOptimizer,
+    PhysicalOptimizer,
+    get_execution_plan,
+)
 from ray.data._internal.logical.operators.all_to_all_operator import (
     Aggregate,
     RandomShuffle,
@@ -37,12 +46,15 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.operators.map_operator import (
+    ExpressionFilter,
     MapRows,
     MapBatches,
     Filter,
     FlatMap,
+    Project,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Zip
+from ray.data._internal.logical.operators.limit_operator import Limit
+from ray.data._internal.logical.operators.n_ary_operator import Join, Zip
 from ray.data._internal.logical.util import (
     _recorded_operators,
     _recorded_operators_lock,
@@ -211,6 +223,82 @@ def test_column_ops_e2e(ray_start_regular_shared, enable_optimizer):
     _check_usage_record(["ReadRange", "MapBatches"])
 
 
+def test_read_pushdown_rule(ray_start_regular_shared, enable_optimizer):
+    import pyarrow.dataset as pds
+
+    read_op = Read(ParquetDatasource(), read_args={"paths": "/data", "columns": None})
+    op = Project(read_op, lambda x: x, ["a", "b", "c"])
+    op = ExpressionFilter(op, lambda x: x, pds.field("a") > 1)
+    op = ExpressionFilter(op, lambda x: x, pds.field("b") < 5)
+    op = Project(op, lambda x: x, ["c"], drop=True)
+    op = MapRows(op, lambda x: x)
+    optimized_op = LogicalOptimizer().optimize(LogicalPlan(op)).dag
+
+    assert isinstance(optimized_op, MapRows)
+    optimized_read_op = optimized_op.input_dependencies[0]
+    assert isinstance(optimized_read_op, Read)
+    assert optimized_read_op._read_args["paths"] == "/data"
+    assert optimized_read_op._read_args["columns"] == ["a", "b"]
+    assert optimized_read_op._read_args["filter"].equals(
+        (pds.field("a") > 1) & (pds.field("b") < 5)
+    )
+    # The original plan isn't modified.
+    assert read_op._read_args == {"paths": "/data", "columns": None}
+    assert isinstance(op.input_dependencies[0], Project)
+
+
+def test_read_pushdown_rule_not_applicable(ray_start_regular_shared, enable_optimizer):
+    import pyarrow.dataset as pds
+
+    def optimize(op):
+        return LogicalOptimizer().optimize(LogicalPlan(op)).dag
+
+    # Dropping columns requires the read columns to be known.
+    read_op = Read(ParquetDatasource(), read_args={"paths": "/data"})
+    op = Project(read_op, lambda x: x, ["a"], drop=True)
+    assert optimize(op) is op
+
+    # Selecting columns that aren't read must still raise an error.
+    read_op = Read(ParquetDatasource(), read_args={"columns": ["a"]})
+    op = Project(read_op, lambda x: x, ["a", "b"])
+    assert optimize(op) is op
+
+    # The block UDF of the read may depend on the filtered rows.
+    read_op = Read(ParquetDatasource(), read_args={"_block_udf": lambda x: x})
+    op = ExpressionFilter(read_op, lambda x: x, pds.field("a") > 1)
+    assert optimize(op) is op
+
+    # Only operators directly following the read are pushed down.
+    read_op = Read(ParquetDatasource(), read_args={})
+    op = MapBatches(read_op, lambda x: x)
+    op = Project(op, lambda x: x, ["a"])
+    assert optimize(op) is op
+
+
+def test_read_pushdown_e2e(ray_start_regular_shared, enable_optimizer, tmp_path):
+    import pyarrow as pa
+    import pyarrow.dataset as pds
+    import pyarrow.parquet as pq
+
+    table = pa.table({"a": list(range(100)), "b": [str(i) for i in range(100)]})
+    pq.write_table(table, os.path.join(tmp_path, "data.parquet"), row_group_size=10)
+
+    ds = ray.data.read_parquet(str(tmp_path))
+    ds = ds.filter(pds.field("a") >= 95).select_columns(["a"])
+    assert ds.take_all() == [{"a": i} for i in range(95, 100)]
+    _check_usage_record(["ReadParquet"])
+
+    optimized_op = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(optimized_op, Read)
+    assert optimized_op._read_args["columns"] == ["a"]
+
+    ds = ray.data.read_parquet(str(tmp_path)).drop_columns(["b"])
+    assert ds.take(1) == [{"a": 0}]
+    ds = ray.data.range_table(10).filter(pds.field("value") < 3)
+    assert ds.take_all() == [{"value": 0}, {"value": 1}, {"value": 2}]
+    _check_usage_record(["ReadRange", "Filter"])
+
+
 def test_random_sample_e2e(ray_start_regular_shared, enable_optimizer):
     import math
 
@@ -602,6 +690,130 @@ def test_read_map_batches_operator_fusion_incompatible_constructor_args(
     assert isinstance(physical_op.input_dependencies[0], InputDataBuffer)
 
 
+def test_read_map_batches_operator_fusion_tasks_to_actors_resources(
+    ray_start_regular_shared, enable_optimizer
+):
+    # Test that a task-based map operator that doesn't request any resources is fused
+    # into an actor-based map operator that does.
+    planner = Planner()
+    read_op = Read(ParquetDatasource())
+    op = MapBatches(read_op, lambda x: x, compute="tasks")
+    op = MapBatches(op, lambda x: x, compute="actors", ray_remote_args={"num_gpus": 1})
+    logical_plan = LogicalPlan(op)
+    physical_plan = planner.plan(logical_plan)
+    physical_plan = PhysicalOptimizer().optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert physical_op.name == "MapBatches->MapBatches"
+    assert isinstance(physical_op, MapOperator)
+    assert physical_op._ray_remote_args["num_gpus"] == 1
+    # Reads request the default resources, so they aren't fused.
+    upstream_physical_op = physical_op.input_dependencies[0]
+    assert upstream_physical_op.name == "DoRead"
+
+    # Task-based map operators that request resources aren't fused.
+    read_op = Read(ParquetDatasource())
+    op = MapBatches(
+        read_op, lambda x: x, compute="tasks", ray_remote_args={"num_cpus": 2}
+    )
+    op = MapBatches(op, lambda x: x, compute="actors", ray_remote_args={"num_gpus": 1})
+    logical_plan = LogicalPlan(op)
+    physical_plan = planner.plan(logical_plan)
+    physical_plan = PhysicalOptimizer().optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert physical_op.name == "MapBatches"
+    assert physical_op.input_dependencies[0].name == "MapBatches"
+
+    # Neither are task-based map operators with other incompatible remote args.
+    read_op = Read(ParquetDatasource())
+    op = MapBatches(
+        read_op,
+        lambda x: x,
+        compute="tasks",
+        ray_remote_args={"runtime_env": {"env_vars": {"foo": "bar"}}},
+    )
+    op = MapBatches(op, lambda x: x, compute="actors", ray_remote_args={"num_gpus": 1})
+    logical_plan = LogicalPlan(op)
+    physical_plan = planner.plan(logical_plan)
+    physical_plan = PhysicalOptimizer().optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert physical_op.name == "MapBatches"
+    assert physical_op.input_dependencies[0].name == "MapBatches"
+
+
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_map_batches_all_to_all_operator_fusion(
+    ray_start_regular_shared, enable_optimizer, shuffle
+):
+    # Test that map operators are fused into the map side of random shuffles and
+    # shuffling repartitions.
+    for all_to_all_op_cls, fusable in [
+        (lambda op: RandomShuffle(op, seed=0), True),
+        (lambda op: Repartition(op, num_outputs=5, shuffle=shuffle), shuffle),
+        (lambda op: Sort(op, key="col1", descending=False), False),
+    ]:
+        planner = Planner()
+        read_op = Read(ParquetDatasource())
+        op = MapBatches(read_op, lambda x: x)
+        op = MapRows(op, lambda x: x)
+        op = all_to_all_op_cls(op)
+        logical_plan = LogicalPlan(op)
+        physical_plan = planner.plan(logical_plan)
+        physical_plan = PhysicalOptimizer().optimize(physical_plan)
+        physical_op = physical_plan.dag
+
+        assert isinstance(physical_op, AllToAllOperator)
+        assert len(physical_op.input_dependencies) == 1
+        upstream_physical_op = physical_op.input_dependencies[0]
+        assert isinstance(upstream_physical_op, MapOperator)
+        if fusable:
+            assert physical_op.name == f"MapBatches->MapRows->{op.name}"
+            # Reads aren't fused into all-to-all operators.
+            assert upstream_physical_op.name == "DoRead"
+        else:
+            assert physical_op.name == op.name
+            assert upstream_physical_op.name == "DoRead->MapBatches->MapRows"
+
+
+def test_map_batches_all_to_all_operator_fusion_disabled(
+    ray_start_regular_shared, enable_optimizer, restore_data_context
+):
+    ray.data.DataContext.get_current().optimize_fuse_shuffle_stages = False
+    planner = Planner()
+    read_op = Read(ParquetDatasource())
+    op = MapBatches(read_op, lambda x: x)
+    op = RandomShuffle(op, seed=0)
+    logical_plan = LogicalPlan(op)
+    physical_plan = planner.plan(logical_plan)
+    physical_plan = PhysicalOptimizer().optimize(physical_plan)
+    physical_op = physical_plan.dag
+
+    assert physical_op.name == "RandomShuffle"
+    assert physical_op.input_dependencies[0].name == "DoRead->MapBatches"
+
+
+def test_map_batches_all_to_all_operator_fusion_e2e(
+    ray_start_regular_shared, enable_optimizer, use_push_based_shuffle
+):
+    ds = ray.data.range(100, parallelism=4)
+    ds = ds.map(lambda x: x + 1)
+    ds = ds.flat_map(lambda x: [x, -x])
+    ds = ds.random_shuffle(seed=0)
+    assert sorted(ds.take_all()) == sorted([x for i in range(1, 101) for x in [i, -i]])
+    assert "MapRows->FlatMap->RandomShuffle" in ds.stats()
+    _check_usage_record(["ReadRange", "MapRows", "FlatMap", "RandomShuffle"])
+
+    ds = ray.data.range(100, parallelism=4)
+    ds = ds.map_batches(lambda batch: [x * 2 for x in batch])
+    ds = ds.repartition(5, shuffle=True)
+    assert ds.num_blocks() == 5
+    assert sorted(ds.take_all()) == [x * 2 for x in range(100)]
+    assert "MapBatches->Repartition" in ds.stats()
+    _check_usage_record(["ReadRange", "MapBatches", "Repartition"])
+
+
 def test_read_map_chain_operator_fusion_e2e(ray_start_regular_shared, enable_optimizer):
     ds = ray.data.range(10, parallelism=2)
     ds = ds.filter(lambda x: x % 2 == 0)
@@ -751,6 +963,7 @@ def test_aggregate_e2e(
     ray_start_regular_shared,
     enable_optimizer,
     use_push_based_shuffle,
+    use_hash_groupby,
 ):
     ds = ray.data.range_table(100, parallelism=4)
     ds = ds.groupby("value").count()
@@ -843,6 +1056,128 @@ def test_zip_e2e(ray_start_regular_shared, enable_optimizer, num_blocks1, num_bl
     _check_usage_record(["ReadRange", "Zip"])
 
 
+def test_join_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op1 = Read(ParquetDatasource())
+    read_op2 = Read(ParquetDatasource())
+    op = Join(read_op1, read_op2, ["id"], "inner", ("_x", "_y"))
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Join"
+    assert isinstance(physical_op, JoinOperator)
+    assert len(physical_op.input_dependencies) == 2
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert isinstance(physical_op.input_dependencies[1], MapOperator)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+@pytest.mark.parametrize("broadcast_join_threshold_bytes", [0, 10 * 1024 * 1024])
+def test_join_e2e(
+    ray_start_regular_shared, enable_optimizer, how, broadcast_join_threshold_bytes
+):
+    ctx = ray.data.context.DataContext.get_current()
+    original = ctx.broadcast_join_threshold_bytes
+    ctx.broadcast_join_threshold_bytes = broadcast_join_threshold_bytes
+    try:
+        ds1 = ray.data.range_table(10, parallelism=3)
+        ds2 = ray.data.range_table(20, parallelism=4).map_batches(
+            lambda df: df.assign(value=df["value"] // 2, other=df["value"]),
+            batch_format="pandas",
+        )
+        ds = ds1.join(ds2, on="value", how=how)
+        result = sorted((row["value"], row["other"]) for row in ds.iter_rows())
+        assert result == [(i // 2, i) for i in range(20)]
+        _check_usage_record(["ReadRange", "MapBatches", "Join"])
+    finally:
+        ctx.broadcast_join_threshold_bytes = original
+
+
+def test_limit_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op = Read(ParquetDatasource())
+    op = Limit(read_op, 10)
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Limit"
+    assert isinstance(physical_op, LimitOperator)
+    assert len(physical_op.input_dependencies) == 1
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+
+
+def test_limit_pushdown_rule(ray_start_regular_shared, enable_optimizer):
+    def optimize(op):
+        return LogicalOptimizer().optimize(LogicalPlan(op)).dag
+
+    read_op = Read(ParquetDatasource(), read_args={})
+    op = MapRows(read_op, lambda x: x)
+    op = Limit(op, 10)
+    op = Project(op, lambda x: x, ["a"], drop=True)
+    op = Limit(op, 5)
+    optimized_op = optimize(op)
+
+    # The limits are merged, and moved before the row-preserving operators.
+    assert isinstance(optimized_op, Project)
+    op2 = optimized_op.input_dependencies[0]
+    assert isinstance(op2, MapRows)
+    op3 = op2.input_dependencies[0]
+    assert isinstance(op3, Limit)
+    assert op3._limit == 5
+    # The limit is pushed into the read, but the Limit operator is kept.
+    optimized_read_op = op3.input_dependencies[0]
+    assert isinstance(optimized_read_op, Read)
+    assert optimized_read_op._limit == 5
+    # The original plan isn't modified.
+    assert read_op._limit is None
+    assert isinstance(op.input_dependencies[0], Project)
+
+    # Operators that can change the number of rows are not skipped.
+    read_op = Read(ParquetDatasource(), read_args={})
+    op = Limit(MapBatches(read_op, lambda x: x), 5)
+    assert optimize(op) is op
+    # Nor is the read, if it filters its rows.
+    read_op = Read(ParquetDatasource(), read_args={"_block_udf": lambda x: x})
+    op = Limit(read_op, 5)
+    assert optimize(op) is op
+
+
+def test_limit_pushdown_read_tasks(ray_start_regular_shared, enable_optimizer):
+    ds = ray.data.range(100, parallelism=10).limit(15)
+    physical_op = get_execution_plan(ds._logical_plan).dag
+    assert isinstance(physical_op, LimitOperator)
+    input_op = physical_op.input_dependencies[0].input_dependencies[0]
+    assert isinstance(input_op, InputDataBuffer)
+    # Only the read tasks of the first 15 rows are launched.
+    input_op.start(ExecutionOptions())
+    assert input_op.num_outputs_total() == 2
+
+
+def test_limit_e2e(ray_start_regular_shared, enable_optimizer):
+    ds = ray.data.range(100, parallelism=10)
+    assert ds.limit(15).map(lambda x: x * 2).take_all() == [2 * i for i in range(15)]
+    _check_usage_record(["ReadRange", "Limit", "MapRows"])
+    assert ds.limit(0).take_all() == []
+    assert ds.limit(200).count() == 100
+    # The order of the blocks is randomized before the limit.
+    ds = ray.data.range(100, parallelism=100).randomize_block_order(seed=0)
+    rows = ds.limit(10).take_all()
+    assert len(rows) == 10 and rows != list(range(10))
+
+
+def test_limit_early_termination(ray_start_regular_shared, enable_optimizer):
+    def slow(batch):
+        if batch[0] > 0:
+            time.sleep(60)
+        return batch
+
+    # The outstanding tasks are cancelled once the limit is reached.
+    ds = ray.data.range(100, parallelism=10).map_batches(slow, batch_size=None)
+    start = time.time()
+    assert ds.limit(5).take_all() == list(range(5))
+    assert time.time() - start < 30
+
+
 def test_from_dask_operator(ray_start_regular_shared, enable_optimizer):
     import dask.dataframe as dd
 
@@ -3,7 +3,7 @@ import logging
 import os
 import pytest
 import posixpath
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import urllib.parse
 
 import pyarrow as pa
@@ -11,16 +11,24 @@ from pyarrow.fs import LocalFileSystem
 import pandas as pd
 import pyarrow.parquet as pq
 from pytest_lazyfixture import lazy_fixture
+import ray
 from ray.data.datasource.file_based_datasource import (
     FILE_SIZE_FETCH_PARALLELIZATION_THRESHOLD,
+    _fetch_metadata_parallel,
     _resolve_paths_and_filesystem,
     _unwrap_protocol,
 )
 from ray.data.datasource.file_meta_provider import (
+    _expand_directory,
+    _get_file_infos,
     _get_file_infos_serial,
     _get_file_infos_common_path_prefix,
     _get_file_infos_parallel,
+    _parquet_metadata_cache_keys,
 )
+from ray.data.datasource.parquet_datasource import _fetch_metadata
+from ray.data._internal.metadata_cache import MetadataCache
+from ray.data.context import DataContext
 
 from ray.tests.conftest import *  # noqa
 from ray.data.datasource import (
@@ -168,7 +176,7 @@ def test_default_file_metadata_provider(
         wraps=_get_file_infos_serial,
     ) as mock_get:
         file_paths, file_sizes = map(list, zip(*meta_provider.expand_paths(paths, fs)))
-    mock_get.assert_called_once_with(paths, fs, False)
+    mock_get.assert_called_once_with(paths, fs, False, None)
     # No warning should be logged.
     assert len(caplog.text) == 0
     assert file_paths == paths
@@ -274,9 +282,11 @@ def test_default_file_metadata_provider_many_files_basic(
     with caplog.at_level(logging.WARNING), patcher as mock_get:
         file_paths, file_sizes = map(list, zip(*meta_provider.expand_paths(paths, fs)))
     if isinstance(fs, LocalFileSystem):
-        mock_get.assert_called_once_with(paths, fs, False)
+        mock_get.assert_called_once_with(paths, fs, False, None)
     else:
-        mock_get.assert_called_once_with(paths, _unwrap_protocol(data_path), fs, False)
+        mock_get.assert_called_once_with(
+            paths, _unwrap_protocol(data_path), fs, False, None
+        )
     # No warning should be logged.
     assert len(caplog.text) == 0
     assert file_paths == paths
@@ -346,10 +356,10 @@ def test_default_file_metadata_provider_many_files_partitioned(
             list, zip(*meta_provider.expand_paths(paths, fs, partitioning))
         )
     if isinstance(fs, LocalFileSystem):
-        mock_get.assert_called_once_with(paths, fs, False)
+        mock_get.assert_called_once_with(paths, fs, False, None)
     else:
         mock_get.assert_called_once_with(
-            paths, _unwrap_protocol(partitioning.base_dir), fs, False
+            paths, _unwrap_protocol(partitioning.base_dir), fs, False, None
         )
     assert len(caplog.text) == 0
     assert file_paths == paths
@@ -412,7 +422,7 @@ def test_default_file_metadata_provider_many_files_diff_dirs(
     with caplog.at_level(logging.WARNING), patcher as mock_get:
         file_paths, file_sizes = map(list, zip(*meta_provider.expand_paths(paths, fs)))
 
-    mock_get.assert_called_once_with(paths, fs, False)
+    mock_get.assert_called_once_with(paths, fs, False, None)
     if isinstance(fs, LocalFileSystem):
         # No warning should be logged.
         assert len(caplog.text) == 0
@@ -482,6 +492,151 @@ def test_fast_file_metadata_provider(
     assert meta.schema is None
 
 
+def test_metadata_cache(tmp_path):
+    cache = MetadataCache(str(tmp_path), ttl_s=60, max_size_bytes=1024 * 1024)
+    assert cache.get("ns", ("a", 1)) is None
+    cache.put("ns", ("a", 1), [1, 2, 3])
+    assert cache.get("ns", ("a", 1)) == [1, 2, 3]
+    # Keys and namespaces are distinct.
+    assert cache.get("ns", ("a", 2)) is None
+    assert cache.get("other", ("a", 1)) is None
+    # Entries are shared across cache instances.
+    cache = MetadataCache(str(tmp_path), ttl_s=60, max_size_bytes=1024 * 1024)
+    assert cache.get("ns", ("a", 1)) == [1, 2, 3]
+
+    # Entries expire after the TTL.
+    cache = MetadataCache(str(tmp_path), ttl_s=-1, max_size_bytes=1024 * 1024)
+    assert cache.get("ns", ("a", 1)) is None
+    cache = MetadataCache(str(tmp_path), ttl_s=60, max_size_bytes=1024 * 1024)
+    assert cache.get("ns", ("a", 1)) is None
+
+    # The least recently used entries are evicted once the cache is full.
+    value = "x" * 1000
+    cache = MetadataCache(str(tmp_path), ttl_s=60, max_size_bytes=3500)
+    for i in range(3):
+        cache.put("ns", i, value)
+        # Make sure that modification times are ordered.
+        path = cache._entry_path("ns", i)
+        os.utime(path, (i, os.stat(path).st_mtime - 10 + i))
+    # Use the first entry, so the second one is the least recently used.
+    assert cache.get("ns", 0) == value
+    cache.put("ns", 3, value)
+    assert cache.get("ns", 1) is None
+    for i in [0, 2, 3]:
+        assert cache.get("ns", i) == value
+
+
+def test_default_file_metadata_provider_cache(
+    ray_start_regular_shared, restore_data_context, tmp_path
+):
+    data_dir = tmp_path / "data"
+    nested_dir = data_dir / "nested" / "dir"
+    nested_dir.mkdir(parents=True)
+    for i in range(3):
+        pd.DataFrame({"one": [i]}).to_csv(data_dir / f"test{i}.csv", index=False)
+    pd.DataFrame({"one": [0]}).to_csv(nested_dir / "test0.csv", index=False)
+    DataContext.get_current().metadata_cache_dir = str(tmp_path / "cache")
+    paths, fs = _resolve_paths_and_filesystem([str(data_dir)])
+
+    meta_provider = DefaultFileMetadataProvider()
+    with patch(
+        "ray.data.datasource.file_meta_provider._expand_directory",
+        wraps=_expand_directory,
+    ) as mock_expand:
+        expected = list(meta_provider.expand_paths(paths, fs))
+        assert len(expected) == 4
+        assert mock_expand.call_count == 1
+        # The directory listing is cached.
+        assert list(meta_provider.expand_paths(paths, fs)) == expected
+        assert mock_expand.call_count == 1
+        assert ray.data.read_csv(paths).count() == 4
+        assert mock_expand.call_count == 1
+
+        # Adding a file to the directory invalidates the cached listing.
+        pd.DataFrame({"one": [3]}).to_csv(data_dir / "test3.csv", index=False)
+        os.utime(data_dir, (0, os.stat(data_dir).st_mtime + 10))
+        assert len(list(meta_provider.expand_paths(paths, fs))) == 5
+        assert mock_expand.call_count == 2
+
+        # Adding a file to a nested directory also invalidates it, even though the
+        # modification time of the listed directory doesn't change.
+        data_dir_mtime = os.stat(data_dir).st_mtime_ns
+        pd.DataFrame({"one": [1]}).to_csv(nested_dir / "test1.csv", index=False)
+        os.utime(nested_dir, (0, os.stat(nested_dir).st_mtime + 10))
+        assert os.stat(data_dir).st_mtime_ns == data_dir_mtime
+        assert len(list(meta_provider.expand_paths(paths, fs))) == 6
+        assert mock_expand.call_count == 3
+        assert len(list(meta_provider.expand_paths(paths, fs))) == 6
+        assert mock_expand.call_count == 3
+
+
+def test_file_listing_cache_without_mtime(restore_data_context, tmp_path):
+    # Object stores don't report a modification time for prefixes.
+    fs = MagicMock()
+    fs.type_name = "s3"
+    fs.get_file_info.return_value = pa.fs.FileInfo(
+        "bucket/data", type=pa.fs.FileType.Directory
+    )
+    cache = MetadataCache(str(tmp_path / "cache"), ttl_s=60, max_size_bytes=10**6)
+
+    with patch(
+        "ray.data.datasource.file_meta_provider._expand_directory",
+        return_value=[("bucket/data/test0.csv", 1)],
+    ) as mock_expand:
+        for _ in range(2):
+            assert _get_file_infos("bucket/data", fs, cache=cache) == [
+                ("bucket/data/test0.csv", 1)
+            ]
+        # The listing is not cached, so files added later are not missed.
+        assert mock_expand.call_count == 2
+
+
+def test_default_parquet_metadata_provider_cache(
+    ray_start_regular_shared, restore_data_context, tmp_path
+):
+    paths = [str(tmp_path / f"test{i}.parquet") for i in range(3)]
+    for i, path in enumerate(paths):
+        pq.write_table(pa.table({"one": list(range(i + 1))}), path)
+    DataContext.get_current().metadata_cache_dir = str(tmp_path / "cache")
+
+    meta_provider = DefaultParquetMetadataProvider()
+    pq_ds = pq.ParquetDataset(paths, use_legacy_dataset=False)
+    with patch(
+        "ray.data.datasource.parquet_datasource._fetch_metadata",
+        wraps=_fetch_metadata,
+    ) as mock_fetch:
+        file_metas = meta_provider.prefetch_file_metadata(pq_ds.pieces)
+        assert [m.num_rows for m in file_metas] == [1, 2, 3]
+        assert mock_fetch.call_count == 1
+        # The file metadata is cached.
+        file_metas = meta_provider.prefetch_file_metadata(pq_ds.pieces)
+        assert [m.num_rows for m in file_metas] == [1, 2, 3]
+        assert mock_fetch.call_count == 1
+        assert ray.data.read_parquet(paths).count() == 6
+        assert mock_fetch.call_count == 1
+
+        # Rewriting a file only invalidates its cached metadata.
+        pq.write_table(pa.table({"one": list(range(10))}), paths[1])
+        os.utime(paths[1], (0, os.stat(paths[1]).st_mtime + 10))
+        pq_ds = pq.ParquetDataset(paths, use_legacy_dataset=False)
+        file_metas = meta_provider.prefetch_file_metadata(pq_ds.pieces)
+        assert [m.num_rows for m in file_metas] == [1, 10, 3]
+        assert mock_fetch.call_count == 2
+        (fetched_pieces,) = mock_fetch.call_args[0]
+        assert [p.path for p in fetched_pieces] == [paths[1]]
+
+    # The file infos of many files are fetched in parallel.
+    keys = _parquet_metadata_cache_keys(pq_ds.pieces)
+    with patch(
+        "ray.data.datasource.parquet_datasource.PARALLELIZE_META_FETCH_THRESHOLD", 1
+    ), patch(
+        "ray.data.datasource.file_based_datasource._fetch_metadata_parallel",
+        wraps=_fetch_metadata_parallel,
+    ) as mock_fetch_parallel:
+        assert _parquet_metadata_cache_keys(pq_ds.pieces) == keys
+        assert mock_fetch_parallel.call_count == 1
+
+
 def test_fast_file_metadata_provider_ignore_missing():
     meta_provider = FastFileMetadataProvider()
     with pytest.raises(ValueError):
@@ -18,6 +18,7 @@ from ray.data._internal.execution.operators.map_operator import (
     MapOperator,
     _BlockRefBundler,
 )
+from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.operators.output_splitter import OutputSplitter
 from ray.data._internal.execution.operators.task_pool_map_operator import (
     TaskPoolMapOperator,
@@ -219,6 +220,26 @@ def test_map_operator_streamed(ray_start_regular_shared, use_actors):
     assert not op.completed()
 
 
+def test_limit_operator(ray_start_regular_shared):
+    input_op = InputDataBuffer(make_ref_bundles([[i, i] for i in range(10)]))
+    op = LimitOperator(5, input_op)
+
+    op.start(ExecutionOptions())
+    assert op.need_more_inputs()
+    output = []
+    while op.need_more_inputs():
+        op.add_input(input_op.get_next(), 0)
+        output.extend(_take_outputs(op))
+    # The last block is truncated to the limit.
+    assert output == [[0, 0], [1, 1], [2]]
+    assert op.completed()
+    assert sum(len(m) for m in op.get_stats().values()) == 3
+
+    # Inputs that arrive after the limit is reached are dropped.
+    op.add_input(input_op.get_next(), 0)
+    assert not op.has_next()
+
+
 @pytest.mark.parametrize("equal", [False, True])
 @pytest.mark.parametrize("chunk_size", [1, 10])
 def test_split_operator(ray_start_regular_shared, equal, chunk_size):
@@ -719,6 +719,45 @@ def test_parquet_reader_estimate_data_size(shutdown_only, tmp_path):
         ctx.decoding_size_estimation = old_decoding_size_estimation
 
 
+def test_parquet_reader_estimate_data_size_with_columns(
+    ray_start_regular_shared, tmp_path
+):
+    ctx = ray.data.context.DataContext.get_current()
+    old_decoding_size_estimation = ctx.decoding_size_estimation
+    # Use the same encoding ratio for all the readers.
+    ctx.decoding_size_estimation = False
+    try:
+        table = pa.table(
+            {
+                "small": list(range(1000)),
+                "large": [str(i).zfill(1000) for i in range(1000)],
+            }
+        )
+        pq.write_table(
+            table, os.path.join(tmp_path, "data.parquet"), row_group_size=100
+        )
+
+        full_size = _ParquetDatasourceReader(
+            str(tmp_path)
+        ).estimate_inmemory_data_size()
+        small_size = _ParquetDatasourceReader(
+            str(tmp_path), columns=["small"]
+        ).estimate_inmemory_data_size()
+        large_size = _ParquetDatasourceReader(
+            str(tmp_path), columns=["large"]
+        ).estimate_inmemory_data_size()
+        # Only the column chunks of the read columns are counted.
+        assert small_size < full_size / 10
+        assert small_size + large_size == full_size
+
+        read_tasks = _ParquetDatasourceReader(
+            str(tmp_path), columns=["small"]
+        ).get_read_tasks(1)
+        assert read_tasks[0].get_metadata().size_bytes == small_size
+    finally:
+        ctx.decoding_size_estimation = old_decoding_size_estimation
+
+
 @pytest.mark.parametrize(
     "fs,data_path,endpoint_url",
     [
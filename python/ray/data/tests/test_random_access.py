@@ -2,6 +2,7 @@ import pytest
 import pyarrow
 
 import ray
+from ray.data.random_access_dataset import _RandomAccessWorker
 
 from ray.tests.conftest import *  # noqa
 
@@ -29,6 +30,74 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
 
+def test_multiget(ray_start_regular_shared):
+    ds = ray.data.range_table(100, parallelism=10)
+    ds = ds.add_column("embedding", lambda b: b["value"] ** 2)
+    rad = ds.to_random_access_dataset("value", num_workers=2)
+
+    def expected(i):
+        return {"value": i, "embedding": i**2}
+
+    # Keys from all blocks, out of order, with duplicates and missing keys.
+    keys = [42, -1, 99, 0, 42, 100, 57, 3, 1.5, 13]
+    results = rad.multiget(keys)
+    assert results == [
+        None if k in (-1, 100, 1.5) else expected(k) for k in keys
+    ], results
+    assert rad.multiget([]) == []
+
+
+def test_multiget_string_keys(ray_start_regular_shared):
+    ds = ray.data.from_items([{"id": f"k{i:03d}", "value": i} for i in range(50)])
+    rad = ds.to_random_access_dataset("id", num_workers=1)
+    results = rad.multiget(["k010", "k049", "k000", "missing", "k0105"])
+    assert results == [
+        {"id": "k010", "value": 10},
+        {"id": "k049", "value": 49},
+        {"id": "k000", "value": 0},
+        None,
+        None,
+    ], results
+    assert ray.get(rad.get_async("k020")) == {"id": "k020", "value": 20}
+    # Keys that can't be compared with the key column raise an error.
+    with pytest.raises(TypeError):
+        rad.multiget([1])
+
+
+def test_cache(ray_start_regular_shared):
+    ds = ray.data.range_table(100, parallelism=10)
+    rad = ds.to_random_access_dataset("value", num_workers=1, cache_size=2)
+
+    assert rad.multiget([1, 2, -1]) == [{"value": 1}, {"value": 2}, None]
+    assert "Cache hit rate: 0.0%" in rad.stats(), rad.stats()
+    # Both keys are cached.
+    assert rad.multiget([1, 2]) == [{"value": 1}, {"value": 2}]
+    assert "Cache hit rate: 50.0%" in rad.stats(), rad.stats()
+    # Key 1 is evicted to make room for key 3.
+    assert ray.get(rad.get_async(3)) == {"value": 3}
+    assert rad.multiget([1, 2, 3]) == [{"value": 1}, {"value": 2}, {"value": 3}]
+    assert "Cache hit rate: 50.0%" in rad.stats(), rad.stats()
+
+
+def test_cache_copies_records(ray_start_regular_shared):
+    # Use the worker class directly to inspect its cache.
+    worker = _RandomAccessWorker.__ray_actor_class__("value", cache_size=10)
+    block = pyarrow.Table.from_pydict({"value": list(range(100))})
+    worker.assign_blocks({0: ray.put(block)})
+
+    result, indices = worker.multiget([0, 0, 0], [1, 2, -1])
+    assert indices == [0, 1, -1]
+    # Each record is cached in its own block, rather than in the result block.
+    cached, index = worker.cache.get(2, None)
+    assert cached.num_rows == 1 and index == 0
+    assert cached is not result
+    assert cached.to_pydict() == {"value": [2]}
+    assert worker.cache.get(-1, "missing") is None
+
+    result, indices = worker.multiget([0, 0], [2, 1])
+    assert [result["value"][i].as_py() for i in indices] == [2, 1]
+
+
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range_table(10).repartition(20)
     assert ds.num_blocks() == 20
@@ -7,6 +7,9 @@ import pyarrow as pa
 import pytest
 
 import ray
+from ray.data._internal.planner.exchange.sort_task_spec import (
+    split_hot_key_partitions,
+)
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data.block import BlockAccessor
 from ray.data.tests.conftest import *  # noqa
@@ -52,6 +55,63 @@ def test_sort_partition_same_key_to_same_block(
     assert total == num_items
 
 
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("block_format", ["arrow", "pandas"])
+def test_split_hot_key_partitions(descending, block_format):
+    df = pd.DataFrame({"a": [0, 1, 1, 1, 1, 1, 1, 2, 3], "b": range(9)})
+    block = pa.Table.from_pandas(df) if block_format == "arrow" else df
+    key = [("a", "descending" if descending else "ascending")]
+    boundaries = [1, 1, 1]
+    out = BlockAccessor.for_block(block).sort_and_partition(boundaries, key, descending)
+    # All rows of the hot key go to a single partition.
+    assert [BlockAccessor.for_block(b).num_rows() for b in out] == (
+        [8, 0, 0, 1] if descending else [1, 0, 0, 8]
+    )
+
+    out = split_hot_key_partitions(out, boundaries, key, descending)
+    # The rows of the hot key are spread over all partitions, in the same order.
+    assert [BlockAccessor.for_block(b).num_rows() for b in out] == (
+        [4, 1, 1, 3] if descending else [3, 1, 1, 4]
+    )
+    expected = df.sort_values("a", ascending=not descending, kind="stable")
+    actual = pd.concat([BlockAccessor.for_block(b).to_pandas() for b in out])
+    assert actual["a"].tolist() == expected["a"].tolist()
+
+    # Partitions without repeated boundaries are unchanged.
+    boundaries = [1, 2, 3]
+    out = BlockAccessor.for_block(block).sort_and_partition(boundaries, key, descending)
+    assert split_hot_key_partitions(out, boundaries, key, descending) == out
+
+
+@pytest.mark.parametrize("optimizer", [False, True])
+def test_sort_skew_aware(
+    ray_start_regular, use_push_based_shuffle, restore_data_context, optimizer
+):
+    ctx = ray.data.context.DataContext.get_current()
+    ctx.optimizer_enabled = optimizer
+    # Half of the rows have the same key.
+    xs = [0] * 500 + list(range(500))
+    random.shuffle(xs)
+    ds = ray.data.from_items([{"a": x} for x in xs], parallelism=10)
+
+    sorted_ds = ds.sort("a")
+    assert max(sorted_ds._block_num_rows()) >= 500
+
+    ctx.use_skew_aware_sort = True
+    for descending in [False, True]:
+        sorted_ds = ds.sort("a", descending=descending)
+        assert [r["a"] for r in sorted_ds.iter_rows()] == sorted(xs, reverse=descending)
+        assert max(sorted_ds._block_num_rows()) < 200, sorted_ds._block_num_rows()
+
+    # map_groups() still gets all rows of a key in a single group.
+    counts = ds.groupby("a").map_groups(
+        lambda df: pd.DataFrame({"a": [df["a"][0]], "count": [len(df)]}),
+        batch_format="pandas",
+    )
+    assert counts.filter(lambda r: r["a"] == 0).take_all()[0]["count"] == 501
+    assert counts.count() == 500
+
+
 @pytest.mark.parametrize("num_items,parallelism", [(100, 1), (1000, 4)])
 @pytest.mark.parametrize("use_polars", [False, True])
 def test_sort_arrow(
@@ -11,22 +11,28 @@ from ray.data._internal.execution.interfaces import (
 )
 from ray.data._internal.execution.streaming_executor import (
     _debug_dump_topology,
+    _SpilledBytesPoller,
     _validate_dag,
 )
 from ray.data._internal.execution.streaming_executor_state import (
     AutoscalingState,
+    OpMemoryBudget,
     OpState,
     TopologyResourceUsage,
     DownstreamMemoryInfo,
+    attribute_spilled_bytes,
     build_streaming_topology,
+    compute_memory_budgets,
     process_completed_tasks,
     select_operator_to_run,
     _execution_allowed,
 )
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.limit_operator import LimitOperator
 from ray.data._internal.execution.util import make_ref_bundles
 from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+from ray._private.test_utils import wait_for_condition
 from ray.data.tests.conftest import *  # noqa
 
 
@@ -114,6 +120,24 @@ def test_process_completed_tasks():
     o2.inputs_done.assert_called_once()
 
 
+def test_process_completed_tasks_limit_reached():
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(make_transform(lambda block: [b * -1 for b in block]), o1)
+    o3 = LimitOperator(1, o2)
+    topo, _ = build_streaming_topology(o3, ExecutionOptions(verbose_progress=True))
+    process_completed_tasks(topo)
+    assert len(topo[o1].outqueue) == 20, topo
+
+    # The upstream operators are stopped once the limit is reached.
+    o2.mark_execution_completed = MagicMock()
+    o3.add_input(make_ref_bundles([[0]])[0], 0)
+    process_completed_tasks(topo)
+    o2.mark_execution_completed.assert_called_once()
+    assert len(topo[o1].outqueue) == 0
+    assert o1.completed()
+
+
 def test_select_operator_to_run():
     opt = ExecutionOptions()
     inputs = make_ref_bundles([[x] for x in range(20)])
@@ -206,16 +230,19 @@ def test_dispatch_next_task():
     op_state = OpState(o2, [o1_state.outqueue])
 
     # TODO: test multiple inqueues with the union operator.
-    op_state.inqueues[0].append("dummy1")
-    op_state.inqueues[0].append("dummy2")
+    op_state.inqueues[0].append(inputs[0])
+    op_state.inqueues[0].append(inputs[1])
 
     o2.add_input = MagicMock()
     op_state.dispatch_next_task()
-    assert o2.add_input.called_once_with("dummy1")
+    assert o2.add_input.called_once_with(inputs[0])
 
     o2.add_input = MagicMock()
     op_state.dispatch_next_task()
-    assert o2.add_input.called_once_with("dummy2")
+    assert o2.add_input.called_once_with(inputs[1])
+
+    # The size of the dispatched inputs is tracked.
+    assert op_state.input_bytes == inputs[0].size_bytes() + inputs[1].size_bytes()
 
 
 def test_debug_dump_topology():
@@ -620,6 +647,98 @@ def test_execution_allowed_nothrottle():
     )
 
 
+def test_compute_memory_budgets():
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(make_transform(lambda block: [b * -1 for b in block]), o1)
+    o3 = MapOperator.create(make_transform(lambda block: [b * 2 for b in block]), o2)
+    topo, _ = build_streaming_topology(o3, ExecutionOptions())
+
+    # Nothing observed yet, so the output sizes are expected to match the input
+    # sizes, and both operators get the same budget.
+    budgets = compute_memory_budgets(topo, ExecutionResources(object_store_memory=800))
+    assert list(budgets) == [o2, o3], budgets
+    assert budgets[o2].budget == 400, budgets
+    assert budgets[o3].budget == 400, budgets
+    assert compute_memory_budgets(topo, ExecutionResources()) == {}
+
+    # o2 inflates its inputs by 10x, and o3 shrinks its inputs by 5x, so they get
+    # (1 + 10) and (10 + 2) shares of the limit.
+    topo[o2].input_bytes, topo[o2].output_bytes = 100, 1000
+    topo[o3].input_bytes, topo[o3].output_bytes = 1000, 200
+    o2.current_resource_usage = MagicMock(
+        return_value=ExecutionResources(object_store_memory=500)
+    )
+    inputs[0].size_bytes = MagicMock(return_value=200)
+    topo[o2].outqueue.append(inputs[0])
+    budgets = compute_memory_budgets(topo, ExecutionResources(object_store_memory=2300))
+    assert budgets[o2].budget == 1100, budgets
+    assert budgets[o3].budget == 1200, budgets
+    # The usage of o2 includes its outqueue.
+    assert budgets[o2].usage == 700, budgets
+    # The next task of o3 is expected to produce 200 * 0.2 bytes.
+    assert budgets[o3].expected_task_output == 40, budgets
+
+
+def test_execution_allowed_memory_budget():
+    op = InputDataBuffer([])
+    op.incremental_resource_usage = MagicMock(return_value=ExecutionResources())
+    usage = TopologyResourceUsage(
+        ExecutionResources(object_store_memory=800),
+        {op: DownstreamMemoryInfo(1, 800)},
+    )
+    limits = ExecutionResources(object_store_memory=1000)
+    # The expected output fits in the global limit.
+    assert _execution_allowed(op, usage, limits, OpMemoryBudget(100, 500, 200))
+    # The expected output doesn't fit in the global limit, nor in the budget.
+    assert not _execution_allowed(op, usage, limits, OpMemoryBudget(600, 500, 300))
+    # The expected output doesn't fit in the global limit, but fits in the budget.
+    assert _execution_allowed(op, usage, limits, OpMemoryBudget(800, 500, 300))
+    # Operators without memory usage are always allowed to run.
+    assert _execution_allowed(op, usage, limits, OpMemoryBudget(100, 0, 300))
+
+
+def test_attribute_spilled_bytes():
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(make_transform(lambda block: [b * -1 for b in block]), o1)
+    o3 = MapOperator.create(make_transform(lambda block: [b * 2 for b in block]), o2)
+    topo, _ = build_streaming_topology(o3, ExecutionOptions())
+
+    # Spilling is attributed to the operators over budget.
+    attribute_spilled_bytes(
+        topo,
+        {o2: OpMemoryBudget(100, 300, 0), o3: OpMemoryBudget(100, 200, 0)},
+        900,
+    )
+    assert topo[o2].spilled_bytes == 600
+    assert topo[o3].spilled_bytes == 300
+    # Without operators over budget, spilling is attributed by memory usage.
+    attribute_spilled_bytes(
+        topo,
+        {o2: OpMemoryBudget(1000, 100, 0), o3: OpMemoryBudget(1000, 300, 0)},
+        400,
+    )
+    assert topo[o2].spilled_bytes == 700
+    assert topo[o3].spilled_bytes == 600
+
+
+def test_spilled_bytes_poller():
+    ray.shutdown()
+    ray.init(num_cpus=1)
+    poller = _SpilledBytesPoller(
+        ray.get_runtime_context().gcs_address,
+        ray.get_runtime_context().get_node_id(),
+    )
+    assert poller.spilled_bytes_total is None
+    poller.start()
+    # The spilling is polled in the background.
+    wait_for_condition(lambda: poller.spilled_bytes_total is not None)
+    poller.stop()
+    poller.join(timeout=10)
+    assert not poller.is_alive()
+
+
 if __name__ == "__main__":
     import sys
 
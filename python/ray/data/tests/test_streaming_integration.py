@@ -333,6 +333,49 @@ def test_backpressure_from_output(ray_start_10_cpus_shared, restore_data_context
     assert "100/100 blocks executed" in stats, stats
 
 
+def test_backpressure_with_operator_memory_budgets(
+    ray_start_10_cpus_shared, restore_data_context
+):
+    @ray.remote
+    class Counter:
+        def __init__(self):
+            self.i = 0
+
+        def inc(self):
+            self.i += 1
+
+        def get(self):
+            return self.i
+
+    counter = Counter.remote()
+
+    def func(x):
+        ray.get(counter.inc.remote())
+        return x
+
+    ctx = DataContext.get_current()
+    ctx.use_streaming_executor = True
+    ctx.enable_operator_memory_budgets = True
+    ctx.execution_options.resource_limits.object_store_memory = 10000
+
+    # Only take the first item from the iterator.
+    ds = ray.data.range(100000, parallelism=100).map_batches(func, batch_size=None)
+    it = iter(ds.iter_batches(batch_size=None))
+    next(it)
+    time.sleep(3)  # Pause a little so anything that would be executed runs.
+    num_finished = ray.get(counter.get.remote())
+    assert num_finished < 20, num_finished
+
+    # Check we can get the rest.
+    for rest in it:
+        pass
+    assert ray.get(counter.get.remote()) == 100
+    # Check the memory budgets are reported in the stats.
+    stats = ds.stats()
+    assert "obj_store_mem_budget" in stats, stats
+    assert "obj_store_mem_spilled" in stats, stats
+
+
 def test_e2e_liveness_with_output_backpressure_edge_case(
     ray_start_10_cpus_shared, restore_data_context
 ):
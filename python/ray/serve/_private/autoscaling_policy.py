@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
+from collections import deque
 import math
+import time
 
 from ray.serve.config import AutoscalingConfig
 from ray.serve._private.constants import CONTROL_LOOP_PERIOD_S
 
-from typing import List
+from typing import Deque, List, Optional, Tuple
 
 
 def calculate_desired_num_replicas(
@@ -89,6 +91,14 @@ class AutoscalingPolicy:
         """
         return curr_target_num_replicas
 
+    def record_replica_startup_time(self, startup_time_s: float) -> None:
+        """Record how long a new replica took to start and become ready.
+
+        Policies can use this to account for the delay between a scaling
+        decision and the new replicas serving traffic.
+        """
+        pass
+
 
 class BasicAutoscalingPolicy(AutoscalingPolicy):
     """The default autoscaling policy based on basic thresholds for scaling.
@@ -176,3 +186,110 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
             self.decision_counter = 0
 
         return decision_num_replicas
+
+
+class PredictiveAutoscalingPolicy(BasicAutoscalingPolicy):
+    """Autoscaling policy that scales up ahead of a forecasted load increase.
+
+    The total number of ongoing requests (including requests queued at
+    handles) is sampled every `metrics_interval_s` over the last
+    `forecast_window_s`. A linear trend fitted over these samples is used to
+    forecast the load once a replica started now would be ready, i.e.
+    `upscale_delay_s` plus the measured replica startup time ahead. The
+    scaling decision is made as in BasicAutoscalingPolicy but using the
+    forecasted load when it is higher than the current one. Scaling down only
+    uses the current load, since removing replicas takes effect immediately.
+    """
+
+    def __init__(self, config: AutoscalingConfig):
+        super().__init__(config)
+        # (timestamp_s, total ongoing requests) samples, oldest first.
+        self.load_history: Deque[Tuple[float, float]] = deque()
+        # Moving average of the measured replica startup time.
+        self.replica_startup_time_s: Optional[float] = None
+
+    def record_replica_startup_time(self, startup_time_s: float) -> None:
+        if self.replica_startup_time_s is None:
+            self.replica_startup_time_s = startup_time_s
+        else:
+            self.replica_startup_time_s = (
+                0.5 * self.replica_startup_time_s + 0.5 * startup_time_s
+            )
+
+    def record_load(self, timestamp_s: float, load: float) -> None:
+        """Record a load sample, at most once every metrics_interval_s."""
+        if (
+            len(self.load_history) > 0
+            and timestamp_s - self.load_history[-1][0] < self.config.metrics_interval_s
+        ):
+            return
+
+        self.load_history.append((timestamp_s, load))
+        while timestamp_s - self.load_history[0][0] > self.config.forecast_window_s:
+            self.load_history.popleft()
+
+    def get_forecast_horizon_s(self) -> float:
+        return self.config.upscale_delay_s + (self.replica_startup_time_s or 0)
+
+    def forecast_load(self, horizon_s: float) -> Optional[float]:
+        """Forecast the load `horizon_s` after the latest sample.
+
+        Returns None if there aren't enough samples to fit a trend.
+        """
+        if len(self.load_history) < 3:
+            return None
+
+        n = len(self.load_history)
+        mean_t = sum(t for t, _ in self.load_history) / n
+        mean_load = sum(load for _, load in self.load_history) / n
+        var_t = sum((t - mean_t) ** 2 for t, _ in self.load_history)
+        if var_t == 0:
+            return None
+        slope = (
+            sum((t - mean_t) * (load - mean_load) for t, load in self.load_history)
+            / var_t
+        )
+
+        latest_t, latest_load = self.load_history[-1]
+        fitted_latest_load = mean_load + slope * (latest_t - mean_t)
+        # Anchor the trend on the fitted value so a single noisy sample
+        # doesn't dominate the forecast.
+        return max(0, fitted_latest_load + slope * horizon_s)
+
+    def get_decision_num_replicas(
+        self,
+        curr_target_num_replicas: int,
+        current_num_ongoing_requests: List[float],
+        current_handle_queued_queries: float,
+    ) -> int:
+        current_load = sum(current_num_ongoing_requests) + current_handle_queued_queries
+        self.record_load(time.time(), current_load)
+
+        forecasted_load = self.forecast_load(self.get_forecast_horizon_s())
+        num_replicas = len(current_num_ongoing_requests)
+        if (
+            forecasted_load is not None
+            and forecasted_load > current_load
+            and num_replicas > 0
+        ):
+            # Spread the forecasted load evenly over the current replicas.
+            current_num_ongoing_requests = [
+                forecasted_load / num_replicas
+            ] * num_replicas
+
+        return super().get_decision_num_replicas(
+            curr_target_num_replicas,
+            current_num_ongoing_requests,
+            current_handle_queued_queries,
+        )
+
+
+AUTOSCALING_POLICIES = {
+    "basic": BasicAutoscalingPolicy,
+    "predictive": PredictiveAutoscalingPolicy,
+}
+
+
+def create_autoscaling_policy(config: AutoscalingConfig) -> AutoscalingPolicy:
+    """Instantiate the autoscaling policy selected in the config."""
+    return AUTOSCALING_POLICIES[config.policy](config)
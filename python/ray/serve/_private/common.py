@@ -35,6 +35,7 @@ class ReplicaState(str, Enum):
     RECOVERING = "RECOVERING"
     RUNNING = "RUNNING"
     STOPPING = "STOPPING"
+    STANDBY = "STANDBY"
 
 
 class ApplicationStatus(str, Enum):
@@ -301,6 +302,9 @@ class RunningReplicaInfo:
     actor_handle: ActorHandle
     max_concurrent_queries: int
     is_cross_language: bool = False
+    # Locality of the replica, used to prefer nearby replicas when routing.
+    node_id: Optional[NodeId] = None
+    availability_zone: Optional[str] = None
 
     def __post_init__(self):
         # Set hash value when object is constructed.
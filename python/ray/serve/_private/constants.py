@@ -114,6 +114,29 @@ RAY_INTERNAL_SERVE_CONTROLLER_PIN_ON_NODE = (
     os.environ.get("RAY_INTERNAL_SERVE_CONTROLLER_PIN_ON_NODE") != "0"
 )
 
+# Policy used by handles to choose a replica for each query. One of
+# "round_robin", "power_of_two_choices", "least_outstanding_requests" or
+# "latency_ewma".
+RAY_SERVE_REPLICA_SELECTION_POLICY = os.environ.get(
+    "RAY_SERVE_REPLICA_SELECTION_POLICY", "round_robin"
+)
+
+# Environment variable holding the availability zone of a node. Replicas and
+# handles read it to prefer replicas in their own zone when routing.
+SERVE_AVAILABILITY_ZONE_ENV_VAR = "RAY_SERVE_AVAILABILITY_ZONE"
+
+# Fraction of requests whose latency breakdown is written to a trace file, in
+# addition to the `serve_request_stage_latency_ms` histogram. The sampling
+# decision is derived from the request ID so all components trace the same
+# requests.
+RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE = float(
+    os.environ.get("RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE", 0.0)
+)
+
+# Directory the sampled request traces are written to. Defaults to the Serve
+# logs directory of the Ray session.
+RAY_SERVE_REQUEST_TRACE_DIR = os.environ.get("RAY_SERVE_REQUEST_TRACE_DIR", "")
+
 # Timeout for GCS RPC request
 RAY_GCS_RPC_TIMEOUT_S = 3.0
 
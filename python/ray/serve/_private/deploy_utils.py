@@ -4,7 +4,7 @@ import time
 
 from ray.serve.config import ReplicaConfig, DeploymentConfig
 from ray.serve._private.constants import SERVE_LOGGER_NAME
-from ray.serve._private.autoscaling_policy import BasicAutoscalingPolicy
+from ray.serve._private.autoscaling_policy import create_autoscaling_policy
 from ray.serve._private.common import DeploymentInfo
 
 import ray
@@ -115,7 +115,7 @@ def deploy_args_to_deployment_info(
                     previous_deployment.deployment_config.num_replicas
                 )
 
-        autoscaling_policy = BasicAutoscalingPolicy(autoscaling_config)
+        autoscaling_policy = create_autoscaling_policy(autoscaling_config)
     else:
         autoscaling_policy = None
 
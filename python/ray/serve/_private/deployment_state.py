@@ -10,7 +10,7 @@ import traceback
 from collections import defaultdict, OrderedDict
 from copy import copy
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import ray
 from ray import ObjectRef, cloudpickle
@@ -219,6 +219,7 @@ class ActorReplicaWrapper:
             # Populated after replica is allocated.
             self._node_id: str = None
         self._node_ip: str = None
+        self._availability_zone: Optional[str] = None
 
         # Populated in self.stop().
         self._graceful_shutdown_ref: ObjectRef = None
@@ -281,6 +282,11 @@ class ActorReplicaWrapper:
         """Returns the node ip of the actor, None if not placed."""
         return self._node_ip
 
+    @property
+    def availability_zone(self) -> Optional[str]:
+        """Returns the availability zone of the actor's node, None if unknown."""
+        return self._availability_zone
+
     def _check_obj_ref_ready(self, obj_ref: ObjectRef) -> bool:
         ready, _ = ray.wait([obj_ref], timeout=0)
         return len(ready) == 1
@@ -493,9 +499,13 @@ class ActorReplicaWrapper:
                 )
                 self._health_check_period_s = deployment_config.health_check_period_s
                 self._health_check_timeout_s = deployment_config.health_check_timeout_s
-                self._pid, self._actor_id, self._node_id, self._node_ip = ray.get(
-                    self._allocated_obj_ref
-                )
+                (
+                    self._pid,
+                    self._actor_id,
+                    self._node_id,
+                    self._node_ip,
+                    self._availability_zone,
+                ) = ray.get(self._allocated_obj_ref)
             except Exception:
                 logger.exception(
                     f"Exception in replica '{self._replica_tag}', "
@@ -704,6 +714,7 @@ class DeploymentReplica(VersionedReplica):
         self._version = version
         self._start_time = None
         self._prev_slow_startup_warning_time = None
+        self._is_initialized = False
 
     def get_running_replica_info(self) -> RunningReplicaInfo:
         return RunningReplicaInfo(
@@ -712,6 +723,8 @@ class DeploymentReplica(VersionedReplica):
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
             is_cross_language=self._actor.is_cross_language,
+            node_id=self._actor.node_id,
+            availability_zone=self._actor.availability_zone,
         )
 
     def get_replica_details(self, state: ReplicaState) -> ReplicaDetails:
@@ -753,6 +766,11 @@ class DeploymentReplica(VersionedReplica):
         """Returns the node id of the actor, None if not placed."""
         return self._actor.node_id
 
+    @property
+    def is_initialized(self) -> bool:
+        """Whether check_started() has observed a successful startup."""
+        return self._is_initialized
+
     def start(self, deployment_info: DeploymentInfo, version: DeploymentVersion):
         """
         Start a new actor for current DeploymentReplica instance.
@@ -798,6 +816,7 @@ class DeploymentReplica(VersionedReplica):
             # by reading re-computed version in RayServeReplica
             if version is not None:
                 self._version = version
+            self._is_initialized = True
 
         return status
 
@@ -1032,6 +1051,12 @@ class DeploymentState:
         self._last_retry: float = 0.0
         self._backoff_time_s: int = 1
         self._replica_constructor_retry_counter: int = 0
+        # Backoff when standby replicas consistently fail to start.
+        self._standby_retry_time: float = 0.0
+        self._standby_backoff_time_s: float = 1
+        # Tags of the STOPPING replicas that were stopped as standby replicas.
+        # They never served traffic, so they don't hold back a scale-up.
+        self._stopping_standby_replica_tags: Set[str] = set()
         self._replicas: ReplicaStateContainer = ReplicaStateContainer()
         self._curr_status_info: DeploymentStatusInfo = DeploymentStatusInfo(
             self._name, DeploymentStatus.UPDATING
@@ -1065,6 +1090,16 @@ class DeploymentState:
         """
         return self._target_state
 
+    def get_standby_replica_tags(self) -> List[str]:
+        """
+        Return the tags of the standby replicas. They are checkpointed with the
+        target state, so that standby replicas are recovered as standby.
+        """
+        return [
+            replica.replica_tag
+            for replica in self._replicas.get([ReplicaState.STANDBY])
+        ]
+
     def recover_target_state_from_checkpoint(
         self, target_state_checkpoint: DeploymentTargetState
     ):
@@ -1074,7 +1109,9 @@ class DeploymentState:
         self._target_state = target_state_checkpoint
 
     def recover_current_state_from_replica_actor_names(
-        self, replica_actor_names: List[str]
+        self,
+        replica_actor_names: List[str],
+        standby_replica_tags: Optional[List[str]] = None,
     ):
         assert self._target_state is not None, (
             "Target state should be recovered successfully first before "
@@ -1085,6 +1122,7 @@ class DeploymentState:
             "Recovering current state for deployment "
             f"{self._name} from {len(replica_actor_names)} total actors."
         )
+        standby_replica_tags = set(standby_replica_tags or [])
         # All current states use default value, only attach running replicas.
         for replica_actor_name in replica_actor_names:
             replica_name: ReplicaName = ReplicaName.from_str(replica_actor_name)
@@ -1096,10 +1134,16 @@ class DeploymentState:
                 None,
             )
             new_deployment_replica.recover()
-            self._replicas.add(ReplicaState.RECOVERING, new_deployment_replica)
+            if new_deployment_replica.replica_tag in standby_replica_tags:
+                # Standby replicas are recovered as standby, so they aren't
+                # routed to until a scale-up promotes them.
+                replica_state = ReplicaState.STANDBY
+            else:
+                replica_state = ReplicaState.RECOVERING
+            self._replicas.add(replica_state, new_deployment_replica)
             logger.debug(
-                f"RECOVERING replica: {new_deployment_replica.replica_tag}, "
-                f"deployment: {self._name}."
+                f"{replica_state.value} replica: "
+                f"{new_deployment_replica.replica_tag}, deployment: {self._name}."
             )
 
         # TODO(jiaodong): this currently halts all traffic in the cluster
@@ -1306,8 +1350,8 @@ class DeploymentState:
             exclude_version=self._target_state.version,
             states=[ReplicaState.STARTING, ReplicaState.UPDATING, ReplicaState.RUNNING],
         )
-        old_stopping_replicas = self._replicas.count(
-            exclude_version=self._target_state.version, states=[ReplicaState.STOPPING]
+        old_stopping_replicas = self._count_stopping_replicas(
+            exclude_version=self._target_state.version
         )
         new_running_replicas = self._replicas.count(
             version=self._target_state.version, states=[ReplicaState.RUNNING]
@@ -1360,12 +1404,16 @@ class DeploymentState:
             return False
 
         elif delta_replicas > 0:
+            # Standby replicas are already initialized, so prefer them over
+            # starting new replicas.
+            num_promoted = self._promote_standby_replicas(delta_replicas)
+            if num_promoted > 0:
+                # The set of running replicas changed, so it must be broadcast.
+                replicas_stopped = True
+                delta_replicas -= num_promoted
+
             # Don't ever exceed self._target_state.num_replicas.
-            stopping_replicas = self._replicas.count(
-                states=[
-                    ReplicaState.STOPPING,
-                ]
-            )
+            stopping_replicas = self._count_stopping_replicas()
             to_add = max(delta_replicas - stopping_replicas, 0)
             if to_add > 0:
                 # Exponential backoff
@@ -1434,6 +1482,160 @@ class DeploymentState:
 
         return replicas_stopped
 
+    def _promote_standby_replicas(self, max_to_promote: int) -> int:
+        """Move up to max_to_promote initialized standby replicas to RUNNING.
+
+        Only standby replicas of the target version are promoted.
+
+        Returns the number of promoted replicas.
+        """
+        num_promoted = 0
+        for replica in self._replicas.pop(states=[ReplicaState.STANDBY]):
+            if (
+                num_promoted < max_to_promote
+                and replica.is_initialized
+                and replica.version == self._target_state.version
+            ):
+                self._replicas.add(ReplicaState.RUNNING, replica)
+                num_promoted += 1
+            else:
+                self._replicas.add(ReplicaState.STANDBY, replica)
+
+        if num_promoted > 0:
+            # Checkpoint the remaining standby replicas before the promoted
+            # replicas are broadcast, so they aren't recovered as standby.
+            self._save_checkpoint_func(writeahead_checkpoints=None)
+            logger.info(
+                f"Promoted {num_promoted} standby "
+                f"replica{'s' if num_promoted > 1 else ''} "
+                f"of deployment '{self._name}' to RUNNING."
+            )
+        return num_promoted
+
+    def _scale_standby_replicas(self) -> None:
+        """Keep the pool of standby replicas at its configured size.
+
+        Standby replicas are started and initialized like regular replicas
+        but aren't added to the routing table until a scale-up promotes
+        them. The pool is only replenished while the deployment is HEALTHY so
+        it doesn't compete for resources with a rollout or a scale-up.
+        """
+        if self._target_state.deleting:
+            target_num_standby = 0
+        else:
+            target_num_standby = (
+                self._target_state.info.deployment_config.num_standby_replicas
+            )
+
+        # Standby replicas of an outdated version would never be promoted.
+        # Recovered standby replicas have no version until they're initialized.
+        replicas_to_stop = []
+        for replica in self._replicas.pop(states=[ReplicaState.STANDBY]):
+            if self._target_state.deleting or (
+                replica.version is not None
+                and replica.version != self._target_state.version
+            ):
+                replicas_to_stop.append(replica)
+            else:
+                self._replicas.add(ReplicaState.STANDBY, replica)
+        num_standby = self._replicas.count(states=[ReplicaState.STANDBY])
+        if num_standby > target_num_standby:
+            replicas_to_stop.extend(
+                self._replicas.pop(
+                    states=[ReplicaState.STANDBY],
+                    max_replicas=num_standby - target_num_standby,
+                )
+            )
+        for replica in replicas_to_stop:
+            self._stop_standby_replica(replica)
+
+        to_add = target_num_standby - num_standby
+        if (
+            to_add <= 0
+            or self._curr_status_info.status != DeploymentStatus.HEALTHY
+            or time.time() < self._standby_retry_time
+        ):
+            return
+
+        logger.info(
+            f"Adding {to_add} standby replica{'s' if to_add > 1 else ''} "
+            f"to deployment {self._name}."
+        )
+        new_deployment_replicas = []
+        for _ in range(to_add):
+            replica_name = ReplicaName(self._name, get_random_letters())
+            new_deployment_replica = DeploymentReplica(
+                self._controller_name,
+                self._detached,
+                replica_name.replica_tag,
+                replica_name.deployment_tag,
+                self._target_state.version,
+            )
+            self._replicas.add(ReplicaState.STANDBY, new_deployment_replica)
+            new_deployment_replicas.append(new_deployment_replica)
+        # Checkpoint the standby replicas before starting them, so they are
+        # recovered as standby if the controller fails.
+        self._save_checkpoint_func(writeahead_checkpoints=None)
+        for new_deployment_replica in new_deployment_replicas:
+            new_deployment_replica.start(
+                self._target_state.info, self._target_state.version
+            )
+
+    def _check_standby_replicas(self) -> None:
+        """Track the startup and health of standby replicas.
+
+        Standby replicas that fail to start or fail their health check are
+        stopped and replaced after an exponential backoff.
+        """
+        for replica in self._replicas.pop(states=[ReplicaState.STANDBY]):
+            if replica.is_initialized:
+                healthy = replica.check_health()
+            else:
+                start_status = replica.check_started()
+                healthy = start_status != ReplicaStartupStatus.FAILED
+                if start_status == ReplicaStartupStatus.SUCCEEDED:
+                    self._standby_backoff_time_s = 1
+                    logger.info(
+                        f"Standby replica {replica.replica_tag} started "
+                        "successfully.",
+                        extra={"log_to_stderr": False},
+                    )
+
+            if healthy:
+                self._replicas.add(ReplicaState.STANDBY, replica)
+            else:
+                logger.warning(
+                    f"Standby replica {replica.replica_tag} of deployment "
+                    f"{self._name} failed to start or failed its health check, "
+                    "stopping it."
+                )
+                self._stop_standby_replica(replica, graceful=False)
+                self._standby_retry_time = time.time() + self._standby_backoff_time_s
+                self._standby_backoff_time_s = min(
+                    EXPONENTIAL_BACKOFF_FACTOR * self._standby_backoff_time_s,
+                    MAX_BACKOFF_TIME_S,
+                )
+
+    def _count_stopping_replicas(
+        self, exclude_version: Optional[DeploymentVersion] = None
+    ) -> int:
+        """Count the STOPPING replicas, except the stopped standby replicas."""
+        return len(
+            [
+                replica
+                for replica in self._replicas.get([ReplicaState.STOPPING])
+                if replica.replica_tag not in self._stopping_standby_replica_tags
+                and (exclude_version is None or replica.version != exclude_version)
+            ]
+        )
+
+    def _stop_standby_replica(
+        self, replica: DeploymentReplica, graceful: bool = True
+    ) -> None:
+        replica.stop(graceful=graceful)
+        self._replicas.add(ReplicaState.STOPPING, replica)
+        self._stopping_standby_replica_tags.add(replica.replica_tag)
+
     def _check_curr_status(self) -> bool:
         """Check the current deployment status.
 
@@ -1536,6 +1738,17 @@ class DeploymentState:
                 # set.
                 self._replicas.add(ReplicaState.RUNNING, replica)
                 transitioned_to_running = True
+                target_info = self._target_state.info
+                if (
+                    original_state == ReplicaState.STARTING
+                    and target_info is not None
+                    and target_info.autoscaling_policy is not None
+                ):
+                    # Let the autoscaling policy know how long it takes for a
+                    # new replica to serve traffic.
+                    target_info.autoscaling_policy.record_replica_startup_time(
+                        time.time() - replica._start_time
+                    )
                 logger.info(
                     f"Replica {replica.replica_tag} started successfully.",
                     extra={"log_to_stderr": False},
@@ -1632,6 +1845,7 @@ class DeploymentState:
         slow_recover, recovering_to_running = self._check_startup_replicas(
             ReplicaState.RECOVERING, stop_on_slow=True
         )
+        self._check_standby_replicas()
 
         slow_start_replicas = slow_start + slow_update + slow_recover
         running_replicas_changed = (
@@ -1704,6 +1918,8 @@ class DeploymentState:
             stopped = replica.check_stopped()
             if not stopped:
                 self._replicas.add(ReplicaState.STOPPING, replica)
+            else:
+                self._stopping_standby_replica_tags.discard(replica.replica_tag)
 
         return running_replicas_changed
 
@@ -1723,6 +1939,7 @@ class DeploymentState:
             # we manage.
 
             running_replicas_changed = self._scale_deployment_replicas()
+            self._scale_standby_replicas()
 
             # Check the state of existing replicas and transition if necessary.
             running_replicas_changed |= self._check_and_update_replicas()
@@ -1980,6 +2197,7 @@ class DeploymentStateManager:
             (
                 deployment_state_info,
                 self._deleted_deployment_metadata,
+                standby_replica_tags,
             ) = cloudpickle.loads(checkpoint)
 
             for deployment_tag, checkpoint_data in deployment_state_info.items():
@@ -1992,7 +2210,8 @@ class DeploymentStateManager:
                 deployment_state.recover_target_state_from_checkpoint(checkpoint_data)
                 if len(deployment_to_current_replicas[deployment_tag]) > 0:
                     deployment_state.recover_current_state_from_replica_actor_names(  # noqa: E501
-                        deployment_to_current_replicas[deployment_tag]
+                        deployment_to_current_replicas[deployment_tag],
+                        standby_replica_tags.get(deployment_tag),
                     )
                 self._deployment_states[deployment_tag] = deployment_state
 
@@ -2037,10 +2256,21 @@ class DeploymentStateManager:
         if writeahead_checkpoints is not None:
             deployment_state_info.update(writeahead_checkpoints)
 
+        # The standby replicas are checkpointed so they aren't recovered as
+        # running replicas.
+        standby_replica_tags = {
+            deployment_name: deployment_state.get_standby_replica_tags()
+            for deployment_name, deployment_state in self._deployment_states.items()
+        }
+
         self._kv_store.put(
             CHECKPOINT_KEY,
             cloudpickle.dumps(
-                (deployment_state_info, self._deleted_deployment_metadata)
+                (
+                    deployment_state_info,
+                    self._deleted_deployment_metadata,
+                    standby_replica_tags,
+                )
             ),
         )
 
@@ -1,5 +1,6 @@
 import asyncio
 from asyncio.tasks import FIRST_COMPLETED
+from collections import OrderedDict
 import os
 import logging
 import pickle
@@ -33,6 +34,11 @@ from ray.serve._private.constants import (
 )
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
+from ray.serve._private.request_latency import (
+    PROXY_RECEIVE,
+    RESPONSE_SEND,
+    RequestLatencyRecorder,
+)
 
 from ray.serve._private.utils import get_random_letters
 
@@ -66,7 +72,14 @@ if os.environ.get("SERVE_REQUEST_PROCESSING_TIMEOUT_S") is not None:
     )
 
 
-async def _send_request_to_handle(handle, scope, receive, send) -> str:
+async def _send_request_to_handle(
+    handle,
+    scope,
+    receive,
+    send,
+    latency_recorder: Optional[RequestLatencyRecorder] = None,
+) -> str:
+    receive_start_time = time.time()
     http_body_bytes = await receive_http_body(scope, receive, send)
 
     # NOTE(edoakes): it's important that we defer building the starlette
@@ -77,6 +90,17 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
     # dataclasses are 10-100x faster than cloudpickle.
     request = pickle.dumps(request)
 
+    request_context = ray.serve.context._serve_request_context.get()
+    if latency_recorder is not None:
+        latency_recorder.record(
+            PROXY_RECEIVE,
+            receive_start_time,
+            time.time(),
+            deployment=handle.deployment_name,
+            route=request_context.route,
+            request_id=request_context.request_id,
+        )
+
     retries = 0
     backoff_time_s = 0.05
     backoff = False
@@ -157,22 +181,57 @@ async def _send_request_to_handle(handle, scope, receive, send) -> str:
         await Response(error_message, status_code=500).send(scope, receive, send)
         return "500"
 
+    send_start_time = time.time()
     if isinstance(result, (starlette.responses.Response, RawASGIResponse)):
         await result(scope, receive, send)
-        return str(result.status_code)
+        status_code = str(result.status_code)
     else:
         await Response(result).send(scope, receive, send)
-        return "200"
+        status_code = "200"
+    if latency_recorder is not None:
+        latency_recorder.record(
+            RESPONSE_SEND,
+            send_start_time,
+            time.time(),
+            deployment=handle.deployment_name,
+            route=request_context.route,
+            request_id=request_context.request_id,
+        )
+    return status_code
+
+
+class _RouteTrieNode:
+    """A node of the path segment trie used by LongestPrefixRouter.
+
+    Each node corresponds to a sequence of "/"-separated path segments.
+    `route` is set if a route consisting of exactly these segments exists
+    (e.g. "/a/b") and matches the target route "/a/b" and any "/a/b/...".
+    `slash_route` is set if the route is these segments followed by a
+    trailing "/" (e.g. "/a/b/") and only matches target routes that continue
+    past this node.
+    """
+
+    __slots__ = ("children", "route", "slash_route")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteTrieNode"] = dict()
+        self.route: Optional[str] = None
+        self.slash_route: Optional[str] = None
 
 
 class LongestPrefixRouter:
     """Router that performs longest prefix matches on incoming routes."""
 
+    # Max number of recently matched target routes to cache.
+    MATCH_CACHE_SIZE = 1024
+
     def __init__(self, get_handle: Callable):
         # Function to get a handle given a name. Used to mock for testing.
         self._get_handle = get_handle
-        # Routes sorted in order of decreasing length.
-        self.sorted_routes: List[str] = list()
+        # Trie of path segments compiled from the routes.
+        self._route_trie = _RouteTrieNode()
+        # LRU cache of target route -> matched route, cleared on route updates.
+        self._match_cache: Dict[str, Optional[str]] = OrderedDict()
         # Endpoints associated with the routes.
         self.route_info: Dict[str, EndpointTag] = dict()
         # Contains a ServeHandle for each endpoint.
@@ -206,11 +265,56 @@ class LongestPrefixRouter:
         for endpoint in existing_handles:
             del self.handles[endpoint]
 
-        # Routes are sorted in order of decreasing length to enable longest
-        # prefix matching.
-        self.sorted_routes = sorted(routes, key=lambda x: len(x), reverse=True)
+        self._route_trie = self._build_route_trie(routes)
+        self._match_cache = OrderedDict()
         self.route_info = route_info
 
+    @staticmethod
+    def _build_route_trie(routes: List[str]) -> _RouteTrieNode:
+        root = _RouteTrieNode()
+        for route in routes:
+            segments = route.split("/")
+            is_slash_route = route.endswith("/")
+            if is_slash_route:
+                # "/a/b/" splits into ["", "a", "b", ""], drop the last one.
+                segments = segments[:-1]
+
+            node = root
+            for segment in segments:
+                if segment not in node.children:
+                    node.children[segment] = _RouteTrieNode()
+                node = node.children[segment]
+
+            if is_slash_route:
+                node.slash_route = route
+            else:
+                node.route = route
+        return root
+
+    def _match_route_in_trie(self, target_route: str) -> Optional[str]:
+        """Walk down the trie along the segments of the target route.
+
+        A route without a trailing "/" matches if the target route is either
+        the route itself or continues with a "/" after it, which is exactly
+        when its segments are a prefix of the target's segments. This guards
+        against '/route' matching a request to '/routesuffix'. A route with a
+        trailing "/" matches whenever the target route has more segments.
+        """
+        segments = target_route.split("/")
+        matched = None
+        node = self._route_trie
+        for i, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            candidates = [node.route]
+            if i + 1 < len(segments):
+                candidates.append(node.slash_route)
+            for route in candidates:
+                if route is not None and (matched is None or len(route) > len(matched)):
+                    matched = route
+        return matched
+
     def match_route(
         self, target_route: str
     ) -> Tuple[Optional[str], Optional[RayServeHandle]]:
@@ -224,25 +328,18 @@ class LongestPrefixRouter:
             else (None, None).
         """
 
-        for route in self.sorted_routes:
-            if target_route.startswith(route):
-                matched = False
-                # If the route we matched on ends in a '/', then so does the
-                # target route and this must be a match.
-                if route.endswith("/"):
-                    matched = True
-                # If the route we matched on doesn't end in a '/', we need to
-                # do another check to ensure that either this is an exact match
-                # or the next character in the target route is a '/'. This is
-                # to guard against the scenario where we have '/route' as a
-                # prefix and there's a request to '/routesuffix'. In this case,
-                # it should *not* be a match.
-                elif len(target_route) == len(route) or target_route[len(route)] == "/":
-                    matched = True
-
-                if matched:
-                    endpoint = self.route_info[route]
-                    return route, self.handles[endpoint]
+        if target_route in self._match_cache:
+            self._match_cache.move_to_end(target_route)
+            route = self._match_cache[target_route]
+        else:
+            route = self._match_route_in_trie(target_route)
+            self._match_cache[target_route] = route
+            if len(self._match_cache) > self.MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+
+        if route is not None:
+            endpoint = self.route_info[route]
+            return route, self.handles[endpoint]
 
         return None, None
 
@@ -321,6 +418,7 @@ class HTTPProxy:
             boundaries=DEFAULT_LATENCY_BUCKET_MS,
             tag_keys=("route",),
         )
+        self.request_latency_recorder = RequestLatencyRecorder("http_proxy")
 
     def _update_routes(self, endpoints: Dict[EndpointTag, EndpointInfo]) -> None:
         self.route_info: Dict[str, Tuple[EndpointTag, List[str]]] = dict()
@@ -401,7 +499,9 @@ class HTTPProxy:
         ray.serve.context._serve_request_context.set(
             ray.serve.context.RequestContext(route_path, get_random_letters(10))
         )
-        status_code = await _send_request_to_handle(handle, scope, receive, send)
+        status_code = await _send_request_to_handle(
+            handle, scope, receive, send, self.request_latency_recorder
+        )
         latency_ms = (time.time() - start_time) * 1000.0
         self.processing_latency_tracker.observe(latency_ms, tags={"route": route_path})
         logger.info(
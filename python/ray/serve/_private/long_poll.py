@@ -1,12 +1,25 @@
 import asyncio
 from asyncio.events import AbstractEventLoop
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum, auto
 import logging
 import os
 import random
-from typing import Any, Tuple, Callable, DefaultDict, Dict, Set, Union
+import uuid
+from typing import (
+    Any,
+    Tuple,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Union,
+)
 from ray._private.utils import get_or_create_event_loop
 
 from ray.serve._private.common import ReplicaName
@@ -20,8 +33,10 @@ from ray.serve.generated.serve_pb2 import (
 )
 
 import ray
+from ray import cloudpickle
 from ray.serve._private.constants import SERVE_LOGGER_NAME
 from ray.serve._private.utils import format_actor_name
+from ray.util import metrics
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
@@ -37,6 +52,12 @@ LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S = (
     int(os.environ.get("LISTEN_FOR_CHANGE_REQUEST_TIMEOUT_S_UPPER_BOUND", "60")),
 )
 
+# Number of deltas kept per key by LongPollHost. Clients that are further
+# behind than this receive the full snapshot.
+LONG_POLL_DELTA_HISTORY_SIZE = int(
+    os.environ.get("RAY_SERVE_LONG_POLL_DELTA_HISTORY_SIZE", "64")
+)
+
 
 class LongPollNamespace(Enum):
     def __repr__(self):
@@ -46,12 +67,105 @@ class LongPollNamespace(Enum):
     ROUTE_TABLE = auto()
 
 
+@dataclass
+class SnapshotDelta:
+    """The changes between two snapshots of a list or dict object.
+
+    For dict snapshots, `added` maps the added or updated keys to their new
+    values and `removed` holds the removed keys. For list snapshots, `added`
+    holds the added items and `removed` the removed items; the order of the
+    items isn't preserved.
+    """
+
+    is_list: bool
+    added: Union[Dict[Hashable, Any], List[Hashable]]
+    removed: List[Hashable]
+
+    def __len__(self):
+        return len(self.added) + len(self.removed)
+
+    def apply(self, snapshot: Union[Dict, List]) -> Union[Dict, List]:
+        """Return a new snapshot with this delta applied to `snapshot`."""
+        removed = set(self.removed)
+        if self.is_list:
+            return [item for item in snapshot if item not in removed] + list(self.added)
+        else:
+            updated = {k: v for k, v in snapshot.items() if k not in removed}
+            updated.update(self.added)
+            return updated
+
+
 @dataclass
 class UpdatedObject:
     object_snapshot: Any
     # The identifier for the object's version. There is not sequential relation
     # among different object's snapshot_ids.
     snapshot_id: int
+    # If set, object_snapshot is None and this delta must be applied to the
+    # client's current snapshot to obtain the snapshot with snapshot_id.
+    delta: Optional[SnapshotDelta] = None
+    # The epoch of the host that sent the snapshot. Snapshot ids are only
+    # comparable within the same epoch, so deltas are only sent against
+    # snapshots with the host's current epoch.
+    epoch: Optional[str] = None
+
+
+def _to_delta_base(object_snapshot: Any) -> Optional[Tuple[bool, Dict]]:
+    """Convert a snapshot to a dict that deltas can be computed against.
+
+    Returns (is_list, dict), or None if the snapshot isn't a dict or a list
+    of unique hashable items and can only be sent in full.
+    """
+    if isinstance(object_snapshot, dict):
+        return False, dict(object_snapshot)
+    if isinstance(object_snapshot, list):
+        try:
+            base = dict.fromkeys(object_snapshot)
+        except TypeError:
+            return None
+        if len(base) == len(object_snapshot):
+            return True, base
+    return None
+
+
+def _compute_delta(
+    old_base: Tuple[bool, Dict], new_base: Tuple[bool, Dict]
+) -> Optional[SnapshotDelta]:
+    is_list, old = old_base
+    new_is_list, new = new_base
+    if is_list != new_is_list:
+        return None
+
+    removed = [k for k in old if k not in new]
+    if is_list:
+        added = [k for k in new if k not in old]
+    else:
+        added = {k: v for k, v in new.items() if k not in old or old[k] != v}
+    return SnapshotDelta(is_list=is_list, added=added, removed=removed)
+
+
+def _merge_deltas(deltas: List[SnapshotDelta]) -> SnapshotDelta:
+    """Merge consecutive deltas into a single one."""
+    is_list = deltas[0].is_list
+    added = dict()
+    removed = set()
+    for delta in deltas:
+        for k in delta.removed:
+            added.pop(k, None)
+            removed.add(k)
+        if is_list:
+            delta_added = dict.fromkeys(delta.added)
+        else:
+            delta_added = delta.added
+        for k, v in delta_added.items():
+            added[k] = v
+            removed.discard(k)
+
+    return SnapshotDelta(
+        is_list=is_list,
+        added=list(added) if is_list else added,
+        removed=list(removed),
+    )
 
 
 # Type signature for the update state callbacks. E.g.
@@ -61,6 +175,14 @@ UpdateStateCallable = Callable[[Any], None]
 KeyType = Union[str, LongPollNamespace, Tuple[LongPollNamespace, str]]
 
 
+def _key_namespace(key: KeyType) -> str:
+    if isinstance(key, tuple):
+        key = key[0]
+    if isinstance(key, LongPollNamespace):
+        return key.name
+    return str(key)
+
+
 class LongPollState(Enum):
     TIME_OUT = auto()
 
@@ -99,6 +221,7 @@ class LongPollClient:
         self.snapshot_ids: Dict[KeyType, int] = {
             key: -1 for key in self.key_listeners.keys()
         }
+        self.snapshot_epochs: Dict[KeyType, str] = dict()
         self.object_snapshots: Dict[KeyType, Any] = dict()
 
         self._current_ref = None
@@ -123,7 +246,9 @@ class LongPollClient:
         """Poll the update. The callback is expected to scheduler another
         _poll_next call.
         """
-        self._current_ref = self.host_actor.listen_for_change.remote(self.snapshot_ids)
+        self._current_ref = self.host_actor.listen_for_change.remote(
+            self.snapshot_ids, keys_to_epochs=self.snapshot_epochs
+        )
         self._current_ref._on_completed(lambda update: self._process_update(update))
 
     def _schedule_to_event_loop(self, callback):
@@ -170,13 +295,20 @@ class LongPollClient:
             extra={"log_to_stderr": False},
         )
         for key, update in updates.items():
-            self.object_snapshots[key] = update.object_snapshot
+            if update.delta is not None:
+                # The host only sends a delta against the snapshot this
+                # client reported, which is the one it currently holds.
+                object_snapshot = update.delta.apply(self.object_snapshots[key])
+            else:
+                object_snapshot = update.object_snapshot
+            self.object_snapshots[key] = object_snapshot
             self.snapshot_ids[key] = update.snapshot_id
+            self.snapshot_epochs[key] = update.epoch
             callback = self.key_listeners[key]
 
             # Bind the parameters because closures are late-binding.
             # https://docs.python-guide.org/writing/gotchas/#late-binding-closures # noqa: E501
-            def chained(callback=callback, arg=update.object_snapshot):
+            def chained(callback=callback, arg=object_snapshot):
                 callback(arg)
                 self._on_callback_completed(trigger_at=len(updates))
 
@@ -195,9 +327,20 @@ class LongPollHost:
     outdated object and immediately return the result. If the client has the
     up-to-date verison, then the listen_for_change call will only return when
     the object is updated.
+
+    For list and dict objects, the host also keeps the deltas between the
+    last LONG_POLL_DELTA_HISTORY_SIZE snapshots. Clients that accept deltas
+    and are within that history receive only the added and removed entries
+    instead of the full snapshot, which keeps updates small when e.g. one
+    replica of a large deployment is added. Since the snapshot ids of a
+    restarted host start over from a random value, each host has a random
+    epoch, and deltas are only sent to clients whose snapshot has the same
+    epoch.
     """
 
     def __init__(self):
+        # Identifies this host in the delta bases of the clients.
+        self.epoch = uuid.uuid4().hex
         # Map object_key -> int
         self.snapshot_ids: DefaultDict[KeyType, int] = defaultdict(
             lambda: random.randint(0, 1_000_000)
@@ -208,24 +351,106 @@ class LongPollHost:
         self.notifier_events: DefaultDict[KeyType, Set[asyncio.Event]] = defaultdict(
             set
         )
+        # Map object_key -> the latest snapshot converted by _to_delta_base.
+        self._delta_bases: Dict[KeyType, Tuple[bool, Dict]] = dict()
+        # Map object_key -> deque of (snapshot_id, delta from the previous
+        # snapshot_id), in increasing order of snapshot_id.
+        self._delta_history: DefaultDict[
+            KeyType, Deque[Tuple[int, SnapshotDelta]]
+        ] = defaultdict(lambda: deque(maxlen=LONG_POLL_DELTA_HISTORY_SIZE))
+        # Map object_key -> (snapshot_id, pickled size of the full snapshot).
+        self._snapshot_sizes: Dict[KeyType, Tuple[int, int]] = dict()
+
+        self.pushed_bytes_counter = metrics.Counter(
+            "serve_long_poll_pushed_bytes",
+            description="The number of bytes of updates pushed to long poll clients.",
+            tag_keys=("namespace", "update_type"),
+        )
+
+    def _get_snapshot_size(self, key: KeyType) -> int:
+        snapshot_id = self.snapshot_ids[key]
+        cached = self._snapshot_sizes.get(key)
+        if cached is None or cached[0] != snapshot_id:
+            size = len(cloudpickle.dumps(self.object_snapshots[key]))
+            cached = self._snapshot_sizes[key] = (snapshot_id, size)
+        return cached[1]
+
+    def _get_delta(
+        self, key: KeyType, client_snapshot_id: int
+    ) -> Optional[SnapshotDelta]:
+        """Merge the deltas from the client's snapshot to the latest one.
+
+        Returns None if the client's snapshot is not in the delta history.
+        """
+        history = self._delta_history.get(key)
+        if not history or client_snapshot_id >= history[-1][0]:
+            return None
+        first_snapshot_id = history[0][0]
+        if client_snapshot_id + 1 < first_snapshot_id:
+            return None
+        deltas = [delta for snapshot_id, delta in history][
+            client_snapshot_id + 1 - first_snapshot_id :
+        ]
+        if len(deltas) == 1:
+            return deltas[0]
+        return _merge_deltas(deltas)
+
+    def _make_updated_object(
+        self,
+        key: KeyType,
+        client_snapshot_id: int,
+        client_epoch: Optional[str],
+    ) -> UpdatedObject:
+        snapshot_id = self.snapshot_ids[key]
+        delta = None
+        if client_epoch == self.epoch:
+            delta = self._get_delta(key, client_snapshot_id)
+        # Only send the delta if it is smaller than the snapshot itself.
+        if delta is not None and len(delta) < len(self.object_snapshots[key]):
+            update_type = "delta"
+            updated_object = UpdatedObject(
+                None, snapshot_id, delta=delta, epoch=self.epoch
+            )
+            num_bytes = len(cloudpickle.dumps(delta))
+        else:
+            update_type = "full"
+            updated_object = UpdatedObject(
+                self.object_snapshots[key], snapshot_id, epoch=self.epoch
+            )
+            num_bytes = self._get_snapshot_size(key)
+
+        self.pushed_bytes_counter.inc(
+            num_bytes,
+            tags={"namespace": _key_namespace(key), "update_type": update_type},
+        )
+        return updated_object
 
     async def listen_for_change(
         self,
         keys_to_snapshot_ids: Dict[KeyType, int],
+        keys_to_epochs: Optional[Dict[KeyType, str]] = None,
     ) -> Union[LongPollState, Dict[KeyType, UpdatedObject]]:
         """Listen for changed objects.
 
         This method will returns a dictionary of updated objects. It returns
         immediately if the snapshot_ids are outdated, otherwise it will block
         until there's one updates.
+
+        If keys_to_epochs is given, it maps keys to the epochs of the client's
+        snapshots, and the updated objects of the keys whose snapshot has this
+        host's epoch may carry a delta against it instead of the full snapshot.
         """
+        if keys_to_epochs is None:
+            keys_to_epochs = {}
         watched_keys = keys_to_snapshot_ids.keys()
         existent_keys = set(watched_keys).intersection(set(self.snapshot_ids.keys()))
 
         # If there are any outdated keys (by comparing snapshot ids)
         # return immediately.
         client_outdated_keys = {
-            key: UpdatedObject(self.object_snapshots[key], self.snapshot_ids[key])
+            key: self._make_updated_object(
+                key, keys_to_snapshot_ids[key], keys_to_epochs.get(key)
+            )
             for key in existent_keys
             if self.snapshot_ids[key] != keys_to_snapshot_ids[key]
         }
@@ -257,9 +482,10 @@ class LongPollHost:
         else:
             updated_object_key: str = async_task_to_watched_keys[done.pop()]
             return {
-                updated_object_key: UpdatedObject(
-                    self.object_snapshots[updated_object_key],
-                    self.snapshot_ids[updated_object_key],
+                updated_object_key: self._make_updated_object(
+                    updated_object_key,
+                    keys_to_snapshot_ids[updated_object_key],
+                    keys_to_epochs.get(updated_object_key),
                 )
             }
 
@@ -356,6 +582,22 @@ class LongPollHost:
         self.object_snapshots[object_key] = updated_object
         logger.debug(f"LongPollHost: Notify change for key {object_key}.")
 
+        # Keep the delta from the previous snapshot. The delta bases are
+        # copies because callers may mutate the object they notified with.
+        old_base = self._delta_bases.pop(object_key, None)
+        new_base = _to_delta_base(updated_object)
+        delta = None
+        if old_base is not None and new_base is not None:
+            delta = _compute_delta(old_base, new_base)
+        if delta is not None:
+            self._delta_history[object_key].append(
+                (self.snapshot_ids[object_key], delta)
+            )
+        else:
+            self._delta_history.pop(object_key, None)
+        if new_base is not None:
+            self._delta_bases[object_key] = new_base
+
         if object_key in self.notifier_events:
             for event in self.notifier_events.pop(object_key):
                 event.set()
@@ -31,8 +31,14 @@ from ray.serve.deployment import Deployment
 from ray.serve.exceptions import RayServeException
 from ray.serve._private.http_util import ASGIHTTPSender
 from ray.serve._private.logging_utils import access_log_msg, configure_component_logger
+from ray.serve._private.request_latency import (
+    HANDLER,
+    REPLICA_QUEUE,
+    RequestLatencyRecorder,
+)
 from ray.serve._private.router import Query, RequestMetadata
 from ray.serve._private.utils import (
+    get_current_node_availability_zone,
     parse_import_path,
     parse_request_item,
     wrap_to_ray_error,
@@ -217,13 +223,15 @@ def create_replica_wrapper(name: str):
             to PENDING_INITIALIZATION startup state.
 
             Returns:
-                The PID, actor ID, node ID, node IP of the replica.
+                The PID, actor ID, node ID, node IP and availability zone of
+                the replica.
             """
             return (
                 os.getpid(),
                 ray.get_runtime_context().get_actor_id(),
                 ray.get_runtime_context().get_node_id(),
                 ray.util.get_node_ip_address(),
+                get_current_node_availability_zone(),
             )
 
         async def is_initialized(
@@ -358,6 +366,8 @@ class RayServeReplica:
             {"deployment": self.deployment_name, "replica": self.replica_tag}
         )
 
+        self.request_latency_recorder = RequestLatencyRecorder("replica")
+
         self.restart_counter.inc()
 
         self._shutdown_wait_loop_s = deployment_config.graceful_shutdown_wait_loop_s
@@ -519,11 +529,29 @@ class RayServeReplica:
             )
 
             start_time = time.time()
+            if request.metadata.assigned_time_s is not None:
+                self.request_latency_recorder.record(
+                    REPLICA_QUEUE,
+                    request.metadata.assigned_time_s,
+                    start_time,
+                    deployment=self.deployment_name,
+                    route=request.metadata.route,
+                    request_id=request.metadata.request_id,
+                )
             result, success = await self.invoke_single(request)
-            latency_ms = (time.time() - start_time) * 1000
+            end_time = time.time()
+            latency_ms = (end_time - start_time) * 1000
             self.processing_latency_tracker.observe(
                 latency_ms, tags={"route": request.metadata.route}
             )
+            self.request_latency_recorder.record(
+                HANDLER,
+                start_time,
+                end_time,
+                deployment=self.deployment_name,
+                route=request.metadata.route,
+                request_id=request.metadata.request_id,
+            )
             logger.info(
                 access_log_msg(
                     method=request.metadata.call_method,
@@ -0,0 +1,171 @@
+from abc import ABCMeta, abstractmethod
+import itertools
+import random
+from typing import Dict, Iterator, List, Sized
+
+from ray.serve._private.common import ReplicaTag, RunningReplicaInfo
+
+
+class ReplicaSelectionPolicy:
+    """Defines the interface for choosing which replica serves a query.
+
+    A policy doesn't enforce `max_concurrent_queries`: it only proposes an
+    ordering of candidate replicas and the ReplicaSet assigns the query to the
+    first candidate that still has spare capacity. Policies are owned by a
+    single ReplicaSet and are only accessed from its event loop, so they don't
+    need any locking.
+    """
+
+    __metaclass__ = ABCMeta
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        """Called after the replica membership has been updated."""
+        pass
+
+    @abstractmethod
+    def select_replicas(
+        self, in_flight_queries: Dict[RunningReplicaInfo, Sized]
+    ) -> Iterator[RunningReplicaInfo]:
+        """Yield the candidate replicas in the order they should be tried.
+
+        Arguments:
+            in_flight_queries: Mapping from each candidate replica to the
+                queries currently in flight on it. The candidates may be a
+                subset of the running replicas.
+        """
+        raise NotImplementedError
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float):
+        """Called when a query assigned to `replica` finished successfully."""
+        pass
+
+
+class RoundRobinPolicy(ReplicaSelectionPolicy):
+    """Cycle through a shuffled list of replicas, skipping overloaded ones.
+
+    The replicas are shuffled on each membership update to avoid multiple
+    handles sending requests in the same order.
+    """
+
+    def __init__(self):
+        self._num_replicas = 0
+        self._replica_iterator = itertools.cycle([])
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        replicas = list(replicas)
+        random.shuffle(replicas)
+        self._num_replicas = len(replicas)
+        self._replica_iterator = itertools.cycle(replicas)
+
+    def select_replicas(
+        self, in_flight_queries: Dict[RunningReplicaInfo, Sized]
+    ) -> Iterator[RunningReplicaInfo]:
+        for _ in range(self._num_replicas):
+            replica = next(self._replica_iterator)
+            # The candidates may be a subset of the replicas, e.g. only the
+            # replicas on the caller's node.
+            if replica in in_flight_queries:
+                yield replica
+
+
+class PowerOfTwoChoicesPolicy(ReplicaSelectionPolicy):
+    """Sample two replicas at random and prefer the less loaded one.
+
+    If both sampled replicas are at capacity, the remaining replicas are tried
+    in random order so a query is never blocked while a replica is free.
+    """
+
+    def select_replicas(
+        self, in_flight_queries: Dict[RunningReplicaInfo, Sized]
+    ) -> Iterator[RunningReplicaInfo]:
+        replicas = list(in_flight_queries.keys())
+        random.shuffle(replicas)
+        if len(replicas) >= 2 and len(in_flight_queries[replicas[1]]) < len(
+            in_flight_queries[replicas[0]]
+        ):
+            replicas[0], replicas[1] = replicas[1], replicas[0]
+        yield from replicas
+
+
+class LeastOutstandingRequestsPolicy(ReplicaSelectionPolicy):
+    """Prefer the replicas with the fewest queries in flight.
+
+    Ties are broken randomly so concurrent handles don't herd on one replica.
+    """
+
+    def select_replicas(
+        self, in_flight_queries: Dict[RunningReplicaInfo, Sized]
+    ) -> Iterator[RunningReplicaInfo]:
+        replicas = list(in_flight_queries.keys())
+        random.shuffle(replicas)
+        replicas.sort(key=lambda replica: len(in_flight_queries[replica]))
+        yield from replicas
+
+
+class LatencyEWMAPolicy(ReplicaSelectionPolicy):
+    """Prefer the replicas with the lowest expected completion time.
+
+    Each replica is scored by the exponentially weighted moving average of
+    its observed query latency multiplied by its number of queries in flight
+    (plus the one being assigned). Replicas without any observation yet are
+    scored with the mean latency of the others so new replicas receive
+    traffic right away.
+    """
+
+    def __init__(self, alpha: float = 0.3):
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}.")
+        self._alpha = alpha
+        self._latency_ewma_s: Dict[ReplicaTag, float] = dict()
+
+    def update_replicas(self, replicas: List[RunningReplicaInfo]):
+        running_tags = {replica.replica_tag for replica in replicas}
+        for tag in list(self._latency_ewma_s.keys()):
+            if tag not in running_tags:
+                del self._latency_ewma_s[tag]
+
+    def on_query_completed(self, replica: RunningReplicaInfo, latency_s: float):
+        prev = self._latency_ewma_s.get(replica.replica_tag)
+        if prev is None:
+            self._latency_ewma_s[replica.replica_tag] = latency_s
+        else:
+            self._latency_ewma_s[replica.replica_tag] = (
+                self._alpha * latency_s + (1 - self._alpha) * prev
+            )
+
+    def select_replicas(
+        self, in_flight_queries: Dict[RunningReplicaInfo, Sized]
+    ) -> Iterator[RunningReplicaInfo]:
+        replicas = list(in_flight_queries.keys())
+        random.shuffle(replicas)
+        if len(self._latency_ewma_s) > 0:
+            default_latency_s = sum(self._latency_ewma_s.values()) / len(
+                self._latency_ewma_s
+            )
+        else:
+            default_latency_s = 1.0
+
+        def score(replica: RunningReplicaInfo) -> float:
+            latency_s = self._latency_ewma_s.get(replica.replica_tag, default_latency_s)
+            return latency_s * (len(in_flight_queries[replica]) + 1)
+
+        replicas.sort(key=score)
+        yield from replicas
+
+
+REPLICA_SELECTION_POLICIES = {
+    "round_robin": RoundRobinPolicy,
+    "power_of_two_choices": PowerOfTwoChoicesPolicy,
+    "least_outstanding_requests": LeastOutstandingRequestsPolicy,
+    "latency_ewma": LatencyEWMAPolicy,
+}
+
+
+def create_replica_selection_policy(name: str) -> ReplicaSelectionPolicy:
+    """Instantiate one of the built-in policies by name."""
+    if name not in REPLICA_SELECTION_POLICIES:
+        raise ValueError(
+            f"Unknown replica selection policy '{name}'. Valid options are "
+            f"{list(REPLICA_SELECTION_POLICIES.keys())}."
+        )
+    return REPLICA_SELECTION_POLICIES[name]()
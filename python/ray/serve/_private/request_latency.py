@@ -0,0 +1,132 @@
+"""Latency breakdown of the requests handled by Serve.
+
+A request goes through the following stages, each of them recorded as a span
+by the component that observes it:
+
+- ``proxy_receive``: the HTTP proxy receives and serializes the request.
+- ``assignment``: the router waits for a replica with spare capacity.
+- ``replica_queue``: the request is sent to the replica and waits there until
+  the handler starts. This span is computed from the wall-clock time of the
+  router and the replica, so it includes any clock skew between their nodes.
+- ``handler``: the user handler runs.
+- ``response_send``: the HTTP proxy sends the response back to the client.
+
+All spans are observed in the ``serve_request_stage_latency_ms`` histogram.
+A sample of the requests can additionally be written as JSON lines to a trace
+file per process. The sample is chosen from the request ID, so every component
+traces the same requests and their spans can be joined by request ID.
+"""
+import json
+import os
+import threading
+import zlib
+from typing import Dict, TextIO
+
+import ray
+from ray.util import metrics
+from ray.serve._private.constants import (
+    DEFAULT_LATENCY_BUCKET_MS,
+    RAY_SERVE_REQUEST_TRACE_DIR,
+    RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE,
+)
+
+PROXY_RECEIVE = "proxy_receive"
+ASSIGNMENT = "assignment"
+REPLICA_QUEUE = "replica_queue"
+HANDLER = "handler"
+RESPONSE_SEND = "response_send"
+
+TRACE_FILE_FMT = "request_trace_{pid}.jsonl"
+
+# Trace files opened by this process, shared by all the recorders in it.
+_trace_files: Dict[str, TextIO] = dict()
+_trace_files_lock = threading.Lock()
+
+
+def is_request_sampled(request_id: str, sample_rate: float) -> bool:
+    """Whether the spans of this request should be written to the trace file.
+
+    Requests without an ID are never sampled because their spans can't be
+    joined across components.
+    """
+    if sample_rate <= 0 or not request_id:
+        return False
+    return zlib.crc32(request_id.encode()) < sample_rate * 2**32
+
+
+def get_request_trace_path(trace_dir: str = RAY_SERVE_REQUEST_TRACE_DIR) -> str:
+    """Returns the path of the trace file of this process."""
+    if not trace_dir:
+        trace_dir = os.path.join(
+            ray._private.worker._global_node.get_logs_dir_path(), "serve"
+        )
+    return os.path.join(trace_dir, TRACE_FILE_FMT.format(pid=os.getpid()))
+
+
+def _write_trace(path: str, span: Dict):
+    line = json.dumps(span) + "\n"
+    with _trace_files_lock:
+        trace_file = _trace_files.get(path)
+        if trace_file is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            trace_file = open(path, "a", buffering=1)
+            _trace_files[path] = trace_file
+        trace_file.write(line)
+
+
+class RequestLatencyRecorder:
+    """Records the latency spans of the requests seen by one Serve component.
+
+    Recording a span only takes a histogram observation unless the request is
+    sampled, so it's cheap enough to be done for every request.
+    """
+
+    def __init__(
+        self,
+        component: str,
+        sample_rate: float = RAY_SERVE_REQUEST_TRACE_SAMPLE_RATE,
+        trace_dir: str = RAY_SERVE_REQUEST_TRACE_DIR,
+    ):
+        self.component = component
+        self.sample_rate = sample_rate
+        self.trace_dir = trace_dir
+        self.stage_latency_tracker = metrics.Histogram(
+            "serve_request_stage_latency_ms",
+            description=(
+                "The latency of each stage of a request: proxy_receive, "
+                "assignment, replica_queue, handler and response_send."
+            ),
+            boundaries=DEFAULT_LATENCY_BUCKET_MS,
+            tag_keys=("stage", "deployment", "route"),
+        )
+
+    def record(
+        self,
+        stage: str,
+        start_time_s: float,
+        end_time_s: float,
+        *,
+        deployment: str,
+        route: str = "",
+        request_id: str = "",
+    ):
+        """Record that a request spent [start_time_s, end_time_s] in a stage."""
+        latency_ms = max(end_time_s - start_time_s, 0.0) * 1000
+        self.stage_latency_tracker.observe(
+            latency_ms,
+            tags={"stage": stage, "deployment": deployment, "route": route},
+        )
+        if is_request_sampled(request_id, self.sample_rate):
+            _write_trace(
+                get_request_trace_path(self.trace_dir),
+                {
+                    "request_id": request_id,
+                    "stage": stage,
+                    "component": self.component,
+                    "deployment": deployment,
+                    "route": route,
+                    "start_time_s": start_time_s,
+                    "end_time_s": end_time_s,
+                    "latency_ms": latency_ms,
+                },
+            )
@@ -1,10 +1,10 @@
 import asyncio
 from dataclasses import dataclass
-import itertools
+import functools
 import logging
 import pickle
-import random
 import sys
+import time
 from typing import Any, Dict, List, Optional
 
 import ray
@@ -14,10 +14,19 @@ from ray.exceptions import RayActorError, RayTaskError
 from ray.util import metrics
 
 from ray.serve._private.common import RunningReplicaInfo
-from ray.serve._private.constants import SERVE_LOGGER_NAME
+from ray.serve._private.constants import (
+    RAY_SERVE_REPLICA_SELECTION_POLICY,
+    SERVE_LOGGER_NAME,
+)
 from ray.serve._private.long_poll import LongPollClient, LongPollNamespace
+from ray.serve._private.replica_selection_policy import (
+    ReplicaSelectionPolicy,
+    create_replica_selection_policy,
+)
+from ray.serve._private.request_latency import ASSIGNMENT, RequestLatencyRecorder
 from ray.serve._private.utils import (
     compute_iterable_delta,
+    get_current_node_availability_zone,
     JavaActorHandleProxy,
 )
 from ray.serve.generated.serve_pb2 import (
@@ -40,6 +49,14 @@ class RequestMetadata:
     # HTTP route path of the request.
     route: str = ""
 
+    # If set, replicas on the caller's node and then in the caller's
+    # availability zone are preferred when they have spare capacity.
+    prefer_local_routing: bool = False
+
+    # Wall-clock time at which the router sent the request to a replica, used
+    # to measure how long the request waited before the replica handled it.
+    assigned_time_s: Optional[float] = None
+
 
 @dataclass
 class Query:
@@ -69,27 +86,39 @@ class ReplicaSet:
         self,
         deployment_name,
         event_loop: asyncio.AbstractEventLoop,
+        replica_selection_policy: Optional[ReplicaSelectionPolicy] = None,
+        node_id: Optional[str] = None,
+        availability_zone: Optional[str] = None,
     ):
         self.deployment_name = deployment_name
+        # The refs of the queries in flight on each replica. Completed refs are
+        # removed by done callbacks, so the size of each set is the current
+        # number of outstanding queries on that replica.
         self.in_flight_queries: Dict[RunningReplicaInfo, set] = dict()
-        # The iterator used for load balancing among replicas. Using itertools
-        # cycle, we implements a round-robin policy, skipping overloaded
-        # replicas.
-        # NOTE(simon): We can make this more pluggable and consider different
-        # policies like: min load, pick min of two replicas, pick replicas on
-        # the same node.
-        self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
+        # The policy used for load balancing among replicas. It proposes the
+        # order in which replicas are tried, overloaded replicas are skipped.
+        self.replica_selection_policy = (
+            replica_selection_policy
+            or create_replica_selection_policy(RAY_SERVE_REPLICA_SELECTION_POLICY)
+        )
+        # Location of the caller, used for locality-aware routing.
+        self.node_id = node_id
+        self.availability_zone = availability_zone
+        # The replicas grouped by locality: same node, then same availability
+        # zone, then the rest. Empty groups are omitted. The groups share the
+        # in flight query sets with `in_flight_queries`.
+        self.locality_groups: List[Dict[RunningReplicaInfo, set]] = []
 
         # Used to unblock this replica set waiting for free replicas. A newly
-        # added replica or updated max_concurrent_queries value means the
-        # query that waits on a free replica might be unblocked on.
+        # added replica, updated max_concurrent_queries value or a completed
+        # query means the query that waits on a free replica might be unblocked.
 
         # Python 3.8 has deprecated the 'loop' parameter, and Python 3.10 has
         # removed it alltogether. Call accordingly.
         if sys.version_info.major >= 3 and sys.version_info.minor >= 10:
-            self.config_updated_event = asyncio.Event()
+            self.replica_available_event = asyncio.Event()
         else:
-            self.config_updated_event = asyncio.Event(loop=event_loop)
+            self.replica_available_event = asyncio.Event(loop=event_loop)
 
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
@@ -103,17 +132,34 @@ class ReplicaSet:
         self.num_queued_queries_gauge.set_default_tags(
             {"deployment": self.deployment_name}
         )
+        self.request_latency_recorder = RequestLatencyRecorder("router")
 
     def _reset_replica_iterator(self):
-        """Reset the iterator used to load balance replicas.
+        """Notify the replica selection policy of the current replicas.
 
         This call is expected to be called after the replica membership has
-        been updated. It will shuffle the replicas randomly to avoid multiple
-        handle sending requests in the same order.
+        been updated.
         """
-        replicas = list(self.in_flight_queries.keys())
-        random.shuffle(replicas)
-        self.replica_iterator = itertools.cycle(replicas)
+        self.replica_selection_policy.update_replicas(
+            list(self.in_flight_queries.keys())
+        )
+        self._update_locality_groups()
+
+    def _update_locality_groups(self):
+        same_node, same_zone, others = dict(), dict(), dict()
+        for replica, queries in self.in_flight_queries.items():
+            if self.node_id is not None and replica.node_id == self.node_id:
+                same_node[replica] = queries
+            elif (
+                self.availability_zone is not None
+                and replica.availability_zone == self.availability_zone
+            ):
+                same_zone[replica] = queries
+            else:
+                others[replica] = queries
+        self.locality_groups = [
+            group for group in [same_node, same_zone, others] if len(group) > 0
+        ]
 
     def update_running_replicas(self, running_replicas: List[RunningReplicaInfo]):
         added, removed, _ = compute_iterable_delta(
@@ -132,94 +178,116 @@ class ReplicaSet:
         if len(added) > 0 or len(removed) > 0:
             logger.debug(f"ReplicaSet: +{len(added)}, -{len(removed)} replicas.")
             self._reset_replica_iterator()
-            self.config_updated_event.set()
+            self.replica_available_event.set()
 
     def _try_assign_replica(self, query: Query) -> Optional[ray.ObjectRef]:
         """Try to assign query to a replica, return the object ref if succeeded
         or return None if it can't assign this query to any replicas.
-        """
-        for _ in range(len(self.in_flight_queries.keys())):
-            replica = next(self.replica_iterator)
-            if len(self.in_flight_queries[replica]) >= replica.max_concurrent_queries:
-                # This replica is overloaded, try next one
-                continue
 
-            logger.debug(
-                f"Assigned query {query.metadata.request_id} "
-                f"to replica {replica.replica_tag}."
-            )
-            if replica.is_cross_language:
-                # Handling requests for Java replica
-                arg = query.args[0]
-                if query.metadata.http_arg_is_pickled:
-                    assert isinstance(arg, bytes)
-                    loaded_http_input = pickle.loads(arg)
-                    query_string = loaded_http_input.scope.get("query_string")
-                    if query_string:
-                        arg = query_string.decode().split("=", 1)[1]
-                    elif loaded_http_input.body:
-                        arg = loaded_http_input.body.decode()
-                user_ref = JavaActorHandleProxy(
-                    replica.actor_handle
-                ).handle_request.remote(
-                    RequestMetadataProto(
-                        request_id=query.metadata.request_id,
-                        endpoint=query.metadata.endpoint,
-                        call_method=query.metadata.call_method
-                        if query.metadata.call_method != "__call__"
-                        else "call",
-                    ).SerializeToString(),
-                    [arg],
-                )
-                self.in_flight_queries[replica].add(user_ref)
-            else:
-                # Directly passing args because it might contain an ObjectRef.
-                tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
-                    pickle.dumps(query.metadata), *query.args, **query.kwargs
+        If the query prefers local routing, the replica selection policy is
+        applied to each locality group in turn, so a remote replica is only
+        chosen when all closer replicas are at capacity.
+        """
+        if query.metadata.prefer_local_routing:
+            candidate_groups = self.locality_groups
+        else:
+            candidate_groups = [self.in_flight_queries]
+
+        for candidates in candidate_groups:
+            for replica in self.replica_selection_policy.select_replicas(candidates):
+                if (
+                    len(self.in_flight_queries[replica])
+                    >= replica.max_concurrent_queries
+                ):
+                    # This replica is overloaded, try next one
+                    continue
+
+                logger.debug(
+                    f"Assigned query {query.metadata.request_id} "
+                    f"to replica {replica.replica_tag}."
                 )
-                self.in_flight_queries[replica].add(tracker_ref)
-            return user_ref
+                return self._send_query(replica, query)
         return None
 
-    @property
-    def _all_query_refs(self):
-        return list(itertools.chain.from_iterable(self.in_flight_queries.values()))
-
-    def _drain_completed_object_refs(self) -> int:
-        refs = self._all_query_refs
-        # NOTE(simon): even though the timeout is 0, a large number of refs can still
-        # cause some blocking delay in the event loop. Consider moving this to async?
-        done, _ = ray.wait(refs, num_returns=len(refs), timeout=0)
-        replicas_to_remove = []
-        for replica_info, replica_in_flight_queries in self.in_flight_queries.items():
-            completed_queries = replica_in_flight_queries.intersection(done)
-            if len(completed_queries):
-                try:
-                    # NOTE(simon): this ray.get call should be cheap because all these
-                    # refs are ready as indicated by previous `ray.wait` call.
-                    ray.get(list(completed_queries))
-                except RayActorError:
-                    logger.debug(
-                        f"Removing {replica_info.replica_tag} from replica set "
-                        "because the actor exited."
-                    )
-                    replicas_to_remove.append(replica_info)
-                except RayTaskError:
-                    # Ignore application error.
-                    pass
-                except Exception:
-                    logger.exception(
-                        "Handle received unexpected error when processing request."
-                    )
-
-                replica_in_flight_queries.difference_update(completed_queries)
-
-        if len(replicas_to_remove) > 0:
-            for replica_info in replicas_to_remove:
-                self.in_flight_queries.pop(replica_info, None)
+    def _send_query(self, replica: RunningReplicaInfo, query: Query) -> ray.ObjectRef:
+        """Submit the query to the replica and track it until it completes."""
+        query.metadata.assigned_time_s = time.time()
+        if replica.is_cross_language:
+            # Handling requests for Java replica
+            arg = query.args[0]
+            if query.metadata.http_arg_is_pickled:
+                assert isinstance(arg, bytes)
+                loaded_http_input = pickle.loads(arg)
+                query_string = loaded_http_input.scope.get("query_string")
+                if query_string:
+                    arg = query_string.decode().split("=", 1)[1]
+                elif loaded_http_input.body:
+                    arg = loaded_http_input.body.decode()
+            user_ref = JavaActorHandleProxy(replica.actor_handle).handle_request.remote(
+                RequestMetadataProto(
+                    request_id=query.metadata.request_id,
+                    endpoint=query.metadata.endpoint,
+                    call_method=query.metadata.call_method
+                    if query.metadata.call_method != "__call__"
+                    else "call",
+                ).SerializeToString(),
+                [arg],
+            )
+            self._track_query(replica, user_ref)
+        else:
+            # Directly passing args because it might contain an ObjectRef.
+            tracker_ref, user_ref = replica.actor_handle.handle_request.remote(
+                pickle.dumps(query.metadata), *query.args, **query.kwargs
+            )
+            self._track_query(replica, tracker_ref)
+        return user_ref
+
+    def _track_query(self, replica: RunningReplicaInfo, ref: ray.ObjectRef):
+        """Record a query in flight on the replica until its ref completes.
+
+        The completion is delivered as a done callback on the event loop, so
+        the replica set never has to scan or `ray.wait` on all in flight refs.
+        """
+        self.in_flight_queries[replica].add(ref)
+        future = asyncio.wrap_future(ref.future())
+        future.add_done_callback(
+            functools.partial(self._on_query_completed, replica, ref, time.time())
+        )
+
+    def _on_query_completed(
+        self,
+        replica: RunningReplicaInfo,
+        ref: ray.ObjectRef,
+        start_time_s: float,
+        future: asyncio.Future,
+    ):
+        replica_in_flight_queries = self.in_flight_queries.get(replica)
+        if replica_in_flight_queries is None or ref not in replica_in_flight_queries:
+            # The replica has been removed in the meantime.
+            return
+        replica_in_flight_queries.discard(ref)
+
+        error = None if future.cancelled() else future.exception()
+        if error is None:
+            self.replica_selection_policy.on_query_completed(
+                replica, time.time() - start_time_s
+            )
+        elif isinstance(error, RayActorError):
+            logger.debug(
+                f"Removing {replica.replica_tag} from replica set "
+                "because the actor exited."
+            )
+            self.in_flight_queries.pop(replica, None)
             self._reset_replica_iterator()
+        elif not isinstance(error, RayTaskError):
+            # RayTaskError is an application error and is ignored here.
+            logger.error(
+                "Handle received unexpected error when processing request.",
+                exc_info=error,
+            )
 
-        return len(done)
+        # A slot is now free on this replica, wake up the queued queries.
+        self.replica_available_event.set()
 
     async def assign_replica(self, query: Query) -> ray.ObjectRef:
         """Given a query, submit it to a replica and return the object ref.
@@ -227,6 +295,7 @@ class ReplicaSet:
         and only send a query to available replicas (determined by the
         max_concurrent_quries value.)
         """
+        assignment_start_time_s = time.time()
         self.num_queued_queries += 1
         self.num_queued_queries_gauge.set(
             self.num_queued_queries, tags={"route": query.metadata.route}
@@ -237,19 +306,12 @@ class ReplicaSet:
             logger.debug(
                 "Failed to assign a replica for " f"query {query.metadata.request_id}"
             )
-            # Maybe there exists a free replica, we just need to refresh our
-            # query tracker.
-            num_finished = self._drain_completed_object_refs()
             # All replicas are really busy, wait for a query to complete or the
-            # config to be updated.
-            if num_finished == 0:
-                logger.debug("All replicas are busy, waiting for a free replica.")
-                await asyncio.wait(
-                    self._all_query_refs + [self.config_updated_event.wait()],
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                if self.config_updated_event.is_set():
-                    self.config_updated_event.clear()
+            # config to be updated. All waiting queries are woken up at once and
+            # retry, so it's safe to clear the event once we are woken up.
+            logger.debug("All replicas are busy, waiting for a free replica.")
+            await self.replica_available_event.wait()
+            self.replica_available_event.clear()
             # We are pretty sure a free replica is ready now, let's recurse and
             # assign this query a replica.
             assigned_ref = self._try_assign_replica(query)
@@ -257,6 +319,14 @@ class ReplicaSet:
         self.num_queued_queries_gauge.set(
             self.num_queued_queries, tags={"route": query.metadata.route}
         )
+        self.request_latency_recorder.record(
+            ASSIGNMENT,
+            assignment_start_time_s,
+            query.metadata.assigned_time_s,
+            deployment=self.deployment_name,
+            route=query.metadata.route,
+            request_id=query.metadata.request_id,
+        )
         return assigned_ref
 
 
@@ -273,7 +343,12 @@ class Router:
             controller_handle: The controller handle.
         """
         self._event_loop = event_loop
-        self._replica_set = ReplicaSet(deployment_name, event_loop)
+        self._replica_set = ReplicaSet(
+            deployment_name,
+            event_loop,
+            node_id=ray.get_runtime_context().get_node_id(),
+            availability_zone=get_current_node_availability_zone(),
+        )
 
         # -- Metrics Registration -- #
         self.num_router_requests = metrics.Counter(
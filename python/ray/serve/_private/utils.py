@@ -9,7 +9,7 @@ import time
 import traceback
 from enum import Enum
 from functools import wraps
-from typing import Dict, Iterable, List, Tuple, TypeVar, Union
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 import fastapi.encoders
 import numpy as np
@@ -21,7 +21,11 @@ import ray
 import ray.util.serialization_addons
 from ray.actor import ActorHandle
 from ray.exceptions import RayTaskError
-from ray.serve._private.constants import HTTP_PROXY_TIMEOUT, RAY_GCS_RPC_TIMEOUT_S
+from ray.serve._private.constants import (
+    HTTP_PROXY_TIMEOUT,
+    RAY_GCS_RPC_TIMEOUT_S,
+    SERVE_AVAILABILITY_ZONE_ENV_VAR,
+)
 from ray.serve._private.http_util import HTTPRequestWrapper, build_starlette_request
 from ray.util.serialization import StandaloneSerializationContext
 from ray._raylet import MessagePackSerializer
@@ -171,6 +175,11 @@ def get_all_node_ids(gcs_client) -> List[Tuple[str, str]]:
     return node_ids
 
 
+def get_current_node_availability_zone() -> Optional[str]:
+    """Get the availability zone of the current node, None if it isn't set."""
+    return os.environ.get(SERVE_AVAILABILITY_ZONE_ENV_VAR)
+
+
 def compute_iterable_delta(old: Iterable, new: Iterable) -> Tuple[set, set, set]:
     """Given two iterables, return the entries that's (added, removed, updated).
 
@@ -273,6 +273,7 @@ def deployment(
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
     health_check_period_s: Default[float] = DEFAULT.VALUE,
     health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+    num_standby_replicas: Default[int] = DEFAULT.VALUE,
     is_driver_deployment: Optional[bool] = DEFAULT.VALUE,
 ) -> Callable[[Callable], Deployment]:
     pass
@@ -295,6 +296,7 @@ def deployment(
     graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
     health_check_period_s: Default[float] = DEFAULT.VALUE,
     health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+    num_standby_replicas: Default[int] = DEFAULT.VALUE,
     is_driver_deployment: Optional[bool] = DEFAULT.VALUE,
 ) -> Callable[[Callable], Deployment]:
     """Define a Serve deployment.
@@ -338,6 +340,11 @@ def deployment(
         max_concurrent_queries (Default[int]): The maximum number of queries
             that will be sent to a replica of this deployment without receiving
             a response. Defaults to 100.
+        num_standby_replicas (Default[int]): The number of fully initialized
+            replicas to keep on standby. Standby replicas hold resources but
+            don't receive traffic until the deployment scales up, at which
+            point they're promoted without paying the replica startup time.
+            Defaults to 0.
         is_driver_deployment (Optional[bool]): [Experiment] when set it as True, serve
             will deploy exact one deployment to every node.
 
@@ -397,6 +404,7 @@ def deployment(
         graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
         health_check_period_s=health_check_period_s,
         health_check_timeout_s=health_check_timeout_s,
+        num_standby_replicas=num_standby_replicas,
     )
     config.user_configured_option_names = set(user_configured_option_names)
 
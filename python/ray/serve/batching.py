@@ -1,9 +1,19 @@
 import asyncio
 from functools import wraps
-from inspect import iscoroutinefunction
+from inspect import isasyncgenfunction, iscoroutinefunction
 import time
-from typing import Any, Callable, Dict, List, Optional, overload, Tuple, TypeVar
-from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    overload,
+    Tuple,
+    TypeVar,
+)
+from dataclasses import dataclass, field
 
 
 from ray._private.signature import extract_signature, flatten_args, recover_args
@@ -17,6 +27,7 @@ class _SingleRequest:
     self_arg: Optional[Any]
     flattened_args: List[Any]
     future: asyncio.Future
+    enqueue_time_s: float = field(default_factory=time.time)
 
 
 def _batch_args_kwargs(
@@ -44,12 +55,93 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchSizer:
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_timeout_s: float,
+        target_latency_s: float,
+        smoothing_factor: float = 0.2,
+    ) -> None:
+        """Tunes the batch size and wait timeout from observed batches.
+
+        The batch size follows an additive increase, multiplicative decrease
+        scheme: it grows by one after each full batch that met the latency
+        target and is halved after each batch that missed it. The wait
+        timeout is the time expected to fill the current batch size at the
+        observed arrival rate, capped by the latency budget left after the
+        handler runs. If not even one more request is expected to arrive
+        within that budget, batches are run without waiting.
+
+        Arguments:
+            max_batch_size: upper bound for the batch size.
+            max_timeout_s: upper bound for the wait timeout.
+            target_latency_s: target latency from the time a request is
+                enqueued to the time its batch has been handled.
+            smoothing_factor: weight of the latest observation in the
+                moving averages of the handler latency and arrival rate.
+        """
+        self.max_batch_size = max_batch_size
+        self.max_timeout_s = max_timeout_s
+        self.target_latency_s = target_latency_s
+        self.smoothing_factor = smoothing_factor
+
+        self.batch_size = 1
+        self.handler_latency_s: Optional[float] = None
+        self.arrival_interval_s: Optional[float] = None
+        self._last_arrival_time_s: Optional[float] = None
+
+    def _smooth(self, prev: Optional[float], value: float) -> float:
+        if prev is None:
+            return value
+        return self.smoothing_factor * value + (1 - self.smoothing_factor) * prev
+
+    def record_arrival(self, arrival_time_s: float) -> None:
+        if self._last_arrival_time_s is not None:
+            self.arrival_interval_s = self._smooth(
+                self.arrival_interval_s,
+                max(0, arrival_time_s - self._last_arrival_time_s),
+            )
+        self._last_arrival_time_s = arrival_time_s
+
+    def record_batch(
+        self, batch_size: int, handler_latency_s: float, max_latency_s: float
+    ) -> None:
+        """Record a handled batch.
+
+        Arguments:
+            batch_size: number of requests in the batch.
+            handler_latency_s: time spent in the batch handler.
+            max_latency_s: latency of the oldest request in the batch,
+                including the time it waited in the queue.
+        """
+        self.handler_latency_s = self._smooth(self.handler_latency_s, handler_latency_s)
+        if max_latency_s > self.target_latency_s:
+            self.batch_size = max(1, self.batch_size // 2)
+        elif batch_size >= self.batch_size:
+            self.batch_size = min(self.max_batch_size, self.batch_size + 1)
+
+    @property
+    def timeout_s(self) -> float:
+        if self.arrival_interval_s is None or self.batch_size == 1:
+            return 0
+
+        wait_budget_s = self.target_latency_s - (self.handler_latency_s or 0)
+        if self.arrival_interval_s >= wait_budget_s:
+            # Light traffic, waiting would only add latency.
+            return 0
+
+        fill_time_s = (self.batch_size - 1) * self.arrival_interval_s
+        return min(fill_time_s, wait_budget_s, self.max_timeout_s)
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        target_latency_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -57,6 +149,10 @@ class _BatchQueue:
         max_batch_size elements are available or the timeout has passed since
         the previous get.
 
+        If target_latency_s is passed in, the batch size and timeout are
+        instead tuned online from the observed handler latency and arrival
+        rate, with max_batch_size and timeout_s as upper bounds.
+
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
@@ -66,36 +162,58 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            target_latency_s(Optional[float]): enables adaptive batching
+                targeting this latency for each request.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.full_batch_event = asyncio.Event()
         self.max_batch_size = max_batch_size
         self.timeout_s = timeout_s
 
+        self._adaptive_batch_sizer = None
+        if target_latency_s is not None:
+            self._adaptive_batch_sizer = _AdaptiveBatchSizer(
+                max_batch_size, timeout_s, target_latency_s
+            )
+
         self._handle_batch_task = None
         if handle_batch_func is not None:
             self._handle_batch_task = get_or_create_event_loop().create_task(
                 self._handle_batches(handle_batch_func)
             )
 
-    def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+    def _get_batch_size(self) -> int:
+        if self._adaptive_batch_sizer is not None:
+            return self._adaptive_batch_sizer.batch_size
+        return self.max_batch_size
+
+    def _get_timeout_s(self) -> float:
+        if self._adaptive_batch_sizer is not None:
+            return self._adaptive_batch_sizer.timeout_s
+        return self.timeout_s
+
+    def put(self, request: _SingleRequest) -> None:
+        if self._adaptive_batch_sizer is not None:
+            self._adaptive_batch_sizer.record_arrival(request.enqueue_time_s)
         self.queue.put_nowait(request)
         # Signal when the full batch is ready. The event will be reset
         # in wait_for_batch.
-        if self.queue.qsize() == self.max_batch_size:
+        if self.queue.qsize() >= self._get_batch_size():
             self.full_batch_event.set()
 
     async def wait_for_batch(self) -> List[Any]:
-        """Wait for batch respecting self.max_batch_size and self.timeout_s.
+        """Wait for batch respecting the batch size and timeout.
 
-        Returns a batch of up to self.max_batch_size items, waiting for up
-        to self.timeout_s for a full batch. After the timeout, returns as many
-        items as are ready.
+        Returns a batch of up to self.max_batch_size items (or the adaptive
+        batch size), waiting for up to self.timeout_s (or the adaptive
+        timeout) for a full batch. After the timeout, returns as many items
+        as are ready.
 
         Always returns a batch with at least one item - will block
         indefinitely until an item comes in.
         """
-        curr_timeout = self.timeout_s
+        max_batch_size = self._get_batch_size()
+        curr_timeout = self._get_timeout_s()
         batch = []
         while len(batch) == 0:
             loop_start = time.time()
@@ -113,15 +231,12 @@ class _BatchQueue:
                     pass
 
             # Pull up to the max_batch_size requests off the queue.
-            while len(batch) < self.max_batch_size and not self.queue.empty():
+            while len(batch) < max_batch_size and not self.queue.empty():
                 batch.append(self.queue.get_nowait())
 
             # Reset the event if there are fewer than max_batch_size requests
             # in the queue.
-            if (
-                self.queue.qsize() < self.max_batch_size
-                and self.full_batch_event.is_set()
-            ):
+            if self.queue.qsize() < max_batch_size and self.full_batch_event.is_set():
                 self.full_batch_event.clear()
 
             # Adjust the timeout based on the time spent in this iteration.
@@ -129,7 +244,34 @@ class _BatchQueue:
 
         return batch
 
+    async def _consume_batch_generator(
+        self, generator: AsyncGenerator, futures: List[asyncio.Future]
+    ) -> None:
+        """Resolve each future as soon as the generator yields its result.
+
+        The generator yields `(index, result)` tuples where `index` is the
+        position of the request in the batch.
+        """
+        resolved = set()
+        async for index, result in generator:
+            if not 0 <= index < len(futures) or index in resolved:
+                raise RayServeException(
+                    "Batched generator yielded an invalid index. Expected a "
+                    f"unique index in [0, {len(futures)}) but got {index}."
+                )
+            resolved.add(index)
+            if not futures[index].done():
+                futures[index].set_result(result)
+
+        if len(resolved) != len(futures):
+            raise RayServeException(
+                "Batched generator doesn't preserve batch size. The input "
+                f"list has length {len(futures)} but the generator only "
+                f"yielded {len(resolved)} results."
+            )
+
     async def _handle_batches(self, func):
+        is_generator = isasyncgenfunction(func)
         while True:
             batch: List[_SingleRequest] = await self.wait_for_batch()
             assert len(batch) > 0
@@ -138,25 +280,43 @@ class _BatchQueue:
             futures = [item.future for item in batch]
 
             try:
+                handler_start_time_s = time.time()
                 # Method call.
                 if self_arg is not None:
-                    results = await func(self_arg, *args, **kwargs)
+                    results = func(self_arg, *args, **kwargs)
                 # Normal function call.
                 else:
-                    results = await func(*args, **kwargs)
+                    results = func(*args, **kwargs)
 
-                if len(results) != len(batch):
-                    raise RayServeException(
-                        "Batched function doesn't preserve batch size. "
-                        f"The input list has length {len(batch)} but the "
-                        f"returned list has length {len(results)}."
+                if is_generator:
+                    await self._consume_batch_generator(results, futures)
+                else:
+                    results = await results
+
+                if self._adaptive_batch_sizer is not None:
+                    now = time.time()
+                    oldest_enqueue_time_s = min(item.enqueue_time_s for item in batch)
+                    self._adaptive_batch_sizer.record_batch(
+                        len(batch),
+                        handler_latency_s=now - handler_start_time_s,
+                        max_latency_s=now - oldest_enqueue_time_s,
                     )
 
-                for i, result in enumerate(results):
-                    futures[i].set_result(result)
+                if not is_generator:
+                    if len(results) != len(batch):
+                        raise RayServeException(
+                            "Batched function doesn't preserve batch size. "
+                            f"The input list has length {len(batch)} but the "
+                            f"returned list has length {len(results)}."
+                        )
+
+                    for i, result in enumerate(results):
+                        futures[i].set_result(result)
             except Exception as e:
                 for future in futures:
-                    future.set_exception(e)
+                    # Generators may already have resolved some of the futures.
+                    if not future.done():
+                        future.set_exception(e)
 
     def __del__(self):
         if (
@@ -210,19 +370,29 @@ def batch(func: F) -> G:
 # "Decorator factory" use case (called with arguments).
 @overload
 def batch(
-    max_batch_size: Optional[int] = 10, batch_wait_timeout_s: Optional[float] = 0.0
+    max_batch_size: Optional[int] = 10,
+    batch_wait_timeout_s: Optional[float] = 0.0,
+    target_latency_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
 
 @PublicAPI(stability="beta")
-def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
+def batch(
+    _func=None, max_batch_size=10, batch_wait_timeout_s=0.0, target_latency_s=None
+):
     """Converts a function to asynchronously handle batches.
 
     The function can be a standalone function or a class method. In both
     cases, the function must be `async def` and take a list of objects as
     its sole argument and return a list of the same length as a result.
 
+    The function can also be an async generator that yields an
+    `(index, result)` tuple for each element of the input list, where
+    `index` is the position of the element in the list. Each caller then
+    gets its result as soon as it is yielded instead of waiting for the
+    whole batch to finish.
+
     When invoked, the caller passes a single object. These will be batched
     and executed asynchronously once there is a batch of `max_batch_size`
     or `batch_wait_timeout_s` has elapsed, whichever occurs first.
@@ -235,12 +405,22 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
         >>> async def handle_single(s: str): # doctest: +SKIP
         ...     # Returns s.lower().
         ...     return await handle_batch(s) # doctest: +SKIP
+        >>> @serve.batch(max_batch_size=50) # doctest: +SKIP
+        ... async def handle_batch_streaming(batch: List[str]): # doctest: +SKIP
+        ...     for i, s in enumerate(batch): # doctest: +SKIP
+        ...         yield i, await slow_lower(s) # doctest: +SKIP
 
     Arguments:
         max_batch_size: the maximum batch size that will be executed in
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the underlying function.
+        target_latency_s: if set, enables adaptive batching. The batch size
+            and wait timeout are tuned online from the observed handler
+            latency and request arrival rate so that requests complete within
+            this latency when possible, with `max_batch_size` and
+            `batch_wait_timeout_s` as upper bounds. Batches grow under heavy
+            load and requests are not delayed when traffic is light.
     """
     # `_func` will be None in the case when the decorator is parametrized.
     # See the comment at the end of this function for a detailed explanation.
@@ -250,7 +430,7 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
                 "@serve.batch can only be used to decorate functions or methods."
             )
 
-        if not iscoroutinefunction(_func):
+        if not (iscoroutinefunction(_func) or isasyncgenfunction(_func)):
             raise TypeError("Functions decorated with @serve.batch must be 'async def'")
 
     if not isinstance(max_batch_size, int):
@@ -268,6 +448,13 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
     if batch_wait_timeout_s < 0:
         raise ValueError("batch_wait_timeout_s must be a float >= 0")
 
+    if target_latency_s is not None:
+        if not isinstance(target_latency_s, (float, int)):
+            raise TypeError("target_latency_s must be a float > 0")
+
+        if target_latency_s <= 0:
+            raise ValueError("target_latency_s must be a float > 0")
+
     def _batch_decorator(_func):
         @wraps(_func)
         async def batch_wrapper(*args, **kwargs):
@@ -290,7 +477,12 @@ def batch(_func=None, max_batch_size=10, batch_wait_timeout_s=0.0):
             # runs, we just get a reference to the attribute.
             batch_queue_attr = f"__serve_batch_queue_{_func.__name__}"
             if not hasattr(batch_queue_object, batch_queue_attr):
-                batch_queue = _BatchQueue(max_batch_size, batch_wait_timeout_s, _func)
+                batch_queue = _BatchQueue(
+                    max_batch_size,
+                    batch_wait_timeout_s,
+                    _func,
+                    target_latency_s=target_latency_s,
+                )
                 setattr(batch_queue_object, batch_queue_attr, batch_queue)
             else:
                 batch_queue = getattr(batch_queue_object, batch_queue_attr)
@@ -0,0 +1,89 @@
+# Microbenchmark for the longest prefix route matching done by the HTTP proxy
+# on every request. It compares the path segment trie used by
+# LongestPrefixRouter (with and without its LRU cache of recent paths) against
+# the linear scan over the routes sorted by decreasing length that it replaced.
+#
+# No Ray cluster is needed, the router is used with a mocked handle getter.
+#
+# Sample usage:
+# python route_matching.py --num-routes 500 --num-queries 100000
+
+import random
+import time
+from typing import List, Optional
+
+import click
+
+from ray.serve._private.common import EndpointInfo
+from ray.serve._private.http_proxy import LongestPrefixRouter
+
+
+def linear_scan_match(sorted_routes: List[str], target_route: str) -> Optional[str]:
+    for route in sorted_routes:
+        if target_route.startswith(route):
+            if (
+                route.endswith("/")
+                or len(target_route) == len(route)
+                or target_route[len(route)] == "/"
+            ):
+                return route
+    return None
+
+
+def generate_routes(num_routes: int) -> List[str]:
+    routes = {"/"}
+    while len(routes) < num_routes:
+        depth = random.randint(1, 3)
+        routes.add(
+            "/" + "/".join(f"app{random.randint(0, num_routes)}" for _ in range(depth))
+        )
+    return list(routes)
+
+
+def generate_queries(routes: List[str], num_queries: int, num_unique: int):
+    unique_paths = [
+        random.choice(routes).rstrip("/") + f"/item/{i}" for i in range(num_unique)
+    ]
+    return [random.choice(unique_paths) for _ in range(num_queries)]
+
+
+def timeit(name: str, fn, queries: List[str]):
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    duration_s = time.perf_counter() - start
+    print(
+        f"{name}: {len(queries) / duration_s:.0f} matches/s, "
+        f"{duration_s / len(queries) * 1e6:.2f} us/match"
+    )
+
+
+@click.command()
+@click.option("--num-routes", type=int, default=500)
+@click.option("--num-queries", type=int, default=100000)
+@click.option(
+    "--num-unique-paths",
+    type=int,
+    default=1000,
+    help="Number of distinct request paths, controls the cache hit rate.",
+)
+def main(num_routes: int, num_queries: int, num_unique_paths: int):
+    routes = generate_routes(num_routes)
+    queries = generate_queries(routes, num_queries, num_unique_paths)
+
+    router = LongestPrefixRouter(lambda endpoint: endpoint)
+    router.update_routes({route: EndpointInfo(route=route) for route in routes})
+    sorted_routes = sorted(routes, key=lambda x: len(x), reverse=True)
+
+    # Sanity check that all strategies agree.
+    for query in queries[:1000]:
+        assert router.match_route(query)[0] == linear_scan_match(sorted_routes, query)
+
+    print(f"{num_routes} routes, {num_unique_paths} unique paths:")
+    timeit("linear scan", lambda q: linear_scan_match(sorted_routes, q), queries)
+    timeit("trie", router._match_route_in_trie, queries)
+    timeit("trie + LRU cache", router.match_route, queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -68,6 +68,21 @@ class AutoscalingConfig(BaseModel):
     # How long to wait before scaling up replicas
     upscale_delay_s: NonNegativeFloat = 30.0
 
+    # The autoscaling policy to use: "basic" reacts to the current load,
+    # "predictive" also scales up ahead of a forecasted load increase.
+    policy: str = "basic"
+    # Time window of load history used to forecast the load.
+    forecast_window_s: PositiveFloat = 600.0
+
+    @validator("policy")
+    def policy_valid(cls, v):
+        if v not in ("basic", "predictive"):
+            raise ValueError(
+                f"Got invalid autoscaling policy '{v}', must be one of "
+                "'basic' or 'predictive'."
+            )
+        return v
+
     @validator("max_replicas", always=True)
     def replicas_settings_valid(cls, max_replicas, values):
         min_replicas = values.get("min_replicas")
@@ -137,6 +152,9 @@ class DeploymentConfig(BaseModel):
         health_check_timeout_s (Optional[float]):
             Timeout that the controller will wait for a response from the
             replica's health check before marking it unhealthy.
+        num_standby_replicas (Optional[int]): The number of fully initialized
+            replicas to keep out of the routing table and promote instantly
+            when the deployment scales up. Defaults to 0.
         user_configured_option_names (Set[str]):
             The names of options manually configured by the user.
     """
@@ -155,6 +173,8 @@ class DeploymentConfig(BaseModel):
     health_check_period_s: PositiveFloat = DEFAULT_HEALTH_CHECK_PERIOD_S
     health_check_timeout_s: PositiveFloat = DEFAULT_HEALTH_CHECK_TIMEOUT_S
 
+    num_standby_replicas: NonNegativeInt = 0
+
     autoscaling_config: Optional[AutoscalingConfig] = None
 
     # This flag is used to let replica know they are deplyed from
@@ -189,15 +189,24 @@ class ServeController:
             deployment_name
         ]._stop_one_running_replica_for_testing()
 
-    async def listen_for_change(self, keys_to_snapshot_ids: Dict[str, int]):
+    async def listen_for_change(
+        self,
+        keys_to_snapshot_ids: Dict[str, int],
+        keys_to_epochs: Optional[Dict[str, str]] = None,
+    ):
         """Proxy long pull client's listen request.
 
         Args:
             keys_to_snapshot_ids (Dict[str, int]): Snapshot IDs are used to
               determine whether or not the host should immediately return the
               data or wait for the value to be changed.
+            keys_to_epochs (Dict[str, str]): The host epochs of the client's
+              snapshots. Updates may be sent as deltas against the snapshots
+              with the host's current epoch.
         """
-        return await (self.long_poll_host.listen_for_change(keys_to_snapshot_ids))
+        return await (
+            self.long_poll_host.listen_for_change(keys_to_snapshot_ids, keys_to_epochs)
+        )
 
     async def listen_for_change_java(self, keys_to_snapshot_ids_bytes: bytes):
         """Proxy long pull client's listen request.
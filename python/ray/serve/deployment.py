@@ -334,6 +334,7 @@ class Deployment:
         graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
         health_check_period_s: Default[float] = DEFAULT.VALUE,
         health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+        num_standby_replicas: Default[int] = DEFAULT.VALUE,
         is_driver_deployment: bool = DEFAULT.VALUE,
         _internal: bool = False,
     ) -> "Deployment":
@@ -430,6 +431,9 @@ class Deployment:
         if health_check_timeout_s is not DEFAULT.VALUE:
             new_config.health_check_timeout_s = health_check_timeout_s
 
+        if num_standby_replicas is not DEFAULT.VALUE:
+            new_config.num_standby_replicas = num_standby_replicas
+
         if is_driver_deployment is DEFAULT.VALUE:
             is_driver_deployment = self._is_driver_deployment
 
@@ -466,6 +470,7 @@ class Deployment:
         graceful_shutdown_timeout_s: Default[float] = DEFAULT.VALUE,
         health_check_period_s: Default[float] = DEFAULT.VALUE,
         health_check_timeout_s: Default[float] = DEFAULT.VALUE,
+        num_standby_replicas: Default[int] = DEFAULT.VALUE,
         is_driver_deployment: bool = DEFAULT.VALUE,
         _internal: bool = False,
     ) -> None:
@@ -491,6 +496,7 @@ class Deployment:
             graceful_shutdown_timeout_s=graceful_shutdown_timeout_s,
             health_check_period_s=health_check_period_s,
             health_check_timeout_s=health_check_timeout_s,
+            num_standby_replicas=num_standby_replicas,
             _internal=_internal,
             is_driver_deployment=is_driver_deployment,
         )
@@ -557,6 +563,7 @@ def deployment_to_schema(
         "graceful_shutdown_timeout_s": d._config.graceful_shutdown_timeout_s,
         "health_check_period_s": d._config.health_check_period_s,
         "health_check_timeout_s": d._config.health_check_timeout_s,
+        "num_standby_replicas": d._config.num_standby_replicas,
         "ray_actor_options": ray_actor_options_schema,
         "is_driver_deployment": d._is_driver_deployment,
     }
@@ -607,6 +614,7 @@ def schema_to_deployment(s: DeploymentSchema) -> Deployment:
         graceful_shutdown_timeout_s=s.graceful_shutdown_timeout_s,
         health_check_period_s=s.health_check_period_s,
         health_check_timeout_s=s.health_check_timeout_s,
+        num_standby_replicas=s.num_standby_replicas,
     )
     config.user_configured_option_names = s.get_user_configured_option_names()
 
@@ -72,6 +72,9 @@ class HandleOptions:
     """Options for each ServeHandle instances. These fields are immutable."""
 
     method_name: str = "__call__"
+    # Prefer replicas on the caller's node, then in its availability zone,
+    # as long as they have spare capacity.
+    prefer_local_routing: bool = False
 
 
 @PublicAPI(stability="beta")
@@ -189,16 +192,26 @@ class RayServeHandle:
         self,
         *,
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
     ):
         """Set options for this handle.
 
         Args:
             method_name: The method to invoke.
+            prefer_local_routing: If True, requests are sent to replicas on
+                the caller's node when they have spare capacity, then to
+                replicas in the same availability zone (read from the
+                RAY_SERVE_AVAILABILITY_ZONE environment variable), and only
+                then to other replicas. This avoids shipping large arguments
+                across nodes in deployment graphs.
         """
         new_options_dict = self.handle_options.__dict__.copy()
         user_modified_options_dict = {
             key: value
-            for key, value in zip(["method_name"], [method_name])
+            for key, value in zip(
+                ["method_name", "prefer_local_routing"],
+                [method_name, prefer_local_routing],
+            )
             if value != DEFAULT.VALUE
         }
         new_options_dict.update(user_modified_options_dict)
@@ -220,6 +233,7 @@ class RayServeHandle:
             call_method=handle_options.method_name,
             http_arg_is_pickled=self._pickled_http_request,
             route=_request_context.route,
+            prefer_local_routing=handle_options.prefer_local_routing,
         )
         self.request_counter.inc(tags={"route": _request_context.route})
         coro = self.router.assign_request(request_metadata, *args, **kwargs)
@@ -334,17 +348,28 @@ class RayServeDeploymentHandle:
         # requirement of serve.start; Thus handle is fulfilled at runtime.
         self.handle: RayServeHandle = None
 
-    def options(self, *, method_name: str):
-        return self.__class__(
-            self.deployment_name, HandleOptions(method_name=method_name)
-        )
+    def options(
+        self,
+        *,
+        method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
+        prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
+    ):
+        new_options_dict = self.handle_options.__dict__.copy()
+        if method_name != DEFAULT.VALUE:
+            new_options_dict["method_name"] = method_name
+        if prefer_local_routing != DEFAULT.VALUE:
+            new_options_dict["prefer_local_routing"] = prefer_local_routing
+        return self.__class__(self.deployment_name, HandleOptions(**new_options_dict))
 
     def remote(self, *args, _ray_cache_refs: bool = False, **kwargs) -> asyncio.Task:
         if not self.handle:
             handle = serve._private.api.get_deployment(
                 self.deployment_name
             )._get_handle(sync=FLAG_SERVE_DEPLOYMENT_HANDLE_IS_SYNC)
-            self.handle = handle.options(method_name=self.handle_options.method_name)
+            self.handle = handle.options(
+                method_name=self.handle_options.method_name,
+                prefer_local_routing=self.handle_options.prefer_local_routing,
+            )
         return self.handle.remote(*args, **kwargs)
 
     @classmethod
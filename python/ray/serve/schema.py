@@ -226,6 +226,15 @@ class DeploymentSchema(
         ),
         gt=0,
     )
+    num_standby_replicas: int = Field(
+        default=DEFAULT.VALUE,
+        description=(
+            "The number of fully initialized replicas kept out of the "
+            "routing table and promoted instantly when the deployment "
+            "scales up. Uses a default if null."
+        ),
+        ge=0,
+    )
     ray_actor_options: RayActorOptionsSchema = Field(
         default=DEFAULT.VALUE, description="Options set for each replica actor."
     )
@@ -281,6 +290,7 @@ def _deployment_info_to_schema(name: str, info: DeploymentInfo) -> DeploymentSch
         graceful_shutdown_timeout_s=info.deployment_config.graceful_shutdown_timeout_s,
         health_check_period_s=info.deployment_config.health_check_period_s,
         health_check_timeout_s=info.deployment_config.health_check_timeout_s,
+        num_standby_replicas=info.deployment_config.num_standby_replicas,
         ray_actor_options=info.replica_config.ray_actor_options,
         is_driver_deployment=info.is_driver_deployment,
     )
@@ -12,7 +12,9 @@ import requests
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve._private.autoscaling_policy import (
     BasicAutoscalingPolicy,
+    PredictiveAutoscalingPolicy,
     calculate_desired_num_replicas,
+    create_autoscaling_policy,
 )
 from ray.serve._private.common import DeploymentInfo
 from ray.serve._private.common import ReplicaState
@@ -457,6 +459,83 @@ def test_replicas_delayed_startup():
     assert new_num_replicas == 123
 
 
+def test_create_autoscaling_policy():
+    policy = create_autoscaling_policy(AutoscalingConfig())
+    assert type(policy) is BasicAutoscalingPolicy
+
+    policy = create_autoscaling_policy(AutoscalingConfig(policy="predictive"))
+    assert isinstance(policy, PredictiveAutoscalingPolicy)
+
+    with pytest.raises(ValueError):
+        AutoscalingConfig(policy="unknown")
+
+
+def test_predictive_policy_forecast():
+    """Unit test for the load history and forecast of the predictive policy."""
+    config = AutoscalingConfig(
+        policy="predictive", metrics_interval_s=10, forecast_window_s=100
+    )
+    policy = PredictiveAutoscalingPolicy(config)
+
+    policy.record_load(0, 10)
+    policy.record_load(10, 20)
+    # Not enough samples to fit a trend.
+    assert policy.forecast_load(10) is None
+
+    # Samples closer than metrics_interval_s are ignored.
+    policy.record_load(15, 1000)
+    policy.record_load(20, 30)
+    assert policy.forecast_load(10) == pytest.approx(40)
+
+    # Samples older than forecast_window_s are dropped.
+    for t in range(30, 210, 10):
+        policy.record_load(t, 30)
+    assert policy.load_history[0][0] == 100
+    assert policy.forecast_load(10) == pytest.approx(30)
+
+    # A decreasing trend never forecasts a negative load.
+    for t in range(210, 260, 10):
+        policy.record_load(t, 0)
+    assert policy.forecast_load(1000) == 0
+
+    # The horizon accounts for the measured replica startup time.
+    config = AutoscalingConfig(policy="predictive", upscale_delay_s=30)
+    policy = PredictiveAutoscalingPolicy(config)
+    assert policy.get_forecast_horizon_s() == 30
+    policy.record_replica_startup_time(20)
+    policy.record_replica_startup_time(40)
+    assert policy.get_forecast_horizon_s() == 60
+
+
+def test_predictive_policy_scales_ahead():
+    """Unit test for scaling up ahead of a load increase."""
+    config = AutoscalingConfig(
+        policy="predictive",
+        min_replicas=1,
+        max_replicas=100,
+        target_num_ongoing_requests_per_replica=1,
+        metrics_interval_s=10,
+        upscale_delay_s=0,
+        downscale_delay_s=100000,
+    )
+    policy = PredictiveAutoscalingPolicy(config)
+    policy.record_replica_startup_time(50)
+
+    with mock.patch("ray.serve._private.autoscaling_policy.time") as mock_time:
+        # The load increases by 2 requests every 10 seconds.
+        decisions = []
+        for i in range(4):
+            mock_time.time.return_value = i * 10
+            load = 20 + 2 * i
+            decisions.append(policy.get_decision_num_replicas(20, [load / 20] * 20, 0))
+
+    # Without enough history the policy behaves like the basic policy. Once a
+    # trend is detected, it scales for the load expected in 50 seconds.
+    assert decisions[:2] == [20, 22]
+    assert decisions[2] == 34
+    assert decisions[3] == 36
+
+
 @pytest.mark.parametrize("delay_s", [30.0, 0.0])
 def test_fluctuating_ongoing_requests(delay_s):
     """
@@ -5,6 +5,8 @@ import pytest
 import ray
 from ray import serve
 from ray._private.utils import get_or_create_event_loop
+from ray.serve.batching import _AdaptiveBatchSizer
+from ray.serve.exceptions import RayServeException
 
 
 def test_batching(serve_instance):
@@ -132,6 +134,25 @@ async def test_decorator_validation():
             async def method(self, requests):
                 pass
 
+    class TargetLatency:
+        @serve.batch(target_latency_s=0.1)
+        async def method(self, requests):
+            pass
+
+    with pytest.raises(ValueError):
+
+        class ZeroTargetLatency:
+            @serve.batch(target_latency_s=0)
+            async def method(self, requests):
+                pass
+
+    with pytest.raises(TypeError):
+
+        class NonTargetLatency:
+            @serve.batch(target_latency_s="a")
+            async def method(self, requests):
+                pass
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("use_class", [True, False])
@@ -291,6 +312,153 @@ async def test_batch_args_kwargs(mode, use_class):
     assert result == [("hi1", "hi2"), ("hi3", "hi4")]
 
 
+def test_adaptive_batch_sizer():
+    sizer = _AdaptiveBatchSizer(
+        max_batch_size=4, max_timeout_s=0.5, target_latency_s=1.0
+    )
+    # Nothing observed yet, run batches of one without waiting.
+    assert sizer.batch_size == 1
+    assert sizer.timeout_s == 0
+
+    # Full batches that meet the target grow the batch size up to the max.
+    for _ in range(5):
+        sizer.record_batch(sizer.batch_size, handler_latency_s=0.1, max_latency_s=0.2)
+    assert sizer.batch_size == 4
+
+    # Partial batches don't grow the batch size.
+    sizer.batch_size = 2
+    sizer.record_batch(1, handler_latency_s=0.1, max_latency_s=0.2)
+    assert sizer.batch_size == 2
+
+    # Missing the target halves the batch size.
+    sizer.batch_size = 4
+    sizer.record_batch(4, handler_latency_s=1.5, max_latency_s=2.0)
+    assert sizer.batch_size == 2
+    sizer.record_batch(2, handler_latency_s=1.5, max_latency_s=2.0)
+    sizer.record_batch(1, handler_latency_s=1.5, max_latency_s=2.0)
+    assert sizer.batch_size == 1
+
+
+def test_adaptive_batch_sizer_timeout():
+    sizer = _AdaptiveBatchSizer(
+        max_batch_size=10, max_timeout_s=0.5, target_latency_s=1.0
+    )
+    sizer.batch_size = 5
+    # A full batch within the latency target grows the batch size to 6.
+    sizer.record_batch(5, handler_latency_s=0.2, max_latency_s=0.3)
+
+    # Heavy traffic: wait for the time expected to fill the batch.
+    for i in range(10):
+        sizer.record_arrival(i * 0.01)
+    assert sizer.timeout_s == pytest.approx(0.05)
+
+    # The timeout is capped by the configured max.
+    sizer.batch_size = 10
+    sizer.arrival_interval_s = 0.1
+    assert sizer.timeout_s == 0.5
+
+    # Light traffic: no request is expected within the latency budget.
+    sizer.arrival_interval_s = 0.9
+    assert sizer.timeout_s == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_adaptive_batching(use_class):
+    batch_sizes = []
+
+    @serve.batch(max_batch_size=8, batch_wait_timeout_s=0.1, target_latency_s=10)
+    async def adaptive(requests):
+        batch_sizes.append(len(requests))
+        await asyncio.sleep(0.01)
+        return requests
+
+    class Adaptive:
+        @serve.batch(max_batch_size=8, batch_wait_timeout_s=0.1, target_latency_s=10)
+        async def adaptive(self, requests):
+            batch_sizes.append(len(requests))
+            await asyncio.sleep(0.01)
+            return requests
+
+    cls = Adaptive()
+
+    async def call(arg):
+        if use_class:
+            return await cls.adaptive(arg)
+        else:
+            return await adaptive(arg)
+
+    # A single request isn't delayed.
+    assert await call("hi") == "hi"
+    assert batch_sizes == [1]
+
+    # Under sustained load the batch size grows up to the max.
+    for _ in range(10):
+        tasks = [get_or_create_event_loop().create_task(call(i)) for i in range(16)]
+        assert await asyncio.gather(*tasks) == list(range(16))
+    assert max(batch_sizes) == 8
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_class", [True, False])
+async def test_batch_generator(use_class):
+    finish_batch = asyncio.Event()
+
+    @serve.batch(max_batch_size=2, batch_wait_timeout_s=1000)
+    async def streaming(requests):
+        for i, request in enumerate(requests):
+            if request == "raise":
+                1 / 0
+            yield i, request
+            await finish_batch.wait()
+
+    class Streaming:
+        @serve.batch(max_batch_size=2, batch_wait_timeout_s=1000)
+        async def streaming(self, requests):
+            for i, request in enumerate(requests):
+                if request == "raise":
+                    1 / 0
+                yield i, request
+                await finish_batch.wait()
+
+    cls = Streaming()
+
+    async def call(arg):
+        if use_class:
+            return await cls.streaming(arg)
+        else:
+            return await streaming(arg)
+
+    # The first result is returned before the batch finishes.
+    t1 = get_or_create_event_loop().create_task(call("hi1"))
+    t2 = get_or_create_event_loop().create_task(call("hi2"))
+    assert await t1 == "hi1"
+    await asyncio.sleep(0.1)
+    assert not t2.done()
+    finish_batch.set()
+    assert await t2 == "hi2"
+
+    # Only the results that haven't been yielded yet get the exception.
+    t1 = get_or_create_event_loop().create_task(call("hi1"))
+    t2 = get_or_create_event_loop().create_task(call("raise"))
+    assert await t1 == "hi1"
+    with pytest.raises(ZeroDivisionError):
+        await t2
+
+
+@pytest.mark.asyncio
+async def test_batch_generator_missing_results():
+    @serve.batch(max_batch_size=2, batch_wait_timeout_s=1000)
+    async def missing(requests):
+        yield 0, requests[0]
+
+    t1 = get_or_create_event_loop().create_task(missing("hi1"))
+    t2 = get_or_create_event_loop().create_task(missing("hi2"))
+    assert await t1 == "hi1"
+    with pytest.raises(RayServeException, match="preserve batch size"):
+        await t2
+
+
 if __name__ == "__main__":
     import sys
 
@@ -101,6 +101,10 @@ class MockReplicaActorWrapper:
             return "node-id"
         return None
 
+    @property
+    def availability_zone(self) -> Optional[str]:
+        return None
+
     def set_ready(self):
         self.ready = ReplicaStartupStatus.SUCCEEDED
 
@@ -1627,6 +1631,210 @@ def test_new_version_and_scale_up(mock_deployment_state):
     assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
 
 
+@pytest.mark.parametrize("mock_deployment_state", [False], indirect=True)
+def test_standby_replicas(mock_deployment_state):
+    deployment_state, timer = mock_deployment_state
+
+    b_info_1, b_version_1 = deployment_info(
+        num_replicas=1, num_standby_replicas=2, version="1"
+    )
+    updating = deployment_state.deploy(b_info_1)
+    assert updating
+
+    # Standby replicas aren't started until the deployment is HEALTHY.
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.STARTING, 1)])
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.RUNNING, 1)])
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 2)],
+    )
+
+    # Uninitialized standby replicas can't be promoted, so scaling up starts
+    # a new replica.
+    b_info_2, _ = deployment_info(num_replicas=2, num_standby_replicas=2, version="1")
+    deployment_state.deploy(b_info_2)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=4,
+        by_state=[
+            (ReplicaState.RUNNING, 1),
+            (ReplicaState.STARTING, 1),
+            (ReplicaState.STANDBY, 2),
+        ],
+    )
+    for replica in deployment_state._replicas.get():
+        replica._actor.set_ready()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=4,
+        by_state=[(ReplicaState.RUNNING, 2), (ReplicaState.STANDBY, 2)],
+    )
+    assert all(
+        replica.is_initialized
+        for replica in deployment_state._replicas.get([ReplicaState.STANDBY])
+    )
+
+    # Initialized standby replicas are promoted instantly on scale-up and the
+    # running replicas are broadcast right away.
+    deployment_state._long_poll_host.notify_changed.reset_mock()
+    b_info_3, _ = deployment_info(num_replicas=4, num_standby_replicas=2, version="1")
+    deployment_state.deploy(b_info_3)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=4,
+        by_state=[(ReplicaState.RUNNING, 4), (ReplicaState.STANDBY, 0)],
+    )
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+    assert deployment_state._long_poll_host.notify_changed.called
+
+    # The pool is then replenished.
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=6,
+        by_state=[(ReplicaState.RUNNING, 4), (ReplicaState.STANDBY, 2)],
+    )
+
+    # Standby replicas of an outdated version are stopped and replaced once
+    # the rollout finishes.
+    b_info_4, b_version_4 = deployment_info(
+        num_replicas=4, num_standby_replicas=2, version="2"
+    )
+    deployment_state.deploy(b_info_4)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        version=b_version_1,
+        by_state=[(ReplicaState.STANDBY, 0)],
+    )
+
+    # Deleting the deployment stops the standby replicas as well.
+    deployment_state.delete()
+    deployment_state.update()
+    check_counts(deployment_state, by_state=[(ReplicaState.STANDBY, 0)])
+    for replica in deployment_state._replicas.get():
+        replica._actor.set_done_stopping()
+    deleted = deployment_state.update()
+    assert deleted
+    check_counts(deployment_state, total=0)
+
+
+@pytest.mark.parametrize("mock_deployment_state", [False], indirect=True)
+def test_standby_replica_failure(mock_deployment_state):
+    deployment_state, timer = mock_deployment_state
+
+    b_info_1, _ = deployment_info(num_replicas=1, num_standby_replicas=1)
+    deployment_state.deploy(b_info_1)
+    deployment_state.update()
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state.update()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+
+    # A standby replica that fails to start is stopped and only replaced
+    # after the backoff.
+    standby = deployment_state._replicas.get([ReplicaState.STANDBY])[0]
+    standby._actor.set_failed_to_start()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STOPPING, 1)],
+    )
+    standby._actor.set_done_stopping()
+    deployment_state.update()
+    check_counts(deployment_state, total=1, by_state=[(ReplicaState.RUNNING, 1)])
+
+    timer.advance(1.1)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+
+    # An initialized standby replica that fails its health check is stopped.
+    standby = deployment_state._replicas.get([ReplicaState.STANDBY])[0]
+    standby._actor.set_ready()
+    deployment_state.update()
+    assert standby.is_initialized
+    standby._actor.set_unhealthy()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STOPPING, 1)],
+    )
+    # The failed replica doesn't affect the deployment status.
+    assert deployment_state.curr_status_info.status == DeploymentStatus.HEALTHY
+
+
+@pytest.mark.parametrize("mock_deployment_state", [False], indirect=True)
+def test_stopping_standby_replicas_dont_block_scale_up(mock_deployment_state):
+    deployment_state, timer = mock_deployment_state
+
+    b_info_1, _ = deployment_info(num_replicas=1, num_standby_replicas=2, version="1")
+    deployment_state.deploy(b_info_1)
+    deployment_state.update()
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state.update()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 2)],
+    )
+
+    # Shrink the pool, the standby replicas take a while to stop.
+    b_info_2, _ = deployment_info(num_replicas=1, num_standby_replicas=0, version="1")
+    deployment_state.deploy(b_info_2)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STOPPING, 2)],
+    )
+
+    # The stopping standby replicas never served traffic, so they don't delay
+    # starting new replicas.
+    b_info_3, _ = deployment_info(num_replicas=3, num_standby_replicas=0, version="1")
+    deployment_state.deploy(b_info_3)
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=5,
+        by_state=[
+            (ReplicaState.RUNNING, 1),
+            (ReplicaState.STARTING, 2),
+            (ReplicaState.STOPPING, 2),
+        ],
+    )
+
+    for replica in deployment_state._replicas.get([ReplicaState.STOPPING]):
+        replica._actor.set_done_stopping()
+    deployment_state.update()
+    check_counts(
+        deployment_state,
+        total=3,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STARTING, 2)],
+    )
+    assert len(deployment_state._stopping_standby_replica_tags) == 0
+
+
 @pytest.mark.parametrize("mock_deployment_state", [True, False], indirect=True)
 @patch.object(DriverDeploymentState, "_get_all_node_ids")
 def test_health_check(mock_get_all_node_ids, mock_deployment_state):
@@ -2198,6 +2406,72 @@ def test_resume_deployment_state_from_replica_tags(
     assert deployment_state._replicas.get()[0].replica_tag == mocked_replica.replica_tag
 
 
+def test_resume_standby_replicas_from_replica_tags(mock_deployment_state_manager):
+    deployment_state_manager, deployment_state, timer = mock_deployment_state_manager
+
+    tag = "test"
+
+    b_info_1, b_version_1 = deployment_info(
+        version="1", num_replicas=1, num_standby_replicas=1
+    )
+    deployment_state.deploy(b_info_1)
+    deployment_state_manager._deployment_states[tag] = deployment_state
+
+    deployment_state_manager.update()
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state_manager.update()
+    deployment_state_manager.update()
+    deployment_state._replicas.get([ReplicaState.STANDBY])[0]._actor.set_ready()
+    deployment_state_manager.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        version=b_version_1,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    running_tag = deployment_state._replicas.get([ReplicaState.RUNNING])[0].replica_tag
+    standby_tag = deployment_state._replicas.get([ReplicaState.STANDBY])[0].replica_tag
+
+    # Restart the controller with both replicas still alive.
+    deployment_state._replicas = ReplicaStateContainer()
+    deployment_state_manager._recover_from_checkpoint(
+        [ReplicaName.prefix + running_tag, ReplicaName.prefix + standby_tag]
+    )
+
+    # The standby replica is recovered as standby, so it isn't routed to.
+    deployment_state = deployment_state_manager._deployment_states[tag]
+    check_counts(
+        deployment_state,
+        total=2,
+        version=None,
+        by_state=[(ReplicaState.RECOVERING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    assert (
+        deployment_state._replicas.get([ReplicaState.STANDBY])[0].replica_tag
+        == standby_tag
+    )
+    for replica in deployment_state._replicas.get():
+        replica._actor.set_ready()
+        replica._actor.set_starting_version(b_version_1)
+
+    deployment_state_manager.update()
+    deployment_state_manager.update()
+    check_counts(
+        deployment_state,
+        total=2,
+        version=b_version_1,
+        by_state=[(ReplicaState.RUNNING, 1), (ReplicaState.STANDBY, 1)],
+    )
+    assert [
+        replica.replica_tag
+        for replica in deployment_state._replicas.get([ReplicaState.RUNNING])
+    ] == [running_tag]
+    assert [
+        replica.replica_tag
+        for replica in deployment_state._replicas.get([ReplicaState.STANDBY])
+    ] == [standby_tag]
+
+
 def test_stopping_replicas_ranking():
     @dataclass
     class MockReplica:
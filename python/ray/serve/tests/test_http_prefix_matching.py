@@ -97,6 +97,22 @@ def test_update_routes(mock_longest_prefix_router):
     assert route == "/endpoint2" and handle == "endpoint2"
 
 
+def test_match_cache_is_bounded(mock_longest_prefix_router):
+    router = mock_longest_prefix_router
+    router.MATCH_CACHE_SIZE = 2
+    router.update_routes({"endpoint": EndpointInfo(route="/endpoint")})
+
+    for path in ["/endpoint/1", "/endpoint/2", "/endpoint/3", "/other"]:
+        router.match_route(path)
+    assert list(router._match_cache.keys()) == ["/endpoint/3", "/other"]
+
+    # Cached results are still correct.
+    route, handle = router.match_route("/endpoint/3")
+    assert route == "/endpoint" and handle == "endpoint"
+    route, handle = router.match_route("/other")
+    assert route is None and handle is None
+
+
 if __name__ == "__main__":
     import sys
 
@@ -12,8 +12,12 @@ from ray.serve._private.common import EndpointTag, EndpointInfo, RunningReplicaI
 from ray.serve._private.long_poll import (
     LongPollClient,
     LongPollHost,
+    SnapshotDelta,
     UpdatedObject,
     LongPollNamespace,
+    _compute_delta,
+    _merge_deltas,
+    _to_delta_base,
 )
 from ray.serve.generated.serve_pb2 import (
     LongPollRequest,
@@ -225,5 +229,105 @@ def test_listen_for_change_java(serve_instance):
     assert replica_name_list.names == ["SERVE_REPLICA::0", "SERVE_REPLICA::1"]
 
 
+def test_snapshot_delta():
+    old, new = [1, 2, 3], [2, 3, 4]
+    delta = _compute_delta(_to_delta_base(old), _to_delta_base(new))
+    assert delta == SnapshotDelta(is_list=True, added=[4], removed=[1])
+    assert sorted(delta.apply(old)) == new
+
+    old, new = {"a": 1, "b": 2}, {"b": 3, "c": 4}
+    delta = _compute_delta(_to_delta_base(old), _to_delta_base(new))
+    assert delta == SnapshotDelta(is_list=False, added={"b": 3, "c": 4}, removed=["a"])
+    assert delta.apply(old) == new
+
+    # Only lists of unique hashable items and dicts can be delta encoded.
+    assert _to_delta_base([[1], [2]]) is None
+    assert _to_delta_base([1, 1]) is None
+    assert _to_delta_base(999) is None
+    assert _compute_delta(_to_delta_base([1]), _to_delta_base({1: 1})) is None
+
+    # Merged deltas are equivalent to applying them in order.
+    snapshots = [[1, 2], [2, 3], [1, 3, 4], [4]]
+    bases = [_to_delta_base(snapshot) for snapshot in snapshots]
+    deltas = [_compute_delta(bases[i], bases[i + 1]) for i in range(3)]
+    assert sorted(_merge_deltas(deltas).apply(snapshots[0])) == snapshots[-1]
+
+
+def test_host_delta_updates(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+
+    ray.get(host.notify_changed.remote("key", list(range(10))))
+    result = ray.get(host.listen_for_change.remote({"key": -1}, keys_to_epochs={}))
+    assert result["key"].delta is None
+    assert result["key"].object_snapshot == list(range(10))
+    snapshot_id = result["key"].snapshot_id
+    epoch = result["key"].epoch
+
+    # Clients with a snapshot of this host only receive the changes.
+    ray.get(host.notify_changed.remote("key", list(range(1, 11))))
+    ray.get(host.notify_changed.remote("key", list(range(2, 12))))
+    result = ray.get(
+        host.listen_for_change.remote(
+            {"key": snapshot_id}, keys_to_epochs={"key": epoch}
+        )
+    )
+    assert result["key"].object_snapshot is None
+    assert result["key"].snapshot_id == snapshot_id + 2
+    assert sorted(result["key"].delta.added) == [10, 11]
+    assert sorted(result["key"].delta.removed) == [0, 1]
+
+    # Other clients still receive the full snapshot.
+    result = ray.get(host.listen_for_change.remote({"key": snapshot_id}))
+    assert result["key"].delta is None
+    assert result["key"].object_snapshot == list(range(2, 12))
+
+    # Snapshots of another host, e.g. before the controller restarted, may
+    # have the same snapshot id, so they also receive the full snapshot.
+    other_host = ray.remote(LongPollHost).remote()
+    ray.get(other_host.notify_changed.remote("key", list(range(10))))
+    other_epoch = ray.get(other_host.listen_for_change.remote({"key": -1}))["key"].epoch
+    assert other_epoch != epoch
+    result = ray.get(
+        host.listen_for_change.remote(
+            {"key": snapshot_id}, keys_to_epochs={"key": other_epoch}
+        )
+    )
+    assert result["key"].delta is None
+    assert result["key"].object_snapshot == list(range(2, 12))
+
+    # Deltas that aren't smaller than the snapshot are sent in full.
+    ray.get(host.notify_changed.remote("key", [100]))
+    result = ray.get(
+        host.listen_for_change.remote(
+            {"key": snapshot_id + 2}, keys_to_epochs={"key": epoch}
+        )
+    )
+    assert result["key"].delta is None
+    assert result["key"].object_snapshot == [100]
+
+
+@pytest.mark.asyncio
+async def test_client_delta_updates(serve_instance):
+    host = ray.remote(LongPollHost).remote()
+    ray.get(host.notify_changed.remote("key", {"a": 1, "b": 2, "c": 3}))
+
+    callback_results = []
+    client = LongPollClient(
+        host,
+        {"key": callback_results.append},
+        call_in_event_loop=get_or_create_event_loop(),
+    )
+
+    while len(callback_results) == 0:
+        await asyncio.sleep(0.1)
+    assert client.snapshot_epochs["key"] is not None
+
+    ray.get(host.notify_changed.remote("key", {"a": 1, "b": 20, "c": 3}))
+    while len(callback_results) == 1:
+        await asyncio.sleep(0.1)
+
+    assert callback_results == [{"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 20, "c": 3}]
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -63,6 +63,7 @@ def test_serve_metrics_for_successful_connection(serve_start_shutdown):
             "serve_deployment_processing_latency_ms_count",
             "serve_deployment_processing_latency_ms_sum",
             "serve_deployment_processing_latency_ms",
+            "serve_request_stage_latency_ms",
             # gauge
             "serve_replica_processing_queries",
             "serve_deployment_replica_healthy",
@@ -218,6 +219,37 @@ def test_http_metrics_fields(serve_start_shutdown):
     print("serve_num_deployment_http_error_requests working as expected.")
 
 
+def test_request_stage_latency_metrics(serve_start_shutdown):
+    """Tests that every stage of an HTTP request is recorded."""
+
+    @serve.deployment(route_prefix="/stages")
+    def f(*args):
+        return "hello"
+
+    serve.run(f.bind())
+
+    url = "http://127.0.0.1:8000/stages"
+    for _ in range(10):
+        assert requests.get(url).text == "hello"
+
+    def all_stages_recorded() -> bool:
+        stage_latencies = get_metric_dictionaries(
+            "serve_request_stage_latency_ms_count"
+        )
+        return {metric["stage"] for metric in stage_latencies} == {
+            "proxy_receive",
+            "assignment",
+            "replica_queue",
+            "handler",
+            "response_send",
+        }
+
+    wait_for_condition(all_stages_recorded, retry_interval_ms=1000, timeout=20)
+    stage_latencies = get_metric_dictionaries("serve_request_stage_latency_ms_count")
+    assert {metric["deployment"] for metric in stage_latencies} == {"f"}
+    assert {metric["route"] for metric in stage_latencies} == {"/stages"}
+
+
 class TestRequestContextMetrics:
     def _generate_metrics_summary(self, metrics):
         """Generate "route" information from metrics.
@@ -0,0 +1,78 @@
+import json
+import os
+import sys
+
+import pytest
+
+from ray.serve._private.request_latency import (
+    HANDLER,
+    REPLICA_QUEUE,
+    RequestLatencyRecorder,
+    get_request_trace_path,
+    is_request_sampled,
+)
+
+
+def test_is_request_sampled():
+    request_ids = [f"request-{i}" for i in range(1000)]
+
+    assert not any(is_request_sampled(request_id, 0) for request_id in request_ids)
+    assert all(is_request_sampled(request_id, 1) for request_id in request_ids)
+    # Requests without an ID can't be joined across components.
+    assert not is_request_sampled("", 1)
+
+    # The decision only depends on the request ID and the rate, so every
+    # component samples the same requests.
+    sampled = [r for r in request_ids if is_request_sampled(r, 0.1)]
+    assert sampled == [r for r in request_ids if is_request_sampled(r, 0.1)]
+    assert 50 < len(sampled) < 150
+    # Requests sampled at a lower rate are also sampled at a higher rate.
+    assert set(r for r in request_ids if is_request_sampled(r, 0.05)) <= set(sampled)
+
+
+def read_spans(trace_dir):
+    with open(get_request_trace_path(str(trace_dir))) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_recorder_writes_sampled_spans(tmp_path):
+    recorder = RequestLatencyRecorder("replica", sample_rate=1, trace_dir=str(tmp_path))
+    recorder.record(
+        REPLICA_QUEUE, 10.0, 10.5, deployment="f", route="/f", request_id="abc"
+    )
+    recorder.record(HANDLER, 10.5, 12.0, deployment="f", route="/f", request_id="abc")
+    # Not sampled because it doesn't have a request ID.
+    recorder.record(HANDLER, 20.0, 21.0, deployment="f")
+
+    assert read_spans(tmp_path) == [
+        {
+            "request_id": "abc",
+            "stage": REPLICA_QUEUE,
+            "component": "replica",
+            "deployment": "f",
+            "route": "/f",
+            "start_time_s": 10.0,
+            "end_time_s": 10.5,
+            "latency_ms": 500.0,
+        },
+        {
+            "request_id": "abc",
+            "stage": HANDLER,
+            "component": "replica",
+            "deployment": "f",
+            "route": "/f",
+            "start_time_s": 10.5,
+            "end_time_s": 12.0,
+            "latency_ms": 1500.0,
+        },
+    ]
+
+
+def test_recorder_without_sampling(tmp_path):
+    recorder = RequestLatencyRecorder("router", sample_rate=0, trace_dir=str(tmp_path))
+    recorder.record(HANDLER, 1.0, 2.0, deployment="f", request_id="abc")
+    assert not os.path.exists(get_request_trace_path(str(tmp_path)))
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -10,8 +10,15 @@ import pytest
 import ray
 from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.common import RunningReplicaInfo
+from ray.serve._private.replica_selection_policy import (
+    LatencyEWMAPolicy,
+    LeastOutstandingRequestsPolicy,
+    PowerOfTwoChoicesPolicy,
+    RoundRobinPolicy,
+    create_replica_selection_policy,
+)
 from ray.serve._private.router import Query, ReplicaSet, RequestMetadata
-from ray._private.test_utils import SignalActor
+from ray._private.test_utils import SignalActor, async_wait_for_condition
 
 pytestmark = pytest.mark.asyncio
 
@@ -155,6 +162,152 @@ async def test_replica_set(ray_instance):
     }
     assert num_queries_set == {2, 1}
 
+    # Completed queries are removed from the tracker without any further
+    # assignment attempt.
+    await async_wait_for_condition(
+        lambda: all(len(queries) == 0 for queries in rs.in_flight_queries.values())
+    )
+
+
+async def test_replica_set_prefer_local_routing(ray_instance):
+    signal = SignalActor.remote()
+
+    @ray.remote(num_cpus=0)
+    class MockWorker:
+        @ray.method(num_returns=2)
+        async def handle_request(self, request):
+            await signal.wait.remote()
+            return b"", "DONE"
+
+    rs = ReplicaSet(
+        "my_deployment",
+        get_or_create_event_loop(),
+        node_id="node-a",
+        availability_zone="zone-1",
+    )
+    remote_replica, same_zone_replica, same_node_replica = [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=MockWorker.remote(),
+            max_concurrent_queries=1,
+            node_id=node_id,
+            availability_zone=availability_zone,
+        )
+        for i, (node_id, availability_zone) in enumerate(
+            [("node-b", "zone-2"), ("node-c", "zone-1"), ("node-a", "zone-1")]
+        )
+    ]
+    rs.update_running_replicas([remote_replica, same_zone_replica, same_node_replica])
+    assert rs.locality_groups == [
+        {same_node_replica: set()},
+        {same_zone_replica: set()},
+        {remote_replica: set()},
+    ]
+
+    # Closer replicas are filled up first.
+    query = Query(
+        [], {}, RequestMetadata("request-id", "endpoint", prefer_local_routing=True)
+    )
+    refs = []
+    for replica in [same_node_replica, same_zone_replica, remote_replica]:
+        refs.append(await rs.assign_replica(query))
+        assert len(rs.in_flight_queries[replica]) == 1
+
+    await signal.send.remote()
+    assert await asyncio.gather(*refs) == ["DONE"] * 3
+
+
+class FakeActorHandle:
+    def __init__(self, actor_id):
+        self._actor_id = actor_id
+
+
+def make_replicas(num_replicas, max_concurrent_queries=10):
+    return [
+        RunningReplicaInfo(
+            deployment_name="my_deployment",
+            replica_tag=str(i),
+            actor_handle=FakeActorHandle(i),
+            max_concurrent_queries=max_concurrent_queries,
+        )
+        for i in range(num_replicas)
+    ]
+
+
+def test_round_robin_policy():
+    replicas = make_replicas(3)
+    policy = RoundRobinPolicy()
+    policy.update_replicas(replicas)
+    in_flight = {replica: set() for replica in replicas}
+
+    first_pass = list(policy.select_replicas(in_flight))
+    assert set(first_pass) == set(replicas)
+    # The cycle continues where it left off.
+    assert list(policy.select_replicas(in_flight)) == first_pass
+    # Only the given candidates are yielded.
+    candidates = {replicas[0]: set()}
+    assert list(policy.select_replicas(candidates)) == [replicas[0]]
+
+
+def test_power_of_two_choices_policy():
+    replicas = make_replicas(2)
+    policy = PowerOfTwoChoicesPolicy()
+    in_flight = {replicas[0]: {1, 2, 3}, replicas[1]: {4}}
+    for _ in range(10):
+        assert list(policy.select_replicas(in_flight)) == [replicas[1], replicas[0]]
+
+    # All replicas are always proposed as a fallback.
+    replicas = make_replicas(5)
+    in_flight = {replica: set() for replica in replicas}
+    assert set(policy.select_replicas(in_flight)) == set(replicas)
+
+
+def test_least_outstanding_requests_policy():
+    replicas = make_replicas(3)
+    policy = LeastOutstandingRequestsPolicy()
+    in_flight = {replicas[0]: {1, 2}, replicas[1]: set(), replicas[2]: {3}}
+    assert list(policy.select_replicas(in_flight)) == [
+        replicas[1],
+        replicas[2],
+        replicas[0],
+    ]
+
+
+def test_latency_ewma_policy():
+    replicas = make_replicas(3)
+    policy = LatencyEWMAPolicy(alpha=0.5)
+    policy.update_replicas(replicas)
+    policy.on_query_completed(replicas[0], 1.0)
+    policy.on_query_completed(replicas[1], 0.1)
+    policy.on_query_completed(replicas[1], 0.3)
+    assert policy._latency_ewma_s["1"] == pytest.approx(0.2)
+
+    # The slow replica is tried last even though it is idle. The replica
+    # without observations uses the mean latency.
+    in_flight = {replicas[0]: set(), replicas[1]: {1}, replicas[2]: set()}
+    assert list(policy.select_replicas(in_flight)) == [
+        replicas[1],
+        replicas[2],
+        replicas[0],
+    ]
+
+    # Removed replicas are forgotten.
+    policy.update_replicas(replicas[1:])
+    assert "0" not in policy._latency_ewma_s
+
+    with pytest.raises(ValueError):
+        LatencyEWMAPolicy(alpha=0)
+
+
+def test_create_replica_selection_policy():
+    assert isinstance(
+        create_replica_selection_policy("power_of_two_choices"),
+        PowerOfTwoChoicesPolicy,
+    )
+    with pytest.raises(ValueError):
+        create_replica_selection_policy("random")
+
 
 if __name__ == "__main__":
     import sys
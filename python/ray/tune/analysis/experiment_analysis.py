@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from numbers import Number
 from pathlib import Path
 
+import numpy as np
+
 from ray.air._internal.remote_storage import (
     download_from_uri,
     is_directory,
@@ -15,10 +17,14 @@ from ray.air._internal.remote_storage import (
 )
 from ray.air._internal.uri_utils import _join_path_or_uri, URI
 from ray.air.checkpoint import Checkpoint
+from ray.tune.execution.experiment_state import (
+    _experiment_state_log_path,
+    _load_experiment_state,
+)
+from ray.tune.logger.parquet import _read_parquet_results
 from ray.tune.syncer import SyncConfig
 from ray.tune.utils import flatten_dict
-from ray.tune.utils.serialization import TuneFunctionDecoder
-from ray.tune.utils.util import is_nan_or_inf, is_nan
+from ray.tune.utils.util import is_nan
 from ray.util import log_once
 
 try:
@@ -31,6 +37,7 @@ except ImportError:
 from ray.tune.error import TuneError
 from ray.tune.result import (
     DEFAULT_METRIC,
+    EXPR_PARQUET_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
     EXPR_PARAM_FILE,
@@ -48,6 +55,13 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_FILE_TYPE = "csv"
 
+# Result file of each file type, under the trial directory.
+_RESULT_FILES = {
+    "csv": EXPR_PROGRESS_FILE,
+    "json": EXPR_RESULT_FILE,
+    "parquet": EXPR_PARQUET_FILE,
+}
+
 
 @PublicAPI(stability="beta")
 class ExperimentAnalysis:
@@ -69,6 +83,14 @@ class ExperimentAnalysis:
         default_mode: Default mode for comparing results. Has to be one
             of [min, max]. Can be overwritten with the ``mode`` parameter
             in the respective functions.
+        file_type: Read results from json, csv or parquet files. Has to be one
+            of [None, json, csv, parquet]. Defaults to csv. Parquet files are
+            written by the ``ParquetLoggerCallback``.
+        lazy: If True, the trial results are only loaded when they are first
+            accessed, instead of when this object is created. Methods that only
+            need a few metrics of a trial, like ``get_best_checkpoint()``,
+            then only load these metrics, which is much faster with the
+            parquet file type.
 
     Example:
         >>> from ray import tune
@@ -87,6 +109,8 @@ class ExperimentAnalysis:
         remote_storage_path: Optional[str] = None,
         # Deprecate: Raise in 2.6, remove in 2.7
         sync_config: Optional[SyncConfig] = None,
+        file_type: Optional[str] = None,
+        lazy: bool = False,
     ):
         self._local_experiment_path: str = None
         self._remote_experiment_path: Optional[str] = None
@@ -116,12 +140,14 @@ class ExperimentAnalysis:
 
         self._configs = {}
         self._trial_dataframes = {}
+        self._trial_dataframes_fetched = False
+        self._lazy = lazy
 
         self.default_metric = default_metric
         if default_mode and default_mode not in ["min", "max"]:
             raise ValueError("`default_mode` has to be None or one of [min, max]")
         self.default_mode = default_mode
-        self._file_type = self._validate_filetype(None)
+        self._file_type = self._validate_filetype(file_type)
 
         if self.default_metric is None and self.default_mode:
             # If only a mode was passed, use anonymous metric
@@ -144,6 +170,9 @@ class ExperimentAnalysis:
                 "pandas not installed. Run `pip install pandas` for "
                 "ExperimentAnalysis utilities."
             )
+        elif self._lazy:
+            # Only load the trials, their results are loaded when accessed.
+            self._get_trial_paths()
         else:
             self.fetch_trial_dataframes()
 
@@ -201,9 +230,8 @@ class ExperimentAnalysis:
     def _load_checkpoints_from_latest(self, latest_checkpoint: List[str]) -> None:
         # Collect all checkpoints and their directory paths.
         for path in latest_checkpoint:
-            with open(path) as f:
-                experiment_state = json.load(f, cls=TuneFunctionDecoder)
-                self._experiment_states.append(experiment_state)
+            experiment_state = _load_experiment_state(path)
+            self._experiment_states.append(experiment_state)
 
             if "checkpoints" not in experiment_state:
                 raise TuneError("Experiment state invalid; no checkpoints found.")
@@ -249,6 +277,16 @@ class ExperimentAnalysis:
         except FileNotFoundError:
             return None
 
+        # Also download the log of changes to the experiment checkpoint, if any.
+        remote_uri = URI(experiment_checkpoint_path)
+        remote_log_uri = remote_uri.parent / _experiment_state_log_path(remote_uri.name)
+        try:
+            download_from_uri(
+                str(remote_log_uri), _experiment_state_log_path(local_path)
+            )
+        except FileNotFoundError:
+            pass
+
         return local_path
 
     def _get_latest_checkpoint_from_dir(
@@ -500,6 +538,8 @@ class ExperimentAnalysis:
         Each dataframe is indexed by iterations and contains reported
         metrics.
         """
+        if not self._trial_dataframes_fetched and pd:
+            self.fetch_trial_dataframes()
         return self._trial_dataframes
 
     def dataframe(
@@ -563,7 +603,9 @@ class ExperimentAnalysis:
             chkpt_df = TrainableUtil.get_checkpoints_paths(trial_dir)
 
             # Join with trial dataframe to get metrics.
-            trial_df = self.trial_dataframes[trial_dir]
+            trial_df = self._get_trial_dataframe(
+                trial_dir, columns=[TRAINING_ITERATION, metric]
+            )
             path_metric_df = chkpt_df.merge(
                 trial_df, on="training_iteration", how="inner"
             )
@@ -746,32 +788,30 @@ class ExperimentAnalysis:
                     metric, scope
                 )
             )
-        best_trial = None
-        best_metric_score = None
-
-        for trial in self.trials:
-            if metric not in trial.metric_analysis:
-                continue
+        trials = [trial for trial in self.trials if metric in trial.metric_analysis]
+        if scope not in ["last", "avg", "last-5-avg", "last-10-avg"]:
+            scope = mode
+        metric_scores = np.array(
+            [trial.metric_analysis[metric][scope] for trial in trials], dtype=float
+        )
 
-            if scope in ["last", "avg", "last-5-avg", "last-10-avg"]:
-                metric_score = trial.metric_analysis[metric][scope]
+        # Compare all trials at once. NaN scores are never better than other
+        # scores.
+        if filter_nan_and_inf:
+            valid = np.isfinite(metric_scores)
+        else:
+            valid = ~np.isnan(metric_scores)
+        (valid_indices,) = np.nonzero(valid)
+        best_trial = None
+        if len(valid_indices):
+            valid_scores = metric_scores[valid_indices]
+            if mode == "max":
+                best_index = valid_indices[np.argmax(valid_scores)]
             else:
-                metric_score = trial.metric_analysis[metric][mode]
-
-            if filter_nan_and_inf and is_nan_or_inf(metric_score):
-                continue
-
-            if best_metric_score is None:
-                best_metric_score = metric_score
-                best_trial = trial
-                continue
-
-            if (mode == "max") and (best_metric_score < metric_score):
-                best_metric_score = metric_score
-                best_trial = trial
-            elif (mode == "min") and (best_metric_score > metric_score):
-                best_metric_score = metric_score
-                best_trial = trial
+                best_index = valid_indices[np.argmin(valid_scores)]
+            best_trial = trials[best_index]
+        elif trials and not filter_nan_and_inf:
+            best_trial = trials[0]
 
         if not best_trial:
             logger.warning(
@@ -875,28 +915,9 @@ class ExperimentAnalysis:
         """
         fail_count = 0
         failed_paths = []
-        force_dtype = {"trial_id": str}  # Never convert trial_id to float.
         for path in self._get_trial_paths():
             try:
-                if self._file_type == "json":
-                    json_file = os.path.join(path, EXPR_RESULT_FILE)
-                    if not os.path.exists(json_file) and self._remote_path:
-                        download_from_uri(
-                            self._convert_local_to_cloud_path(json_file), json_file
-                        )
-
-                    with open(json_file, "r") as f:
-                        json_list = [json.loads(line) for line in f if line]
-                    df = pd.json_normalize(json_list, sep="/")
-                elif self._file_type == "csv":
-                    csv_file = os.path.join(path, EXPR_PROGRESS_FILE)
-                    if not os.path.exists(csv_file) and self._remote_path:
-                        download_from_uri(
-                            self._convert_local_to_cloud_path(csv_file), csv_file
-                        )
-
-                    df = pd.read_csv(csv_file, dtype=force_dtype)
-                self.trial_dataframes[path] = df
+                self._trial_dataframes[path] = self._load_trial_dataframe(path)
             except Exception:
                 logger.debug(
                     f"Exception occurred when loading trial results. See traceback:\n"
@@ -904,6 +925,7 @@ class ExperimentAnalysis:
                 )
                 fail_count += 1
                 failed_paths.append(path)
+        self._trial_dataframes_fetched = True
 
         if fail_count:
             failed_paths_str = "\n".join([f"- {path}" for path in failed_paths])
@@ -912,7 +934,55 @@ class ExperimentAnalysis:
                 f"{failed_paths_str}"
             )
 
-        return self.trial_dataframes
+        return self._trial_dataframes
+
+    def _load_trial_dataframe(
+        self, path: str, columns: Optional[List[str]] = None
+    ) -> DataFrame:
+        """Loads the results of the trial in the `path` directory.
+
+        Args:
+            path: The trial directory.
+            columns: If set, only return these result columns. Only the parquet
+                file type avoids parsing the other columns.
+        """
+        result_file = os.path.join(path, _RESULT_FILES[self._file_type])
+        if not os.path.exists(result_file) and self._remote_path:
+            download_from_uri(
+                self._convert_local_to_cloud_path(result_file), result_file
+            )
+
+        if self._file_type == "parquet":
+            return _read_parquet_results(result_file, columns=columns)
+        elif self._file_type == "json":
+            with open(result_file, "r") as f:
+                json_list = [json.loads(line) for line in f if line]
+            df = pd.json_normalize(json_list, sep="/")
+        else:
+            # Never convert trial_id to float.
+            force_dtype = {"trial_id": str}
+            if columns is not None:
+                return pd.read_csv(
+                    result_file,
+                    dtype=force_dtype,
+                    usecols=lambda column: column in columns,
+                )
+            df = pd.read_csv(result_file, dtype=force_dtype)
+        if columns is not None:
+            df = df[[column for column in df.columns if column in columns]]
+        return df
+
+    def _get_trial_dataframe(
+        self, path: str, columns: Optional[List[str]] = None
+    ) -> DataFrame:
+        """Returns the results of the trial in the `path` directory.
+
+        If the results are loaded lazily and have not been loaded yet, only the
+        `columns` are loaded, and they are not cached.
+        """
+        if self._trial_dataframes_fetched or not self._lazy:
+            return self.trial_dataframes[path]
+        return self._load_trial_dataframe(path, columns=columns)
 
     def stats(self) -> Dict:
         """Returns a dictionary of the statistics of the experiment.
@@ -934,11 +1004,15 @@ class ExperimentAnalysis:
         """Overrides the existing file type.
 
         Args:
-            file_type: Read results from json or csv files. Has to be one
-                of [None, json, csv]. Defaults to csv.
+            file_type: Read results from json, csv or parquet files. Has to be
+                one of [None, json, csv, parquet]. Defaults to csv.
         """
         self._file_type = self._validate_filetype(file_type)
-        self.fetch_trial_dataframes()
+        if self._lazy:
+            self._trial_dataframes = {}
+            self._trial_dataframes_fetched = False
+        else:
+            self.fetch_trial_dataframes()
         return True
 
     def runner_data(self) -> Dict:
@@ -994,8 +1068,10 @@ class ExperimentAnalysis:
         return _trial_paths
 
     def _validate_filetype(self, file_type: Optional[str] = None):
-        if file_type not in {None, "json", "csv"}:
-            raise ValueError("`file_type` has to be None or one of [json, csv].")
+        if file_type not in {None, "json", "csv", "parquet"}:
+            raise ValueError(
+                "`file_type` has to be None or one of [json, csv, parquet]."
+            )
         return file_type or DEFAULT_FILE_TYPE
 
     def _validate_metric(self, metric: str) -> str:
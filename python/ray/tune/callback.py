@@ -225,6 +225,36 @@ class Callback(metaclass=_CallbackMeta):
         """
         pass
 
+    def on_trial_results_batch(
+        self,
+        iteration: int,
+        trials: List["Trial"],
+        results: List[Tuple["Trial", Dict]],
+        **info,
+    ):
+        """Called after receiving results from several trials at once.
+
+        This is only called when results are processed in batches, see the
+        ``TUNE_RESULT_BATCH_SIZE`` environment variable. By default,
+        ``on_trial_result`` is called for each result. Override this method
+        to handle all results of the batch at once, e.g. to write them
+        with a single request.
+
+        The search algorithm and scheduler are notified before this
+        hook is called.
+
+        Arguments:
+            iteration: Number of iterations of the tuning loop.
+            trials: List of trials.
+            results: List of (trial, result) tuples. Each trial is contained
+                at most once.
+            **info: Kwargs dict for forward compatibility.
+        """
+        for trial, result in results:
+            self.on_trial_result(
+                iteration=iteration, trials=trials, trial=trial, result=result, **info
+            )
+
     def on_trial_complete(
         self, iteration: int, trials: List["Trial"], trial: "Trial", **info
     ):
@@ -391,6 +421,10 @@ class CallbackList(Callback):
         for callback in self._callbacks:
             callback.on_trial_result(**info)
 
+    def on_trial_results_batch(self, **info):
+        for callback in self._callbacks:
+            callback.on_trial_results_batch(**info)
+
     def on_trial_complete(self, **info):
         for callback in self._callbacks:
             callback.on_trial_complete(**info)
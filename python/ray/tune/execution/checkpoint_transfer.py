@@ -0,0 +1,145 @@
+import os
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import ray
+from ray.air import Checkpoint
+from ray.air.util.node import _force_on_current_node
+
+if TYPE_CHECKING:
+    from ray.tune.experiment import Trial
+
+
+@ray.remote(num_cpus=0)
+class _CheckpointPacker:
+    """Packs checkpoint directories on the driver node into bytes."""
+
+    def pack(self, checkpoint_path: str) -> bytes:
+        return Checkpoint.from_directory(checkpoint_path).to_bytes()
+
+
+class _CheckpointTransferManager:
+    """Moves checkpoints between the driver and the trial actors.
+
+    Trials that restore from a checkpoint on the driver node used to
+    read the checkpoint into memory on the driver, one trial at a time.
+    Instead, a bounded pool of actors on the driver node packs the
+    checkpoints, and the trial actors fetch the packed checkpoints from
+    the object store directly. Trials that restore the same checkpoint at
+    the same time, e.g. when many PBT trials clone the same trial, share
+    one packed checkpoint.
+
+    This also keeps track of the time spent saving and restoring
+    checkpoints, see ``stats()``.
+
+    Args:
+        max_concurrent_transfers: Maximum number of checkpoints that are
+            packed at the same time. Defaults to the
+            ``TUNE_MAX_CONCURRENT_CHECKPOINT_TRANSFERS`` environment
+            variable, or 4.
+    """
+
+    SAVE = "save"
+    RESTORE = "restore"
+
+    def __init__(self, max_concurrent_transfers: Optional[int] = None):
+        self._max_concurrent_transfers = max_concurrent_transfers or int(
+            os.environ.get("TUNE_MAX_CONCURRENT_CHECKPOINT_TRANSFERS", "4")
+        )
+        self._packers: List[ray.actor.ActorHandle] = []
+        self._next_packer = 0
+
+        # checkpoint path -> (packed checkpoint, number of trials restoring it)
+        self._packed_checkpoints: Dict[str, Tuple[ray.ObjectRef, int]] = {}
+        # trial -> checkpoint path of the packed checkpoint the trial restores
+        self._trial_packed_checkpoints: Dict["Trial", str] = {}
+        # trial -> (transfer type, start time)
+        self._transfers: Dict["Trial", Tuple[str, float]] = {}
+
+        self._stats = defaultdict(int)
+
+    def get_packed_checkpoint(
+        self, trial: "Trial", checkpoint_path: str
+    ) -> ray.ObjectRef:
+        """Returns the packed checkpoint at ``checkpoint_path`` for ``trial``.
+
+        The checkpoint is only packed once while other trials are still
+        restoring from it. Call ``on_transfer_end()`` once the trial is
+        restored to release the packed checkpoint.
+        """
+        self._release_packed_checkpoint(trial)
+        if checkpoint_path in self._packed_checkpoints:
+            packed_checkpoint, num_trials = self._packed_checkpoints[checkpoint_path]
+            self._stats["num_deduplicated_restores"] += 1
+        else:
+            packed_checkpoint = self._get_packer().pack.remote(checkpoint_path)
+            num_trials = 0
+        self._packed_checkpoints[checkpoint_path] = (
+            packed_checkpoint,
+            num_trials + 1,
+        )
+        self._trial_packed_checkpoints[trial] = checkpoint_path
+        return packed_checkpoint
+
+    def on_transfer_start(self, trial: "Trial", transfer_type: str):
+        """Marks the start of a checkpoint save or restore of the trial."""
+        self._transfers[trial] = (transfer_type, time.monotonic())
+
+    def on_transfer_end(self, trial: "Trial", completed: bool = True):
+        """Marks the end of the checkpoint save or restore of the trial.
+
+        Args:
+            trial: The trial.
+            completed: If False, the transfer was aborted, e.g. because the
+                trial was stopped. Aborted transfers are not counted.
+        """
+        self._release_packed_checkpoint(trial)
+        if trial not in self._transfers:
+            return
+        transfer_type, start_time = self._transfers.pop(trial)
+        if completed:
+            self._stats[f"num_{transfer_type}s"] += 1
+            self._stats[f"{transfer_type}_time_s"] += time.monotonic() - start_time
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the number of and total time spent in checkpoint transfers."""
+        stats = {
+            "num_saves": 0,
+            "save_time_s": 0.0,
+            "num_restores": 0,
+            "restore_time_s": 0.0,
+            "num_deduplicated_restores": 0,
+        }
+        stats.update(self._stats)
+        return stats
+
+    def cleanup(self):
+        for packer in self._packers:
+            ray.kill(packer)
+        self._packers = []
+        self._packed_checkpoints = {}
+        self._trial_packed_checkpoints = {}
+
+    def _get_packer(self) -> ray.actor.ActorHandle:
+        # Each packer packs one checkpoint at a time, so at most
+        # `max_concurrent_transfers` checkpoints are packed at the same time.
+        if len(self._packers) < self._max_concurrent_transfers:
+            self._packers.append(_force_on_current_node(_CheckpointPacker).remote())
+            return self._packers[-1]
+        packer = self._packers[self._next_packer]
+        self._next_packer = (self._next_packer + 1) % len(self._packers)
+        return packer
+
+    def _release_packed_checkpoint(self, trial: "Trial"):
+        checkpoint_path = self._trial_packed_checkpoints.pop(trial, None)
+        if checkpoint_path is None:
+            return
+        packed_checkpoint, num_trials = self._packed_checkpoints[checkpoint_path]
+        if num_trials > 1:
+            self._packed_checkpoints[checkpoint_path] = (
+                packed_checkpoint,
+                num_trials - 1,
+            )
+        else:
+            del self._packed_checkpoints[checkpoint_path]
@@ -1,11 +1,13 @@
 from collections import Counter
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import click
+import json
 import logging
 import os
 import time
+import uuid
 import warnings
 
 from ray.air._internal.remote_storage import list_at_uri
@@ -15,6 +17,7 @@ from ray.tune import TuneError
 from ray.tune.experiment import Trial
 from ray.tune.impl.out_of_band_serialize_dataset import out_of_band_serialize_dataset
 from ray.tune.syncer import SyncConfig, get_node_to_storage_syncer
+from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 
 
 logger = logging.getLogger(__name__)
@@ -96,6 +99,175 @@ def _find_newest_experiment_checkpoint(experiment_dir: str) -> Optional[str]:
     return max(candidate_paths)
 
 
+# Suffix of the append-only log of changes written next to each experiment
+# checkpoint file (see ``_ExperimentStateWriter``).
+EXPERIMENT_STATE_LOG_SUFFIX = ".log"
+
+
+def _experiment_state_log_path(experiment_state_path: str) -> str:
+    """Returns the path of the log of changes to an experiment checkpoint file."""
+    return experiment_state_path + EXPERIMENT_STATE_LOG_SUFFIX
+
+
+def _load_experiment_state(experiment_state_path: str) -> Dict[str, Any]:
+    """Loads an experiment checkpoint file and replays its log of changes.
+
+    Returns the experiment state in the format of the checkpoint file, i.e. a dict
+    with the JSON states of all trials under ``"checkpoints"``, the trial runner
+    state under ``"runner_data"``, and the experiment stats under ``"stats"``.
+    """
+    with open(experiment_state_path, "r") as f:
+        experiment_state = json.load(f, cls=TuneFunctionDecoder)
+
+    log_path = _experiment_state_log_path(experiment_state_path)
+    log_id = experiment_state.get("log_id")
+    if log_id is None or not os.path.exists(log_path):
+        return experiment_state
+
+    trial_states = None
+    with open(log_path, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line, cls=TuneFunctionDecoder)
+            except json.JSONDecodeError:
+                # The last entry may have been written only partially.
+                logger.warning(
+                    f"Ignoring an invalid entry of the experiment state log "
+                    f"{log_path}."
+                )
+                break
+            if entry["log_id"] != log_id:
+                # The entry was written before the checkpoint file was compacted.
+                continue
+            if trial_states is None:
+                trial_states = {
+                    json.loads(trial_state)["trial_id"]: trial_state
+                    for trial_state in experiment_state["checkpoints"]
+                }
+            trial_states.update(entry["checkpoints"])
+            experiment_state["runner_data"] = entry["runner_data"]
+            experiment_state["stats"] = entry["stats"]
+
+    if trial_states is not None:
+        experiment_state["checkpoints"] = list(trial_states.values())
+    return experiment_state
+
+
+class _ExperimentStateWriter:
+    """Writes experiment checkpoint files incrementally.
+
+    The first checkpoint of an experiment writes the full experiment state to the
+    checkpoint file. Every following checkpoint only appends the states of the
+    trials that changed since the previous checkpoint (and the small trial runner
+    state) to a log next to it, so that the cost of a checkpoint is proportional
+    to the number of changed trials rather than the number of trials. Once the log
+    grows larger than ``compaction_factor`` times the checkpoint file, the full
+    state is written again and the log is discarded.
+
+    Use ``_load_experiment_state`` to read the experiment state back.
+
+    Args:
+        compaction_factor: Compact the log once it is larger than this many times
+            the size of the checkpoint file. If 0 or less, the full experiment
+            state is written on every checkpoint.
+    """
+
+    def __init__(self, compaction_factor: Optional[float] = None):
+        if compaction_factor is None:
+            compaction_factor = float(
+                os.environ.get("TUNE_EXPERIMENT_STATE_COMPACTION_FACTOR", "1")
+            )
+        self._compaction_factor = compaction_factor
+
+        self._experiment_state_path = None
+        self._log_id = None
+        self._state_size = 0
+        self._log_size = 0
+        # The trial states as of the last checkpoint.
+        self._trial_states: Dict[str, str] = {}
+
+    def write(
+        self,
+        experiment_state_path: str,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        """Writes the experiment state to ``experiment_state_path``.
+
+        Args:
+            experiment_state_path: Path of the experiment checkpoint file.
+            trial_states: Mapping of trial IDs to their JSON state.
+            runner_data: Trial runner state.
+            stats: Experiment stats.
+        """
+        if (
+            experiment_state_path != self._experiment_state_path
+            or not os.path.exists(experiment_state_path)
+            or self._compaction_factor <= 0
+            or self._log_size > self._compaction_factor * self._state_size
+        ):
+            self._write_state(experiment_state_path, trial_states, runner_data, stats)
+            return
+
+        changed_trial_states = {
+            trial_id: trial_state
+            for trial_id, trial_state in trial_states.items()
+            if self._trial_states.get(trial_id) != trial_state
+        }
+        entry = json.dumps(
+            {
+                "log_id": self._log_id,
+                "checkpoints": changed_trial_states,
+                "runner_data": runner_data,
+                "stats": stats,
+            },
+            cls=TuneFunctionEncoder,
+        )
+        with open(_experiment_state_log_path(experiment_state_path), "a") as f:
+            f.write(entry + "\n")
+        self._log_size += len(entry) + 1
+        self._trial_states.update(changed_trial_states)
+
+    def _write_state(
+        self,
+        experiment_state_path: str,
+        trial_states: Dict[str, str],
+        runner_data: Dict[str, Any],
+        stats: Dict[str, Any],
+    ):
+        # A new log ID invalidates the entries of the previous log, even if
+        # removing it below fails.
+        log_id = uuid.uuid4().hex
+        experiment_dir = os.path.dirname(experiment_state_path)
+        tmp_file_name = os.path.join(experiment_dir, ".tmp_experiment_state")
+
+        with open(tmp_file_name, "w") as f:
+            json.dump(
+                {
+                    "checkpoints": list(trial_states.values()),
+                    "runner_data": runner_data,
+                    "stats": stats,
+                    "log_id": log_id,
+                },
+                f,
+                indent=2,
+                cls=TuneFunctionEncoder,
+            )
+            self._state_size = f.tell()
+
+        os.replace(tmp_file_name, experiment_state_path)
+
+        log_path = _experiment_state_log_path(experiment_state_path)
+        if os.path.exists(log_path):
+            os.remove(log_path)
+
+        self._experiment_state_path = experiment_state_path
+        self._log_id = log_id
+        self._log_size = 0
+        self._trial_states = dict(trial_states)
+
+
 class _ExperimentCheckpointManager:
     """Helper class for managing experiment-level checkpoints.
 
@@ -7,11 +7,11 @@ import time
 import traceback
 from collections import deque
 from enum import Enum
-from typing import Callable, Dict, Iterable, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import ray
 from ray.actor import ActorHandle
-from ray.air import Checkpoint, AcquiredResources
+from ray.air import AcquiredResources
 from ray.air._internal.checkpoint_manager import CheckpointStorage, _TrackedCheckpoint
 from ray.air.constants import (
     COPY_DIRECTORY_CHECKPOINTS_INSTEAD_OF_MOVING_ENV,
@@ -29,6 +29,7 @@ from ray.tune.error import (
     _TuneStartTrialError,
 )
 from ray.tune.result import STDERR_FILE, STDOUT_FILE, TRIAL_INFO
+from ray.tune.execution.checkpoint_transfer import _CheckpointTransferManager
 from ray.tune.experiment.trial import (
     Trial,
     _Location,
@@ -238,6 +239,12 @@ class RayTrialExecutor:
             os.getenv("TUNE_RESULT_BUFFER_MAX_TIME_S", 100.0)
         )
 
+        # Maximum number of ready training results to process at once
+        self._result_batch_size = int(os.getenv("TUNE_RESULT_BATCH_SIZE", 1))
+
+        # Checkpoint transfers from the driver to trials
+        self._checkpoint_transfer = _CheckpointTransferManager()
+
         # Default kwargs to pass to trainable
         self._trainable_kwargs = {}
 
@@ -671,6 +678,7 @@ class RayTrialExecutor:
             out = self._find_future(trial)
             for result_id in out:
                 self._futures.pop(result_id)
+        self._checkpoint_transfer.on_transfer_end(trial, completed=False)
         trial.saving_to = None
         trial.restoring_from = None
         self._stop_trial(
@@ -948,6 +956,9 @@ class RayTrialExecutor:
                 )
                 trial.saving_to = checkpoint
                 self._futures[value] = (_ExecutorEventType.SAVING_RESULT, trial)
+                self._checkpoint_transfer.on_transfer_start(
+                    trial, _CheckpointTransferManager.SAVE
+                )
         return checkpoint
 
     def restore(self, trial: Trial) -> None:
@@ -1000,9 +1011,13 @@ class RayTrialExecutor:
             elif trial.sync_on_checkpoint:
                 # This provides FT backwards compatibility in the
                 # case where no cloud checkpoints are provided.
-                logger.debug("Trial %s: Reading checkpoint into memory", trial)
+                # The checkpoint is packed on this node without blocking, and
+                # shared by all trials that restore from it at the same time.
+                logger.debug("Trial %s: Packing checkpoint on the driver node", trial)
                 checkpoint_path = TrainableUtil.find_checkpoint_dir(checkpoint_dir)
-                obj = Checkpoint.from_directory(checkpoint_path).to_bytes()
+                obj = self._checkpoint_transfer.get_packed_checkpoint(
+                    trial, checkpoint_path
+                )
                 with _change_working_directory(trial):
                     remote = trial.runner.restore_from_object.remote(obj)
             else:
@@ -1013,6 +1028,9 @@ class RayTrialExecutor:
                 )
 
             self._futures[remote] = (_ExecutorEventType.RESTORING_RESULT, trial)
+            self._checkpoint_transfer.on_transfer_start(
+                trial, _CheckpointTransferManager.RESTORE
+            )
             trial.restoring_from = checkpoint
 
     def export_trial_if_needed(self, trial: Trial) -> Dict:
@@ -1032,8 +1050,13 @@ class RayTrialExecutor:
     def has_gpus(self) -> bool:
         return self._resource_updater.get_num_gpus() > 0
 
+    def get_checkpoint_transfer_stats(self) -> Dict[str, float]:
+        """Returns the number of and time spent in checkpoint saves and restores."""
+        return self._checkpoint_transfer.stats()
+
     def cleanup(self) -> None:
         self._cleanup_cached_actors(force_all=True)
+        self._checkpoint_transfer.cleanup()
 
         while self._futures:
             if self._trial_cleanup and self._trial_cleanup.is_empty():
@@ -1219,19 +1242,75 @@ class RayTrialExecutor:
                     _ExecutorEventType.SAVING_RESULT,
                     _ExecutorEventType.RESTORING_RESULT,
                 )
-                try:
-                    future_result = ray.get(ready_future)
-                    # For local mode
-                    if isinstance(future_result, _LocalWrapper):
-                        future_result = future_result.unwrap()
-                    logger.debug(f"Returning [{result_type}] for trial {trial}")
-                    return _ExecutorEvent(
+                return self._get_future_events([(ready_future, result_type, trial)])[0]
+
+    def get_ready_training_events(self) -> List[_ExecutorEvent]:
+        """Get the training results of other trials that are already ready.
+
+        This is called by TrialRunner after ``get_next_executor_event`` returned
+        a ``TRAINING_RESULT`` event, so that the results of many trials can be
+        processed as one batch. Only the training futures that were found to be
+        ready during the last wait are returned, and at most
+        ``TUNE_RESULT_BATCH_SIZE - 1`` of them. Batching is disabled by default.
+        """
+        max_events = self._result_batch_size - 1
+        if max_events <= 0 or not self._cached_ready_futures:
+            return []
+
+        training_futures = []
+        cached_ready_futures = []
+        for future in self._cached_ready_futures:
+            result_type, trial = self._futures.get(future, (None, None))
+            if (
+                result_type == _ExecutorEventType.TRAINING_RESULT
+                and len(training_futures) < max_events
+            ):
+                del self._futures[future]
+                training_futures.append((future, result_type, trial))
+            else:
+                cached_ready_futures.append(future)
+        self._cached_ready_futures = cached_ready_futures
+        return self._get_future_events(training_futures)
+
+    def _get_future_events(
+        self, futures: List[Tuple[ray.ObjectRef, _ExecutorEventType, Trial]]
+    ) -> List[_ExecutorEvent]:
+        """Fetch the results of ready futures and wrap them in executor events."""
+        if not futures:
+            return []
+        # Fetch all results with a single call. If any of the futures failed,
+        # fetch them one by one to find out which.
+        try:
+            future_results = ray.get([future for future, _, _ in futures])
+        except Exception:
+            future_results = None
+
+        events = []
+        for i, (future, result_type, trial) in enumerate(futures):
+            if result_type in (
+                _ExecutorEventType.SAVING_RESULT,
+                _ExecutorEventType.RESTORING_RESULT,
+            ):
+                self._checkpoint_transfer.on_transfer_end(trial)
+            try:
+                if future_results is not None:
+                    future_result = future_results[i]
+                else:
+                    future_result = ray.get(future)
+                # For local mode
+                if isinstance(future_result, _LocalWrapper):
+                    future_result = future_result.unwrap()
+                logger.debug(f"Returning [{result_type}] for trial {trial}")
+                events.append(
+                    _ExecutorEvent(
                         result_type,
                         trial,
                         result={_ExecutorEvent.KEY_FUTURE_RESULT: future_result},
                     )
-                except Exception as e:
-                    return _ExecutorEvent(
+                )
+            except Exception as e:
+                events.append(
+                    _ExecutorEvent(
                         result_type,
                         trial,
                         result={
@@ -1240,3 +1319,5 @@ class RayTrialExecutor:
                             else _TuneNoNextExecutorEventError(traceback.format_exc())
                         },
                     )
+                )
+        return events
@@ -1,7 +1,6 @@
 from typing import Any, Dict, List, Optional, Union, Tuple, Set
 
 from datetime import datetime
-import json
 import logging
 import os
 from pathlib import Path
@@ -17,8 +16,10 @@ from ray.exceptions import RayTaskError
 from ray.tune.error import _TuneStopTrialError, _TuneRestoreError
 from ray.tune.execution.experiment_state import (
     _ExperimentCheckpointManager,
+    _ExperimentStateWriter,
     _find_newest_experiment_checkpoint,
     _experiment_checkpoint_exists,
+    _load_experiment_state,
 )
 from ray.tune.utils.util import _split_remote_local_path
 from ray.util import get_node_ip_address
@@ -51,7 +52,6 @@ from ray.tune.experiment import Trial
 from ray.tune.utils import warn_if_slow, flatten_dict
 from ray.tune.utils.log import Verbosity, has_verbosity
 from ray.tune.execution.placement_groups import PlacementGroupFactory
-from ray.tune.utils.serialization import TuneFunctionDecoder, TuneFunctionEncoder
 from ray.tune.web_server import TuneServer
 from ray.util.annotations import DeveloperAPI, Deprecated
 from ray.util.debug import log_once
@@ -245,6 +245,7 @@ class _TuneControllerBase:
         self._checkpoint_period = checkpoint_period
         self._trial_checkpoint_config = trial_checkpoint_config or CheckpointConfig()
         self._checkpoint_manager = self._create_checkpoint_manager()
+        self._experiment_state_writer = _ExperimentStateWriter()
 
         self._resumed = False
         resume_config = self._checkpoint_manager.resume(resume_type=resume)
@@ -351,27 +352,16 @@ class _TuneControllerBase:
         """
         experiment_dir = experiment_dir or self._local_experiment_path
 
-        # Get state from trial executor and runner
-        runner_state = {
+        # Only the trials that changed since the last checkpoint are written,
+        # see `_ExperimentStateWriter`.
+        self._experiment_state_writer.write(
+            os.path.join(experiment_dir, self.experiment_state_file_name),
             # Trials
-            "checkpoints": list(self._get_trial_checkpoints().values()),
+            trial_states=self._get_trial_checkpoints(),
             # Experiment data
-            "runner_data": self.__getstate__(),
+            runner_data=self.__getstate__(),
             # Metadata
-            "stats": {
-                "start_time": self._start_time,
-                "timestamp": self._last_checkpoint_time,
-            },
-        }
-
-        tmp_file_name = os.path.join(experiment_dir, ".tmp_experiment_state")
-
-        with open(tmp_file_name, "w") as f:
-            json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
-
-        os.replace(
-            tmp_file_name,
-            os.path.join(experiment_dir, self.experiment_state_file_name),
+            stats=self._get_experiment_stats(),
         )
 
         self._search_alg.save_to_dir(
@@ -419,8 +409,7 @@ class _TuneControllerBase:
         )
 
         # Actually load data
-        with open(newest_state_path, "r") as f:
-            runner_state = json.load(f, cls=TuneFunctionDecoder)
+        runner_state = _load_experiment_state(newest_state_path)
 
         # 1. Restore trial runner state
         self.__setstate__(runner_state["runner_data"])
@@ -560,6 +549,12 @@ class _TuneControllerBase:
     def _get_trial_checkpoints(self) -> Dict[str, str]:
         raise NotImplementedError
 
+    def _get_experiment_stats(self) -> Dict[str, Any]:
+        return {
+            "start_time": self._start_time,
+            "timestamp": self._last_checkpoint_time,
+        }
+
     def _mark_trial_to_checkpoint(self, trial: Trial):
         raise NotImplementedError
 
@@ -740,40 +735,148 @@ class _TuneControllerBase:
                     # non-training future (e.g. a save) was scheduled.
                     # We do not allow processing more results then.
                     if i < len(results) - 1:
-                        if log_once("trial_runner_buffer_checkpoint"):
-                            logger.warning(
-                                f"Trial {trial} has a non-training future "
-                                f"scheduled but {len(results) - i} results "
-                                f"left to process. This means that a "
-                                f"checkpoint was requested, but buffered "
-                                f"training was continued before it was "
-                                f"saved. Consider using non-buffered "
-                                f"training by setting the env variable "
-                                f"`TUNE_RESULT_BUFFER_LENGTH=1`."
-                            )
+                        self._warn_results_left_after_save(trial, len(results) - i)
                 elif decision == TrialScheduler.STOP:
                     # If the decision is to stop the trial,
                     # ignore all results that came after that.
                     break
 
-    def _process_trial_result(self, trial, result):
-        result.update(trial_id=trial.trial_id)
-        is_duplicate = RESULT_DUPLICATE in result
-        force_checkpoint = result.get(SHOULD_CHECKPOINT, False)
-        # TrialScheduler and SearchAlgorithm still receive a
-        # notification because there may be special handling for
-        # the `on_trial_complete` hook.
-        if is_duplicate:
-            logger.debug("Trial finished without logging 'done'.")
-            result = trial.last_result
-            result.update(done=True)
+    def _warn_results_left_after_save(self, trial: Trial, num_results_left: int):
+        if log_once("trial_runner_buffer_checkpoint"):
+            logger.warning(
+                f"Trial {trial} has a non-training future "
+                f"scheduled but {num_results_left} results "
+                f"left to process. This means that a "
+                f"checkpoint was requested, but buffered "
+                f"training was continued before it was "
+                f"saved. Consider using non-buffered "
+                f"training by setting the env variable "
+                f"`TUNE_RESULT_BUFFER_LENGTH=1`."
+            )
 
-        self._total_time += result.get(TIME_THIS_ITER_S, 0)
+    def _on_training_results_batch(
+        self, trials_and_results: List[Tuple[Trial, Union[Dict, List[Dict]]]]
+    ):
+        trials_and_results = [
+            (trial, results if isinstance(results, list) else [results])
+            for trial, results in trials_and_results
+        ]
+        with warn_if_slow("process_trial_results_batch"):
+            self._process_trial_results_batch(trials_and_results)
+        for trial, _ in trials_and_results:
+            self._maybe_execute_queued_decision(trial)
 
-        flat_result = flatten_dict(result)
-        self._validate_result_metrics(flat_result)
+    def _process_trial_results_batch(
+        self, trials_and_results: List[Tuple[Trial, List[Dict]]]
+    ):
+        """Processes the results of several trials.
+
+        The results are processed in rounds. Each round processes the next
+        result of each trial with ``_process_trial_result_batch``, so that
+        the results of a single trial are still processed in order.
+        """
+        logger.debug(f"Processing trial results batch: {trials_and_results}")
+        with warn_if_slow(
+            "process_trial_results",
+            message="Processing trial results took {duration:.3f} s, "
+            "which may be a performance bottleneck. Please consider "
+            "reporting results less frequently to Ray Tune.",
+        ):
+            while trials_and_results:
+                decisions = self._process_trial_result_batch(
+                    [(trial, results[0]) for trial, results in trials_and_results]
+                )
+                remaining = []
+                for (trial, results), decision in zip(trials_and_results, decisions):
+                    if decision is None and len(results) > 1:
+                        self._warn_results_left_after_save(trial, len(results) - 1)
+                    # If the decision is to stop the trial,
+                    # ignore all results that came after that.
+                    if decision != TrialScheduler.STOP and len(results) > 1:
+                        remaining.append((trial, results[1:]))
+                trials_and_results = remaining
+
+    def _process_trial_result_batch(
+        self, trials_and_results: List[Tuple[Trial, Dict]]
+    ) -> List[Optional[str]]:
+        """Processes one result of each of the trials.
+
+        This does the same as calling ``_process_trial_result`` for each
+        trial, except that the scheduler, search algorithm and callbacks are
+        notified of all results with a single ``on_trial_results_batch`` call
+        each. These hooks thus see all trials of the batch in the state they
+        were in before the batch.
+        """
+        prepared = [
+            self._prepare_trial_result(trial, result)
+            for trial, result in trials_and_results
+        ]
+        decisions = [
+            TrialScheduler.STOP if should_stop else None
+            for _, _, should_stop in prepared
+        ]
 
-        if self._stopper(trial.trial_id, result) or trial.should_stop(flat_result):
+        to_schedule = [i for i, decision in enumerate(decisions) if decision is None]
+        if to_schedule:
+            with warn_if_slow("scheduler.on_trial_results_batch"):
+                scheduler_decisions = self._scheduler_alg.on_trial_results_batch(
+                    self._wrapped(),
+                    [(trials_and_results[i][0], prepared[i][1]) for i in to_schedule],
+                )
+            for i, decision in zip(to_schedule, scheduler_decisions):
+                decisions[i] = decision
+
+        # The scheduler may have stopped or paused other trials of the batch
+        # while processing their results. These results are dropped, and
+        # the remaining results of these trials are ignored.
+        final_decisions = [None] * len(trials_and_results)
+        active = []
+        for i, (trial, _) in enumerate(trials_and_results):
+            if trial.status == Trial.RUNNING:
+                active.append(i)
+            else:
+                final_decisions[i] = TrialScheduler.STOP
+
+        search_results = []
+        for i in active:
+            trial = trials_and_results[i][0]
+            result, flat_result, _ = prepared[i]
+            if decisions[i] == TrialScheduler.STOP:
+                result.update(done=True)
+            else:
+                # Only updating search alg if the trial is not to be stopped.
+                search_results.append((trial.trial_id, flat_result))
+        if search_results:
+            with warn_if_slow("search_alg.on_trial_results_batch"):
+                self._search_alg.on_trial_results_batch(search_results)
+
+        # If a result is not a duplicate, the callbacks should
+        # be informed about it.
+        new_results = [
+            (trials_and_results[i][0], prepared[i][0])
+            for i in active
+            if RESULT_DUPLICATE not in trials_and_results[i][1]
+        ]
+        if new_results:
+            with warn_if_slow("callbacks.on_trial_results_batch"):
+                self._callbacks.on_trial_results_batch(
+                    iteration=self._iteration,
+                    trials=self._trials,
+                    results=[(trial, result.copy()) for trial, result in new_results],
+                )
+
+        for i in active:
+            trial, original_result = trials_and_results[i]
+            final_decisions[i] = self._finish_trial_result(
+                trial, original_result, prepared[i][0], decisions[i]
+            )
+        return final_decisions
+
+    def _process_trial_result(self, trial, result):
+        original_result = result
+        result, flat_result, should_stop = self._prepare_trial_result(trial, result)
+
+        if should_stop:
             decision = TrialScheduler.STOP
         else:
             with warn_if_slow("scheduler.on_trial_result"):
@@ -789,7 +892,7 @@ class _TuneControllerBase:
 
         # If this is not a duplicate result, the callbacks should
         # be informed about the result.
-        if not is_duplicate:
+        if RESULT_DUPLICATE not in original_result:
             with warn_if_slow("callbacks.on_trial_result"):
                 self._callbacks.on_trial_result(
                     iteration=self._iteration,
@@ -797,6 +900,45 @@ class _TuneControllerBase:
                     trial=trial,
                     result=result.copy(),
                 )
+
+        return self._finish_trial_result(trial, original_result, result, decision)
+
+    def _prepare_trial_result(
+        self, trial: Trial, result: Dict
+    ) -> Tuple[Dict, Dict, bool]:
+        """Prepares a result for being processed.
+
+        Returns the result to process, its flattened version and whether
+        the stopper or the trial's stopping criteria ask to stop the trial.
+        """
+        result.update(trial_id=trial.trial_id)
+        # TrialScheduler and SearchAlgorithm still receive a
+        # notification because there may be special handling for
+        # the `on_trial_complete` hook.
+        if RESULT_DUPLICATE in result:
+            logger.debug("Trial finished without logging 'done'.")
+            result = trial.last_result
+            result.update(done=True)
+
+        self._total_time += result.get(TIME_THIS_ITER_S, 0)
+
+        flat_result = flatten_dict(result)
+        self._validate_result_metrics(flat_result)
+
+        should_stop = bool(
+            self._stopper(trial.trial_id, result) or trial.should_stop(flat_result)
+        )
+        return result, flat_result, should_stop
+
+    def _finish_trial_result(
+        self, trial: Trial, original_result: Dict, result: Dict, decision: str
+    ) -> Optional[str]:
+        """Finishes processing a result after the callbacks were notified.
+
+        Returns the decision, or None if it was cached because the trial
+        is saving.
+        """
+        if RESULT_DUPLICATE not in original_result:
             trial.update_last_result(result)
             # Include in next experiment checkpoint
             self._mark_trial_to_checkpoint(trial)
@@ -805,7 +947,9 @@ class _TuneControllerBase:
         # the scheduler decision is STOP or PAUSE. Note that
         # PAUSE only checkpoints to memory and does not update
         # the global checkpoint state.
-        self._checkpoint_trial_if_needed(trial, force=force_checkpoint)
+        self._checkpoint_trial_if_needed(
+            trial, force=original_result.get(SHOULD_CHECKPOINT, False)
+        )
 
         if trial.is_saving:
             logger.debug(f"Caching trial decision for trial {trial}: {decision}")
@@ -1147,6 +1291,7 @@ class _TuneControllerBase:
             "_pending_trial_queue_times",
             "_callbacks",
             "_checkpoint_manager",
+            "_experiment_state_writer",
             "_local_experiment_path",
             "_remote_experiment_path",
             "_sync_config",
@@ -1311,6 +1456,13 @@ class TrialRunner(_TuneControllerBase):
     def _get_trial_checkpoints(self) -> Dict[str, str]:
         return self.trial_executor.get_checkpoints()
 
+    def _get_experiment_stats(self) -> Dict[str, Any]:
+        stats = super()._get_experiment_stats()
+        stats[
+            "checkpoint_transfers"
+        ] = self.trial_executor.get_checkpoint_transfer_stats()
+        return stats
+
     def _mark_trial_to_checkpoint(self, trial: Trial):
         self.trial_executor.mark_trial_to_checkpoint(trial)
 
@@ -1429,9 +1581,13 @@ class TrialRunner(_TuneControllerBase):
                         _ExecutorEventType.TRAINING_RESULT,
                     ), f"Unexpected future type - {event.type}"
                     if event.type == _ExecutorEventType.TRAINING_RESULT:
-                        self._on_training_result(
-                            trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
-                        )
+                        ready_events = self.trial_executor.get_ready_training_events()
+                        if ready_events:
+                            self._on_training_events([event] + ready_events)
+                        else:
+                            self._on_training_result(
+                                trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
+                            )
                     else:
                         self._on_saving_result(
                             trial, result[_ExecutorEvent.KEY_FUTURE_RESULT]
@@ -1442,6 +1598,21 @@ class TrialRunner(_TuneControllerBase):
             else:
                 raise TuneError(traceback.format_exc())
 
+    def _on_training_events(self, events: List[_ExecutorEvent]):
+        """Handles several ready training results as one batch."""
+        trials_and_results = []
+        for event in events:
+            if _ExecutorEvent.KEY_EXCEPTION in event.result:
+                self._on_executor_error(
+                    event.trial, event.type, event.result[_ExecutorEvent.KEY_EXCEPTION]
+                )
+            else:
+                trials_and_results.append(
+                    (event.trial, event.result[_ExecutorEvent.KEY_FUTURE_RESULT])
+                )
+        if trials_and_results:
+            self._on_training_results_batch(trials_and_results)
+
     def _on_pg_ready(self, next_trial: Optional[Trial]):
         def _start_trial(trial: Trial) -> bool:
             """Helper function to start trial and call callbacks"""
@@ -0,0 +1,149 @@
+import logging
+import os
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+from ray.tune.logger.logger import LoggerCallback
+from ray.tune.result import EXPR_PARQUET_FILE
+from ray.tune.utils import flatten_dict
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+    from ray.tune.experiment.trial import Trial  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+@PublicAPI(stability="alpha")
+class ParquetLoggerCallback(LoggerCallback):
+    """Logs results to Parquet files in progress.parquet under the trial directory.
+
+    Like the CSV logger, this logger automatically flattens nested dicts in the
+    result dict before writing:
+
+        {"a": {"b": 1, "c": 2}} -> {"a/b": 1, "a/c": 2}
+
+    The results of each trial are buffered, and written to a new file in the
+    progress.parquet directory every ``flush_every_n_results`` results, when the
+    trial is checkpointed, and when it ends. Since the files are columnar,
+    ``ExperimentAnalysis(..., file_type="parquet")`` can load single metrics
+    without parsing the full results.
+
+    Args:
+        flush_every_n_results: Number of results of a trial to buffer before
+            writing them to a file.
+    """
+
+    _SAVED_FILE_TEMPLATES = [EXPR_PARQUET_FILE]
+
+    def __init__(self, flush_every_n_results: int = 100):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required by the `ParquetLoggerCallback`. "
+                "Install it with `pip install pyarrow`."
+            )
+        self._flush_every_n_results = flush_every_n_results
+        self._trial_results: Dict["Trial", List[Dict]] = {}
+        self._trial_num_files: Dict["Trial", int] = {}
+
+    def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
+        tmp = result.copy()
+        tmp.pop("config", None)
+        results = self._trial_results.setdefault(trial, [])
+        results.append(flatten_dict(tmp, delimiter="/"))
+        if len(results) >= self._flush_every_n_results:
+            self._flush(trial)
+
+    def log_trial_save(self, trial: "Trial"):
+        self._flush(trial)
+
+    def log_trial_end(self, trial: "Trial", failed: bool = False):
+        self._flush(trial)
+        self._trial_num_files.pop(trial, None)
+
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        for trial in list(self._trial_results):
+            self._flush(trial)
+
+    def _flush(self, trial: "Trial"):
+        import pyarrow.parquet as pq
+
+        results = self._trial_results.pop(trial, None)
+        if not results:
+            return
+
+        # Make sure logdir exists
+        trial.init_local_path()
+        local_dir = os.path.join(trial.local_path, EXPR_PARQUET_FILE)
+        os.makedirs(local_dir, exist_ok=True)
+        if trial not in self._trial_num_files:
+            # Don't overwrite the files written before the trial was restored.
+            self._trial_num_files[trial] = len(_list_parquet_files(local_dir))
+        file_name = f"part-{self._trial_num_files[trial]:06d}.parquet"
+        self._trial_num_files[trial] += 1
+
+        # Write to a temporary file first, so that readers never see a partially
+        # written file.
+        tmp_file = os.path.join(local_dir, f".{file_name}.tmp")
+        pq.write_table(_results_to_table(results), tmp_file)
+        os.replace(tmp_file, os.path.join(local_dir, file_name))
+
+
+def _results_to_table(results: List[Dict]) -> "pyarrow.Table":
+    import pyarrow as pa
+
+    columns = {}
+    for result in results:
+        for key in result:
+            columns.setdefault(key, None)
+
+    arrays = []
+    for key in columns:
+        values = [result.get(key) for result in results]
+        values = [v.item() if isinstance(v, np.generic) else v for v in values]
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Fall back to strings for values of mixed or unsupported types.
+            arrays.append(pa.array([None if v is None else str(v) for v in values]))
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def _list_parquet_files(local_dir: str) -> List[str]:
+    return sorted(
+        file_name
+        for file_name in os.listdir(local_dir)
+        if file_name.endswith(".parquet")
+    )
+
+
+def _read_parquet_results(
+    local_dir: str, columns: Optional[List[str]] = None
+) -> "pandas.DataFrame":
+    """Reads the results written by the `ParquetLoggerCallback` to `local_dir`.
+
+    Args:
+        local_dir: The progress.parquet directory of a trial.
+        columns: If set, only read these result columns.
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    dfs = []
+    for file_name in _list_parquet_files(local_dir):
+        parquet_file = pq.ParquetFile(os.path.join(local_dir, file_name))
+        file_columns = None
+        if columns is not None:
+            file_column_names = set(parquet_file.schema_arrow.names)
+            file_columns = [column for column in columns if column in file_column_names]
+        dfs.append(parquet_file.read(columns=file_columns).to_pandas())
+    if not dfs:
+        raise FileNotFoundError(f"No results found in {local_dir}.")
+    return pd.concat(dfs, ignore_index=True)
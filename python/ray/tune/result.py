@@ -156,5 +156,8 @@ EXPR_PROGRESS_FILE = "progress.csv"
 # File that stores results of the trial.
 EXPR_RESULT_FILE = "result.json"
 
+# Directory that stores the progress of the trial in Parquet files.
+EXPR_PARQUET_FILE = "progress.parquet"
+
 # Config prefix when using ExperimentAnalysis.
 CONFIG_PREFIX = "config"
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ray.air._internal.usage import tag_scheduler
 from ray.tune.execution import trial_runner
@@ -87,6 +87,28 @@ class TrialScheduler:
 
         raise NotImplementedError
 
+    def on_trial_results_batch(
+        self,
+        trial_runner: "trial_runner.TrialRunner",
+        results: List[Tuple[Trial, Dict]],
+    ) -> List[str]:
+        """Called on intermediate results of several trials at once.
+
+        This is only called when results are processed in batches, see the
+        ``TUNE_RESULT_BATCH_SIZE`` environment variable. Each trial is
+        contained at most once. Returns one decision per result.
+
+        By default, ``on_trial_result`` is called for each trial that is
+        still in the RUNNING state. Trials that were e.g. paused when
+        processing an earlier result of the batch get the NOOP decision."""
+        decisions = []
+        for trial, result in results:
+            if trial.status == Trial.RUNNING:
+                decisions.append(self.on_trial_result(trial_runner, trial, result))
+            else:
+                decisions.append(TrialScheduler.NOOP)
+        return decisions
+
     def on_trial_complete(
         self, trial_runner: "trial_runner.TrialRunner", trial: Trial, result: Dict
     ):
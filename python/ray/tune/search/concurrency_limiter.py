@@ -1,6 +1,6 @@
 import copy
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from ray.tune.search.searcher import Searcher
 from ray.tune.search.util import _set_search_properties_backwards_compatible
@@ -142,6 +142,9 @@ class ConcurrencyLimiter(Searcher):
     def on_trial_result(self, trial_id: str, result: Dict) -> None:
         self.searcher.on_trial_result(trial_id, result)
 
+    def on_trial_results_batch(self, results: List[Tuple[str, Dict]]) -> None:
+        self.searcher.on_trial_results_batch(results)
+
     def add_evaluated_point(
         self,
         parameters: Dict,
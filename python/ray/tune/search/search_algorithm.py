@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
 from ray.util.annotations import DeveloperAPI
 
@@ -87,6 +87,17 @@ class SearchAlgorithm:
         """
         pass
 
+    def on_trial_results_batch(self, results: List[Tuple[str, Dict]]):
+        """Called on intermediate results of several trials at once.
+
+        By default, ``on_trial_result`` is called for each result.
+
+        Arguments:
+            results: List of (trial_id, result) tuples.
+        """
+        for trial_id, result in results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ):
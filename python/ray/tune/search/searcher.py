@@ -3,7 +3,7 @@ import glob
 import logging
 import os
 import warnings
-from typing import Dict, Optional, List, Union, Any, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, Union, Any, TYPE_CHECKING
 
 from ray.air._internal.usage import tag_searcher
 from ray.tune.search.util import _set_search_properties_backwards_compatible
@@ -139,6 +139,21 @@ class Searcher:
         """
         pass
 
+    def on_trial_results_batch(self, results: List[Tuple[str, Dict]]) -> None:
+        """Optional notification for the results of several trials at once.
+
+        This is only called when results are processed in batches, see the
+        ``TUNE_RESULT_BATCH_SIZE`` environment variable. By default,
+        ``on_trial_result`` is called for each result. Searchers can
+        override this method to e.g. update their model only once.
+
+        Args:
+            results: List of (trial_id, result) tuples. Each trial ID is
+                contained at most once.
+        """
+        for trial_id, result in results:
+            self.on_trial_result(trial_id, result)
+
     def on_trial_complete(
         self, trial_id: str, result: Optional[Dict] = None, error: bool = False
     ) -> None:
@@ -27,6 +27,7 @@ from ray.air._internal.remote_storage import (
     delete_at_uri,
     is_non_local_path_uri,
 )
+from ray.air.checkpoint_store import ContentAddressedStore
 from ray.air.constants import LAZY_CHECKPOINT_MARKER_FILE
 from ray.exceptions import RayActorError
 from ray.tune import TuneError
@@ -621,6 +622,91 @@ class _DefaultSyncer(_BackgroundSyncer):
         return delete_at_uri, dict(uri=uri)
 
 
+@DeveloperAPI
+class ContentAddressedSyncer(_BackgroundSyncer):
+    """Syncer that deduplicates files on local or mounted storage.
+
+    Files are uploaded through a
+    :class:`~ray.air.checkpoint_store.ContentAddressedStore`, so that
+    each distinct file is only stored (and written) once, even if it is part
+    of many checkpoints, e.g. when PBT trials clone the checkpoints of other
+    trials. Unreferenced files are removed from the store after every sync
+    and deletion.
+
+    The upload dir has to be a ``file://`` URI, e.g. a path on a network
+    file system that is mounted on all nodes, and ``store_dir`` has to be on
+    the same file system.
+
+    Example:
+
+        .. code-block:: python
+
+            sync_config = SyncConfig(
+                syncer=ContentAddressedSyncer("/mnt/shared/checkpoint_store"),
+            )
+            run_config = RunConfig(
+                storage_path="file:///mnt/shared/results", sync_config=sync_config
+            )
+
+    Args:
+        store_dir: Directory of the content-addressed store.
+        sync_period: Minimum time in seconds to wait between two sync operations.
+        sync_timeout: Maximum time in seconds to wait for a sync process
+            to finish before issuing a new sync operation.
+    """
+
+    def __init__(
+        self,
+        store_dir: str,
+        sync_period: float = DEFAULT_SYNC_PERIOD,
+        sync_timeout: float = DEFAULT_SYNC_TIMEOUT,
+    ):
+        super(ContentAddressedSyncer, self).__init__(
+            sync_period=sync_period, sync_timeout=sync_timeout
+        )
+        self._store = ContentAddressedStore(store_dir)
+
+    @classmethod
+    def validate_upload_dir(cls, upload_dir: str) -> bool:
+        if upload_dir and not upload_dir.startswith("file://"):
+            raise ValueError(
+                f"`ContentAddressedSyncer` only supports `file://` upload dirs, "
+                f"got: `{upload_dir}`."
+            )
+        return True
+
+    def _sync_up_command(
+        self, local_path: str, uri: str, exclude: Optional[List] = None
+    ) -> Tuple[Callable, Dict]:
+        def _copy_and_collect_garbage():
+            self._store.copy_directory(
+                local_path, _get_path_from_uri(uri), exclude=exclude
+            )
+            # Files that changed since the last sync, e.g. result logs and the
+            # experiment state, now link to new chunks, so their previous
+            # chunks may not be referenced anymore.
+            self._store.collect_garbage()
+
+        return _copy_and_collect_garbage, {}
+
+    def _sync_down_command(self, uri: str, local_path: str) -> Tuple[Callable, Dict]:
+        return (
+            download_from_uri,
+            dict(uri=uri, local_path=local_path),
+        )
+
+    def _delete_command(self, uri: str) -> Tuple[Callable, Dict]:
+        def _delete_and_collect_garbage():
+            delete_at_uri(uri)
+            self._store.collect_garbage()
+
+        return _delete_and_collect_garbage, {}
+
+
+def _get_path_from_uri(uri: str) -> str:
+    return uri[len("file://") :] if uri.startswith("file://") else uri
+
+
 @DeveloperAPI
 def get_node_to_storage_syncer(
     sync_config: SyncConfig, upload_dir: Optional[str] = None
@@ -11,6 +11,7 @@ import ray
 from ray import tune
 from ray.air._internal.remote_storage import upload_to_uri
 from ray.tune import ExperimentAnalysis
+from ray.tune.logger import ParquetLoggerCallback
 import ray.tune.registry
 from ray.tune.tests.utils.experiment import create_test_experiment_checkpoint
 from ray.tune.utils.mock_trainable import MyTrainableClass
@@ -87,6 +88,50 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         all_dataframes_via_csv2 = self.ea.fetch_trial_dataframes()
         assert set(all_dataframes_via_csv) == set(all_dataframes_via_csv2)
 
+    def testLoadParquet(self):
+        ea = tune.run(
+            MyTrainableClass,
+            name="parquet_exp",
+            storage_path=self.test_dir,
+            stop={"training_iteration": 3},
+            checkpoint_freq=1,
+            num_samples=2,
+            callbacks=[ParquetLoggerCallback()],
+        )
+        csv_dataframes = ea.trial_dataframes
+
+        ea = ExperimentAnalysis(
+            os.path.join(self.test_dir, "parquet_exp"),
+            default_metric=self.metric,
+            default_mode="max",
+            file_type="parquet",
+            lazy=True,
+        )
+        # Only the metric and the iteration of the trial are loaded.
+        trial = ea.get_best_trial()
+        checkpoints_paths = ea.get_trial_checkpoints_paths(trial.local_path)
+        self.assertEqual(len(checkpoints_paths), 3)
+        self.assertFalse(ea._trial_dataframes)
+
+        parquet_dataframes = ea.trial_dataframes
+        self.assertEqual(set(parquet_dataframes), set(csv_dataframes))
+        for path, df in parquet_dataframes.items():
+            pd.testing.assert_series_equal(
+                df[self.metric], csv_dataframes[path][self.metric]
+            )
+
+    def testBestTrialVectorized(self):
+        trials = self.ea.trials
+        for trial, score in zip(trials, [1.0, nan, 3.0, float("inf"), 3.0]):
+            trial.metric_analysis["score"] = {"last": score}
+        # The first of the best trials is returned.
+        self.assertIs(self.ea.get_best_trial("score", "max"), trials[2])
+        self.assertIs(
+            self.ea.get_best_trial("score", "max", filter_nan_and_inf=False),
+            trials[3],
+        )
+        self.assertIs(self.ea.get_best_trial("score", "min"), trials[0])
+
     def testStats(self):
         assert self.ea.stats()
         assert self.ea.runner_data()
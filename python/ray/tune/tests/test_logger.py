@@ -17,13 +17,16 @@ from ray.tune.logger import (
     JsonLoggerCallback,
     JsonLogger,
     CSVLogger,
+    ParquetLoggerCallback,
     TBXLoggerCallback,
     TBXLogger,
 )
 from ray.tune.logger.aim import AimLoggerCallback
+from ray.tune.logger.parquet import _read_parquet_results
 from ray.tune.result import (
     EXPR_PARAM_FILE,
     EXPR_PARAM_PICKLE_FILE,
+    EXPR_PARQUET_FILE,
     EXPR_PROGRESS_FILE,
     EXPR_RESULT_FILE,
 )
@@ -135,6 +138,41 @@ class LoggerSuite(unittest.TestCase):
         # Assert header has been written to progress.csv
         assert "training_iteration" in csv_lines[0]
 
+    def testParquet(self):
+        config = {"a": 2, "b": 5, "c": {"c": {"D": 123}, "e": None}}
+        t = Trial(evaluated_params=config, trial_id="parquet", logdir=self.test_dir)
+        logger = ParquetLoggerCallback(flush_every_n_results=2)
+        logger.on_trial_result(0, [], t, result(0, 4))
+        logger.on_trial_result(1, [], t, result(1, 5))
+        # The first two results were flushed to a file.
+        result_dir = os.path.join(self.test_dir, EXPR_PARQUET_FILE)
+        self.assertEqual(len(os.listdir(result_dir)), 1)
+        logger.on_trial_result(
+            2,
+            [],
+            t,
+            result(2, np.float32(6), score=[1, 2, 3], hello={"world": 1}, mixed="a"),
+        )
+        logger.on_trial_complete(3, [], t)
+        self.assertEqual(len(os.listdir(result_dir)), 2)
+
+        # Results are appended when the trial is restored.
+        logger = ParquetLoggerCallback()
+        logger.on_trial_result(3, [], t, result(3, 7, mixed=1))
+        logger.on_trial_complete(4, [], t)
+
+        df = _read_parquet_results(result_dir)
+        self.assertEqual(df["episode_reward_mean"].tolist(), [4, 5, 6, 7])
+        self.assertEqual(df["hello/world"].tolist()[2], 1)
+        self.assertEqual(df["score"].tolist()[2].tolist(), [1, 2, 3])
+        self.assertNotIn("config/a", df.columns)
+
+        df = _read_parquet_results(
+            result_dir, columns=["training_iteration", "mean_accuracy"]
+        )
+        self.assertEqual(list(df.columns), ["training_iteration", "mean_accuracy"])
+        self.assertEqual(df["mean_accuracy"].tolist(), [8, 10, 12, 14])
+
     def _validate_csv_result(self):
         results = []
         result_file = os.path.join(self.test_dir, EXPR_PROGRESS_FILE)
@@ -1,5 +1,6 @@
 # coding: utf-8
 
+import copy
 import os
 import pytest
 import time
@@ -342,6 +343,75 @@ class RayTrialExecutorTest(unittest.TestCase):
     def testPauseAndStartActualBuffer(self):
         self._testPauseAndStart(8)
 
+    def testGetReadyTrainingEvents(self):
+        """Tests that ready training results of other trials are fetched at once."""
+        os.environ["TUNE_RESULT_BATCH_SIZE"] = "3"
+        # Need a new trial executor so the ENV vars are parsed again
+        self.trial_executor = RayTrialExecutor()
+        os.environ.pop("TUNE_RESULT_BATCH_SIZE")
+
+        @ray.remote
+        def fail():
+            raise RuntimeError("Failing on purpose.")
+
+        trials = [_make_trial("__fake") for _ in range(4)]
+        futures = [ray.put({"i": 0}), ray.put(None), fail.remote(), ray.put({"i": 3})]
+        ray.wait(futures, num_returns=len(futures))
+        result_types = [
+            _ExecutorEventType.TRAINING_RESULT,
+            _ExecutorEventType.SAVING_RESULT,
+            _ExecutorEventType.TRAINING_RESULT,
+            _ExecutorEventType.TRAINING_RESULT,
+        ]
+        for future, result_type, trial in zip(futures, result_types, trials):
+            self.trial_executor._futures[future] = (result_type, trial)
+        self.trial_executor._cached_ready_futures = list(futures)
+
+        # At most two training results are returned, other futures stay cached.
+        events = self.trial_executor.get_ready_training_events()
+        self.assertEqual([event.trial for event in events], [trials[0], trials[2]])
+        self.assertEqual(events[0].result[_ExecutorEvent.KEY_FUTURE_RESULT], {"i": 0})
+        self.assertIn(_ExecutorEvent.KEY_EXCEPTION, events[1].result)
+        self.assertEqual(
+            self.trial_executor._cached_ready_futures, [futures[1], futures[3]]
+        )
+        self.assertEqual(set(self.trial_executor._futures), {futures[1], futures[3]})
+
+    def testRestoreSharesPackedCheckpoint(self):
+        """Tests that trials restoring the same checkpoint share one transfer."""
+        trial = _make_trial("__fake")
+        self._simulate_starting_trial(trial)
+        self._simulate_getting_result(trial)
+        self._simulate_saving(trial)
+        self.trial_executor.stop_trial(trial)
+
+        clones = [_make_trial("__fake") for _ in range(2)]
+        for clone in clones:
+            checkpoint = copy.copy(trial.checkpoint)
+            checkpoint.id = None
+            clone.on_checkpoint(checkpoint)
+            self._simulate_starting_trial(clone)
+
+        stats = self.trial_executor.get_checkpoint_transfer_stats()
+        self.assertEqual(stats["num_saves"], 1)
+        self.assertEqual(stats["num_deduplicated_restores"], 1)
+
+        restored = set()
+        while len(restored) < len(clones):
+            event = self.trial_executor.get_next_executor_event(
+                live_trials=set(clones), next_trial_exists=False
+            )
+            if event.type == _ExecutorEventType.RESTORING_RESULT:
+                self.assertNotIn(_ExecutorEvent.KEY_EXCEPTION, event.result)
+                restored.add(event.trial)
+
+        stats = self.trial_executor.get_checkpoint_transfer_stats()
+        self.assertEqual(stats["num_restores"], 2)
+        self.assertGreater(stats["restore_time_s"], 0)
+        self.assertFalse(self.trial_executor._checkpoint_transfer._packed_checkpoints)
+        for clone in clones:
+            self.trial_executor.stop_trial(clone)
+
     def testNoResetTrial(self):
         """Tests that reset handles NotImplemented properly."""
         trial = _make_trial("__fake")
@@ -17,7 +17,12 @@ from ray import tune
 from ray.air import session, Checkpoint, RunConfig
 from ray.air._internal.uri_utils import URI
 from ray.tune import TuneError
-from ray.tune.syncer import _DefaultSyncer, Syncer, SyncConfig
+from ray.tune.syncer import (
+    _DefaultSyncer,
+    ContentAddressedSyncer,
+    Syncer,
+    SyncConfig,
+)
 from ray.tune.utils.file_transfer import _pack_dir, _unpack_dir
 from ray.air._internal.remote_storage import upload_to_uri, download_from_uri
 
@@ -512,6 +517,55 @@ def test_syncer_delete(temp_data_dirs):
     assert_file(False, tmp_target, "subdir_exclude/something/somewhere.txt")
 
 
+def test_content_addressed_syncer(temp_data_dirs, tmp_path):
+    """Check that identical files are only stored once on remote storage"""
+    tmp_source, tmp_target = temp_data_dirs
+
+    with pytest.raises(ValueError):
+        ContentAddressedSyncer.validate_upload_dir("memory:///test")
+
+    syncer = ContentAddressedSyncer(store_dir=str(tmp_path / "store"))
+    store = syncer._store
+    for name in ["checkpoint_1", "checkpoint_2"]:
+        syncer.sync_up(
+            local_dir=tmp_source,
+            remote_dir=f"file://{tmp_path / name}",
+            exclude=["*_exclude*"],
+        )
+        syncer.wait()
+
+    # All synced files have the same content
+    assert list(store.get_ref_counts().values()) == [6]
+
+    syncer.sync_down(
+        remote_dir=f"file://{tmp_path / 'checkpoint_2'}", local_dir=tmp_target
+    )
+    syncer.wait()
+    assert_file(True, tmp_target, "level0.txt")
+    assert_file(True, tmp_target, "subdir/nested/level2.txt")
+    assert_file(False, tmp_target, "level0_exclude.txt")
+
+    syncer.delete(remote_dir=f"file://{tmp_path / 'checkpoint_1'}")
+    syncer.wait()
+    assert list(store.get_ref_counts().values()) == [3]
+
+    syncer.delete(remote_dir=f"file://{tmp_path / 'checkpoint_2'}")
+    syncer.wait()
+    assert store.get_ref_counts() == {}
+
+    # Files that change between syncs don't leave unreferenced chunks behind
+    for content in ["Changed", "Changed again"]:
+        with open(os.path.join(tmp_source, "level0.txt"), "w") as f:
+            f.write(content)
+        syncer.sync_up(
+            local_dir=tmp_source,
+            remote_dir=f"file://{tmp_path / 'checkpoint_3'}",
+            exclude=["*_exclude*"],
+        )
+        syncer.wait()
+    assert sorted(store.get_ref_counts().values()) == [1, 2]
+
+
 def test_syncer_wait_or_retry_failure(temp_data_dirs):
     """Check that the wait or retry API fails after max_retries."""
     tmp_source, tmp_target = temp_data_dirs
@@ -1,5 +1,6 @@
 import time
 from collections import Counter
+import json
 import logging
 import os
 import pandas as pd
@@ -19,6 +20,11 @@ from ray.rllib import _register_all
 from ray.rllib.algorithms.callbacks import DefaultCallbacks
 
 from ray.tune import TuneError, PlacementGroupFactory
+from ray.tune.execution.experiment_state import (
+    _ExperimentStateWriter,
+    _experiment_state_log_path,
+    _load_experiment_state,
+)
 from ray.tune.execution.ray_trial_executor import RayTrialExecutor
 from ray.tune.impl.placeholder import create_resolvers_map, inject_placeholders
 from ray.tune.result import TRAINING_ITERATION
@@ -779,6 +785,126 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEqual(count_checkpoints(tmpdir), 2)
         shutil.rmtree(tmpdir)
 
+    def testIncrementalCheckpoint(self):
+        """Check that experiment checkpoints only log the changed trials."""
+        ray.init(num_cpus=2)
+
+        runner = TrialRunner(
+            local_checkpoint_dir=self.tmpdir,
+            checkpoint_period=0,
+            trial_executor=RayTrialExecutor(resource_manager=self._resourceManager()),
+        )
+        for i in range(4):
+            runner.add_trial(
+                Trial(
+                    "__fake",
+                    trial_id=f"trial_{i}",
+                    stopping_criterion={"training_iteration": 2},
+                )
+            )
+        runner.checkpoint(force=True)
+        log_path = _experiment_state_log_path(runner.experiment_state_path)
+        self.assertFalse(os.path.exists(log_path))
+
+        runner.step()
+        runner.checkpoint(force=True)
+        with open(log_path) as f:
+            entries = [json.loads(line) for line in f]
+        # Only the started trials changed.
+        changed_trial_ids = {
+            trial_id for entry in entries for trial_id in entry["checkpoints"]
+        }
+        started_trial_ids = {
+            trial.trial_id
+            for trial in runner.get_trials()
+            if trial.status != Trial.PENDING
+        }
+        self.assertTrue(changed_trial_ids)
+        self.assertLessEqual(changed_trial_ids, started_trial_ids)
+        self.assertLess(len(started_trial_ids), 4)
+
+        while not runner.is_finished():
+            runner.step()
+        runner.checkpoint(force=True)
+
+        runner2 = TrialRunner(
+            resume="LOCAL",
+            local_checkpoint_dir=self.tmpdir,
+            trial_executor=RayTrialExecutor(resource_manager=self._resourceManager()),
+        )
+        self.assertEqual(len(runner2.get_trials()), 4)
+        for trial in runner2.get_trials():
+            self.assertEqual(trial.status, Trial.TERMINATED)
+            self.assertEqual(trial.last_result[TRAINING_ITERATION], 2)
+
+    def testExperimentStateWriterCompaction(self):
+        state_path = os.path.join(self.tmpdir, "experiment_state-test.json")
+        log_path = _experiment_state_log_path(state_path)
+        writer = _ExperimentStateWriter(compaction_factor=1)
+        trial_states = {
+            f"trial_{i}": json.dumps({"trial_id": f"trial_{i}"}) for i in range(4)
+        }
+
+        def write(i):
+            writer.write(state_path, trial_states, {"step": i}, {"timestamp": i})
+
+        write(0)
+        self.assertFalse(os.path.exists(log_path))
+
+        # Unchanged trials are not written to the log.
+        write(1)
+        with open(log_path) as f:
+            self.assertEqual(json.loads(f.readline())["checkpoints"], {})
+
+        step = 1
+        while os.path.exists(log_path):
+            step += 1
+            trial_states["trial_1"] = json.dumps(
+                {"trial_id": "trial_1", "padding": "x" * 100, "step": step}
+            )
+            write(step)
+            experiment_state = _load_experiment_state(state_path)
+            self.assertEqual(experiment_state["runner_data"], {"step": step})
+            self.assertEqual(
+                experiment_state["checkpoints"], list(trial_states.values())
+            )
+        # The log was compacted into the checkpoint file once it grew larger than
+        # the checkpoint file.
+        self.assertGreater(step, 2)
+        with open(state_path) as f:
+            self.assertEqual(json.load(f)["checkpoints"], list(trial_states.values()))
+
+        # Entries of a log that was not removed on compaction are ignored.
+        with open(log_path, "w") as f:
+            f.write(json.dumps({"log_id": "stale", "checkpoints": {}}) + "\n")
+        experiment_state = _load_experiment_state(state_path)
+        self.assertEqual(experiment_state["runner_data"], {"step": step})
+
+        # A partially written entry is ignored.
+        write(step + 1)
+        with open(log_path, "a") as f:
+            f.write('{"log_id": ')
+        experiment_state = _load_experiment_state(state_path)
+        self.assertEqual(experiment_state["runner_data"], {"step": step + 1})
+
+    def testExperimentStateWriterNoCompaction(self):
+        state_path = os.path.join(self.tmpdir, "experiment_state-test.json")
+        log_path = _experiment_state_log_path(state_path)
+        writer = _ExperimentStateWriter(compaction_factor=0)
+        trial_states = {"trial_0": json.dumps({"trial_id": "trial_0"})}
+
+        # The full experiment state is written on every checkpoint.
+        for step in range(3):
+            trial_states["trial_0"] = json.dumps({"trial_id": "trial_0", "step": step})
+            writer.write(state_path, trial_states, {"step": step}, {"timestamp": step})
+            self.assertFalse(os.path.exists(log_path))
+            with open(state_path) as f:
+                experiment_state = json.load(f)
+            self.assertEqual(experiment_state["runner_data"], {"step": step})
+            self.assertEqual(
+                experiment_state["checkpoints"], list(trial_states.values())
+            )
+
     def testCheckpointFreqBuffered(self):
         os.environ["TUNE_RESULT_BUFFER_LENGTH"] = "7"
         os.environ["TUNE_RESULT_BUFFER_MIN_TIME_S"] = "1"
@@ -18,6 +18,7 @@ from ray.tune.execution.ray_trial_executor import (
     RayTrialExecutor,
 )
 from ray.tune.result import TRAINING_ITERATION
+from ray.tune.schedulers import FIFOScheduler
 from ray.tune.syncer import SyncConfig, SyncerCallback
 
 from ray.tune.callback import warnings
@@ -73,6 +74,7 @@ class _MockTrialExecutor(RayTrialExecutor):
     def __init__(self):
         super().__init__()
         self.next_future_result = None
+        self.next_ready_training_events = []
 
     def start_trial(self, trial: Trial):
         trial.status = Trial.RUNNING
@@ -84,6 +86,11 @@ class _MockTrialExecutor(RayTrialExecutor):
     def get_next_executor_event(self, live_trials, next_trial_exists):
         return self.next_future_result
 
+    def get_ready_training_events(self):
+        events = self.next_ready_training_events
+        self.next_ready_training_events = []
+        return events
+
 
 class TrialRunnerCallbacks(unittest.TestCase):
     def setUp(self):
@@ -218,6 +225,126 @@ class TrialRunnerCallbacks(unittest.TestCase):
         self.assertEqual(self.callback.state["trial_fail"]["iteration"], 6)
         self.assertEqual(self.callback.state["trial_fail"]["trial"].trial_id, "one")
 
+    def testCallbackResultsBatch(self):
+        class BatchCallback(Callback):
+            def __init__(self):
+                self.batches = []
+
+            def on_trial_results_batch(self, iteration, trials, results, **info):
+                self.batches.append(
+                    [(trial.trial_id, result["metric"]) for trial, result in results]
+                )
+
+        batch_callback = BatchCallback()
+        trial_runner = TrialRunner(
+            trial_executor=self.executor, callbacks=[self.callback, batch_callback]
+        )
+        trial_runner.setup_experiments(experiments=[None], total_num_samples=2)
+
+        trials = [Trial("__fake", trial_id="one"), Trial("__fake", trial_id="two")]
+        for t in trials:
+            trial_runner.add_trial(t)
+        for _ in trials:
+            self.executor.next_future_result = _ExecutorEvent(
+                event_type=_ExecutorEventType.PG_READY
+            )
+            trial_runner.step()
+
+        # The first trial sends a result, and the second trial sends two
+        # buffered results that were ready at the same time.
+        self.executor.next_future_result = _ExecutorEvent(
+            event_type=_ExecutorEventType.TRAINING_RESULT,
+            trial=trials[0],
+            result={
+                _ExecutorEvent.KEY_FUTURE_RESULT: {TRAINING_ITERATION: 1, "metric": 1}
+            },
+        )
+        self.executor.next_ready_training_events = [
+            _ExecutorEvent(
+                event_type=_ExecutorEventType.TRAINING_RESULT,
+                trial=trials[1],
+                result={
+                    _ExecutorEvent.KEY_FUTURE_RESULT: [
+                        {TRAINING_ITERATION: 1, "metric": 2},
+                        {TRAINING_ITERATION: 2, "metric": 3},
+                    ]
+                },
+            )
+        ]
+        trial_runner.step()
+
+        # Results of a trial are processed in order, one per batch
+        self.assertEqual(
+            batch_callback.batches, [[("one", 1), ("two", 2)], [("two", 3)]]
+        )
+        self.assertEqual(trials[0].last_result["metric"], 1)
+        self.assertEqual(trials[1].last_result["metric"], 3)
+        # Callbacks without batch support get each result
+        self.assertEqual(self.callback.state["trial_result"]["trial"].trial_id, "two")
+        self.assertEqual(self.callback.state["trial_result"]["result"]["metric"], 3)
+
+    def testCallbackResultsBatchTrialPausedByScheduler(self):
+        class PausingScheduler(FIFOScheduler):
+            def on_trial_result(self, trial_runner, trial, result):
+                # Pause all other trials, like a synchronous scheduler would
+                for other in trial_runner.get_trials():
+                    if other is not trial and other.status == Trial.RUNNING:
+                        trial_runner._set_trial_status(other, Trial.PAUSED)
+                return super().on_trial_result(trial_runner, trial, result)
+
+        class BatchCallback(Callback):
+            def __init__(self):
+                self.batches = []
+
+            def on_trial_results_batch(self, iteration, trials, results, **info):
+                self.batches.append(
+                    [(trial.trial_id, result["metric"]) for trial, result in results]
+                )
+
+        batch_callback = BatchCallback()
+        trial_runner = TrialRunner(
+            trial_executor=self.executor,
+            scheduler=PausingScheduler(),
+            callbacks=[batch_callback],
+        )
+        trial_runner.setup_experiments(experiments=[None], total_num_samples=2)
+
+        trials = [Trial("__fake", trial_id="one"), Trial("__fake", trial_id="two")]
+        for t in trials:
+            trial_runner.add_trial(t)
+        for _ in trials:
+            self.executor.next_future_result = _ExecutorEvent(
+                event_type=_ExecutorEventType.PG_READY
+            )
+            trial_runner.step()
+
+        self.executor.next_future_result = _ExecutorEvent(
+            event_type=_ExecutorEventType.TRAINING_RESULT,
+            trial=trials[0],
+            result={
+                _ExecutorEvent.KEY_FUTURE_RESULT: {TRAINING_ITERATION: 1, "metric": 1}
+            },
+        )
+        self.executor.next_ready_training_events = [
+            _ExecutorEvent(
+                event_type=_ExecutorEventType.TRAINING_RESULT,
+                trial=trials[1],
+                result={
+                    _ExecutorEvent.KEY_FUTURE_RESULT: [
+                        {TRAINING_ITERATION: 1, "metric": 2},
+                        {TRAINING_ITERATION: 2, "metric": 3},
+                    ]
+                },
+            )
+        ]
+        trial_runner.step()
+
+        # The results of the paused trial are dropped
+        self.assertEqual(trials[1].status, Trial.PAUSED)
+        self.assertEqual(batch_callback.batches, [[("one", 1)]])
+        self.assertEqual(trials[0].last_result["metric"], 1)
+        self.assertNotIn("metric", trials[1].last_result)
+
     def testCallbacksEndToEnd(self):
         def train(config):
             if config["do"] == "save":
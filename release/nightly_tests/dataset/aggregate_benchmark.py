@@ -3,6 +3,7 @@ from typing import Tuple
 import ray
 from ray.data.aggregate import _AggregateOnKeyBase, Max, Mean, Min, Sum
 from ray.data.block import Block, KeyFn
+from ray.data.context import DataContext
 from ray.data.datastream import Dataset
 import pyarrow.compute as pac
 
@@ -39,8 +40,15 @@ def run_h2oai(benchmark: Benchmark):
             (h2oai_q8, "q8"),
         ]
 
+        ctx = DataContext.get_current()
         for q, name in q_list:
             benchmark.run(f"{test_name}-{name}", q, ds=input_ds)
+        # Run the queries again with hash-based groupby, which combines rows
+        # before the shuffle without sampling and sorting the keys.
+        ctx.use_hash_groupby = True
+        for q, name in q_list:
+            benchmark.run(f"{test_name}-{name}-hash", q, ds=input_ds)
+        ctx.use_hash_groupby = False
 
 
 def h2oai_q1(ds: Dataset) -> Dataset:
@@ -3,6 +3,33 @@ import random
 import os
 import json
 
+import numpy as np
+
+
+def run_multiget_clients(rmap, nclient, batch_size, run_time, sample_keys):
+    """Run clients issuing multiget() calls for `run_time` seconds.
+
+    Returns the throughput in keys / second, and the latencies of the calls.
+    """
+    start = time.time()
+
+    @ray.remote(scheduling_strategy="SPREAD")
+    def client():
+        total = 0
+        latencies = []
+        keys = sample_keys(batch_size)
+        while time.time() - start < run_time:
+            call_start = time.perf_counter()
+            rmap.multiget(keys)
+            latencies.append(time.perf_counter() - call_start)
+            total += batch_size
+        return total, latencies
+
+    results = ray.get([client.remote() for _ in range(nclient)])
+    total = sum(r[0] for r in results)
+    latencies = [latency for r in results for latency in r[1]]
+    return total / (time.time() - start), latencies
+
 
 def main():
     if "SMOKE_TEST" in os.environ:
@@ -25,25 +52,32 @@ def main():
         parallelism = 200
         num_workers = 400
         run_time = 15
+    # The number of keys that receive most of the lookups in the hot key benchmark.
+    num_hot_keys = 10000
 
     ds = ray.data.range_table(nrow, parallelism=parallelism)
     rmap = ds.to_random_access_dataset("value", num_workers=num_workers)
 
-    print("Multiget throughput: ", end="")
-    start = time.time()
+    def uniform_keys(n):
+        return [random.randint(0, nrow) for _ in range(n)]
 
-    @ray.remote(scheduling_strategy="SPREAD")
-    def client():
-        total = 0
-        rand_values = [random.randint(0, nrow) for _ in range(batch_size)]
-        while time.time() - start < run_time:
-            rmap.multiget(rand_values)
-            total += batch_size
-        return total
+    def hot_keys(n):
+        # Zipf-distributed ranks over a random set of hot keys.
+        hot = np.random.randint(0, nrow, size=num_hot_keys)
+        ranks = np.random.zipf(1.2, size=n) % num_hot_keys
+        return hot[ranks].tolist()
 
-    total = sum(ray.get([client.remote() for _ in range(nclient)]))
-    multiget_qps = total / (time.time() - start)
+    print("Multiget throughput: ", end="")
+    multiget_qps, multiget_latencies = run_multiget_clients(
+        rmap, nclient, batch_size, run_time, uniform_keys
+    )
     print(multiget_qps, "keys / second")
+    print(
+        "Multiget latency: p50 {}ms, p99 {}ms".format(
+            np.percentile(multiget_latencies, 50) * 1000,
+            np.percentile(multiget_latencies, 99) * 1000,
+        )
+    )
 
     print("Single get throughput: ", end="")
     start = time.time()
@@ -60,7 +94,27 @@ def main():
     get_qps = total / (time.time() - start)
     print(get_qps, "keys / second")
 
-    return get_qps, multiget_qps
+    del rmap
+    rmap = ds.to_random_access_dataset(
+        "value", num_workers=num_workers, cache_size=num_hot_keys
+    )
+    print("Hot key multiget throughput with cache: ", end="")
+    cached_multiget_qps, cached_multiget_latencies = run_multiget_clients(
+        rmap, nclient, batch_size, run_time, hot_keys
+    )
+    print(cached_multiget_qps, "keys / second")
+    print(rmap.stats())
+
+    return {
+        "get_qps": get_qps,
+        "multiget_qps": multiget_qps,
+        "multiget_p50_latency_ms": np.percentile(multiget_latencies, 50) * 1000,
+        "multiget_p99_latency_ms": np.percentile(multiget_latencies, 99) * 1000,
+        "cached_multiget_qps": cached_multiget_qps,
+        "cached_multiget_p99_latency_ms": (
+            np.percentile(cached_multiget_latencies, 99) * 1000
+        ),
+    }
 
 
 if __name__ == "__main__":
@@ -70,7 +124,7 @@ if __name__ == "__main__":
     ray.init(address="auto")
 
     start = time.time()
-    get_qps, multiget_qps = main()
+    metrics = main()
     delta = time.time() - start
 
     print(f"success! total time {delta}")
@@ -80,15 +134,13 @@ if __name__ == "__main__":
                 {
                     "perf_metrics": [
                         {
-                            "perf_metric_name": "get_qps",
-                            "perf_metric_value": get_qps,
-                            "perf_metric_type": "THROUGHPUT",
-                        },
-                        {
-                            "perf_metric_name": "multiget_qps",
-                            "perf_metric_value": multiget_qps,
-                            "perf_metric_type": "THROUGHPUT",
-                        },
+                            "perf_metric_name": name,
+                            "perf_metric_value": value,
+                            "perf_metric_type": "LATENCY"
+                            if name.endswith("_ms")
+                            else "THROUGHPUT",
+                        }
+                        for name, value in metrics.items()
                     ],
                     "success": 1,
                 }
@@ -0,0 +1,70 @@
+import pandas as pd
+
+import ray
+from ray.data.context import DataContext
+from ray.data.datastream import Dataset
+
+from benchmark import Benchmark
+
+
+def make_table(num_rows: int, num_keys: int, column: str) -> Dataset:
+    num_blocks = int(ray.cluster_resources().get("CPU", 1))
+    ds = ray.data.range_table(num_rows, parallelism=num_blocks)
+    ds = ds.map_batches(
+        lambda df: pd.DataFrame({"key": df["value"] % num_keys, column: df["value"]}),
+        batch_format="pandas",
+    )
+    return ds.materialize()
+
+
+def join_with_map_groups(left: Dataset, right: Dataset) -> Dataset:
+    """The workaround for joins without `Datastream.join()`.
+
+    Both sides are tagged, unioned, and grouped by the key, and each group is
+    joined separately.
+    """
+    left = left.map_batches(lambda df: df.assign(side=0), batch_format="pandas")
+    right = right.map_batches(lambda df: df.assign(side=1), batch_format="pandas")
+
+    def join_group(df: pd.DataFrame) -> pd.DataFrame:
+        left_df = df[df["side"] == 0].drop(columns=["side", "right_value"])
+        right_df = df[df["side"] == 1].drop(columns=["side", "left_value"])
+        return pd.merge(left_df, right_df, on="key")
+
+    return (
+        left.union(right).groupby("key").map_groups(join_group, batch_format="pandas")
+    )
+
+
+def run_join_benchmark(benchmark: Benchmark):
+    ctx = DataContext.get_current()
+    default_threshold = ctx.broadcast_join_threshold_bytes
+    left = make_table(10_000_000, 1_000_000, "left_value")
+    for right_rows, test_name in [
+        (10_000_000, "large-large"),
+        (100_000, "large-small"),
+    ]:
+        right = make_table(right_rows, 1_000_000, "right_value")
+
+        ctx.broadcast_join_threshold_bytes = 0
+        benchmark.run(
+            f"{test_name}-shuffle-join",
+            lambda: left.join(right, on="key"),
+        )
+        ctx.broadcast_join_threshold_bytes = default_threshold
+        benchmark.run(
+            f"{test_name}-join",
+            lambda: left.join(right, on="key"),
+        )
+        benchmark.run(
+            f"{test_name}-map-groups",
+            lambda: join_with_map_groups(left, right),
+        )
+
+
+if __name__ == "__main__":
+    benchmark = Benchmark("join")
+
+    run_join_benchmark(benchmark)
+
+    benchmark.write_result()
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+import ray
+from ray.data.context import DataContext
+from ray.data.datastream import Dataset
+
+from benchmark import Benchmark
+
+
+def make_zipf_table(num_rows: int, a: float) -> Dataset:
+    """Make a table whose `key` column follows a Zipf distribution with parameter
+    `a`, so that the smallest keys are much more frequent than the others."""
+    num_blocks = int(ray.cluster_resources().get("CPU", 1)) * 4
+    ds = ray.data.range_table(num_rows, parallelism=num_blocks)
+    ds = ds.map_batches(
+        lambda df: pd.DataFrame(
+            {"key": np.random.zipf(a, size=len(df)), "value": df["value"]}
+        ),
+        batch_format="pandas",
+    )
+    return ds.materialize()
+
+
+def run_sort_skew_benchmark(benchmark: Benchmark):
+    ctx = DataContext.get_current()
+    for a, test_name in [(1.1, "zipf-1.1"), (2.0, "zipf-2.0")]:
+        ds = make_zipf_table(100_000_000, a)
+        ctx.use_skew_aware_sort = False
+        benchmark.run(f"{test_name}-sort", lambda: ds.sort("key"))
+        ctx.use_skew_aware_sort = True
+        benchmark.run(f"{test_name}-skew-aware-sort", lambda: ds.sort("key"))
+        ctx.use_skew_aware_sort = False
+
+
+if __name__ == "__main__":
+    benchmark = Benchmark("sort-skew")
+
+    run_sort_skew_benchmark(benchmark)
+
+    benchmark.write_result()